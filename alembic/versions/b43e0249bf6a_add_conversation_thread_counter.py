@@ -0,0 +1,42 @@
+"""Add conversation thread counter
+
+Revision ID: b43e0249bf6a
+Revises: cfae9b1bff49
+Create Date: 2026-10-18 10:02:17.530962
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b43e0249bf6a"
+down_revision: Union[str, None] = "cfae9b1bff49"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("conversation", sa.Column("last_thread_id", sa.Integer(), server_default="0", nullable=False))
+
+    # Start each counter from the highest thread ID already used in the conversation
+    op.execute(
+        sa.text(
+            """
+            UPDATE conversation
+            SET last_thread_id = thread_ids.max_thread_id
+            FROM (
+                SELECT conversation_id, MAX(thread_id) AS max_thread_id
+                FROM message_base
+                GROUP BY conversation_id
+            ) AS thread_ids
+            WHERE conversation.id = thread_ids.conversation_id
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("conversation", "last_thread_id")
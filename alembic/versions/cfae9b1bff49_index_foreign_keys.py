@@ -0,0 +1,86 @@
+"""Index foreign keys
+
+Revision ID: cfae9b1bff49
+Revises: 3bdadc507473
+Create Date: 2026-10-18 09:12:41.208514
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "cfae9b1bff49"
+down_revision: Union[str, None] = "3bdadc507473"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_message_base_conversation_id_thread_id", "message_base", ["conversation_id", "thread_id"], unique=False
+    )
+    op.create_index(
+        "ix_message_base_conversation_id_created_at_id",
+        "message_base",
+        ["conversation_id", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index(op.f("ix_message_content_message_id"), "message_content", ["message_id"], unique=False)
+    op.create_index(op.f("ix_citation_agent_message_id"), "citation", ["agent_message_id"], unique=False)
+    op.create_index(op.f("ix_citation_source_data_id"), "citation", ["source_data_id"], unique=False)
+    op.create_index(op.f("ix_conversation_research_context_id"), "conversation", ["research_context_id"], unique=False)
+    op.create_index(op.f("ix_research_context_client_id"), "research_context", ["client_id"], unique=False)
+    op.create_index(
+        op.f("ix_source_data_research_context_association_source_data_id"),
+        "source_data_research_context_association",
+        ["source_data_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_source_data_research_context_association_research_context_id"),
+        "source_data_research_context_association",
+        ["research_context_id"],
+        unique=False,
+    )
+
+    # Drop duplicated associations before enforcing their uniqueness
+    op.execute(
+        sa.text(
+            """
+            DELETE FROM source_data_research_context_association a
+            USING source_data_research_context_association b
+            WHERE a.ctid < b.ctid
+            AND a.source_data_id = b.source_data_id
+            AND a.research_context_id = b.research_context_id
+            """
+        )
+    )
+    op.create_unique_constraint(
+        "uix_source_data_id_research_context_id",
+        "source_data_research_context_association",
+        ["source_data_id", "research_context_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "uix_source_data_id_research_context_id", "source_data_research_context_association", type_="unique"
+    )
+    op.drop_index(
+        op.f("ix_source_data_research_context_association_research_context_id"),
+        table_name="source_data_research_context_association",
+    )
+    op.drop_index(
+        op.f("ix_source_data_research_context_association_source_data_id"),
+        table_name="source_data_research_context_association",
+    )
+    op.drop_index(op.f("ix_research_context_client_id"), table_name="research_context")
+    op.drop_index(op.f("ix_conversation_research_context_id"), table_name="conversation")
+    op.drop_index(op.f("ix_citation_source_data_id"), table_name="citation")
+    op.drop_index(op.f("ix_citation_agent_message_id"), table_name="citation")
+    op.drop_index(op.f("ix_message_content_message_id"), table_name="message_content")
+    op.drop_index("ix_message_base_conversation_id_created_at_id", table_name="message_base")
+    op.drop_index("ix_message_base_conversation_id_thread_id", table_name="message_base")
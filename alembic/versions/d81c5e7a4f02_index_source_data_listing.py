@@ -0,0 +1,51 @@
+"""Index source data listing
+
+Revision ID: d81c5e7a4f02
+Revises: b43e0249bf6a
+Create Date: 2026-10-18 14:03:27.550912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d81c5e7a4f02"
+down_revision: Union[str, None] = "b43e0249bf6a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # client_id leads every index below, so source_data.client_id is deliberately left without a single-column index
+    op.create_index(
+        "ix_source_data_client_id_created_at_id", "source_data", ["client_id", "created_at", "id"], unique=False
+    )
+    op.create_index(
+        "ix_source_data_client_id_status_created_at_id",
+        "source_data",
+        ["client_id", "status", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_source_data_client_id_type_created_at_id",
+        "source_data",
+        ["client_id", "type", "created_at", "id"],
+        unique=False,
+    )
+    # text_pattern_ops lets the relative path prefix filter (LIKE 'prefix%') use the index whatever the collation
+    op.create_index(
+        "ix_source_data_client_id_relative_path_pattern",
+        "source_data",
+        ["client_id", "relative_path"],
+        unique=False,
+        postgresql_ops={"relative_path": "text_pattern_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_source_data_client_id_relative_path_pattern", table_name="source_data")
+    op.drop_index("ix_source_data_client_id_type_created_at_id", table_name="source_data")
+    op.drop_index("ix_source_data_client_id_status_created_at_id", table_name="source_data")
+    op.drop_index("ix_source_data_client_id_created_at_id", table_name="source_data")
@@ -0,0 +1,81 @@
+"""Search message contents
+
+Revision ID: e5b7a90c3d18
+Revises: d81c5e7a4f02
+Create Date: 2026-10-18 17:42:09.118304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5b7a90c3d18"
+down_revision: Union[str, None] = "d81c5e7a4f02"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Number of message contents whose tsvector is computed per backfill transaction
+BACKFILL_BATCH_SIZE = 10000
+
+
+def upgrade() -> None:
+    # Give up instead of queueing every other query of message_content behind the brief exclusive lock of ALTER TABLE
+    op.execute("SET LOCAL lock_timeout = '5s'")
+
+    # A nullable column without a default is only a catalog change; a generated column would rewrite the whole table
+    op.add_column("message_content", sa.Column("content_tsv", postgresql.TSVECTOR(), nullable=True))
+    op.execute(
+        """
+        CREATE FUNCTION message_content_tsv_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.content_tsv := to_tsvector('english', NEW.content);
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER message_content_tsv_update
+        BEFORE INSERT OR UPDATE OF content ON message_content
+        FOR EACH ROW EXECUTE FUNCTION message_content_tsv_update()
+        """
+    )
+
+    # The trigger covers the new and updated contents from here on; the existing ones are backfilled in batches of IDs, each in its own transaction, so that only the rows of a batch are locked at a time
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        min_id, max_id = connection.execute(sa.text("SELECT min(id), max(id) FROM message_content")).one()
+        if min_id is not None:
+            for low in range(min_id, max_id + 1, BACKFILL_BATCH_SIZE):
+                connection.execute(
+                    sa.text(
+                        "UPDATE message_content SET content_tsv = to_tsvector('english', content) "
+                        "WHERE id BETWEEN :low AND :high AND content_tsv IS NULL"
+                    ),
+                    {"low": low, "high": low + BACKFILL_BATCH_SIZE - 1},
+                )
+
+        # Built without blocking the writes to message_content
+        op.create_index(
+            "ix_message_content_content_tsv",
+            "message_content",
+            ["content_tsv"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_message_content_content_tsv", table_name="message_content", postgresql_concurrently=True)
+
+    op.execute("DROP TRIGGER message_content_tsv_update ON message_content")
+    op.execute("DROP FUNCTION message_content_tsv_update()")
+    op.drop_column("message_content", "content_tsv")
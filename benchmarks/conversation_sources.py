@@ -0,0 +1,222 @@
+"""
+Benchmark of listing the sources cited in a conversation, as the conversation grows.
+
+It seeds conversations of increasing length, where every agent message cites one source data, then measures the
+latency and the number of statements sent to the RDBMS by `SQLAConversationRepository.list_conversation_sources`.
+The same is measured for the previous implementation, which queried the sources of each agent message in turn, as a
+baseline: its number of statements grows with the conversation, while the current one stays constant.
+
+Usage, from the root of the project (see benchmarks.features for the RDBMS options):
+
+    python -m benchmarks.conversation_sources --messages 10,100,1000,10000
+"""
+import argparse
+from datetime import datetime, timezone
+import json
+import platform
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Set
+
+from sqlalchemy import text
+
+from benchmarks.features import git_commit, prepare_database, rdbms
+from lib.core.sdk.metrics import start_request_metrics, stop_request_metrics
+from lib.infrastructure.config.containers import ApplicationContainer
+from lib.infrastructure.repository.sqla.database import Database
+from lib.infrastructure.repository.sqla.models import SQLAAgentMessage, SQLACitation, SQLAConversation, SQLASourceData
+from lib.infrastructure.repository.sqla.sqla_conversation_repository import SQLAConversationRepository
+from lib.infrastructure.repository.sqla.unit_of_work import SQLAUnitOfWork
+
+
+def seed(db: Database, messages: int, sources: int) -> int:
+    """
+    Seeds one client, LLM, research context with the given number of source data, and one conversation with the given number of messages, alternating between user and agent. Each agent message cites one source data, in turn.
+
+    @return: The ID of the conversation.
+    """
+    with db.engine.begin() as connection:
+        client_id = connection.execute(
+            text(
+                "INSERT INTO client (sub, deleted, created_at, updated_at) "
+                "VALUES ('benchmark-client-' || :messages, false, now(), now()) RETURNING id"
+            ),
+            {"messages": messages},
+        ).scalar_one()
+        llm_id = connection.execute(
+            text(
+                "INSERT INTO llm (llm_name, deleted, created_at, updated_at) "
+                "VALUES ('benchmark-llm-' || :messages, false, now(), now()) RETURNING id"
+            ),
+            {"messages": messages},
+        ).scalar_one()
+        research_context_id = connection.execute(
+            text(
+                "INSERT INTO research_context "
+                "(title, description, client_id, llm_id, external_id, deleted, created_at, updated_at) "
+                "VALUES ('benchmark', 'benchmark', :client_id, :llm_id, 'benchmark', false, now(), now()) RETURNING id"
+            ),
+            {"client_id": client_id, "llm_id": llm_id},
+        ).scalar_one()
+        source_data_ids: List[int] = list(
+            connection.execute(
+                text(
+                    "INSERT INTO source_data "
+                    "(name, relative_path, type, protocol, status, client_id, deleted, created_at, updated_at) "
+                    "SELECT 'file-' || g, 'benchmark/file-' || g || '.pdf', 'pdf', 'S3', 'AVAILABLE', :client_id, "
+                    "false, now(), now() FROM generate_series(1, :sources) g RETURNING id"
+                ),
+                {"client_id": client_id, "sources": sources},
+            ).scalars()
+        )
+        conversation_id: int = connection.execute(
+            text(
+                "INSERT INTO conversation (title, research_context_id, deleted, created_at, updated_at) "
+                "VALUES ('benchmark', :research_context_id, false, now(), now()) RETURNING id"
+            ),
+            {"research_context_id": research_context_id},
+        ).scalar_one()
+        connection.execute(
+            text(
+                "INSERT INTO message_base (type, conversation_id, thread_id, deleted, created_at, updated_at) "
+                "SELECT CASE WHEN g % 2 = 0 THEN 'agent_message' ELSE 'user_message' END, :conversation_id, g / 2, "
+                "false, now() - make_interval(secs => :messages - g), now() - make_interval(secs => :messages - g) "
+                "FROM generate_series(1, :messages) g"
+            ),
+            {"conversation_id": conversation_id, "messages": messages},
+        )
+        connection.execute(
+            text(
+                "INSERT INTO user_message (id) SELECT id FROM message_base "
+                "WHERE conversation_id = :conversation_id AND type = 'user_message'"
+            ),
+            {"conversation_id": conversation_id},
+        )
+        connection.execute(
+            text(
+                "INSERT INTO agent_message (id) SELECT id FROM message_base "
+                "WHERE conversation_id = :conversation_id AND type = 'agent_message'"
+            ),
+            {"conversation_id": conversation_id},
+        )
+        connection.execute(
+            text(
+                "INSERT INTO citation "
+                "(source_data_id, citation_metadata, agent_message_id, deleted, created_at, updated_at) "
+                "SELECT (:source_data_ids)[1 + (row_number() OVER (ORDER BY id) - 1) % :sources], 'benchmark', id, "
+                "false, now(), now() FROM message_base "
+                "WHERE conversation_id = :conversation_id AND type = 'agent_message'"
+            ),
+            {"source_data_ids": source_data_ids, "sources": len(source_data_ids), "conversation_id": conversation_id},
+        )
+
+    with db.engine.connect() as connection:
+        connection.execution_options(isolation_level="AUTOCOMMIT").execute(text("ANALYZE"))
+    return conversation_id
+
+
+def per_message_sources(repository: SQLAConversationRepository, conversation_id: int) -> List[SQLASourceData]:
+    """
+    The previous implementation of `list_conversation_sources`: one query per agent message of the conversation.
+    """
+    session = repository.session
+    sqla_conversation = session.get(SQLAConversation, conversation_id)
+    assert sqla_conversation is not None
+    sources: Set[SQLASourceData] = set()
+    for message in sqla_conversation.messages:
+        if isinstance(message, SQLAAgentMessage):
+            sources.update(
+                session.query(SQLASourceData)
+                .join(SQLACitation, SQLACitation.source_data_id == SQLASourceData.id)
+                .filter(SQLACitation.agent_message_id == message.id)
+                .all()
+            )
+    return list(sources)
+
+
+def measure(operation: Callable[[], Any], unit_of_work: SQLAUnitOfWork, samples: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    round_trips: List[int] = []
+    for _ in range(samples):
+        # Each call runs in its own unit of work, like an API request does
+        metrics, token = start_request_metrics()
+        start = time.perf_counter()
+        try:
+            with unit_of_work.begin():
+                operation()
+        finally:
+            stop_request_metrics(token)
+        latencies.append((time.perf_counter() - start) * 1000)
+        round_trips.append(metrics.db_round_trips)
+
+    latencies.sort()
+    return {
+        "db_round_trips": max(round_trips),
+        "mean_ms": statistics.mean(latencies),
+        "p50_ms": latencies[len(latencies) // 2],
+        "p95_ms": latencies[max(0, int(len(latencies) * 0.95) - 1)],
+        "max_ms": latencies[-1],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", default="10,100,1000,10000", help="Comma-separated conversation lengths.")
+    parser.add_argument("--sources", type=int, default=50, help="Number of source data cited in each conversation.")
+    parser.add_argument("--samples", type=int, default=20, help="Number of timed calls per operation and length.")
+    parser.add_argument("--rdbms", choices=("local", "config"), default="local", help="Where to run the RDBMS.")
+    parser.add_argument("--postgres-bin", default=None, help="Directory of the initdb and pg_ctl binaries.")
+    parser.add_argument("--postgres-os-user", default=None, help="System user to run PostgreSQL as, if root.")
+    parser.add_argument("--database", default="kp-benchmark", help="Name of the scratch database.")
+    parser.add_argument("--output", default=None, help="Write the results to this JSON file too.")
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = {
+        "benchmark": "conversation_sources",
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "rdbms": args.rdbms,
+        "sources": args.sources,
+        "samples": args.samples,
+        "lengths": [],
+    }
+    with rdbms(args) as rdbms_settings:
+        container = ApplicationContainer()
+        container.config.rdbms.from_dict({**container.config.rdbms(), **rdbms_settings, "echo": False})
+        db = prepare_database(container)
+        repository = container.sqla_conversation_repository()
+        unit_of_work = container.unit_of_work()
+        try:
+            for messages in [int(length) for length in args.messages.split(",")]:
+                conversation_id = seed(db, messages=messages, sources=args.sources)
+
+                def single_query() -> None:
+                    dto = repository.list_conversation_sources(conversation_id=conversation_id)
+                    assert dto.status, dto.errorMessage
+
+                length: Dict[str, Any] = {
+                    "messages": messages,
+                    "before": measure(
+                        lambda: per_message_sources(repository, conversation_id), unit_of_work, args.samples
+                    ),
+                    "after": measure(single_query, unit_of_work, args.samples),
+                }
+                results["lengths"].append(length)
+                print(
+                    f"{messages:>7} messages  before: {length['before']['db_round_trips']:>6} queries "
+                    f"{length['before']['p50_ms']:9.2f} ms  after: {length['after']['db_round_trips']:>2} queries "
+                    f"{length['after']['p50_ms']:9.2f} ms",
+                    flush=True,
+                )
+        finally:
+            db.engine.dispose()
+
+    print(json.dumps(results, indent=2))
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
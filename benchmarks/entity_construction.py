@@ -0,0 +1,124 @@
+"""
+Benchmark of converting source data rows into core entities, the CPU cost of listing source data.
+
+It builds lists of transient SQLAlchemy rows of increasing length (no RDBMS is involved), then measures the time
+`convert_sqla_source_data_to_core_source_data` takes to turn them into core entities, and the time the list source data
+presenter takes to turn those into its view model. The previous converter, which validated every source data like user
+input, is measured too as a baseline, by making `from_trusted` validate again.
+
+Usage, from the root of the project:
+
+    python -m benchmarks.entity_construction --rows 1000,100000
+"""
+import argparse
+from datetime import datetime, timezone
+import json
+import platform
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+from unittest import mock
+
+from benchmarks.features import git_commit
+from lib.core.entity.models import (
+    BaseKernelPlancksterModel,
+    ProtocolEnum,
+    SourceDataStatusEnum,
+    TKernelPlancksterModel,
+)
+from lib.core.usecase_models.list_source_data_usecase_models import ListSourceDataResponse
+from lib.infrastructure.presenter.list_source_data_presenter import ListSourceDataPresenter
+from lib.infrastructure.repository.sqla.models import SQLASourceData
+from lib.infrastructure.repository.sqla.utils import convert_sqla_source_data_to_core_source_data
+
+
+def source_data_rows(rows: int) -> List[SQLASourceData]:
+    now = datetime.now(timezone.utc)
+    return [
+        SQLASourceData(
+            id=i,
+            name=f"file-{i}",
+            relative_path=f"benchmark/file-{i}.pdf",
+            type="pdf",
+            protocol=ProtocolEnum.S3,
+            status=SourceDataStatusEnum.AVAILABLE,
+            created_at=now,
+            updated_at=now,
+            deleted=False,
+            deleted_at=None,
+        )
+        for i in range(rows)
+    ]
+
+
+def validated(cls: type[TKernelPlancksterModel], /, **fields: Any) -> TKernelPlancksterModel:
+    return cls(**fields)
+
+
+def measure(operation: Callable[[], Any], samples: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        operation()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    latencies.sort()
+    return {
+        "mean_ms": statistics.mean(latencies),
+        "p50_ms": latencies[len(latencies) // 2],
+        "min_ms": latencies[0],
+    }
+
+
+def measure_both(operation: Callable[[], Any], samples: int) -> Dict[str, Dict[str, float]]:
+    with mock.patch.object(BaseKernelPlancksterModel, "from_trusted", classmethod(validated)):
+        before = measure(operation, samples)
+    return {"before": before, "after": measure(operation, samples)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", default="1000,100000", help="Comma-separated list lengths.")
+    parser.add_argument("--samples", type=int, default=5, help="Number of timed conversions per list and length.")
+    parser.add_argument("--output", default=None, help="Write the results to this JSON file too.")
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = {
+        "benchmark": "entity_construction",
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "samples": args.samples,
+        "lengths": [],
+    }
+    presenter = ListSourceDataPresenter()
+    for rows in [int(length) for length in args.rows.split(",")]:
+        source_data = source_data_rows(rows)
+        core_source_data = [convert_sqla_source_data_to_core_source_data(row) for row in source_data]
+
+        length: Dict[str, Any] = {
+            "rows": rows,
+            "source_data": measure_both(
+                lambda: [convert_sqla_source_data_to_core_source_data(row) for row in source_data], args.samples
+            ),
+            "present_source_data": measure(
+                lambda: presenter.present_success(ListSourceDataResponse(source_data_list=core_source_data)),
+                args.samples,
+            ),
+        }
+        results["lengths"].append(length)
+        print(
+            f"{rows:>7} rows  before: {length['source_data']['before']['p50_ms']:9.1f} ms  "
+            f"after: {length['source_data']['after']['p50_ms']:9.1f} ms  "
+            f"presenter: {length['present_source_data']['p50_ms']:7.1f} ms",
+            flush=True,
+        )
+
+    print(json.dumps(results, indent=2))
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
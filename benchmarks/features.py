@@ -0,0 +1,407 @@
+"""
+Feature-level micro-benchmarks: every feature is driven through the controller of its feature container, within a unit
+of work, like an API request is, against datasets of increasing size.
+
+For each dataset size (10^2, 10^4 and 10^6 rows by default), a scratch database is migrated and seeded with that many
+messages, spread over conversations of 100 messages, and that many source data of a single client. Each feature is
+then called repeatedly for a fixed time, and its throughput (operations per second), its latency, and the memory it
+allocates per call (with tracemalloc, in a separate pass) are measured.
+
+No Docker is needed:
+
+- the RDBMS is a throwaway PostgreSQL server spawned from a local installation (--rdbms local, the default), or the
+  RDBMS of config.yaml (--rdbms config);
+- the object store is an in-memory stand-in of MinIO, so the credentials features measure the logic of the store and
+  the presigning of the URLs, but no network.
+
+Usage, from the root of the project:
+
+    python -m benchmarks.features --output benchmark-results.json
+    python -m benchmarks.features --sizes 100,10000 --features list_messages,new_message --seconds 2
+
+As root, PostgreSQL must run as another user of the system, e.g. --postgres-os-user postgres.
+"""
+import argparse
+import asyncio
+from contextlib import contextmanager
+from datetime import datetime, timezone
+import json
+import platform
+import random
+import statistics
+import subprocess
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Generator, List, Tuple
+import uuid
+
+from alembic import command
+from alembic.config import Config
+from dependency_injector import providers
+from sqlalchemy import text
+from sqlalchemy_utils.functions import database_exists, drop_database
+
+from benchmarks.local_services import InMemoryMinIOObjectStore, find_postgres_bin_dir, local_postgres
+from benchmarks.message_indexes import analyze, seed as seed_messages
+from lib.core.entity.models import BaseMessageContent, MessageContentTypeEnum, ProtocolEnum, SourceDataCompositeIndex
+from lib.infrastructure.config.containers import ApplicationContainer
+from lib.infrastructure.controller.extend_research_context_controller import ExtendResearchContextControllerParameters
+from lib.infrastructure.controller.get_client_data_for_download_batch_controller import (
+    GetClientDataForDownloadBatchControllerParameters,
+)
+from lib.infrastructure.controller.get_client_data_for_download_controller import (
+    GetClientDataForDownloadControllerParameters,
+)
+from lib.infrastructure.controller.get_client_data_for_upload_batch_controller import (
+    GetClientDataForUploadBatchControllerParameters,
+)
+from lib.infrastructure.controller.get_client_data_for_upload_controller import (
+    GetClientDataForUploadControllerParameters,
+)
+from lib.infrastructure.controller.list_messages_controller import ListMessagesControllerParameters
+from lib.infrastructure.controller.list_source_data_controller import ListSourceDataControllerParameter
+from lib.infrastructure.controller.new_message_controller import NewMessageControllerParameters
+from lib.infrastructure.controller.new_research_context_controller import NewResearchContextControllerParameters
+from lib.infrastructure.repository.sqla.database import Database
+
+CLIENT_SUB = "benchmark-client"
+LLM_NAME = "benchmark-llm"
+MESSAGES_PER_CONVERSATION = 100
+# The source data linked to the seeded research context, and the ones the credentials features pick from
+SAMPLED_SOURCE_DATA = 1000
+BATCH_SIZE = 100
+
+# A benchmarked operation returns whether it succeeded
+TOperation = Callable[[], bool]
+
+
+class Dataset:
+    """
+    The IDs and paths of the seeded rows that the operations pick their parameters from.
+    """
+
+    def __init__(
+        self, client_id: int, research_context_id: int, conversation_ids: List[int], source_data: List[Tuple[int, str]]
+    ) -> None:
+        self.client_id = client_id
+        self.research_context_id = research_context_id
+        self.conversation_ids = conversation_ids
+        self.source_data = source_data
+
+
+def seed(db: Database, rows: int) -> Dataset:
+    """
+    Seeds the messages, then as many source data of the benchmark client, the first half of the sampled ones linked to its research context.
+    """
+    conversation_ids = seed_messages(db, messages=rows, conversations=max(1, rows // MESSAGES_PER_CONVERSATION))
+    with db.engine.begin() as connection:
+        client_id, research_context_id = connection.execute(
+            text(
+                "SELECT client.id, research_context.id FROM client "
+                "JOIN research_context ON research_context.client_id = client.id WHERE client.sub = :sub"
+            ),
+            {"sub": CLIENT_SUB},
+        ).one()
+        connection.execute(
+            text(
+                "INSERT INTO source_data "
+                "(name, relative_path, type, protocol, status, client_id, deleted, created_at, updated_at) "
+                "SELECT 'file-' || g, 'benchmark/file-' || g || '.txt', 'txt', 'S3', 'AVAILABLE', :client_id, "
+                "false, now(), now() FROM generate_series(1, :rows) g"
+            ),
+            {"client_id": client_id, "rows": rows},
+        )
+        source_data = [
+            (row.id, row.relative_path)
+            for row in connection.execute(
+                text("SELECT id, relative_path FROM source_data WHERE client_id = :client_id ORDER BY id LIMIT :limit"),
+                {"client_id": client_id, "limit": SAMPLED_SOURCE_DATA},
+            )
+        ]
+        connection.execute(
+            text(
+                "INSERT INTO source_data_research_context_association (source_data_id, research_context_id) "
+                "SELECT id, :research_context_id FROM source_data WHERE id = ANY(:ids)"
+            ),
+            {
+                "research_context_id": research_context_id,
+                "ids": [id for id, _ in source_data[: len(source_data) // 2]],
+            },
+        )
+
+    analyze(db)
+    return Dataset(client_id, research_context_id, conversation_ids, source_data)
+
+
+def upload_sampled_objects(store: InMemoryMinIOObjectStore, dataset: Dataset) -> None:
+    """
+    Puts the sampled source data in the object store, so that they can be downloaded.
+    """
+    store.create_bucket_if_not_exists(CLIENT_SUB)
+    for _, relative_path in dataset.source_data:
+        pfn = store.protocol_and_relative_path_to_pfn(
+            protocol=ProtocolEnum.S3, relative_path=relative_path, bucket_name=CLIENT_SUB
+        )
+        minio_object = store.pfn_to_object_name(pfn)
+        store.client.put_object(minio_object.bucket_name, minio_object.object_name, None, 0)  # type: ignore
+
+
+def operations(
+    container: ApplicationContainer, dataset: Dataset, loop: asyncio.AbstractEventLoop
+) -> Dict[str, TOperation]:
+    unit_of_work = container.unit_of_work()
+    async_unit_of_work = container.async_unit_of_work()
+
+    def sync_call(controller: Any, parameters: Callable[[], Any]) -> TOperation:
+        # Like FastAPIEndpoint.execute: a unit of work per call, rolled back if the feature fails
+        def operation() -> bool:
+            with unit_of_work.begin():
+                view_model = controller.execute(parameters())
+                if not view_model.status:
+                    unit_of_work.rollback()
+                return bool(view_model.status)
+
+        return operation
+
+    def async_call(controller: Any, parameters: Callable[[], Any]) -> TOperation:
+        async def execute() -> bool:
+            async with async_unit_of_work.begin():
+                view_model = await controller.execute(parameters())
+                if not view_model.status:
+                    await async_unit_of_work.rollback()
+                return bool(view_model.status)
+
+        return lambda: loop.run_until_complete(execute())
+
+    def text_content() -> List[BaseMessageContent]:
+        return [BaseMessageContent(content="benchmark message", content_type=MessageContentTypeEnum.TEXT)]
+
+    def source_data_ids(count: int) -> List[int]:
+        return [id for id, _ in random.sample(dataset.source_data, min(count, len(dataset.source_data)))]
+
+    def relative_paths(count: int) -> List[str]:
+        return [relative_path for _, relative_path in random.sample(dataset.source_data, count)]
+
+    def list_messages_parameters() -> ListMessagesControllerParameters:
+        return ListMessagesControllerParameters(conversation_id=random.choice(dataset.conversation_ids), limit=50)
+
+    def new_message_parameters() -> NewMessageControllerParameters:
+        return NewMessageControllerParameters(
+            conversation_id=random.choice(dataset.conversation_ids),
+            message_contents=text_content(),
+            sender_type="user",
+            thread_id=None,
+        )
+
+    return {
+        "list_messages": sync_call(container.list_messages_feature.controller(), list_messages_parameters),
+        "list_messages_async": async_call(container.list_messages_feature.async_controller(), list_messages_parameters),
+        "new_message": sync_call(container.new_message_feature.controller(), new_message_parameters),
+        "new_message_async": async_call(container.new_message_feature.async_controller(), new_message_parameters),
+        "new_research_context": sync_call(
+            container.new_research_context_feature.controller(),
+            lambda: NewResearchContextControllerParameters(
+                research_context_title="benchmark",
+                research_context_description="benchmark",
+                client_sub=CLIENT_SUB,
+                llm_name=LLM_NAME,
+                source_data_ids=source_data_ids(10),
+                external_id=str(uuid.uuid4()),
+            ),
+        ),
+        "extend_research_context": sync_call(
+            container.extend_research_context_feature.controller(),
+            lambda: ExtendResearchContextControllerParameters(
+                new_research_context_title="benchmark",
+                new_research_context_description="benchmark",
+                client_sub=CLIENT_SUB,
+                llm_name=LLM_NAME,
+                new_source_data_ids=source_data_ids(10),
+                existing_research_context_id=dataset.research_context_id,
+                external_id=str(uuid.uuid4()),
+            ),
+        ),
+        "list_source_data": sync_call(
+            container.list_source_data_feature.controller(),
+            lambda: ListSourceDataControllerParameter(client_id=dataset.client_id),
+        ),
+        "get_client_data_for_upload": sync_call(
+            container.get_client_data_for_upload_feature.controller(),
+            lambda: GetClientDataForUploadControllerParameters(
+                client_id=dataset.client_id, protocol="s3", relative_path=f"benchmark/upload-{uuid.uuid4()}.txt"
+            ),
+        ),
+        "get_client_data_for_download": sync_call(
+            container.get_client_data_for_download_feature.controller(),
+            lambda: GetClientDataForDownloadControllerParameters(
+                client_id=dataset.client_id, protocol="s3", relative_path=relative_paths(1)[0]
+            ),
+        ),
+        "get_client_data_for_upload_batch": sync_call(
+            container.get_client_data_for_upload_batch_feature.controller(),
+            lambda: GetClientDataForUploadBatchControllerParameters(
+                client_id=dataset.client_id,
+                composite_indexes=[
+                    SourceDataCompositeIndex(
+                        protocol=ProtocolEnum.S3, relative_path=f"benchmark/upload-{uuid.uuid4()}.txt"
+                    )
+                    for _ in range(BATCH_SIZE)
+                ],
+            ),
+        ),
+        "get_client_data_for_download_batch": sync_call(
+            container.get_client_data_for_download_batch_feature.controller(),
+            lambda: GetClientDataForDownloadBatchControllerParameters(
+                client_id=dataset.client_id,
+                composite_indexes=[
+                    SourceDataCompositeIndex(protocol=ProtocolEnum.S3, relative_path=relative_path)
+                    for relative_path in relative_paths(BATCH_SIZE)
+                ],
+            ),
+        ),
+    }
+
+
+def measure(operation: TOperation, seconds: float, max_operations: int, allocation_samples: int) -> Dict[str, Any]:
+    """
+    Calls an operation repeatedly for a given time, at least once, then a few more times with tracemalloc on.
+    """
+    latencies: List[float] = []
+    failures = 0
+    start = time.perf_counter()
+    while not latencies or (time.perf_counter() - start < seconds and len(latencies) < max_operations):
+        operation_start = time.perf_counter()
+        if not operation():
+            failures += 1
+        latencies.append((time.perf_counter() - operation_start) * 1000)
+    elapsed = time.perf_counter() - start
+
+    # Allocations are measured apart, as tracemalloc slows every allocation down
+    peaks: List[int] = []
+    retained: List[int] = []
+    tracemalloc.start()
+    try:
+        for _ in range(allocation_samples):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            operation()
+            after, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+            retained.append(after - before)
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "operations": len(latencies),
+        "failures": failures,
+        "seconds": elapsed,
+        "ops_per_second": len(latencies) / elapsed,
+        "mean_ms": statistics.mean(latencies),
+        "p50_ms": latencies[len(latencies) // 2],
+        "p95_ms": latencies[max(0, int(len(latencies) * 0.95) - 1)],
+        "max_ms": latencies[-1],
+        "peak_allocated_kib": statistics.mean(peaks) / 1024 if peaks else None,
+        "retained_kib": statistics.mean(retained) / 1024 if retained else None,
+    }
+
+
+@contextmanager
+def rdbms(args: argparse.Namespace) -> Generator[Dict[str, Any], None, None]:
+    """
+    Provides the settings of the RDBMS to benchmark against, as overrides of the rdbms section of config.yaml.
+    """
+    if args.rdbms == "config":
+        yield {"database": args.database}
+        return
+
+    with local_postgres(find_postgres_bin_dir(args.postgres_bin), os_user=args.postgres_os_user) as (host, port):
+        yield {"host": host, "port": port, "username": "postgres", "password": "", "database": args.database}
+
+
+def prepare_database(container: ApplicationContainer) -> Database:
+    rdbms = container.config.rdbms
+    url = f"postgresql://{rdbms.username()}:{rdbms.password()}@{rdbms.host()}:{rdbms.port()}/{rdbms.database()}"
+    if database_exists(url):
+        drop_database(url)
+
+    db = container.db()
+    alembic_cfg = Config("alembic.ini")
+    alembic_cfg.set_main_option("sqlalchemy.url", db.url)
+    command.upgrade(alembic_cfg, "head")
+    return db
+
+
+def run_size(args: argparse.Namespace, rdbms_settings: Dict[str, Any], rows: int) -> Dict[str, Any]:
+    container = ApplicationContainer()
+    container.config.rdbms.from_dict({**container.config.rdbms(), **rdbms_settings, "echo": False})
+    store = InMemoryMinIOObjectStore(
+        host="localhost", port="9000", access_key="benchmark", secret_key="benchmark", region="us-east-1"
+    )
+    container.storage.override(providers.Object(store))
+
+    db = prepare_database(container)
+    start = time.perf_counter()
+    dataset = seed(db, rows)
+    upload_sampled_objects(store, dataset)
+    seed_seconds = time.perf_counter() - start
+
+    # The async features all run on the same event loop, like under uvicorn
+    loop = asyncio.new_event_loop()
+    results: Dict[str, Any] = {"rows": rows, "seed_seconds": seed_seconds, "features": {}}
+    try:
+        for name, operation in operations(container, dataset, loop).items():
+            if args.features and name not in args.features:
+                continue
+            results["features"][name] = measure(operation, args.seconds, args.max_operations, args.allocation_samples)
+            print(f"{rows:>9} rows  {name:<36} {results['features'][name]['ops_per_second']:10.1f} ops/s", flush=True)
+    finally:
+        loop.run_until_complete(container.async_db().dispose())
+        loop.close()
+        db.engine.dispose()
+    return results
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], check=True, capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="100,10000,1000000", help="Comma-separated numbers of rows to seed.")
+    parser.add_argument("--features", default="", help="Comma-separated features to run. Defaults to all of them.")
+    parser.add_argument("--seconds", type=float, default=5.0, help="How long each feature is called for, per size.")
+    parser.add_argument("--max-operations", type=int, default=10_000, help="Maximum number of timed calls per feature.")
+    parser.add_argument("--allocation-samples", type=int, default=5, help="Number of calls traced by tracemalloc.")
+    parser.add_argument("--rdbms", choices=("local", "config"), default="local", help="Where to run the RDBMS.")
+    parser.add_argument("--postgres-bin", default=None, help="Directory of the initdb and pg_ctl binaries.")
+    parser.add_argument("--postgres-os-user", default=None, help="System user to run PostgreSQL as, if root.")
+    parser.add_argument("--database", default="kp-benchmark", help="Name of the scratch database.")
+    parser.add_argument("--output", default=None, help="Write the results to this JSON file too.")
+    args = parser.parse_args()
+    args.features = [feature.strip() for feature in args.features.split(",") if feature.strip()]
+
+    results: Dict[str, Any] = {
+        "benchmark": "features",
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "rdbms": args.rdbms,
+        "seconds_per_feature": args.seconds,
+        "sizes": [],
+    }
+    with rdbms(args) as rdbms_settings:
+        for rows in [int(size) for size in args.sizes.split(",")]:
+            results["sizes"].append(run_size(args, rdbms_settings, rows))
+
+    print(json.dumps(results, indent=2))
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Benchmark of encoding the view model of a large conversation into the body of a JSON response.
+
+It builds the view model of conversations of increasing length (no RDBMS is involved), then measures the time and the
+peak memory (with tracemalloc, in a separate pass) of encoding it:
+
+- response_model: what FastAPI does for the routes annotated with their view model, i.e. validating the view model
+  again against the response model, converting it to Python primitives, then encoding them with json.dumps;
+- jsonable_encoder: what FastAPI does for the routes without a response model;
+- pydantic: the PydanticJSONResponse of the features with `fast_json_response`, which encodes the view model straight
+  to bytes with pydantic-core.
+
+Usage, from the root of the project:
+
+    python -m benchmarks.json_responses --messages 1000,10000
+"""
+import argparse
+import asyncio
+from datetime import datetime, timezone
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from benchmarks.features import git_commit
+from lib.core.entity.models import AgentMessage, MessageBase, MessageContent, MessageContentTypeEnum, UserMessage
+from lib.core.sdk.fastapi import PydanticJSONResponse
+from lib.core.view_model.list_messages_view_model import ListMessagesViewModel
+
+
+def conversation_view_model(messages: int, content_length: int) -> ListMessagesViewModel:
+    now = datetime.now(timezone.utc)
+    message_list: List[MessageBase] = []
+    for i in range(messages):
+        message_class = UserMessage if i % 2 == 0 else AgentMessage
+        message_list.append(
+            message_class(
+                created_at=now,
+                updated_at=now,
+                deleted=False,
+                deleted_at=None,
+                id=i,
+                thread_id=i // 2,
+                sender="benchmark",
+                message_contents=[
+                    MessageContent(
+                        created_at=now,
+                        updated_at=now,
+                        deleted=False,
+                        deleted_at=None,
+                        id=i,
+                        content="x" * content_length,
+                        content_type=MessageContentTypeEnum.TEXT,
+                    )
+                ],
+            )
+        )
+    return ListMessagesViewModel(status=True, code=200, message_list=message_list)
+
+
+def response_model_encoder() -> Callable[[ListMessagesViewModel], bytes]:
+    def endpoint() -> ListMessagesViewModel | None:
+        return None
+
+    route = APIRoute("/conversations/{id}/message", endpoint)
+
+    def encode(view_model: ListMessagesViewModel) -> bytes:
+        content = asyncio.run(serialize_response(field=route.response_field, response_content=view_model))
+        return JSONResponse(content).body
+
+    return encode
+
+
+def measure(encode: Callable[[], bytes], samples: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        encode()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    try:
+        encode()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "mean_ms": statistics.mean(latencies),
+        "p50_ms": latencies[len(latencies) // 2],
+        "min_ms": latencies[0],
+        "peak_memory_mb": peak / 1024 / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", default="1000,10000", help="Comma-separated conversation lengths.")
+    parser.add_argument("--content-length", type=int, default=500, help="Number of characters of each message.")
+    parser.add_argument("--samples", type=int, default=5, help="Number of timed encodings per encoder and length.")
+    parser.add_argument("--output", default=None, help="Write the results to this JSON file too.")
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = {
+        "benchmark": "json_responses",
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "content_length": args.content_length,
+        "samples": args.samples,
+        "lengths": [],
+    }
+    encode_with_response_model = response_model_encoder()
+    for messages in [int(length) for length in args.messages.split(",")]:
+        view_model = conversation_view_model(messages, args.content_length)
+        encoders: Dict[str, Callable[[], bytes]] = {
+            "response_model": lambda: encode_with_response_model(view_model),
+            "jsonable_encoder": lambda: JSONResponse(jsonable_encoder(view_model)).body,
+            "pydantic": lambda: PydanticJSONResponse(view_model).body,
+        }
+        assert encoders["pydantic"]() == encoders["response_model"]()
+
+        length: Dict[str, Any] = {"messages": messages, "body_mb": len(encoders["pydantic"]()) / 1024 / 1024}
+        for name, encode in encoders.items():
+            length[name] = measure(encode, args.samples)
+            print(
+                f"{messages:>7} messages  {name:<17} {length[name]['p50_ms']:9.1f} ms "
+                f"{length[name]['peak_memory_mb']:8.1f} MB peak",
+                flush=True,
+            )
+        results["lengths"].append(length)
+
+    print(json.dumps(results, indent=2))
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Local stand-ins for the services of Kernel Planckster, so that the benchmarks can run without Docker:
+
+- LocalPostgres spawns a throwaway PostgreSQL server from the binaries of a local installation, listening on a free
+  port of the loopback interface, and deletes it when done;
+- InMemoryMinIOObjectStore is a MinIOObjectStore whose client keeps buckets and objects in memory, so that the logic of
+  the store (caches, presigning) is measured, but not the network.
+"""
+from contextlib import contextmanager
+from datetime import datetime, timezone
+import os
+from pathlib import Path
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+from typing import Any, Dict, Generator, Iterator, List, Set, Tuple
+
+from minio import Minio
+from minio.datatypes import Bucket, Object
+from minio.error import S3Error
+
+from lib.infrastructure.repository.minio.minio_object_store import MinIOObjectStore
+
+
+def _free_port(host: str) -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        port: int = sock.getsockname()[1]
+        return port
+
+
+def find_postgres_bin_dir(bin_dir: str | None = None) -> Path:
+    """
+    Finds the directory holding the initdb and pg_ctl binaries: the given one, else the one on the PATH, else the one bundled with the pgserver package if it is installed.
+
+    @raises FileNotFoundError: If no PostgreSQL installation could be found.
+    """
+    candidates: List[Path] = []
+    if bin_dir is not None:
+        candidates.append(Path(bin_dir))
+    pg_ctl = shutil.which("pg_ctl")
+    if pg_ctl is not None:
+        candidates.append(Path(pg_ctl).parent)
+    try:
+        import pgserver
+
+        candidates.append(Path(pgserver.__file__).parent / "pginstall" / "bin")
+    except ImportError:
+        pass
+
+    for candidate in candidates:
+        if (candidate / "initdb").exists() and (candidate / "pg_ctl").exists():
+            return candidate
+    raise FileNotFoundError(
+        "Could not find the initdb and pg_ctl binaries of PostgreSQL: install PostgreSQL, or pass --postgres-bin"
+    )
+
+
+@contextmanager
+def local_postgres(
+    bin_dir: Path, os_user: str | None = None, db_user: str = "postgres"
+) -> Generator[Tuple[str, int], None, None]:
+    """
+    Runs a throwaway PostgreSQL server, with trust authentication, for the duration of the context.
+
+    @param bin_dir: The directory holding the initdb and pg_ctl binaries.
+    @type bin_dir: Path
+    @param os_user: The operating system user to run the server as. PostgreSQL refuses to run as root, so it is required when running as root.
+    @type os_user: str | None
+    @param db_user: The name of the superuser of the server.
+    @type db_user: str
+    @return: The host and port the server listens on.
+    @rtype: Tuple[str, int]
+    """
+    if os_user is None and hasattr(os, "geteuid") and os.geteuid() == 0:
+        raise PermissionError("PostgreSQL cannot run as root: pass --postgres-os-user to run it as another user")
+
+    host = "127.0.0.1"
+    port = _free_port(host)
+    root = Path(tempfile.mkdtemp(prefix="kp-benchmark-pg-"))
+    data_dir = root / "data"
+    if os_user is not None:
+        shutil.chown(root, user=os_user)
+
+    def run(*args: str) -> None:
+        subprocess.run(args, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, user=os_user)
+
+    try:
+        run(str(bin_dir / "initdb"), "-D", str(data_dir), "-U", db_user, "--auth=trust", "--encoding=utf8")
+        run(
+            str(bin_dir / "pg_ctl"),
+            "-D",
+            str(data_dir),
+            "-o",
+            f"-h {host} -p {port} -k {root}",
+            "-l",
+            str(root / "postgres.log"),
+            "-w",
+            "start",
+        )
+        try:
+            yield host, port
+        finally:
+            run(str(bin_dir / "pg_ctl"), "-D", str(data_dir), "-m", "fast", "-w", "stop")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+class InMemoryMinio(Minio):
+    """
+    A MinIO client that keeps its buckets and objects in memory. Only the calls made by MinIOObjectStore are supported.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._buckets: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def _not_found(self, code: str, bucket_name: str, object_name: str | None = None) -> S3Error:
+        return S3Error(code, code, f"/{bucket_name}/{object_name or ''}", "", "", None, bucket_name, object_name)  # type: ignore
+
+    def list_buckets(self) -> List[Bucket]:
+        with self._lock:
+            return [Bucket(name, datetime.now(timezone.utc)) for name in self._buckets]
+
+    def bucket_exists(self, bucket_name: str) -> bool:
+        with self._lock:
+            return bucket_name in self._buckets
+
+    def make_bucket(self, bucket_name: str, *args: Any, **kwargs: Any) -> None:
+        with self._lock:
+            self._buckets.setdefault(bucket_name, set())
+
+    def put_object(self, bucket_name: str, object_name: str, *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            if bucket_name not in self._buckets:
+                raise self._not_found("NoSuchBucket", bucket_name)
+            self._buckets[bucket_name].add(object_name)
+
+    def stat_object(self, bucket_name: str, object_name: str, *args: Any, **kwargs: Any) -> Object:
+        with self._lock:
+            objects = self._buckets.get(bucket_name)
+            if objects is None:
+                raise self._not_found("NoSuchBucket", bucket_name, object_name)
+            if object_name not in objects:
+                raise self._not_found("NoSuchKey", bucket_name, object_name)
+        return Object(bucket_name, object_name)
+
+    def list_objects(self, bucket_name: str, *args: Any, **kwargs: Any) -> Iterator[Object]:
+        with self._lock:
+            objects = self._buckets.get(bucket_name)
+            if objects is None:
+                raise self._not_found("NoSuchBucket", bucket_name)
+            names = sorted(objects)
+        return iter([Object(bucket_name, name) for name in names])
+
+
+class InMemoryMinIOObjectStore(MinIOObjectStore):
+    """
+    A MinIOObjectStore backed by an InMemoryMinio client, which never calls out to an object store.
+    """
+
+    def _get_client(self) -> Minio:
+        return InMemoryMinio(
+            self.url,
+            access_key=self._access_key,
+            secret_key=self._secret_key,
+            secure=self._secure,
+            cert_check=self._cert_check,
+            region=self._region,
+        )
@@ -0,0 +1,217 @@
+"""
+Benchmark of the message hot paths with and without the foreign key indexes added in alembic revision cfae9b1bff49.
+
+It seeds a scratch database with a large number of messages spread over many conversations, then measures the latency
+of listing a page of messages and of posting a new message through the SQLA conversation repository. The measurements
+are taken once with the indexes in place, and once more after dropping them.
+
+Usage, from the root of the project and with the RDBMS of config.yaml reachable:
+
+    python -m benchmarks.message_indexes --messages 1000000
+
+The scratch database ('kp-benchmark' by default) is dropped and recreated on every run.
+"""
+import argparse
+import json
+import random
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import text
+from sqlalchemy_utils.functions import database_exists, drop_database
+
+from lib.core.dto.conversation_repository_dto import ListConversationMessagesDTO
+from lib.core.entity.models import BaseMessageContent, MessageBase, MessageContentTypeEnum, MessageSenderTypeEnum
+from lib.infrastructure.config.containers import ApplicationContainer
+from lib.infrastructure.repository.sqla.database import Database
+from lib.infrastructure.repository.sqla.sqla_conversation_repository import SQLAConversationRepository
+from lib.infrastructure.repository.sqla.unit_of_work import SQLAUnitOfWork
+
+FOREIGN_KEY_INDEXES = [
+    "ix_message_base_conversation_id_thread_id",
+    "ix_message_base_conversation_id_created_at_id",
+    "ix_message_content_message_id",
+    "ix_citation_agent_message_id",
+    "ix_citation_source_data_id",
+    "ix_conversation_research_context_id",
+    "ix_research_context_client_id",
+    "ix_source_data_research_context_association_source_data_id",
+    "ix_source_data_research_context_association_research_context_id",
+]
+
+
+def seed(db: Database, messages: int, conversations: int) -> List[int]:
+    """
+    Seeds one client, LLM and research context, and the given number of conversations and messages, each message with one piece of text content.
+
+    @return: The IDs of the seeded conversations.
+    """
+    with db.engine.begin() as connection:
+        client_id = connection.execute(
+            text(
+                "INSERT INTO client (sub, deleted, created_at, updated_at) "
+                "VALUES ('benchmark-client', false, now(), now()) RETURNING id"
+            )
+        ).scalar_one()
+        llm_id = connection.execute(
+            text(
+                "INSERT INTO llm (llm_name, deleted, created_at, updated_at) "
+                "VALUES ('benchmark-llm', false, now(), now()) RETURNING id"
+            )
+        ).scalar_one()
+        research_context_id = connection.execute(
+            text(
+                "INSERT INTO research_context "
+                "(title, description, client_id, llm_id, external_id, deleted, created_at, updated_at) "
+                "VALUES ('benchmark', 'benchmark', :client_id, :llm_id, 'benchmark', false, now(), now()) RETURNING id"
+            ),
+            {"client_id": client_id, "llm_id": llm_id},
+        ).scalar_one()
+        conversation_ids: List[int] = list(
+            connection.execute(
+                text(
+                    "INSERT INTO conversation (title, research_context_id, deleted, created_at, updated_at) "
+                    "SELECT 'conversation-' || g, :research_context_id, false, now(), now() "
+                    "FROM generate_series(1, :conversations) g RETURNING id"
+                ),
+                {"research_context_id": research_context_id, "conversations": conversations},
+            ).scalars()
+        )
+
+        # Messages alternate between user and agent, and are spread round-robin over the conversations
+        connection.execute(
+            text(
+                "INSERT INTO message_base (type, conversation_id, thread_id, deleted, created_at, updated_at) "
+                "SELECT CASE WHEN g % 2 = 0 THEN 'agent_message' ELSE 'user_message' END, "
+                ":first_conversation_id + g % :conversations, g / 2, false, "
+                "now() - make_interval(secs => :messages - g), now() - make_interval(secs => :messages - g) "
+                "FROM generate_series(1, :messages) g"
+            ),
+            {"first_conversation_id": min(conversation_ids), "conversations": conversations, "messages": messages},
+        )
+        connection.execute(
+            text("INSERT INTO user_message (id) SELECT id FROM message_base WHERE type = 'user_message'")
+        )
+        connection.execute(
+            text("INSERT INTO agent_message (id) SELECT id FROM message_base WHERE type = 'agent_message'")
+        )
+        connection.execute(
+            text(
+                "INSERT INTO message_content (content, content_type, message_id, deleted, created_at, updated_at) "
+                "SELECT 'benchmark message ' || id, 'TEXT', id, false, created_at, updated_at FROM message_base"
+            )
+        )
+
+    analyze(db)
+    return conversation_ids
+
+
+def analyze(db: Database) -> None:
+    with db.engine.connect() as connection:
+        connection.execution_options(isolation_level="AUTOCOMMIT").execute(text("ANALYZE"))
+
+
+def drop_foreign_key_indexes(db: Database) -> None:
+    with db.engine.begin() as connection:
+        for index in FOREIGN_KEY_INDEXES:
+            connection.execute(text(f"DROP INDEX IF EXISTS {index}"))
+    analyze(db)
+
+
+def measure(operation: Callable[[], Any], samples: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        operation()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    latencies.sort()
+    return {
+        "mean_ms": statistics.mean(latencies),
+        "p50_ms": latencies[len(latencies) // 2],
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+        "max_ms": latencies[-1],
+    }
+
+
+def run(
+    repository: SQLAConversationRepository, unit_of_work: SQLAUnitOfWork, conversation_ids: List[int], samples: int
+) -> Dict[str, Any]:
+    # Each call runs in its own unit of work, like an API request does
+    def list_messages() -> None:
+        with unit_of_work.begin():
+            dto: ListConversationMessagesDTO[MessageBase] = repository.list_conversation_messages(
+                conversation_id=random.choice(conversation_ids), limit=50
+            )
+        assert dto.status, dto.errorMessage
+
+    def new_message() -> None:
+        with unit_of_work.begin():
+            dto = repository.new_message(
+                conversation_id=random.choice(conversation_ids),
+                message_contents=[
+                    BaseMessageContent(content="benchmark message", content_type=MessageContentTypeEnum.TEXT)
+                ],
+                sender_type=MessageSenderTypeEnum.USER,
+            )
+        assert dto.status, dto.errorMessage
+
+    return {
+        "list_conversation_messages": measure(list_messages, samples),
+        "new_message": measure(new_message, samples),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=1_000_000, help="Number of messages to seed.")
+    parser.add_argument("--conversations", type=int, default=10_000, help="Number of conversations to seed.")
+    parser.add_argument("--samples", type=int, default=200, help="Number of timed calls per operation.")
+    parser.add_argument("--database", default="kp-benchmark", help="Name of the scratch database.")
+    parser.add_argument("--output", default=None, help="Write the results to this JSON file too.")
+    args = parser.parse_args()
+
+    container = ApplicationContainer()
+    container.config.rdbms.database.from_value(args.database)
+    rdbms = container.config.rdbms
+    url = f"postgresql://{rdbms.username()}:{rdbms.password()}@{rdbms.host()}:{rdbms.port()}/{args.database}"
+    if database_exists(url):
+        drop_database(url)
+
+    db = container.db()
+    db.engine.echo = False
+
+    alembic_cfg = Config("alembic.ini")
+    alembic_cfg.set_main_option("sqlalchemy.url", db.url)
+    command.upgrade(alembic_cfg, "head")
+
+    start = time.perf_counter()
+    conversation_ids = seed(db, messages=args.messages, conversations=args.conversations)
+    seed_seconds = time.perf_counter() - start
+
+    repository = container.sqla_conversation_repository()
+    unit_of_work = container.unit_of_work()
+    with_indexes = run(repository, unit_of_work, conversation_ids, args.samples)
+    drop_foreign_key_indexes(db)
+    without_indexes = run(repository, unit_of_work, conversation_ids, args.samples)
+
+    results = {
+        "benchmark": "message_indexes",
+        "messages": args.messages,
+        "conversations": args.conversations,
+        "samples": args.samples,
+        "seed_seconds": seed_seconds,
+        "before": without_indexes,
+        "after": with_indexes,
+    }
+    print(json.dumps(results, indent=2))
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark of MinIOObjectStore.object_exists against a bucket holding a large number of objects.
+
+It fills a scratch bucket with empty objects, then measures the latency of checking the existence of random objects
+(half of them present, half missing) in three ways: by listing the whole bucket, as object_exists used to do, with a
+HEAD request on the object, and with the HEAD request answered from the cache of the store.
+
+Usage, from the root of the project and with the object store of config.yaml reachable (MinIO, or any S3 stand-in):
+
+    python -m benchmarks.object_exists --objects 100000
+
+The scratch bucket ('kp-benchmark' by default) is reused across runs, and only filled up to the requested size.
+"""
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import io
+import json
+import random
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+from lib.infrastructure.config.containers import ApplicationContainer
+from lib.infrastructure.repository.minio.minio_object_store import MinIOObjectStore
+from lib.infrastructure.repository.minio.models import MinIOObject
+
+
+def object_name(index: int) -> str:
+    return f"benchmark/{index // 1000:04d}/object-{index:07d}.txt"
+
+
+def seed(store: MinIOObjectStore, bucket_name: str, objects: int, workers: int) -> None:
+    store.create_bucket_if_not_exists(bucket_name)
+    existing = {obj.object_name for obj in store.client.list_objects(bucket_name, recursive=True)}
+
+    def put(index: int) -> None:
+        name = object_name(index)
+        if name not in existing:
+            store.client.put_object(bucket_name, name, io.BytesIO(b""), 0)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(put, range(objects)))
+
+
+def measure(operation: Callable[[], Any], samples: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        operation()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    latencies.sort()
+    return {
+        "mean_ms": statistics.mean(latencies),
+        "p50_ms": latencies[len(latencies) // 2],
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+        "max_ms": latencies[-1],
+    }
+
+
+def run(store: MinIOObjectStore, bucket_name: str, objects: int, samples: int, list_samples: int) -> Dict[str, Any]:
+    # Half of the checks are for objects past the end of the bucket, which do not exist
+    def random_object() -> MinIOObject:
+        index = random.randrange(objects) if random.random() < 0.5 else objects + random.randrange(objects)
+        return MinIOObject(bucket_name=bucket_name, object_name=object_name(index))
+
+    def list_bucket() -> None:
+        minio_object = random_object()
+        minio_object in store.list_objects(minio_object.bucket_name)
+
+    def head_object() -> None:
+        store._object_cache.clear()
+        store.object_exists(random_object())
+
+    cached_objects = [random_object() for _ in range(100)]
+    for minio_object in cached_objects:
+        store.object_exists(minio_object)
+
+    def cached_head_object() -> None:
+        store.object_exists(random.choice(cached_objects))
+
+    return {
+        "list_objects": measure(list_bucket, list_samples),
+        "stat_object": measure(head_object, samples),
+        "stat_object_cached": measure(cached_head_object, samples),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--objects", type=int, default=100_000, help="Number of objects in the bucket.")
+    parser.add_argument("--samples", type=int, default=500, help="Number of timed checks with a HEAD request.")
+    parser.add_argument("--list-samples", type=int, default=5, help="Number of timed checks listing the bucket.")
+    parser.add_argument("--workers", type=int, default=32, help="Number of concurrent uploads when seeding.")
+    parser.add_argument("--bucket", default="kp-benchmark", help="Name of the scratch bucket.")
+    parser.add_argument("--output", default=None, help="Write the results to this JSON file too.")
+    args = parser.parse_args()
+
+    container = ApplicationContainer()
+    store = container.storage()
+    bucket_name = store.process_bucket_name(args.bucket)
+
+    start = time.perf_counter()
+    seed(store, bucket_name, objects=args.objects, workers=args.workers)
+    seed_seconds = time.perf_counter() - start
+
+    results = {
+        "benchmark": "object_exists",
+        "objects": args.objects,
+        "samples": args.samples,
+        "list_samples": args.list_samples,
+        "seed_seconds": seed_seconds,
+        **run(store, bucket_name, args.objects, args.samples, args.list_samples),
+    }
+    print(json.dumps(results, indent=2))
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Micro-benchmark of the generation of presigned URLs for uploads and downloads.
+
+It measures the throughput, in URLs per second on a single thread, of three ways of presigning a URL:
+
+- a new MinIO client per URL with no pinned region, as happened when the object store was built per request: the
+  client first asks the object store for the region of the bucket;
+- a shared MinIO client with a pinned region, which derives the signing key again for every URL;
+- the SigV4Presigner of the object store, which caches the signing key for the day and makes no outbound call.
+
+Usage, from the root of the project and with the object store of config.yaml reachable:
+
+    python -m benchmarks.presigned_urls --urls 20000
+"""
+import argparse
+from datetime import timedelta
+import json
+import time
+from typing import Any, Callable, Dict
+
+from minio import Minio
+
+from lib.infrastructure.config.containers import ApplicationContainer
+
+
+def throughput(operation: Callable[[int], Any], urls: int) -> Dict[str, float]:
+    start = time.perf_counter()
+    for index in range(urls):
+        operation(index)
+    seconds = time.perf_counter() - start
+    return {"urls": urls, "seconds": seconds, "urls_per_second": urls / seconds}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--urls", type=int, default=20_000, help="Number of URLs presigned without outbound calls.")
+    parser.add_argument(
+        "--client-per-url", type=int, default=200, help="Number of URLs presigned with a new client each."
+    )
+    parser.add_argument("--bucket", default="kp-benchmark", help="Name of the bucket the URLs point to.")
+    parser.add_argument("--output", default=None, help="Write the results to this JSON file too.")
+    args = parser.parse_args()
+
+    container = ApplicationContainer()
+    store = container.storage()
+    bucket_name = store.process_bucket_name(args.bucket)
+    store.create_bucket_if_not_exists(bucket_name)
+    expires = timedelta(minutes=store.signed_url_expiry)
+
+    def object_name(index: int) -> str:
+        return f"benchmark/object-{index:07d}.txt"
+
+    def new_client_per_url(index: int) -> None:
+        client = Minio(
+            store.url,
+            access_key=store._access_key,
+            secret_key=store._secret_key,
+            secure=store._secure,
+            cert_check=store._cert_check,
+        )
+        client.presigned_put_object(bucket_name, object_name(index), expires=expires)
+
+    def shared_client(index: int) -> None:
+        store.client.presigned_put_object(bucket_name, object_name(index), expires=expires)
+
+    def presigner(index: int) -> None:
+        store._presigner.presign("PUT", bucket_name, object_name(index), expires)
+
+    results = {
+        "benchmark": "presigned_urls",
+        "minio_client_per_url": throughput(new_client_per_url, args.client_per_url),
+        "minio_client_pinned_region": throughput(shared_client, args.urls),
+        "sigv4_presigner": throughput(presigner, args.urls),
+    }
+    print(json.dumps(results, indent=2))
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from typing import List
-from lib.core.entity.models import LLM, ResearchContext, Client, SourceData
+from lib.core.entity.models import LLM, BaseKernelPlancksterModel, ResearchContext, Client, SourceData
 from lib.core.sdk.dto import BaseDTO
 
 
@@ -47,12 +47,26 @@ class NewSourceDataDTO(BaseDTO[SourceData]):
     data: SourceData | None = None
 
 
+class ListOwnedSourceDataIdsDTO(BaseDTO[BaseKernelPlancksterModel]):
+    """
+    A DTO for whenever the ownership of source data by a client is checked
+
+    @param source_data_ids: The IDs, among the checked ones, of the source data owned by the client
+    @type source_data_ids: List[int]
+    """
+
+    source_data_ids: List[int] = []
+
+
 class ListSourceDataDTO(BaseDTO[SourceData]):
     """
     A DTO for whenever source data is listed
 
     @param data: The source data
     @type data: List[SourceData]
+    @param next_cursor: The cursor to get the page after this one, if there is one
+    @type next_cursor: str | None
     """
 
     data: List[SourceData] = []
+    next_cursor: str | None = None
@@ -1,10 +1,14 @@
-from typing import List
+from typing import AsyncIterable, Dict, Iterable, List
+
+from pydantic import ConfigDict
 
 from lib.core.sdk.dto import BaseDTO
 from lib.core.entity.models import (
     AgentMessage,
+    BaseKernelPlancksterModel,
     Conversation,
     MessageBase,
+    MessageSearchResult,
     ResearchContext,
     SourceData,
     TMessageBase,
@@ -41,9 +45,28 @@ class ListConversationMessagesDTO(BaseDTO[TMessageBase]):
 
     @param data: The messages of the conversation
     @type data: List[TMessageBase] | List[None] | None
+    @param next_cursor: The cursor to get the page after this one, if there is one
+    @type next_cursor: str | None
+    @param previous_cursor: The cursor to get the page before this one, if there is one
+    @type previous_cursor: str | None
     """
 
     data: List[TMessageBase] | None = None
+    next_cursor: str | None = None
+    previous_cursor: str | None = None
+
+
+class StreamConversationMessagesDTO(BaseDTO[MessageBase]):
+    """
+    DTO for streaming the messages of a conversation, instead of loading all of them in memory at once
+
+    @param data: A lazy iterator over the messages of the conversation, fetching them from the database in batches. Async repositories return an async iterator.
+    @type data: Iterable[MessageBase] | AsyncIterable[MessageBase] | None
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    data: Iterable[MessageBase] | AsyncIterable[MessageBase] | None = None  # type: ignore
 
 
 class UpdateConversationDTO(BaseDTO[Conversation]):
@@ -65,9 +88,29 @@ class ListConversationSourcesDTO(BaseDTO[SourceData]):
 
     @param data: The source data of the citations of all of the message responses of the conversation
     @type data: List[SourceData] | None
+    @param citation_counts: The number of citations of each source data in the conversation, by source data ID, if requested
+    @type citation_counts: Dict[int, int] | None
+    @param next_cursor: The cursor to get the page after this one, if there is one
+    @type next_cursor: str | None
     """
 
     data: List[SourceData] | None = None
+    citation_counts: Dict[int, int] | None = None
+    next_cursor: str | None = None
+
+
+class SearchMessagesDTO(BaseDTO[BaseKernelPlancksterModel]):
+    """
+    A DTO for searching the messages of a client
+
+    @param search_results: The messages matching the search, best matches first
+    @type search_results: List[MessageSearchResult] | None
+    @param next_cursor: The cursor to get the page after this one, if there is one
+    @type next_cursor: str | None
+    """
+
+    search_results: List[MessageSearchResult] | None = None
+    next_cursor: str | None = None
 
 
 class NewMessageDTO(BaseDTO[MessageBase]):
@@ -81,6 +124,17 @@ class NewMessageDTO(BaseDTO[MessageBase]):
     data: UserMessage | AgentMessage | None = None
 
 
+class NewMessagesDTO(BaseDTO[MessageBase]):
+    """
+    A DTO for adding a batch of messages to a conversation
+
+    @param message_ids: The IDs assigned to the new messages, in the order they were given
+    @type message_ids: List[int] | None
+    """
+
+    message_ids: List[int] | None = None
+
+
 class NewMessageContentDTO(BaseDTO[MessageContent]):
     """
     A DTO for adding a piece of content to a message
@@ -1,3 +1,4 @@
+from typing import Dict
 from lib.core.entity.models import ProtocolEnum, SourceData
 from lib.core.sdk.dto import BaseDTO
 
@@ -27,6 +28,17 @@ class GetClientDataForUploadDTO(BaseDTO):  # type: ignore
     credentials: str | None = None
 
 
+class GetClientDataForUploadBatchDTO(BaseDTO):  # type: ignore
+    """
+    A DTO for whenever a client wants to upload several files at once via public uploads.
+
+    @param credentials: The credentials to handle each file, by relative path. For example, the signed URL, key, auth token, etc.
+    @type credentials: Dict[str, str]
+    """
+
+    credentials: Dict[str, str] | None = None
+
+
 class GetClientDataForDownloadDTO(BaseDTO):  # type: ignore
     """
     A DTO for whenever source data is downloaded by the client.
@@ -40,6 +52,17 @@ class GetClientDataForDownloadDTO(BaseDTO):  # type: ignore
     credentials: str | None = None
 
 
+class GetClientDataForDownloadBatchDTO(BaseDTO):  # type: ignore
+    """
+    A DTO for whenever several source data are downloaded at once by the client.
+
+    @param credentials: The credentials to handle each file, by relative path. For example, the signed URL, key, auth token, etc.
+    @type credentials: Dict[str, str]
+    """
+
+    credentials: Dict[str, str] | None = None
+
+
 class SourceDataCompositeIndexExistsAsFileDTO(BaseDTO):  # type: ignore
     """
     A DTO for whenever the existence of a SourceData as an actual file is asserted.
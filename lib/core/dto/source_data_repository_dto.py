@@ -1,3 +1,4 @@
+from typing import List
 from lib.core.entity.models import SourceData
 from lib.core.sdk.dto import BaseDTO
 
@@ -8,3 +9,14 @@ class GetSourceDataByProtocolRelativePathDTO(BaseDTO[SourceData]):
     """
 
     data: SourceData | None = None
+
+
+class GetSourceDataByCompositeIndexesDTO(BaseDTO[SourceData]):
+    """
+    A DTO for whenever several source data are retrieved at once by protocol and relative path
+
+    @param data: The source data found. Composite indexes with no source data are left out.
+    @type data: List[SourceData] | None
+    """
+
+    data: List[SourceData] | None = None
@@ -2,7 +2,7 @@ from enum import Enum
 import os
 import re
 from pydantic import BaseModel, field_validator, model_validator
-from typing import TypeVar, List, Optional
+from typing import Any, Type, TypeVar, List, Optional
 from datetime import datetime
 
 
@@ -36,6 +36,9 @@ class SourceDataStatusEnum(Enum):
     INCONSISTENT_DATASET = "inconsistent_dataset"
 
 
+TKernelPlancksterModel = TypeVar("TKernelPlancksterModel", bound="BaseKernelPlancksterModel")
+
+
 class BaseKernelPlancksterModel(BaseModel):
     """
     Base class for all models in the project
@@ -53,6 +56,16 @@ class BaseKernelPlancksterModel(BaseModel):
         """
         return cls.model_dump_json()
 
+    @classmethod
+    def from_trusted(cls: Type[TKernelPlancksterModel], **fields: Any) -> TKernelPlancksterModel:
+        """
+        Builds the model from fields that are already valid, e.g. read from our own database, without running the validators: the data is validated once, when it enters through the API.
+        The fields are taken as they are, so they must already have the types of the model. It only pays off for the models with validators written in Python, like SourceData: pydantic validates the others faster than it constructs them.
+        Wrapper around pydantic's model_construct method: in case they decide to deprecate it, we only refactor here.
+        """
+        # Through BaseModel, whose model_construct keeps the type of the subclass it is called on
+        return super().model_construct(**fields)
+
     def __str__(self) -> str:
         return self.to_json()
 
@@ -196,6 +209,20 @@ class SourceData(BaseSoftDeleteKernelPlancksterModel):
         return values
 
 
+class SourceDataCompositeIndex(BaseModel):
+    """
+    Identifies a file of a client by the composite index of its source data
+
+    @param protocol: the protocol used to store the file
+    @type protocol: ProtocolEnum
+    @param relative_path: the relative path of the file
+    @type relative_path: str
+    """
+
+    protocol: ProtocolEnum
+    relative_path: str
+
+
 class EmbeddingModel(BaseSoftDeleteKernelPlancksterModel):
     """
     An embedding model is a model that can be used to embed a vector storde associated with a research context (including its source data), into a vector space
@@ -350,6 +377,66 @@ class AgentMessage(MessageBase):
     sender_type: MessageSenderTypeEnum = MessageSenderTypeEnum.AGENT
 
 
+class BaseCitation(BaseModel):
+    """
+    Represents a citation to be attached to a new agent message.
+
+    @param source_data_id: the ID of the source data cited
+    @type source_data_id: int
+    @param citation_metadata: the position of the citation in the source_data
+    @type citation_metadata: str
+    """
+
+    source_data_id: int
+    citation_metadata: str
+
+
+class BaseMessage(BaseModel):
+    """
+    Represents a message to be added to a conversation, before it gets an ID.
+
+    @param sender_type: the type of the sender of the message
+    @type sender_type: MessageSenderTypeEnum
+    @param message_contents: the content pieces of the message
+    @type message_contents: List[BaseMessageContent]
+    @param thread_id: the ID of the thread of the message; a new thread is started if not given
+    @type thread_id: int | None
+    @param citations: the citations of the message; only agent messages can have citations
+    @type citations: List[BaseCitation]
+    """
+
+    sender_type: MessageSenderTypeEnum
+    message_contents: List[BaseMessageContent]
+    thread_id: int | None = None
+    citations: List[BaseCitation] = []
+
+
+class MessageSearchResult(BaseModel):
+    """
+    Represents a message matching a full-text search, with the best matching piece of its content
+
+    @param message_id: the ID of the message
+    @type message_id: int
+    @param conversation_id: the ID of the conversation of the message
+    @type conversation_id: int
+    @param thread_id: the ID of the thread of the message
+    @type thread_id: int
+    @param sender_type: the type of the sender of the message
+    @type sender_type: MessageSenderTypeEnum
+    @param snippet: an excerpt of the best matching piece of content, with the matching words between <b> and </b>
+    @type snippet: str
+    @param rank: how well the message matches the search; the higher, the better
+    @type rank: float
+    """
+
+    message_id: int
+    conversation_id: int
+    thread_id: int
+    sender_type: MessageSenderTypeEnum
+    snippet: str
+    rank: float
+
+
 class Citation(BaseSoftDeleteKernelPlancksterModel):
     """
     Represents a citation for a part of a source_data, in an agent's response to a user query
@@ -0,0 +1,59 @@
+from abc import abstractmethod
+from lib.core.ports.secondary.client_repository import ClientRepositoryOutputPort
+from lib.core.ports.secondary.file_repository import FileRepositoryOutputPort
+from lib.core.sdk.presenter import BasePresenter
+from lib.core.sdk.usecase import BaseUseCase
+from lib.core.usecase_models.get_client_data_for_upload_batch_usecase_models import (
+    GetClientDataForUploadBatchError,
+    GetClientDataForUploadBatchRequest,
+    GetClientDataForUploadBatchResponse,
+)
+from lib.core.view_model.get_client_data_for_upload_batch_view_model import GetClientDataForUploadBatchViewModel
+
+
+class GetClientDataForUploadBatchInputPort(
+    BaseUseCase[
+        GetClientDataForUploadBatchRequest, GetClientDataForUploadBatchResponse, GetClientDataForUploadBatchError
+    ]
+):
+    def __init__(
+        self,
+        client_repository: ClientRepositoryOutputPort,
+        file_repository: FileRepositoryOutputPort,
+    ) -> None:
+        self._client_repository = client_repository
+        self._file_repository = file_repository
+
+    @property
+    def client_repository(self) -> ClientRepositoryOutputPort:
+        return self._client_repository
+
+    @property
+    def file_repository(self) -> FileRepositoryOutputPort:
+        return self._file_repository
+
+    @abstractmethod
+    def execute(
+        self, request: GetClientDataForUploadBatchRequest
+    ) -> GetClientDataForUploadBatchResponse | GetClientDataForUploadBatchError:
+        raise NotImplementedError("This method must be implemented by the usecase.")
+
+
+class GetClientDataForUploadBatchOutputPort(
+    BasePresenter[
+        GetClientDataForUploadBatchResponse, GetClientDataForUploadBatchError, GetClientDataForUploadBatchViewModel
+    ]
+):
+    @abstractmethod
+    def convert_error_response_to_view_model(
+        self, response: GetClientDataForUploadBatchError
+    ) -> GetClientDataForUploadBatchViewModel:
+        raise NotImplementedError(
+            "You must implement the convert_error_response_to_view_model method in your presenter"
+        )
+
+    @abstractmethod
+    def convert_response_to_view_model(
+        self, response: GetClientDataForUploadBatchResponse
+    ) -> GetClientDataForUploadBatchViewModel:
+        raise NotImplementedError("You must implement the convert_response_to_view_model method in your presenter")
@@ -1,7 +1,7 @@
 from abc import abstractmethod
-from lib.core.ports.secondary.conversation_repository import ConversationRepository
+from lib.core.ports.secondary.conversation_repository import AsyncConversationRepository, ConversationRepository
 from lib.core.sdk.presenter import BasePresenter
-from lib.core.sdk.usecase import BaseUseCase
+from lib.core.sdk.usecase import AsyncBaseUseCase, BaseUseCase
 from lib.core.usecase_models.list_messages_usecase_models import (
     ListMessagesRequest,
     ListMessagesResponse,
@@ -29,6 +29,25 @@ class ListMessagesInputPort(
         raise NotImplementedError("This method must be implemented by the usecase.")
 
 
+class AsyncListMessagesInputPort(
+    AsyncBaseUseCase[
+        ListMessagesRequest,
+        ListMessagesResponse,
+        ListMessagesError,
+    ]
+):
+    def __init__(self, conversation_repository: AsyncConversationRepository) -> None:
+        self._conversation_repository = conversation_repository
+
+    @property
+    def conversation_repository(self) -> AsyncConversationRepository:
+        return self._conversation_repository
+
+    @abstractmethod
+    async def execute(self, request: ListMessagesRequest) -> ListMessagesResponse | ListMessagesError:
+        raise NotImplementedError("This method must be implemented by the usecase.")
+
+
 class ListMessagesOutputPort(
     BasePresenter[
         ListMessagesResponse,
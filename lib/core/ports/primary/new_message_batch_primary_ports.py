@@ -0,0 +1,53 @@
+from abc import abstractmethod
+from lib.core.ports.secondary.conversation_repository import ConversationRepository
+from lib.core.sdk.presenter import BasePresenter
+from lib.core.sdk.usecase import BaseUseCase
+from lib.core.usecase_models.new_message_batch_usecase_models import (
+    NewMessageBatchError,
+    NewMessageBatchRequest,
+    NewMessageBatchResponse,
+)
+from lib.core.view_model.new_message_batch_view_model import NewMessageBatchViewModel
+
+
+class NewMessageBatchInputPort(BaseUseCase[NewMessageBatchRequest, NewMessageBatchResponse, NewMessageBatchError]):
+    def __init__(
+        self,
+        conversation_repository: ConversationRepository,
+    ) -> None:
+        self._conversation_repository = conversation_repository
+
+    @property
+    def conversation_repository(self) -> ConversationRepository:
+        return self._conversation_repository
+
+    @abstractmethod
+    def execute(
+        self,
+        request: NewMessageBatchRequest,
+    ) -> NewMessageBatchResponse | NewMessageBatchError:
+        raise NotImplementedError("This method must be implemented by the usecase.")
+
+
+class NewMessageBatchOutputPort(
+    BasePresenter[
+        NewMessageBatchResponse,
+        NewMessageBatchError,
+        NewMessageBatchViewModel,
+    ]
+):
+    @abstractmethod
+    def convert_error_response_to_view_model(
+        self,
+        response: NewMessageBatchError,
+    ) -> NewMessageBatchViewModel:
+        raise NotImplementedError(
+            "You must implement the convert_error_response_to_view_model method in your presenter"
+        )
+
+    @abstractmethod
+    def convert_response_to_view_model(
+        self,
+        response: NewMessageBatchResponse,
+    ) -> NewMessageBatchViewModel:
+        raise NotImplementedError("You must implement the convert_response_to_view_model method in your presenter")
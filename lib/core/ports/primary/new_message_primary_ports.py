@@ -1,7 +1,7 @@
 from abc import abstractmethod
-from lib.core.ports.secondary.conversation_repository import ConversationRepository
+from lib.core.ports.secondary.conversation_repository import AsyncConversationRepository, ConversationRepository
 from lib.core.sdk.presenter import BasePresenter
-from lib.core.sdk.usecase import BaseUseCase
+from lib.core.sdk.usecase import AsyncBaseUseCase, BaseUseCase
 from lib.core.usecase_models.new_message_usecase_models import NewMessageError, NewMessageRequest, NewMessageResponse
 from lib.core.view_model.new_message_view_model import NewMessageViewModel
 
@@ -25,6 +25,25 @@ class NewMessageInputPort(BaseUseCase[NewMessageRequest, NewMessageResponse, New
         raise NotImplementedError("This method must be implemented by the usecase.")
 
 
+class AsyncNewMessageInputPort(AsyncBaseUseCase[NewMessageRequest, NewMessageResponse, NewMessageError]):
+    def __init__(
+        self,
+        conversation_repository: AsyncConversationRepository,
+    ) -> None:
+        self._conversation_repository = conversation_repository
+
+    @property
+    def conversation_repository(self) -> AsyncConversationRepository:
+        return self._conversation_repository
+
+    @abstractmethod
+    async def execute(
+        self,
+        request: NewMessageRequest,
+    ) -> NewMessageResponse | NewMessageError:
+        raise NotImplementedError("This method must be implemented by the usecase.")
+
+
 class NewMessageOutputPort(
     BasePresenter[
         NewMessageResponse,
@@ -0,0 +1,41 @@
+from abc import abstractmethod
+from lib.core.ports.secondary.conversation_repository import ConversationRepository
+from lib.core.sdk.presenter import BasePresenter
+from lib.core.sdk.usecase import BaseUseCase
+from lib.core.usecase_models.search_messages_usecase_models import (
+    SearchMessagesError,
+    SearchMessagesRequest,
+    SearchMessagesResponse,
+)
+from lib.core.view_model.search_messages_view_model import SearchMessagesViewModel
+
+
+class SearchMessagesInputPort(BaseUseCase[SearchMessagesRequest, SearchMessagesResponse, SearchMessagesError]):
+    def __init__(self, conversation_repository: ConversationRepository) -> None:
+        self._conversation_repository = conversation_repository
+
+    @property
+    def conversation_repository(self) -> ConversationRepository:
+        return self._conversation_repository
+
+    @abstractmethod
+    def execute(self, request: SearchMessagesRequest) -> SearchMessagesResponse | SearchMessagesError:
+        raise NotImplementedError("This method must be implemented by the usecase.")
+
+
+class SearchMessagesOutputPort(
+    BasePresenter[
+        SearchMessagesResponse,
+        SearchMessagesError,
+        SearchMessagesViewModel,
+    ]
+):
+    @abstractmethod
+    def convert_error_response_to_view_model(self, response: SearchMessagesError) -> SearchMessagesViewModel:
+        raise NotImplementedError(
+            "You must implement the convert_error_response_to_view_model method in your presenter"
+        )
+
+    @abstractmethod
+    def convert_response_to_view_model(self, response: SearchMessagesResponse) -> SearchMessagesViewModel:
+        raise NotImplementedError("You must implement the convert_response_to_view_model method in your presenter")
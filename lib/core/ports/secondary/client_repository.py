@@ -1,15 +1,18 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 import logging
 from typing import List
 
 from lib.core.dto.client_repository_dto import (
     GetClientDTO,
+    ListOwnedSourceDataIdsDTO,
     ListResearchContextsDTO,
     ListSourceDataDTO,
     NewResearchContextDTO,
     NewSourceDataDTO,
 )
-from lib.core.entity.models import ProtocolEnum
+from lib.core.entity.models import ProtocolEnum, SourceDataStatusEnum
+from lib.core.sdk.dto import CollectionVersionDTO
 
 
 class ClientRepositoryOutputPort(ABC):
@@ -93,6 +96,30 @@ class ClientRepositoryOutputPort(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_research_contexts_version(self, client_id: int) -> CollectionVersionDTO:
+        """
+        Summarizes the research contexts of a client, without loading them.
+
+        @param client_id: The ID of the client.
+        @type client_id: int
+        @return: A DTO containing the number of research contexts and their latest update.
+        @rtype: CollectionVersionDTO
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_source_data_version(self, client_id: int) -> CollectionVersionDTO:
+        """
+        Summarizes the source data of a client, without loading them.
+
+        @param client_id: The ID of the client.
+        @type client_id: int
+        @return: A DTO containing the number of source data and their latest update.
+        @rtype: CollectionVersionDTO
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def new_source_data(
         self, client_id: int, source_data_name: str, protocol: ProtocolEnum, relative_path: str
@@ -114,12 +141,53 @@ class ClientRepositoryOutputPort(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def list_source_data(self, client_id: int) -> ListSourceDataDTO:
+    def list_owned_source_data_ids(self, client_id: int, source_data_ids: List[int]) -> ListOwnedSourceDataIdsDTO:
+        """
+        Checks which of the given source data belong to a client, without loading the other source data of the client.
+
+        @param client_id: The ID of the client.
+        @type client_id: int
+        @param source_data_ids: The IDs of the source data to check.
+        @type source_data_ids: List[int]
+        @return: A DTO containing the IDs, among the given ones, of the source data owned by the client.
+        @rtype: ListOwnedSourceDataIdsDTO
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_source_data(
+        self,
+        client_id: int,
+        limit: int | None = None,
+        after: str | None = None,
+        source_data_type: str | None = None,
+        status: SourceDataStatusEnum | None = None,
+        protocol: ProtocolEnum | None = None,
+        relative_path_prefix: str | None = None,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+    ) -> ListSourceDataDTO:
         """
-        Lists source data for a given client.
+        Lists source data for a given client, ordered by creation date. Without a limit, all matching source data are listed.
 
         @param client_id: The ID of the client to list the source data for.
         @type client_id: int
+        @param limit: The maximum number of source data to list.
+        @type limit: int | None
+        @param after: A cursor; only the source data after it are listed.
+        @type after: str | None
+        @param source_data_type: Only list the source data of this type, e.g. 'pdf'.
+        @type source_data_type: str | None
+        @param status: Only list the source data with this status.
+        @type status: SourceDataStatusEnum | None
+        @param protocol: Only list the source data stored with this protocol.
+        @type protocol: ProtocolEnum | None
+        @param relative_path_prefix: Only list the source data whose relative path starts with this prefix.
+        @type relative_path_prefix: str | None
+        @param created_after: Only list the source data created at or after this datetime.
+        @type created_after: datetime | None
+        @param created_before: Only list the source data created before this datetime.
+        @type created_before: datetime | None
         @return: A DTO containing the result of the operation.
         @rtype: ListSourceDataDTO
         """
@@ -7,15 +7,20 @@ from lib.core.dto.conversation_repository_dto import (
     GetConversationResearchContextDTO,
     ListConversationMessagesDTO,
     ListConversationSourcesDTO,
+    StreamConversationMessagesDTO,
     NewMessageDTO,
+    NewMessagesDTO,
+    SearchMessagesDTO,
     UpdateConversationDTO,
 )
 from lib.core.entity.models import (
+    BaseMessage,
     BaseMessageContent,
     MessageSenderTypeEnum,
     TMessageBase,
     MessageContent,
 )
+from lib.core.sdk.dto import CollectionVersionDTO
 
 
 class ConversationRepository(ABC):
@@ -58,16 +63,64 @@ class ConversationRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def list_conversation_messages(self, conversation_id: int) -> ListConversationMessagesDTO[TMessageBase]:
+    def list_conversation_messages(
+        self,
+        conversation_id: int,
+        limit: int | None = None,
+        after: str | None = None,
+        before: str | None = None,
+    ) -> ListConversationMessagesDTO[TMessageBase]:
         """
-        Lists all messages in a conversation.
+        Lists the messages in a conversation, ordered by creation date. Without a limit, all messages are listed.
 
         @param conversation_id: The ID of the conversation to list messages for.
         @type conversation_id: int
+        @param limit: The maximum number of messages to list.
+        @type limit: int | None
+        @param after: A cursor; only the messages after it are listed.
+        @type after: str | None
+        @param before: A cursor; only the messages before it are listed.
+        @type before: str | None
         @return: A DTO containing the result of the operation.
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_conversation_messages_version(self, conversation_id: int) -> CollectionVersionDTO:
+        """
+        Summarizes the messages in a conversation, without loading them.
+
+        @param conversation_id: The ID of the conversation.
+        @type conversation_id: int
+        @return: A DTO containing the number of messages and their latest update.
+        @rtype: CollectionVersionDTO
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_conversation_messages(
+        self,
+        conversation_id: int,
+        after: str | None = None,
+        before: str | None = None,
+        batch_size: int = 100,
+    ) -> StreamConversationMessagesDTO:
+        """
+        Streams the messages in a conversation, ordered by creation date. The messages are fetched lazily, in batches, while the returned iterator is consumed.
+
+        @param conversation_id: The ID of the conversation to stream messages for.
+        @type conversation_id: int
+        @param after: A cursor; only the messages after it are streamed.
+        @type after: str | None
+        @param before: A cursor; only the messages before it are streamed.
+        @type before: str | None
+        @param batch_size: The number of messages fetched from the database at a time.
+        @type batch_size: int
+        @return: A DTO containing the result of the operation.
+        @rtype: StreamConversationMessagesDTO
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def update_conversation(self, conversation_id: int, conversation_title: str) -> UpdateConversationDTO:
         """
@@ -83,17 +136,59 @@ class ConversationRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def list_conversation_sources(self, conversation_id: int) -> ListConversationSourcesDTO:
+    def list_conversation_sources(
+        self,
+        conversation_id: int,
+        limit: int | None = None,
+        after: str | None = None,
+        with_citation_counts: bool = False,
+    ) -> ListConversationSourcesDTO:
         """
-        Lists all data sources of the citations of a conversation.
+        Lists the distinct data sources of the citations of a conversation, ordered by creation date. Without a limit, all of them are listed.
 
         @param conversation_id: The ID of the conversation to list data sources for.
         @type conversation_id: int
+        @param limit: The maximum number of data sources to list.
+        @type limit: int | None
+        @param after: A cursor; only the data sources after it are listed.
+        @type after: str | None
+        @param with_citation_counts: Whether to also count how many times each data source is cited in the conversation.
+        @type with_citation_counts: bool
         @return: A DTO containing the result of the operation.
         @rtype: ListConversationSourcesDTO
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def search_messages(
+        self,
+        client_id: int,
+        query: str,
+        research_context_id: int | None = None,
+        conversation_id: int | None = None,
+        limit: int = 20,
+        after: str | None = None,
+    ) -> SearchMessagesDTO:
+        """
+        Searches the text of the messages of a client, optionally only in one of its research contexts or conversations. The matching messages are ranked, best matches first.
+
+        @param client_id: The ID of the client whose messages are searched.
+        @type client_id: int
+        @param query: The search, in web search syntax: words, "quoted phrases", OR, and -excluded words.
+        @type query: str
+        @param research_context_id: The ID of a research context of the client to search in.
+        @type research_context_id: int | None
+        @param conversation_id: The ID of a conversation of the client to search in.
+        @type conversation_id: int | None
+        @param limit: The maximum number of messages to return.
+        @type limit: int
+        @param after: A cursor; only the messages ranked after it are returned.
+        @type after: str | None
+        @return: A DTO containing the result of the operation.
+        @rtype: SearchMessagesDTO
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def new_message(
         self,
@@ -115,3 +210,114 @@ class ConversationRepository(ABC):
         @rtype: NewMessageDTO | ListConversationSourcesDTO
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def new_messages(self, conversation_id: int, messages: List[BaseMessage]) -> NewMessagesDTO:
+        """
+        Adds a batch of messages, with their content pieces and citations, to a conversation in a single transaction.
+
+        @param conversation_id: The ID of the conversation to add the messages to.
+        @type conversation_id: int
+        @param messages: The messages to add, in order. Messages without a thread ID each start a new thread.
+        @type messages: List[BaseMessage]
+        @return: A DTO containing the IDs of the new messages, in the order they were given.
+        @rtype: NewMessagesDTO
+        """
+        raise NotImplementedError
+
+
+class AsyncConversationRepository(ABC):
+    """
+    Abstract base class for the operations of the conversation repository that are awaited on the event loop, for the hottest features.
+
+    @cvar logger: The logger for this class
+    @type logger: logging.Logger
+    """
+
+    def __init__(self) -> None:
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def logger(self) -> logging.Logger:
+        return self._logger
+
+    @abstractmethod
+    async def list_conversation_messages(
+        self,
+        conversation_id: int,
+        limit: int | None = None,
+        after: str | None = None,
+        before: str | None = None,
+    ) -> ListConversationMessagesDTO[TMessageBase]:
+        """
+        Lists the messages in a conversation, ordered by creation date. Without a limit, all messages are listed.
+
+        @param conversation_id: The ID of the conversation to list messages for.
+        @type conversation_id: int
+        @param limit: The maximum number of messages to list.
+        @type limit: int | None
+        @param after: A cursor; only the messages after it are listed.
+        @type after: str | None
+        @param before: A cursor; only the messages before it are listed.
+        @type before: str | None
+        @return: A DTO containing the result of the operation.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_conversation_messages_version(self, conversation_id: int) -> CollectionVersionDTO:
+        """
+        Summarizes the messages in a conversation, without loading them.
+
+        @param conversation_id: The ID of the conversation.
+        @type conversation_id: int
+        @return: A DTO containing the number of messages and their latest update.
+        @rtype: CollectionVersionDTO
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def stream_conversation_messages(
+        self,
+        conversation_id: int,
+        after: str | None = None,
+        before: str | None = None,
+        batch_size: int = 100,
+    ) -> StreamConversationMessagesDTO:
+        """
+        Streams the messages in a conversation, ordered by creation date. The messages are fetched lazily, in batches, while the returned async iterator is consumed.
+
+        @param conversation_id: The ID of the conversation to stream messages for.
+        @type conversation_id: int
+        @param after: A cursor; only the messages after it are streamed.
+        @type after: str | None
+        @param before: A cursor; only the messages before it are streamed.
+        @type before: str | None
+        @param batch_size: The number of messages fetched from the database at a time.
+        @type batch_size: int
+        @return: A DTO containing the result of the operation.
+        @rtype: StreamConversationMessagesDTO
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def new_message(
+        self,
+        conversation_id: int,
+        message_contents: List[BaseMessageContent],
+        sender_type: MessageSenderTypeEnum,
+        thread_id: int | None = None,
+    ) -> NewMessageDTO:
+        """
+        Sends a message to a conversation.
+
+        @param conversation_id: The ID of the conversation to send the message to.
+        @type conversation_id: int
+        @param thread_id: The ID of the thread of the message
+        @type thread_id: int
+        @param message_contents: A list of the content pieces of the message
+        @type message_contents: List[MessageContent]
+        @return: A DTO containing the result of the operation.
+        @rtype: NewMessageDTO
+        """
+        raise NotImplementedError
@@ -1,13 +1,16 @@
 from abc import ABC, abstractmethod
 import logging
+from typing import List
 
 
 from lib.core.dto.file_repository_dto import (
+    GetClientDataForDownloadBatchDTO,
     GetClientDataForDownloadDTO,
+    GetClientDataForUploadBatchDTO,
     SourceDataCompositeIndexExistsAsFileDTO,
     GetClientDataForUploadDTO,
 )
-from lib.core.entity.models import Client, ProtocolEnum, SourceData
+from lib.core.entity.models import Client, ProtocolEnum, SourceData, SourceDataCompositeIndex
 
 
 class FileRepositoryOutputPort(ABC):
@@ -55,6 +58,22 @@ class FileRepositoryOutputPort(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_client_data_for_upload_batch(
+        self, client: Client, composite_indexes: List[SourceDataCompositeIndex]
+    ) -> GetClientDataForUploadBatchDTO:
+        """
+        Gets the file manager client data for uploading several files at once.
+
+        @param client: The client uploading the files.
+        @type client: Client
+        @param composite_indexes: The protocols and relative paths of the files to upload.
+        @type composite_indexes: List[SourceDataCompositeIndex]
+        @return: A DTO containing the credentials of each file, by relative path.
+        @rtype: GetClientDataForUploadBatchDTO
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_client_data_for_download(self, client: Client, source_data: SourceData) -> GetClientDataForDownloadDTO:
         """
@@ -69,6 +88,22 @@ class FileRepositoryOutputPort(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_client_data_for_download_batch(
+        self, client: Client, source_data_list: List[SourceData]
+    ) -> GetClientDataForDownloadBatchDTO:
+        """
+        Gets the file manager client data for downloading several files at once.
+
+        @param client: The client downloading the files.
+        @type client: Client
+        @param source_data_list: The source data to download.
+        @type source_data_list: List[SourceData]
+        @return: A DTO containing the credentials of each file, by relative path.
+        @rtype: GetClientDataForDownloadBatchDTO
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def composite_index_of_source_data_exists_as_file(
         self, client: Client, protocol: ProtocolEnum, relative_path: str
@@ -8,6 +8,7 @@ from lib.core.dto.research_context_repository_dto import (
     ListSourceDataDTO,
     NewResearchContextConversationDTO,
 )
+from lib.core.sdk.dto import CollectionVersionDTO
 
 
 class ResearchContextRepositoryOutputPort(ABC):
@@ -75,6 +76,18 @@ class ResearchContextRepositoryOutputPort(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_conversations_version(self, research_context_id: int) -> CollectionVersionDTO:
+        """
+        Summarizes the conversations in a research context, without loading them.
+
+        @param research_context_id: The ID of the research context.
+        @type research_context_id: int
+        @return: A DTO containing the number of conversations and their latest update.
+        @rtype: CollectionVersionDTO
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def list_source_data(self, research_context_id: int) -> ListSourceDataDTO:
         """
@@ -86,3 +99,15 @@ class ResearchContextRepositoryOutputPort(ABC):
         @rtype: ListResearchContextSourceDataDTO
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def get_source_data_version(self, research_context_id: int) -> CollectionVersionDTO:
+        """
+        Summarizes the source data related to a research context, without loading them.
+
+        @param research_context_id: The ID of the research context.
+        @type research_context_id: int
+        @return: A DTO containing the number of source data and their latest update.
+        @rtype: CollectionVersionDTO
+        """
+        raise NotImplementedError
@@ -1,8 +1,12 @@
 from abc import ABC, abstractmethod
 import logging
 
-from lib.core.dto.source_data_repository_dto import GetSourceDataByProtocolRelativePathDTO
-from lib.core.entity.models import ProtocolEnum
+from typing import List
+from lib.core.dto.source_data_repository_dto import (
+    GetSourceDataByCompositeIndexesDTO,
+    GetSourceDataByProtocolRelativePathDTO,
+)
+from lib.core.entity.models import ProtocolEnum, SourceDataCompositeIndex
 
 
 class SourceDataRepositoryOutputPort(ABC):
@@ -37,3 +41,19 @@ class SourceDataRepositoryOutputPort(ABC):
         @rtype: GetSourceDataByLFNDTO
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def get_source_data_by_composite_indexes(
+        self, client_id: int, composite_indexes: List[SourceDataCompositeIndex]
+    ) -> GetSourceDataByCompositeIndexesDTO:
+        """
+        Gets several source data at once by their composite indexes.
+
+        @param client_id: The ID of the client that owns the source data.
+        @type client_id: int
+        @param composite_indexes: The protocols and relative paths of the source data.
+        @type composite_indexes: List[SourceDataCompositeIndex]
+        @return: A DTO containing the source data found, leaving out the composite indexes that were not found.
+        @rtype: GetSourceDataByCompositeIndexesDTO
+        """
+        raise NotImplementedError
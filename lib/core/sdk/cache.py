@@ -0,0 +1,99 @@
+from collections import OrderedDict
+import threading
+import time
+from typing import Callable, Generic, Hashable, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    A bounded, thread-safe in-memory cache whose entries expire after a time to live. When the cache is full, the least recently used entry is evicted.
+
+    @param maxsize: The maximum number of entries kept in the cache.
+    @type maxsize: int
+    @param ttl: The default time to live of an entry, in seconds.
+    @type ttl: float
+    @param timer: The clock used to expire entries, in seconds.
+    @type timer: Callable[[], float]
+    """
+
+    def __init__(self, maxsize: int, ttl: float, timer: Callable[[], float] = time.monotonic) -> None:
+        if maxsize < 1:
+            raise ValueError(f"The maximum size of the cache must be at least 1, got {maxsize}")
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._timer = timer
+        self._entries: OrderedDict[K, Tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def get(self, key: K) -> V | None:
+        """
+        Gets the value cached for a key.
+
+        @return: The cached value, or None if the key is not cached or its entry expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self._timer():
+                del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """
+        Caches a value for a key, evicting the least recently used entry if the cache is full.
+
+        @param ttl: The time to live of this entry, in seconds. Defaults to the time to live of the cache.
+        @type ttl: float | None
+        """
+        expires_at = self._timer() + (self._ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> V | None:
+        """
+        Drops the entry of a key, if any.
+
+        @return: The value that was cached for the key, even if it expired, or None.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            return entry[1] if entry is not None else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -2,8 +2,9 @@ from abc import ABC, abstractmethod
 from typing import Generic, TypeVar
 
 from pydantic import BaseModel
+from lib.core.sdk.metrics import timed_stage
 from lib.core.sdk.presenter import BasePresenter
-from lib.core.sdk.usecase import BaseUseCase
+from lib.core.sdk.usecase import AsyncBaseUseCase, BaseUseCase
 
 from lib.core.sdk.usecase_models import BaseErrorResponse, TBaseErrorResponse, TBaseRequest, TBaseResponse
 from lib.core.sdk.viewmodel import TBaseViewModel
@@ -41,9 +42,52 @@ class BaseController(
         raise NotImplementedError("You must implement the create_request method in your controller")
 
     def execute(self, parameters: TBaseControllerParameters | None) -> TBaseViewModel | None:
-        request_model = self.create_request(parameters)
-        response_model = self.usecase.execute(request_model)
-        if isinstance(response_model, BaseErrorResponse):
-            return self.presenter.present_error(response_model)  # type: ignore
-        else:
-            return self.presenter.present_success(response_model)
+        with timed_stage("create_request"):
+            request_model = self.create_request(parameters)
+        with timed_stage("usecase"):
+            response_model = self.usecase.execute(request_model)
+        with timed_stage("present"):
+            if isinstance(response_model, BaseErrorResponse):
+                return self.presenter.present_error(response_model)  # type: ignore
+            else:
+                return self.presenter.present_success(response_model)
+
+
+class AsyncBaseController(
+    ABC, Generic[TBaseControllerParameters, TBaseRequest, TBaseResponse, TBaseErrorResponse, TBaseViewModel]
+):
+    """
+    A controller whose use case runs on the event loop. Creating the request and presenting the response do not do any I/O, so only the execution of the use case is awaited.
+    """
+
+    def __init__(
+        self,
+        usecase: AsyncBaseUseCase[TBaseRequest, TBaseResponse, TBaseErrorResponse],
+        presenter: BasePresenter[TBaseResponse, TBaseErrorResponse, TBaseViewModel],
+    ) -> None:
+        super().__init__()
+        self._presenter = presenter
+        self._usecase = usecase
+
+    @property
+    def usecase(self) -> AsyncBaseUseCase[TBaseRequest, TBaseResponse, TBaseErrorResponse]:
+        return self._usecase
+
+    @property
+    def presenter(self) -> BasePresenter[TBaseResponse, TBaseErrorResponse, TBaseViewModel]:
+        return self._presenter
+
+    @abstractmethod
+    def create_request(self, parameters: TBaseControllerParameters | None) -> TBaseRequest:
+        raise NotImplementedError("You must implement the create_request method in your controller")
+
+    async def execute(self, parameters: TBaseControllerParameters | None) -> TBaseViewModel | None:
+        with timed_stage("create_request"):
+            request_model = self.create_request(parameters)
+        with timed_stage("usecase"):
+            response_model = await self.usecase.execute(request_model)
+        with timed_stage("present"):
+            if isinstance(response_model, BaseErrorResponse):
+                return self.presenter.present_error(response_model)  # type: ignore
+            else:
+                return self.presenter.present_success(response_model)
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Generic, List, Optional, Literal, TypeVar
 from pydantic import BaseModel
 
@@ -34,3 +35,17 @@ class BaseDTO(BaseModel, Generic[TBaseKernelPlancksterModel]):
 
 
 TBaseDTO = TypeVar("TBaseDTO", bound=BaseDTO[BaseKernelPlancksterModel])
+
+
+class CollectionVersionDTO(BaseDTO[BaseKernelPlancksterModel]):
+    """
+    A DTO summarizing the state of a collection of entities, e.g. the research contexts of a client, with a single aggregate query instead of loading them. Any insertion, update or soft deletion in the collection changes it.
+
+    @param count: The number of entities in the collection
+    @type count: int
+    @param last_updated_at: The latest update of an entity in the collection, or None if it is empty
+    @type last_updated_at: datetime | None
+    """
+
+    count: int = 0
+    last_updated_at: datetime | None = None
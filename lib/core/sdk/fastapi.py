@@ -1,10 +1,21 @@
 from abc import ABC, abstractmethod
 from enum import Enum
+import hashlib
 from typing import Annotated, Any, Dict, Generic
-from fastapi import APIRouter, Depends, HTTPException, Header
-from pydantic import ValidationError
-from lib.core.sdk.controller import BaseController, TBaseControllerParameters
+from fastapi import APIRouter, Depends, HTTPException, Header, Request, Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ValidationError
+import pydantic_core
+from lib.core.sdk.controller import (
+    AsyncBaseController,
+    BaseController,
+    BaseControllerParameters,
+    TBaseControllerParameters,
+)
+from lib.core.sdk.dto import CollectionVersionDTO
 from lib.core.sdk.feature_descriptor import BaseFeatureDescriptor
+from lib.core.sdk.metrics import current_request_metrics, timed_stage
+from lib.core.sdk.unit_of_work import AsyncBaseUnitOfWork, BaseUnitOfWork
 import logging
 
 logger = logging.getLogger(__name__)
@@ -17,16 +28,48 @@ from lib.core.sdk.viewmodel import (
 from fastapi import status
 
 
-class FastAPIEndpoint(ABC, Generic[TBaseControllerParameters, TBaseViewModel]):
+def collection_etag(name: str, controller_parameters: BaseControllerParameters, version: CollectionVersionDTO) -> str:
+    """
+    Derives a weak ETag from the version of the collection listed by a read endpoint, and from the parameters of the request, since they shape the payload too.
+    """
+    last_updated_at = version.last_updated_at.isoformat() if version.last_updated_at is not None else ""
+    key = f"{name}|{controller_parameters.model_dump_json()}|{version.count}|{last_updated_at}"
+    return f'W/"{hashlib.sha1(key.encode()).hexdigest()}"'
+
+
+def etag_matches(etag: str, if_none_match: str | None) -> bool:
+    """
+    Checks an ETag against the value of an If-None-Match header, with the weak comparison of RFC 9110.
+    """
+    if if_none_match is None:
+        return False
+    candidates = [candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    A JSON response serializing a view model straight to bytes with pydantic-core. The default path validates the view model again against the response model of the route, converts it to Python primitives and only then encodes them with json.dumps, which dominates the CPU time of the large lists.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return pydantic_core.to_json(content)
+        return super().render(content)
+
+
+class BaseFastAPIEndpoint(ABC, Generic[TBaseControllerParameters, TBaseViewModel]):
+    """
+    The parts shared by the endpoints served on the thread pool and on the event loop: the router and its auth dependency, the ETags, and the serialization of the view models.
+    """
+
     def __init__(
         self,
-        controller: BaseController[TBaseControllerParameters, Any, Any, Any, TBaseViewModel],
         descriptor: BaseFeatureDescriptor,
         responses: Dict[int | str, dict[str, Any]],
     ) -> None:
         name = descriptor.name
         self._name = name
-        self._controller = controller
         self._descriptor = descriptor
         self._responses: Dict[int | str, dict[str, Any]] = responses
 
@@ -50,12 +93,6 @@ class FastAPIEndpoint(ABC, Generic[TBaseControllerParameters, TBaseViewModel]):
     def name(self) -> str:
         return self._name
 
-    @property
-    def controller(
-        self,
-    ) -> BaseController[TBaseControllerParameters, Any, Any, Any, TBaseViewModel]:
-        return self._controller
-
     @property
     def descriptor(self) -> BaseFeatureDescriptor:
         return self._descriptor
@@ -79,27 +116,43 @@ class FastAPIEndpoint(ABC, Generic[TBaseControllerParameters, TBaseViewModel]):
     def register_endpoint(self) -> None:
         raise NotImplementedError("You must implement the register_endpoint method in your FastAPI endpoint subclass")
 
-    def execute(self, controller_parameters: TBaseControllerParameters) -> TBaseViewModel:
-        try:
-            view_model = self.controller.execute(controller_parameters)
-            if view_model is None:
-                raise HTTPException(status_code=500, detail="Internal Server Error. Did not receive a view model")
-            else:
-                return view_model
-        except ValidationError as ve:
-            return self.controller.presenter.present_error(
-                BaseViewModel(
-                    status=False,
-                    code=400,
-                    errorCode=400,
-                    errorMessage=f"ValidationError: {ve}",
-                    errorName="Controller Parameter Validation Error",
-                    errorType=f"ControllerParameterValidationError",
-                )
+    def _etag(
+        self, controller_parameters: TBaseControllerParameters, version: CollectionVersionDTO | None
+    ) -> str | None:
+        if version is None or not version.status:
+            return None
+        return collection_etag(self.name, controller_parameters, version)
+
+    def _not_modified(self, etag: str | None, request: Request) -> Response | None:
+        if etag is not None and etag_matches(etag, request.headers.get("if-none-match")):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        return None
+
+    def json_response(self, result: TBaseViewModel | Response, response: Response) -> TBaseViewModel | Response:
+        """
+        Serializes the view model right away with a PydanticJSONResponse, if the feature opted into it with `fast_json_response`, keeping the status code and the headers already set on the response. Otherwise, and for a ready-made response, the result is handed back to FastAPI as it is.
+        """
+        if isinstance(result, Response) or not self.descriptor.fast_json_response:
+            return result
+        with timed_stage("serialize"):
+            return PydanticJSONResponse(
+                content=result, status_code=response.status_code or status.HTTP_200_OK, headers=dict(response.headers)
             )
-        except Exception as e:
-            logger.error(f"Critical Error in {self.name} endpoint. See the following exception: {e}")
-            raise e
+
+    def _tag_request_metrics(self) -> None:
+        metrics = current_request_metrics()
+        if metrics is not None:
+            metrics.feature = self.name
+
+    def _validation_error(self, ve: ValidationError) -> BaseViewModel:
+        return BaseViewModel(
+            status=False,
+            code=400,
+            errorCode=400,
+            errorMessage=f"ValidationError: {ve}",
+            errorName="Controller Parameter Validation Error",
+            errorType=f"ControllerParameterValidationError",
+        )
 
     def check_auth(self, x_auth_token: Annotated[str, Header()]) -> None:
         auth_required = self.descriptor.auth
@@ -112,3 +165,179 @@ class FastAPIEndpoint(ABC, Generic[TBaseControllerParameters, TBaseViewModel]):
             return
         else:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+
+
+class FastAPIEndpoint(BaseFastAPIEndpoint[TBaseControllerParameters, TBaseViewModel]):
+    """
+    An endpoint served on the thread pool: its route is declared with `def`, and it calls a BaseController within a BaseUnitOfWork.
+    """
+
+    def __init__(
+        self,
+        controller: BaseController[TBaseControllerParameters, Any, Any, Any, TBaseViewModel],
+        descriptor: BaseFeatureDescriptor,
+        responses: Dict[int | str, dict[str, Any]],
+        unit_of_work: BaseUnitOfWork | None = None,
+    ) -> None:
+        super().__init__(descriptor=descriptor, responses=responses)
+        self._controller = controller
+        self._unit_of_work = unit_of_work
+
+    @property
+    def controller(
+        self,
+    ) -> BaseController[TBaseControllerParameters, Any, Any, Any, TBaseViewModel]:
+        return self._controller
+
+    @property
+    def unit_of_work(self) -> BaseUnitOfWork | None:
+        return self._unit_of_work
+
+    def execute(self, controller_parameters: TBaseControllerParameters) -> TBaseViewModel:
+        self._tag_request_metrics()
+        with timed_stage("endpoint"):
+            if self.unit_of_work is None:
+                return self._execute(controller_parameters)
+
+            # All the repositories used while handling this request share the same session, which is committed once at the end
+            with self.unit_of_work.begin():
+                view_model = self._execute(controller_parameters)
+                if not view_model.status:
+                    self.unit_of_work.rollback()
+                return view_model
+
+    def collection_version(self, controller_parameters: TBaseControllerParameters) -> CollectionVersionDTO | None:
+        """
+        Summarizes the collection listed by this endpoint, to answer conditional requests. Read endpoints override it with a single aggregate query; the default, None, disables ETags.
+        """
+        return None
+
+    def conditional_execute(
+        self, controller_parameters: TBaseControllerParameters, request: Request, response: Response
+    ) -> TBaseViewModel | Response:
+        """
+        Executes the feature, unless the client already holds the current representation: if the ETag derived from the collection version matches the If-None-Match header, a 304 is returned without loading the collection. Otherwise, the ETag of a successful view model is set on the response.
+        """
+        self._tag_request_metrics()
+        with timed_stage("endpoint"):
+            if self.unit_of_work is None:
+                return self._conditional_execute(controller_parameters, request, response)
+
+            with self.unit_of_work.begin():
+                result = self._conditional_execute(controller_parameters, request, response)
+                if not isinstance(result, Response) and not result.status:
+                    self.unit_of_work.rollback()
+                return result
+
+    def _conditional_execute(
+        self, controller_parameters: TBaseControllerParameters, request: Request, response: Response
+    ) -> TBaseViewModel | Response:
+        with timed_stage("etag"):
+            version = self.collection_version(controller_parameters)
+        etag = self._etag(controller_parameters, version)
+        not_modified = self._not_modified(etag, request)
+        if not_modified is not None:
+            return not_modified
+
+        view_model = self._execute(controller_parameters)
+        if etag is not None and view_model.status:
+            response.headers["ETag"] = etag
+        return view_model
+
+    def _execute(self, controller_parameters: TBaseControllerParameters) -> TBaseViewModel:
+        try:
+            view_model = self.controller.execute(controller_parameters)
+            if view_model is None:
+                raise HTTPException(status_code=500, detail="Internal Server Error. Did not receive a view model")
+            else:
+                return view_model
+        except ValidationError as ve:
+            return self.controller.presenter.present_error(self._validation_error(ve))
+        except Exception as e:
+            logger.error(f"Critical Error in {self.name} endpoint. See the following exception: {e}")
+            raise e
+
+
+class AsyncFastAPIEndpoint(BaseFastAPIEndpoint[TBaseControllerParameters, TBaseViewModel]):
+    """
+    An endpoint served on the event loop instead of the thread pool: its route must be declared with `async def`, and it awaits an AsyncBaseController within an AsyncBaseUnitOfWork.
+    """
+
+    def __init__(
+        self,
+        controller: AsyncBaseController[TBaseControllerParameters, Any, Any, Any, TBaseViewModel],
+        descriptor: BaseFeatureDescriptor,
+        responses: Dict[int | str, dict[str, Any]],
+        unit_of_work: AsyncBaseUnitOfWork | None = None,
+    ) -> None:
+        super().__init__(descriptor=descriptor, responses=responses)
+        self._controller = controller
+        self._unit_of_work = unit_of_work
+
+    @property
+    def controller(self) -> AsyncBaseController[TBaseControllerParameters, Any, Any, Any, TBaseViewModel]:
+        return self._controller
+
+    @property
+    def unit_of_work(self) -> AsyncBaseUnitOfWork | None:
+        return self._unit_of_work
+
+    async def execute(self, controller_parameters: TBaseControllerParameters) -> TBaseViewModel:
+        self._tag_request_metrics()
+        with timed_stage("endpoint"):
+            if self.unit_of_work is None:
+                return await self._execute(controller_parameters)
+
+            async with self.unit_of_work.begin():
+                view_model = await self._execute(controller_parameters)
+                if not view_model.status:
+                    await self.unit_of_work.rollback()
+                return view_model
+
+    async def collection_version(self, controller_parameters: TBaseControllerParameters) -> CollectionVersionDTO | None:
+        """
+        Like FastAPIEndpoint.collection_version, awaited on the event loop.
+        """
+        return None
+
+    async def conditional_execute(
+        self, controller_parameters: TBaseControllerParameters, request: Request, response: Response
+    ) -> TBaseViewModel | Response:
+        self._tag_request_metrics()
+        with timed_stage("endpoint"):
+            if self.unit_of_work is None:
+                return await self._conditional_execute(controller_parameters, request, response)
+
+            async with self.unit_of_work.begin():
+                result = await self._conditional_execute(controller_parameters, request, response)
+                if not isinstance(result, Response) and not result.status:
+                    await self.unit_of_work.rollback()
+                return result
+
+    async def _conditional_execute(
+        self, controller_parameters: TBaseControllerParameters, request: Request, response: Response
+    ) -> TBaseViewModel | Response:
+        with timed_stage("etag"):
+            version = await self.collection_version(controller_parameters)
+        etag = self._etag(controller_parameters, version)
+        not_modified = self._not_modified(etag, request)
+        if not_modified is not None:
+            return not_modified
+
+        view_model = await self._execute(controller_parameters)
+        if etag is not None and view_model.status:
+            response.headers["ETag"] = etag
+        return view_model
+
+    async def _execute(self, controller_parameters: TBaseControllerParameters) -> TBaseViewModel:
+        try:
+            view_model = await self.controller.execute(controller_parameters)
+            if view_model is None:
+                raise HTTPException(status_code=500, detail="Internal Server Error. Did not receive a view model")
+            else:
+                return view_model
+        except ValidationError as ve:
+            return self.controller.presenter.present_error(self._validation_error(ve))
+        except Exception as e:
+            logger.error(f"Critical Error in {self.name} endpoint. See the following exception: {e}")
+            raise e
@@ -13,6 +13,7 @@ class BaseFeatureDescriptor(
     tags: list[str] = []
     enabled: bool = True
     auth: bool = False
+    fast_json_response: bool = False
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
     )
@@ -13,4 +13,5 @@ class BaseFeatureContainer(containers.DeclarativeContainer):
         tags=config.tags,
         enabled=config.enabled,
         auth=config.auth,
+        fast_json_response=config.fast_json_response.as_(bool),
     )
@@ -0,0 +1,237 @@
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+import threading
+import time
+from typing import Dict, Generator, List, Sequence, Tuple
+
+DEFAULT_SECONDS_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+DEFAULT_COUNT_BUCKETS: Tuple[float, ...] = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class RequestMetrics:
+    """
+    The timings of a single request, broken down by stage of the controller, use case and presenter pipeline, along with the number of round trips to the RDBMS and to the object store.
+    The stages can overlap: 'usecase' includes the time spent in 'db' and 'object_store', and 'endpoint' includes all of them.
+
+    @ivar feature: The name of the feature that handled the request, if any.
+    @type feature: str | None
+    """
+
+    def __init__(self) -> None:
+        self.feature: str | None = None
+        self._stages: Dict[str, float] = {}
+        self._db_round_trips = 0
+        self._object_store_calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def stages(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._stages)
+
+    @property
+    def db_round_trips(self) -> int:
+        return self._db_round_trips
+
+    @property
+    def object_store_calls(self) -> int:
+        return self._object_store_calls
+
+    def record(self, stage: str, seconds: float) -> None:
+        """
+        Adds wall time to a stage. A stage that runs several times in the same request accumulates its time.
+        """
+        with self._lock:
+            self._stages[stage] = self._stages.get(stage, 0.0) + seconds
+
+    def record_db_round_trip(self, seconds: float) -> None:
+        with self._lock:
+            self._db_round_trips += 1
+            self._stages["db"] = self._stages.get("db", 0.0) + seconds
+
+    def record_object_store_call(self, seconds: float) -> None:
+        with self._lock:
+            self._object_store_calls += 1
+            self._stages["object_store"] = self._stages.get("object_store", 0.0) + seconds
+
+    def server_timing(self) -> str:
+        """
+        Formats the stages as the value of a Server-Timing header, e.g. 'usecase;dur=12.3, db;dur=8.1;desc="3 round trips"'.
+        """
+        entries: List[str] = []
+        for stage, seconds in self.stages.items():
+            entry = f"{stage};dur={seconds * 1000:.1f}"
+            if stage == "db":
+                entry += f';desc="{self._db_round_trips} round trips"'
+            elif stage == "object_store":
+                entry += f';desc="{self._object_store_calls} calls"'
+            entries.append(entry)
+        return ", ".join(entries)
+
+
+_request_metrics: ContextVar[RequestMetrics | None] = ContextVar("request_metrics", default=None)
+
+
+def current_request_metrics() -> RequestMetrics | None:
+    """
+    Gets the metrics of the request being handled in the current context, or None outside of a request, e.g. in a script or a test calling a controller directly.
+    """
+    return _request_metrics.get()
+
+
+def start_request_metrics() -> Tuple[RequestMetrics, Token[RequestMetrics | None]]:
+    """
+    Starts collecting the metrics of a new request in the current context.
+
+    @return: The metrics of the request, and the token to pass to `stop_request_metrics` once the request is done.
+    @rtype: Tuple[RequestMetrics, Token[RequestMetrics | None]]
+    """
+    metrics = RequestMetrics()
+    return metrics, _request_metrics.set(metrics)
+
+
+def stop_request_metrics(token: Token[RequestMetrics | None]) -> None:
+    _request_metrics.reset(token)
+
+
+@contextmanager
+def timed_stage(stage: str) -> Generator[None, None, None]:
+    """
+    Records the wall time of the block as a stage of the current request. It does nothing outside of a request.
+    """
+    metrics = _request_metrics.get()
+    if metrics is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.record(stage, time.perf_counter() - start)
+
+
+class Histogram:
+    """
+    A thread-safe histogram with cumulative buckets, rendered in the Prometheus text exposition format.
+
+    @param name: The name of the metric.
+    @type name: str
+    @param description: The help text of the metric.
+    @type description: str
+    @param label_names: The names of the labels every observation is tagged with.
+    @type label_names: Sequence[str]
+    @param buckets: The upper bounds of the buckets, in increasing order. The +Inf bucket is implicit.
+    @type buckets: Sequence[float]
+    """
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_SECONDS_BUCKETS,
+    ) -> None:
+        self._name = name
+        self._description = description
+        self._label_names = tuple(label_names)
+        self._buckets = tuple(buckets)
+        # Per label values: the number of observations in each bucket (not cumulative, the last one is +Inf), and their sum
+        self._series: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def observe(self, label_values: Sequence[str], value: float) -> None:
+        if len(label_values) != len(self._label_names):
+            raise ValueError(f"Histogram {self._name} expects the labels {self._label_names}, got {label_values}")
+        key = tuple(label_values)
+        index = bisect_left(self._buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = ([0] * (len(self._buckets) + 1), [0.0])
+                self._series[key] = series
+            series[0][index] += 1
+            series[1][0] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self._name} {self._description}", f"# TYPE {self._name} histogram"]
+        with self._lock:
+            series = {key: (list(counts), total[0]) for key, (counts, total) in self._series.items()}
+
+        for key, (counts, total) in sorted(series.items()):
+            labels = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(self._label_names, key))
+            separator = "," if labels else ""
+            cumulative = 0
+            for bound, count in zip(self._buckets, counts):
+                cumulative += count
+                lines.append(f'{self._name}_bucket{{{labels}{separator}le="{bound:g}"}} {cumulative}')
+            cumulative += counts[-1]
+            lines.append(f'{self._name}_bucket{{{labels}{separator}le="+Inf"}} {cumulative}')
+            lines.append(f"{self._name}_sum{{{labels}}} {total}")
+            lines.append(f"{self._name}_count{{{labels}}} {cumulative}")
+        return lines
+
+
+def _escape(label_value: str) -> str:
+    return label_value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class RequestMetricsRegistry:
+    """
+    Aggregates the metrics of the requests handled by this process into Prometheus histograms, per feature.
+    """
+
+    def __init__(self) -> None:
+        self._stage_seconds = Histogram(
+            "kp_feature_stage_seconds",
+            "Wall time spent in each stage of a request, per feature.",
+            label_names=("feature", "stage"),
+        )
+        self._db_round_trips = Histogram(
+            "kp_feature_db_round_trips",
+            "Number of statements sent to the RDBMS per request, per feature.",
+            label_names=("feature",),
+            buckets=DEFAULT_COUNT_BUCKETS,
+        )
+        self._object_store_calls = Histogram(
+            "kp_feature_object_store_calls",
+            "Number of requests sent to the object store per request, per feature.",
+            label_names=("feature",),
+            buckets=DEFAULT_COUNT_BUCKETS,
+        )
+
+    def observe(self, metrics: RequestMetrics) -> None:
+        """
+        Adds the metrics of a finished request. Requests that were not handled by a feature, e.g. health checks, are ignored.
+        """
+        if metrics.feature is None:
+            return
+        for stage, seconds in metrics.stages.items():
+            self._stage_seconds.observe((metrics.feature, stage), seconds)
+        self._db_round_trips.observe((metrics.feature,), metrics.db_round_trips)
+        self._object_store_calls.observe((metrics.feature,), metrics.object_store_calls)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for histogram in (self._stage_seconds, self._db_round_trips, self._object_store_calls):
+            lines.extend(histogram.render())
+        return "\n".join(lines) + "\n"
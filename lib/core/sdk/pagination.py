@@ -0,0 +1,71 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Tuple
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    """
+    Encodes the keyset of a row into an opaque cursor that clients can pass back to get the next or previous page.
+
+    @param created_at: The creation datetime of the row.
+    @type created_at: datetime
+    @param id: The ID of the row, used to break ties between rows created at the same time.
+    @type id: int
+    @return: The cursor.
+    @rtype: str
+    """
+    raw = f"{created_at.isoformat()}|{id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decodes a cursor created with `encode_cursor` back into the keyset of a row.
+
+    @param cursor: The cursor to decode.
+    @type cursor: str
+    @return: The creation datetime and the ID of the row.
+    @rtype: Tuple[datetime, int]
+    @raises ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(id)
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor '{cursor}': {e}")
+
+
+def encode_search_cursor(rank: float, id: int) -> str:
+    """
+    Encodes the keyset of a search result into an opaque cursor that clients can pass back to get the next page.
+
+    @param rank: The rank of the search result.
+    @type rank: float
+    @param id: The ID of the search result, used to break ties between results of the same rank.
+    @type id: int
+    @return: The cursor.
+    @rtype: str
+    """
+    # repr round-trips the float exactly, so that the next page starts right after this result
+    raw = f"{rank!r}|{id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_search_cursor(cursor: str) -> Tuple[float, int]:
+    """
+    Decodes a cursor created with `encode_search_cursor` back into the keyset of a search result.
+
+    @param cursor: The cursor to decode.
+    @type cursor: str
+    @return: The rank and the ID of the search result.
+    @rtype: Tuple[float, int]
+    @raises ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        rank, id = raw.rsplit("|", 1)
+        return float(rank), int(id)
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor '{cursor}': {e}")
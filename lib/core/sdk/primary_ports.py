@@ -11,6 +11,12 @@ class BaseInputPort(ABC, Generic[TBaseRequest, TBaseResponse, TBaseErrorResponse
         raise NotImplementedError("This method must be implemented by the usecase.")
 
 
+class AsyncBaseInputPort(ABC, Generic[TBaseRequest, TBaseResponse, TBaseErrorResponse]):
+    @abstractmethod
+    async def execute(self, request: TBaseRequest) -> TBaseResponse | TBaseErrorResponse:
+        raise NotImplementedError("This method must be implemented by the usecase.")
+
+
 class BaseOutputPort(ABC, Generic[TBaseResponse, TBaseErrorResponse, TBaseViewModel]):
     @abstractmethod
     def present_success(self, response: TBaseResponse) -> TBaseViewModel:
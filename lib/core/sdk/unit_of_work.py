@@ -0,0 +1,60 @@
+from abc import ABC, abstractmethod
+from typing import AsyncContextManager, ContextManager
+
+
+class BaseUnitOfWork(ABC):
+    """
+    A unit of work groups all the repository operations of a single request, so that they share the same transaction and are committed or rolled back together once the request is done.
+    """
+
+    @abstractmethod
+    def begin(self) -> ContextManager["BaseUnitOfWork"]:
+        """
+        Opens a unit of work for the duration of the context. On a normal exit the changes are committed, unless `rollback` was called; on an exception they are rolled back.
+        If a unit of work is already open in the current context, the outer one is joined instead.
+        """
+        raise NotImplementedError("You must implement the begin method in your unit of work")
+
+    @abstractmethod
+    def rollback(self) -> None:
+        """
+        Discards all the changes done so far in the open unit of work.
+        """
+        raise NotImplementedError("You must implement the rollback method in your unit of work")
+
+    @property
+    @abstractmethod
+    def active(self) -> bool:
+        """
+        Whether a unit of work is open in the current context.
+        """
+        raise NotImplementedError("You must implement the active property in your unit of work")
+
+
+class AsyncBaseUnitOfWork(ABC):
+    """
+    The counterpart of BaseUnitOfWork for requests handled on the event loop, whose repository operations are awaited.
+    """
+
+    @abstractmethod
+    def begin(self) -> AsyncContextManager["AsyncBaseUnitOfWork"]:
+        """
+        Opens a unit of work for the duration of the context. On a normal exit the changes are committed, unless `rollback` was called; on an exception they are rolled back.
+        If a unit of work is already open in the current context, the outer one is joined instead.
+        """
+        raise NotImplementedError("You must implement the begin method in your unit of work")
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """
+        Discards all the changes done so far in the open unit of work.
+        """
+        raise NotImplementedError("You must implement the rollback method in your unit of work")
+
+    @property
+    @abstractmethod
+    def active(self) -> bool:
+        """
+        Whether a unit of work is open in the current context.
+        """
+        raise NotImplementedError("You must implement the active property in your unit of work")
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar
-from lib.core.sdk.primary_ports import BaseInputPort
+from lib.core.sdk.primary_ports import AsyncBaseInputPort, BaseInputPort
 
 from lib.core.sdk.usecase_models import (
     BaseErrorResponse,
@@ -28,3 +28,21 @@ class BaseUseCase(
 
 
 TBaseUseCase = TypeVar("TBaseUseCase", bound=BaseUseCase[BaseRequest, BaseResponse, BaseErrorResponse])
+
+
+class AsyncBaseUseCase(
+    AsyncBaseInputPort[TBaseRequest, TBaseResponse, TBaseErrorResponse],
+    Generic[TBaseRequest, TBaseResponse, TBaseErrorResponse],
+):
+    @abstractmethod
+    async def execute(self, request: TBaseRequest) -> TBaseResponse | TBaseErrorResponse:
+        """
+        A base class for use cases that run on the event loop, awaiting their repositories instead of blocking a thread
+
+        Raises:
+            NotImplementedError: _description_
+        """
+        raise NotImplementedError("You must implement the execute method in your use case")
+
+
+TAsyncBaseUseCase = TypeVar("TAsyncBaseUseCase", bound=AsyncBaseUseCase[BaseRequest, BaseResponse, BaseErrorResponse])
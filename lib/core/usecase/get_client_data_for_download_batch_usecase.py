@@ -0,0 +1,112 @@
+from lib.core.dto.file_repository_dto import GetClientDataForDownloadBatchDTO
+from lib.core.ports.primary.get_client_data_for_download_batch_primary_ports import (
+    GetClientDataForDownloadBatchInputPort,
+)
+from lib.core.usecase_models.get_client_data_for_download_batch_usecase_models import (
+    GetClientDataForDownloadBatchError,
+    GetClientDataForDownloadBatchRequest,
+    GetClientDataForDownloadBatchResponse,
+)
+from lib.core.usecase.utils import validate_composite_indexes
+
+
+class GetClientDataForDownloadBatchUseCase(GetClientDataForDownloadBatchInputPort):
+    def execute(
+        self, request: GetClientDataForDownloadBatchRequest
+    ) -> GetClientDataForDownloadBatchResponse | GetClientDataForDownloadBatchError:
+        try:
+            client_repository = self.client_repository
+            source_data_repository = self.source_data_repository
+            file_repository = self.file_repository
+
+            client_id = request.client_id
+
+            # 1. First validate all the protocols and relative paths
+            composite_indexes = validate_composite_indexes(
+                request.composite_indexes, GetClientDataForDownloadBatchError
+            )
+            if isinstance(composite_indexes, GetClientDataForDownloadBatchError):
+                return composite_indexes
+
+            # 2. Check that the client exists in the DB, once for all the files
+            client_query_dto = client_repository.get_client(client_id)
+
+            if not client_query_dto.status:
+                return GetClientDataForDownloadBatchError(
+                    errorCode=client_query_dto.errorCode,
+                    errorMessage=client_query_dto.errorMessage,
+                    errorName=client_query_dto.errorName,
+                    errorType=client_query_dto.errorType,
+                )
+
+            client = client_query_dto.data
+
+            if not client:
+                return GetClientDataForDownloadBatchError(
+                    errorCode=404,
+                    errorMessage=f"Client with ID {client_id} not found.",
+                    errorName="ClientNotFound",
+                    errorType="ClientNotFound",
+                )
+
+            # 3. Check that all the composite indexes exist in the DB as SourceData, with a single query
+            source_data_query_dto = source_data_repository.get_source_data_by_composite_indexes(
+                client_id=client.id,
+                composite_indexes=composite_indexes,
+            )
+
+            if not source_data_query_dto.status:
+                return GetClientDataForDownloadBatchError(
+                    errorCode=source_data_query_dto.errorCode,
+                    errorMessage=source_data_query_dto.errorMessage,
+                    errorName=source_data_query_dto.errorName,
+                    errorType=source_data_query_dto.errorType,
+                )
+
+            source_data_list = source_data_query_dto.data or []
+            found = {(source_data.protocol, source_data.relative_path) for source_data in source_data_list}
+            missing = [
+                composite_index.relative_path
+                for composite_index in composite_indexes
+                if (composite_index.protocol, composite_index.relative_path) not in found
+            ]
+
+            if missing:
+                return GetClientDataForDownloadBatchError(
+                    errorCode=404,
+                    errorMessage=f"No source data found for client with id {client_id} with relative paths {missing}. No download possible.",
+                    errorName="SourceDataNotFound",
+                    errorType="SourceDataNotFound",
+                )
+
+            # 4. Get the data for download of all the files
+            dto: GetClientDataForDownloadBatchDTO = file_repository.get_client_data_for_download_batch(
+                client=client,
+                source_data_list=source_data_list,
+            )
+
+            if not dto.status:
+                return GetClientDataForDownloadBatchError(
+                    errorCode=dto.errorCode,
+                    errorMessage=dto.errorMessage,
+                    errorName=dto.errorName,
+                    errorType=dto.errorType,
+                )
+
+            if not dto.credentials:
+                return GetClientDataForDownloadBatchError(
+                    errorCode=500,
+                    errorMessage=f"Repository reports success but no credentials were found for the source data of client {client.sub}. No download possible.",
+                    errorName="Credentials Not Found",
+                    errorType="CredentialsNotFound",
+                )
+
+            return GetClientDataForDownloadBatchResponse(credentials=dto.credentials)
+
+        except Exception as e:
+            return GetClientDataForDownloadBatchError(
+                errorType="Internal Server Error",
+                errorCode=500,
+                errorMessage=f"An unexpected error occurred while trying to get the client data for download. Error:\n{e}",
+                errorName="UnexpectedError",
+            )
@@ -0,0 +1,77 @@
+from lib.core.dto.file_repository_dto import GetClientDataForUploadBatchDTO
+from lib.core.ports.primary.get_client_data_for_upload_batch_primary_ports import GetClientDataForUploadBatchInputPort
+from lib.core.usecase_models.get_client_data_for_upload_batch_usecase_models import (
+    GetClientDataForUploadBatchError,
+    GetClientDataForUploadBatchRequest,
+    GetClientDataForUploadBatchResponse,
+)
+from lib.core.usecase.utils import validate_composite_indexes
+
+
+class GetClientDataForUploadBatchUsecase(GetClientDataForUploadBatchInputPort):
+    def execute(
+        self, request: GetClientDataForUploadBatchRequest
+    ) -> GetClientDataForUploadBatchResponse | GetClientDataForUploadBatchError:
+        try:
+            client_repository = self.client_repository
+            file_repository = self.file_repository
+
+            client_id = request.client_id
+
+            # 1. Validate all the relative paths and protocols before doing anything else
+            composite_indexes = validate_composite_indexes(request.composite_indexes, GetClientDataForUploadBatchError)
+            if isinstance(composite_indexes, GetClientDataForUploadBatchError):
+                return composite_indexes
+
+            # 2. Check if the client exists in the database, once for all the files
+            client_query_dto = client_repository.get_client(client_id)
+
+            if not client_query_dto.status:
+                return GetClientDataForUploadBatchError(
+                    errorCode=client_query_dto.errorCode,
+                    errorMessage=client_query_dto.errorMessage,
+                    errorName=client_query_dto.errorName,
+                    errorType=client_query_dto.errorType,
+                )
+
+            if not client_query_dto.data:
+                return GetClientDataForUploadBatchError(
+                    errorCode=404,
+                    errorMessage=f"Client with id {client_id} not found.",
+                    errorName="ClientNotFound",
+                    errorType="ClientNotFound",
+                )
+
+            client = client_query_dto.data
+
+            # 3. Get the credentials for upload of all the files
+            dto: GetClientDataForUploadBatchDTO = file_repository.get_client_data_for_upload_batch(
+                client=client,
+                composite_indexes=composite_indexes,
+            )
+
+            if not dto.status:
+                return GetClientDataForUploadBatchError(
+                    errorCode=dto.errorCode,
+                    errorMessage=dto.errorMessage,
+                    errorName=dto.errorName,
+                    errorType=dto.errorType,
+                )
+
+            if not dto.credentials:
+                return GetClientDataForUploadBatchError(
+                    errorCode=404,
+                    errorMessage=f"Credentials not found for client with id {client_id}.",
+                    errorName="CredentialsNotFound",
+                    errorType="CredentialsNotFound",
+                )
+
+            return GetClientDataForUploadBatchResponse(credentials=dto.credentials)
+
+        except Exception as e:
+            return GetClientDataForUploadBatchError(
+                errorCode=500,
+                errorMessage=f"Internal Server Error: {e}",
+                errorName="InternalServerError",
+                errorType="InternalServerError",
+            )
@@ -1,6 +1,6 @@
-from lib.core.dto.conversation_repository_dto import ListConversationMessagesDTO
+from lib.core.dto.conversation_repository_dto import ListConversationMessagesDTO, StreamConversationMessagesDTO
 from lib.core.entity.models import MessageBase
-from lib.core.ports.primary.list_messages_primary_ports import ListMessagesInputPort
+from lib.core.ports.primary.list_messages_primary_ports import AsyncListMessagesInputPort, ListMessagesInputPort
 from lib.core.usecase_models.list_messages_usecase_models import (
     ListMessagesError,
     ListMessagesRequest,
@@ -8,42 +8,111 @@ from lib.core.usecase_models.list_messages_usecase_models import (
 )
 
 
+def _stream_response(
+    stream_dto: StreamConversationMessagesDTO, conversation_id: int
+) -> ListMessagesResponse | ListMessagesError:
+    if stream_dto.status and stream_dto.data is not None:
+        return ListMessagesResponse(message_list=[], message_stream=stream_dto.data)
+
+    return ListMessagesError(
+        errorCode=stream_dto.errorCode or -1,
+        errorMessage=stream_dto.errorMessage or "Repository reports success, but no stream was returned",
+        errorName=stream_dto.errorName or "No Stream Returned On Repository Success",
+        errorType=stream_dto.errorType or "NoStreamReturnedOnRepositorySuccess",
+        conversation_id=conversation_id,
+    )
+
+
+def _list_response(
+    dto: ListConversationMessagesDTO[MessageBase], conversation_id: int
+) -> ListMessagesResponse | ListMessagesError:
+    if dto.status:
+        if isinstance(dto.data, list):
+            return ListMessagesResponse(
+                message_list=dto.data,
+                next_cursor=dto.next_cursor,
+                previous_cursor=dto.previous_cursor,
+            )
+
+        else:
+            return ListMessagesError(
+                errorCode=-1,
+                errorMessage="Repository reports success, but no list (even an empty one) was returned",
+                errorName="No List Returned On Repository Success",
+                errorType="NoListReturnedOnRepositorySuccess",
+                conversation_id=conversation_id,
+            )
+
+    return ListMessagesError(
+        errorCode=dto.errorCode,
+        errorMessage=dto.errorMessage,
+        errorName=dto.errorName,
+        errorType=dto.errorType,
+        conversation_id=conversation_id,
+    )
+
+
+def _unknown_error(e: Exception, conversation_id: int) -> ListMessagesError:
+    return ListMessagesError(
+        errorCode=-1,
+        errorMessage=f"{e}",
+        errorName="Unknown Usecase Error",
+        errorType="Unknown Usecase Error",
+        conversation_id=conversation_id,
+    )
+
+
 class ListMessagesUseCase(ListMessagesInputPort):
     def execute(self, request: ListMessagesRequest) -> ListMessagesResponse | ListMessagesError:
         conversation_id = request.conversation_id
         conversation_repository = self.conversation_repository
 
         try:
+            if request.stream:
+                stream_dto: StreamConversationMessagesDTO = conversation_repository.stream_conversation_messages(
+                    conversation_id=conversation_id,
+                    after=request.after,
+                    before=request.before,
+                )
+
+                return _stream_response(stream_dto, conversation_id)
+
             dto: ListConversationMessagesDTO[MessageBase] = conversation_repository.list_conversation_messages(
-                conversation_id=conversation_id
+                conversation_id=conversation_id,
+                limit=request.limit,
+                after=request.after,
+                before=request.before,
             )
 
-            if dto.status:
-                if isinstance(dto.data, list):
-                    return ListMessagesResponse(message_list=dto.data)
+            return _list_response(dto, conversation_id)
+
+        except Exception as e:
+            return _unknown_error(e, conversation_id)
 
-                else:
-                    return ListMessagesError(
-                        errorCode=-1,
-                        errorMessage="Repository reports success, but no list (even an empty one) was returned",
-                        errorName="No List Returned On Repository Success",
-                        errorType="NoListReturnedOnRepositorySuccess",
-                        conversation_id=conversation_id,
-                    )
 
-            return ListMessagesError(
-                errorCode=dto.errorCode,
-                errorMessage=dto.errorMessage,
-                errorName=dto.errorName,
-                errorType=dto.errorType,
+class AsyncListMessagesUseCase(AsyncListMessagesInputPort):
+    async def execute(self, request: ListMessagesRequest) -> ListMessagesResponse | ListMessagesError:
+        conversation_id = request.conversation_id
+        conversation_repository = self.conversation_repository
+
+        try:
+            if request.stream:
+                stream_dto: StreamConversationMessagesDTO = await conversation_repository.stream_conversation_messages(
+                    conversation_id=conversation_id,
+                    after=request.after,
+                    before=request.before,
+                )
+
+                return _stream_response(stream_dto, conversation_id)
+
+            dto: ListConversationMessagesDTO[MessageBase] = await conversation_repository.list_conversation_messages(
                 conversation_id=conversation_id,
+                limit=request.limit,
+                after=request.after,
+                before=request.before,
             )
 
+            return _list_response(dto, conversation_id)
+
         except Exception as e:
-            return ListMessagesError(
-                errorCode=-1,
-                errorMessage=f"{e}",
-                errorName="Unknown Usecase Error",
-                errorType="Unknown Usecase Error",
-                conversation_id=conversation_id,
-            )
+            return _unknown_error(e, conversation_id)
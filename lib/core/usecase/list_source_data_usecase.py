@@ -13,10 +13,20 @@ class ListSourceDataUseCase(ListSourceDataInputPort):
             client_repository = self.client_repository
             client_id = request.client_id
 
-            dto: ListSourceDataDTO = client_repository.list_source_data(client_id=client_id)
+            dto: ListSourceDataDTO = client_repository.list_source_data(
+                client_id=client_id,
+                limit=request.limit,
+                after=request.after,
+                source_data_type=request.source_data_type,
+                status=request.status,
+                protocol=request.protocol,
+                relative_path_prefix=request.relative_path_prefix,
+                created_after=request.created_after,
+                created_before=request.created_before,
+            )
 
             if dto.status:
-                return ListSourceDataResponse(source_data_list=dto.data)
+                return ListSourceDataResponse(source_data_list=dto.data, next_cursor=dto.next_cursor)
 
             return ListSourceDataError(
                 errorCode=dto.errorCode,
@@ -0,0 +1,41 @@
+from lib.core.dto.conversation_repository_dto import NewMessagesDTO
+from lib.core.ports.primary.new_message_batch_primary_ports import NewMessageBatchInputPort
+from lib.core.usecase_models.new_message_batch_usecase_models import (
+    NewMessageBatchError,
+    NewMessageBatchRequest,
+    NewMessageBatchResponse,
+)
+
+
+class NewMessageBatchUseCase(NewMessageBatchInputPort):
+    def execute(self, request: NewMessageBatchRequest) -> NewMessageBatchResponse | NewMessageBatchError:
+        try:
+            dto: NewMessagesDTO = self.conversation_repository.new_messages(
+                conversation_id=request.conversation_id,
+                messages=request.messages,
+            )
+
+            if dto.status:
+                message_ids = dto.message_ids
+
+                if message_ids is not None:
+                    return NewMessageBatchResponse(message_ids=message_ids)
+
+                return NewMessageBatchError(
+                    errorCode=-1,
+                    errorMessage=f"An unexpected error occurred: repository reports success, but got back an unexpected object: '{dto.message_ids}'",
+                    errorName="UnexpectedError",
+                    errorType="UnexpectedError",
+                )
+
+            return NewMessageBatchError(
+                errorCode=dto.errorCode, errorMessage=dto.errorMessage, errorName=dto.errorName, errorType=dto.errorType
+            )
+
+        except Exception as e:
+            return NewMessageBatchError(
+                errorCode=-1,
+                errorMessage=f"An unexpected error occurred:\n{e}",
+                errorName="UnexpectedError",
+                errorType="UnexpectedError",
+            )
@@ -1,57 +1,86 @@
 from lib.core.dto.conversation_repository_dto import NewMessageDTO
 from lib.core.entity.models import MessageBase, MessageSenderTypeEnum
-from lib.core.ports.primary.new_message_primary_ports import NewMessageInputPort
+from lib.core.ports.primary.new_message_primary_ports import AsyncNewMessageInputPort, NewMessageInputPort
 from lib.core.usecase_models.new_message_usecase_models import NewMessageError, NewMessageRequest, NewMessageResponse
 
 
+def _validate_sender_type(sender_type_str_raw: str) -> MessageSenderTypeEnum | NewMessageError:
+    try:
+        sender_type_str = "".join(sender_type_str_raw.lower().split())
+        return MessageSenderTypeEnum(sender_type_str)
+
+    except Exception as e:
+        return NewMessageError(
+            errorCode=-1,
+            errorMessage=f"Couldn't validate the sender type provided. Error: {e}",
+            errorName="Sender Type Validation Error",
+            errorType="SenderTypeValidationError",
+        )
+
+
+def _new_message_response(dto: NewMessageDTO) -> NewMessageResponse | NewMessageError:
+    if dto.status:
+        message = dto.data
+
+        if message is not None:
+            return NewMessageResponse(message_id=message.id)
+
+        return NewMessageError(
+            errorCode=-1,
+            errorMessage=f"An unexpected error occurred: repository reports success, but got back an unexpected object: '{dto.data}'",
+            errorName="UnexpectedError",
+            errorType="UnexpectedError",
+        )
+
+    return NewMessageError(
+        errorCode=dto.errorCode, errorMessage=dto.errorMessage, errorName=dto.errorName, errorType=dto.errorType
+    )
+
+
+def _unexpected_error(e: Exception) -> NewMessageError:
+    return NewMessageError(
+        errorCode=-1,
+        errorMessage=f"An unexpected error occurred:\n{e}",
+        errorName="UnexpectedError",
+        errorType="UnexpectedError",
+    )
+
+
 class NewMessageUseCase(NewMessageInputPort):
     def execute(self, request: NewMessageRequest) -> NewMessageResponse | NewMessageError:
         try:
-            conversation_id = request.conversation_id
-            message_contents = request.message_contents
-            sender_type_str_raw = request.sender_type
-            thread_id = request.thread_id
-
-            try:
-                sender_type_str = "".join(sender_type_str_raw.lower().split())
-                sender_type = MessageSenderTypeEnum(sender_type_str)
-
-            except Exception as e:
-                return NewMessageError(
-                    errorCode=-1,
-                    errorMessage=f"Couldn't validate the sender type provided. Error: {e}",
-                    errorName="Sender Type Validation Error",
-                    errorType="SenderTypeValidationError",
-                )
+            sender_type = _validate_sender_type(request.sender_type)
+            if isinstance(sender_type, NewMessageError):
+                return sender_type
 
             dto: NewMessageDTO = self.conversation_repository.new_message(
-                conversation_id=conversation_id,
-                message_contents=message_contents,
+                conversation_id=request.conversation_id,
+                message_contents=request.message_contents,
                 sender_type=sender_type,
-                thread_id=thread_id,
+                thread_id=request.thread_id,
             )
 
-            if dto.status:
-                message = dto.data
+            return _new_message_response(dto)
+
+        except Exception as e:
+            return _unexpected_error(e)
 
-                if message is not None:
-                    return NewMessageResponse(message_id=message.id)
 
-                return NewMessageError(
-                    errorCode=-1,
-                    errorMessage=f"An unexpected error occurred: repository reports success, but got back an unexpected object: '{dto.data}'",
-                    errorName="UnexpectedError",
-                    errorType="UnexpectedError",
-                )
+class AsyncNewMessageUseCase(AsyncNewMessageInputPort):
+    async def execute(self, request: NewMessageRequest) -> NewMessageResponse | NewMessageError:
+        try:
+            sender_type = _validate_sender_type(request.sender_type)
+            if isinstance(sender_type, NewMessageError):
+                return sender_type
 
-            return NewMessageError(
-                errorCode=dto.errorCode, errorMessage=dto.errorMessage, errorName=dto.errorName, errorType=dto.errorType
+            dto: NewMessageDTO = await self.conversation_repository.new_message(
+                conversation_id=request.conversation_id,
+                message_contents=request.message_contents,
+                sender_type=sender_type,
+                thread_id=request.thread_id,
             )
 
+            return _new_message_response(dto)
+
         except Exception as e:
-            return NewMessageError(
-                errorCode=-1,
-                errorMessage=f"An unexpected error occurred:\n{e}",
-                errorName="UnexpectedError",
-                errorType="UnexpectedError",
-            )
+            return _unexpected_error(e)
@@ -1,4 +1,4 @@
-from lib.core.dto.client_repository_dto import GetClientDTO, ListSourceDataDTO, NewResearchContextDTO
+from lib.core.dto.client_repository_dto import GetClientDTO, ListOwnedSourceDataIdsDTO, NewResearchContextDTO
 from lib.core.ports.primary.new_research_context_primary_ports import NewResearchContextInputPort
 from lib.core.usecase_models.new_research_context_usecase_models import (
     NewResearchContextError,
@@ -49,29 +49,19 @@ class NewResearchContextUseCase(NewResearchContextInputPort):
                 )
 
             # 2. Check if the client has access to the source data
-            client_source_data_list_dto: ListSourceDataDTO = client_repository.list_source_data(
-                client_id=retrieved_client.id
+            owned_source_data_ids_dto: ListOwnedSourceDataIdsDTO = client_repository.list_owned_source_data_ids(
+                client_id=retrieved_client.id, source_data_ids=source_data_ids_req
             )
 
-            if not client_source_data_list_dto.status:
+            if not owned_source_data_ids_dto.status:
                 return NewResearchContextError(
-                    errorCode=client_source_data_list_dto.errorCode,
-                    errorMessage=client_source_data_list_dto.errorMessage,
-                    errorName=client_source_data_list_dto.errorName,
-                    errorType=client_source_data_list_dto.errorType,
+                    errorCode=owned_source_data_ids_dto.errorCode,
+                    errorMessage=owned_source_data_ids_dto.errorMessage,
+                    errorName=owned_source_data_ids_dto.errorName,
+                    errorType=owned_source_data_ids_dto.errorType,
                 )
 
-            client_source_data_list = client_source_data_list_dto.data
-
-            if not isinstance(client_source_data_list, list):
-                return NewResearchContextError(
-                    errorCode=404,
-                    errorMessage=f"Source Data couldn't be retrieved for client with SUB {retrieved_client.sub}.",
-                    errorName="SourceDataNotRetrieved",
-                    errorType="SourceDataNotRetrieved",
-                )
-
-            authorized_source_data_ids = [sd.id for sd in client_source_data_list]
+            authorized_source_data_ids = set(owned_source_data_ids_dto.source_data_ids)
 
             unauthorized_source_data_ids = [
                 sd_id for sd_id in source_data_ids_req if sd_id not in authorized_source_data_ids
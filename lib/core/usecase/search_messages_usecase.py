@@ -0,0 +1,52 @@
+from lib.core.dto.conversation_repository_dto import SearchMessagesDTO
+from lib.core.ports.primary.search_messages_primary_ports import SearchMessagesInputPort
+from lib.core.usecase_models.search_messages_usecase_models import (
+    SearchMessagesError,
+    SearchMessagesRequest,
+    SearchMessagesResponse,
+)
+
+
+class SearchMessagesUseCase(SearchMessagesInputPort):
+    def execute(self, request: SearchMessagesRequest) -> SearchMessagesResponse | SearchMessagesError:
+        try:
+            conversation_repository = self.conversation_repository
+            client_id = request.client_id
+
+            dto: SearchMessagesDTO = conversation_repository.search_messages(
+                client_id=client_id,
+                query=request.query,
+                research_context_id=request.research_context_id,
+                conversation_id=request.conversation_id,
+                limit=request.limit,
+                after=request.after,
+            )
+
+            if dto.status:
+                if isinstance(dto.search_results, list):
+                    return SearchMessagesResponse(search_results=dto.search_results, next_cursor=dto.next_cursor)
+
+                return SearchMessagesError(
+                    errorCode=-1,
+                    errorMessage="Repository reports success, but no list (even an empty one) was returned",
+                    errorName="No List Returned On Repository Success",
+                    errorType="NoListReturnedOnRepositorySuccess",
+                    client_id=client_id,
+                )
+
+            return SearchMessagesError(
+                errorCode=dto.errorCode,
+                errorMessage=dto.errorMessage,
+                errorName=dto.errorName,
+                errorType=dto.errorType,
+                client_id=client_id,
+            )
+
+        except Exception as e:
+            return SearchMessagesError(
+                errorCode="500",
+                errorMessage=f"Internal Server Error: {e}",
+                errorName="Internal Server Error",
+                errorType="Internal Server Error",
+                client_id=client_id,
+            )
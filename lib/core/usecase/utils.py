@@ -0,0 +1,57 @@
+from typing import List, Type
+from lib.core.entity.models import SourceData, SourceDataCompositeIndex
+from lib.core.sdk.usecase_models import TBaseErrorResponse
+
+
+def validate_composite_indexes(
+    composite_indexes: List[SourceDataCompositeIndex], error_type: Type[TBaseErrorResponse]
+) -> List[SourceDataCompositeIndex] | TBaseErrorResponse:
+    """
+    Validates the protocols and relative paths of the files of a batch request, before anything else is done with them.
+
+    @param composite_indexes: The protocols and relative paths of the files given in the request.
+    @type composite_indexes: List[SourceDataCompositeIndex]
+    @param error_type: The error response model of the use case, returned when the validation fails.
+    @type error_type: Type[TBaseErrorResponse]
+    @return: The validated composite indexes, or an error response if no file was given, any of them is invalid, or a relative path is given more than once.
+    @rtype: List[SourceDataCompositeIndex] | TBaseErrorResponse
+    """
+    if not composite_indexes:
+        return error_type(
+            errorCode=400,
+            errorMessage="At least one file must be given.",
+            errorName="No Files Given",
+            errorType="NoFilesGiven",
+        )
+
+    validated: List[SourceDataCompositeIndex] = []
+    validation_errors: List[str] = []
+    for composite_index in composite_indexes:
+        try:
+            validated.append(
+                SourceDataCompositeIndex(
+                    protocol=SourceData.protocol_validation(composite_index.protocol.value),
+                    relative_path=SourceData.relative_path_validation(composite_index.relative_path),
+                )
+            )
+        except ValueError as e:
+            validation_errors.append(f"'{composite_index.relative_path}': {e}")
+
+    if validation_errors:
+        return error_type(
+            errorCode=400,
+            errorMessage=f"Couldn't validate the files: {' '.join(validation_errors)}",
+            errorName="Composite Index Validation Error",
+            errorType="CompositeIndexValidationError",
+        )
+
+    relative_paths = [composite_index.relative_path for composite_index in validated]
+    if len(set(relative_paths)) != len(relative_paths):
+        return error_type(
+            errorCode=400,
+            errorMessage="Each relative path must be given only once.",
+            errorName="Duplicate Relative Paths",
+            errorType="DuplicateRelativePaths",
+        )
+
+    return validated
@@ -0,0 +1,38 @@
+from typing import Dict, List
+from pydantic import Field
+from lib.core.entity.models import SourceDataCompositeIndex
+from lib.core.sdk.usecase_models import BaseErrorResponse, BaseRequest, BaseResponse
+
+
+class GetClientDataForUploadBatchRequest(BaseRequest):
+    """
+    Request model for the Get Client Data For Upload Batch Use Case.
+
+    @param client_id: The ID of the client requesting the upload.
+    @param composite_indexes: The protocols and relative paths of the files to be uploaded.
+    """
+
+    client_id: int = Field(description="The ID of the client requesting the upload.")
+    composite_indexes: List[SourceDataCompositeIndex] = Field(
+        description="The protocols and relative paths of the files to be uploaded."
+    )
+
+
+class GetClientDataForUploadBatchResponse(BaseResponse):
+    """
+    Response model for the Get Client Data For Upload Batch Use Case.
+
+    @param credentials: The credentials to handle each file, by relative path. For example, the signed URL, key, auth token, etc.
+    """
+
+    credentials: Dict[str, str] = Field(
+        description="The credentials to handle each file, by relative path. For example, the signed URL, key, auth token, etc."
+    )
+
+
+class GetClientDataForUploadBatchError(BaseErrorResponse):
+    """
+    Error response model for the Get Client Data For Upload Batch Use Case.
+    """
+
+    pass
@@ -1,4 +1,6 @@
-from typing import List
+from typing import AsyncIterable, Iterable, List
+
+from pydantic import ConfigDict
 from lib.core.entity.models import MessageBase
 from lib.core.sdk.usecase_models import BaseErrorResponse, BaseRequest, BaseResponse
 
@@ -6,17 +8,37 @@ from lib.core.sdk.usecase_models import BaseErrorResponse, BaseRequest, BaseResp
 class ListMessagesRequest(BaseRequest):
     """
     Request Model for the List Messages Use Case.
+
+    @param conversation_id: The ID of the conversation to list messages for.
+    @param limit: The maximum number of messages to list. All messages are listed if None.
+    @param after: A cursor; only the messages after it are listed.
+    @param before: A cursor; only the messages before it are listed.
+    @param stream: Whether to stream the messages lazily instead of listing them.
     """
 
     conversation_id: int
+    limit: int | None = None
+    after: str | None = None
+    before: str | None = None
+    stream: bool = False
 
 
 class ListMessagesResponse(BaseResponse):
     """
     Response Model for the List Messages Use Case.
+
+    @param message_list: The listed messages. Empty when streaming.
+    @param message_stream: A lazy iterator over the messages, when streaming. An async iterator when listed on the event loop.
+    @param next_cursor: The cursor to get the page after this one, if there is one.
+    @param previous_cursor: The cursor to get the page before this one, if there is one.
     """
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     message_list: List[MessageBase]
+    message_stream: Iterable[MessageBase] | AsyncIterable[MessageBase] | None = None
+    next_cursor: str | None = None
+    previous_cursor: str | None = None
 
 
 class ListMessagesError(BaseErrorResponse):
@@ -1,6 +1,7 @@
+from datetime import datetime
 from typing import List
 
-from lib.core.entity.models import SourceData
+from lib.core.entity.models import ProtocolEnum, SourceData, SourceDataStatusEnum
 from lib.core.sdk.usecase_models import BaseErrorResponse, BaseRequest, BaseResponse
 
 
@@ -9,9 +10,25 @@ class ListSourceDataRequest(BaseRequest):
     Request Model for the List Source Data Use Case.
 
     @param client_id: The ID of the client requesting the list of source data.
+    @param limit: The maximum number of source data to list. All matching source data are listed if None.
+    @param after: A cursor; only the source data after it are listed.
+    @param source_data_type: Only list the source data of this type.
+    @param status: Only list the source data with this status.
+    @param protocol: Only list the source data stored with this protocol.
+    @param relative_path_prefix: Only list the source data whose relative path starts with this prefix.
+    @param created_after: Only list the source data created at or after this datetime.
+    @param created_before: Only list the source data created before this datetime.
     """
 
     client_id: int
+    limit: int | None = None
+    after: str | None = None
+    source_data_type: str | None = None
+    status: SourceDataStatusEnum | None = None
+    protocol: ProtocolEnum | None = None
+    relative_path_prefix: str | None = None
+    created_after: datetime | None = None
+    created_before: datetime | None = None
 
 
 class ListSourceDataResponse(BaseResponse):
@@ -19,9 +36,11 @@ class ListSourceDataResponse(BaseResponse):
     Response Model for the List Source Data Use Case.
 
     @param source_data_list: The list of source data.
+    @param next_cursor: The cursor to get the page after this one, if there is one.
     """
 
     source_data_list: List[SourceData]
+    next_cursor: str | None = None
 
 
 class ListSourceDataError(BaseErrorResponse):
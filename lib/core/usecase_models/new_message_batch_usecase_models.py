@@ -0,0 +1,36 @@
+from typing import List
+from pydantic import Field
+from lib.core.entity.models import BaseMessage
+from lib.core.sdk.usecase_models import BaseErrorResponse, BaseRequest, BaseResponse
+
+
+class NewMessageBatchRequest(BaseRequest):
+    """
+    Request model for the New Message Batch Use Case.
+
+    @param conversation_id: The ID of the conversation to which the messages are to be added.
+    @param messages: The messages to be added, in order, with their content pieces and citations.
+    """
+
+    conversation_id: int = Field(description="The ID of the conversation to which the messages are to be added.")
+    messages: List[BaseMessage] = Field(
+        description="The messages to be added, in order, with their content pieces and citations."
+    )
+
+
+class NewMessageBatchResponse(BaseResponse):
+    """
+    Response model for the New Message Batch Use Case.
+
+    @param message_ids: The IDs of the newly created messages, in the order they were given.
+    """
+
+    message_ids: List[int] = Field(description="The IDs of the newly created messages, in the order they were given.")
+
+
+class NewMessageBatchError(BaseErrorResponse):
+    """
+    Error response model for the New Message Batch Use Case.
+    """
+
+    pass
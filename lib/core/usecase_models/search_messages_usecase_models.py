@@ -0,0 +1,46 @@
+from typing import List
+
+from lib.core.entity.models import MessageSearchResult
+from lib.core.sdk.usecase_models import BaseErrorResponse, BaseRequest, BaseResponse
+
+
+class SearchMessagesRequest(BaseRequest):
+    """
+    Request Model for the Search Messages Use Case.
+
+    @param client_id: The ID of the client whose messages are searched.
+    @param query: The search, in web search syntax.
+    @param research_context_id: The ID of a research context of the client to search in, if any.
+    @param conversation_id: The ID of a conversation of the client to search in, if any.
+    @param limit: The maximum number of messages to return.
+    @param after: A cursor; only the messages ranked after it are returned.
+    """
+
+    client_id: int
+    query: str
+    research_context_id: int | None = None
+    conversation_id: int | None = None
+    limit: int = 20
+    after: str | None = None
+
+
+class SearchMessagesResponse(BaseResponse):
+    """
+    Response Model for the Search Messages Use Case.
+
+    @param search_results: The messages matching the search, best matches first.
+    @param next_cursor: The cursor to get the page after this one, if there is one.
+    """
+
+    search_results: List[MessageSearchResult]
+    next_cursor: str | None = None
+
+
+class SearchMessagesError(BaseErrorResponse):
+    """
+    Error Response Model for the Search Messages Use Case.
+
+    @param client_id: The ID of the client whose messages were searched.
+    """
+
+    client_id: int | None = None
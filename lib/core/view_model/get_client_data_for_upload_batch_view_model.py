@@ -0,0 +1,23 @@
+from typing import Dict
+from pydantic import Field
+from lib.core.sdk.viewmodel import BaseViewModel
+
+
+class GetClientDataForUploadBatchViewModel(BaseViewModel):
+    """
+    View Model for the Get Client Data For Upload Batch Feature.
+    """
+
+    signed_urls: Dict[str, str] = Field(description="The signed URL to upload each file, by relative path.")
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "status": True,
+                    "code": 200,
+                    "signed_urls": {"path/to/file1.txt": "auth1_string", "path/to/file2.txt": "auth2_string"},
+                }
+            ]
+        }
+    }
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import AsyncIterable, Iterable, List, Optional
 
 from pydantic import Field
 from lib.core.entity.models import MessageBase
@@ -13,8 +13,22 @@ class ListMessagesViewModel(BaseViewModel):
     message_list: List[MessageBase] = Field(
         description="List of all messages in the database for a given conversation."
     )
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor to pass as 'after' to get the next page of messages, if there is one.",
+    )
+    previous_cursor: str | None = Field(
+        default=None,
+        description="Cursor to pass as 'before' to get the previous page of messages, if there is one.",
+    )
+    message_stream: Iterable[MessageBase] | AsyncIterable[MessageBase] | None = Field(
+        default=None,
+        exclude=True,
+        description="Lazy iterator over the messages, when they are streamed instead of listed.",
+    )
 
     model_config = {
+        "arbitrary_types_allowed": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -46,7 +60,9 @@ class ListMessagesViewModel(BaseViewModel):
                             "sender_type": "agent",
                         },
                     ],
+                    "next_cursor": "MjAyMS0wMS0wMVQwMDowMDowMXwy",
+                    "previous_cursor": None,
                 }
             ]
-        }
+        },
     }
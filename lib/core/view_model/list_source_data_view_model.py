@@ -11,6 +11,10 @@ class ListSourceDataViewModel(BaseViewModel):
     """
 
     source_data_list: List[SourceData] = Field(description="List of source data in the database.")
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor to pass as 'after' to get the next page of source data, if there is one.",
+    )
 
     model_config = {
         "json_schema_extra": {
@@ -46,6 +50,7 @@ class ListSourceDataViewModel(BaseViewModel):
                             "status": "available",
                         },
                     ],
+                    "next_cursor": "MjAyMS0wMS0wMVQwMDowMDowMXwy",
                 }
             ]
         }
@@ -0,0 +1,21 @@
+from typing import List
+from pydantic import Field
+from lib.core.sdk.viewmodel import BaseViewModel
+
+
+class NewMessageBatchViewModel(BaseViewModel):
+    """
+    View Model for the New Message Batch Feature.
+    """
+
+    message_ids: List[int] = Field(description="IDs of the newly created messages, in the order they were given.")
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "message_ids": [1, 2, 3],
+                }
+            ]
+        }
+    }
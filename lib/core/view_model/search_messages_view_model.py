@@ -0,0 +1,37 @@
+from typing import List
+
+from pydantic import Field
+from lib.core.entity.models import MessageSearchResult
+from lib.core.sdk.viewmodel import BaseViewModel
+
+
+class SearchMessagesViewModel(BaseViewModel):
+    """
+    View Model for the Search Messages Feature. Represents the messages of a client matching a full-text search, best matches first.
+    """
+
+    search_results: List[MessageSearchResult] = Field(description="Messages matching the search, best matches first.")
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor to pass as 'after' to get the next page of search results, if there is one.",
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "search_results": [
+                        {
+                            "message_id": 12,
+                            "conversation_id": 3,
+                            "thread_id": 6,
+                            "sender_type": "agent",
+                            "snippet": "the <b>climate</b> models of the report",
+                            "rank": 0.2,
+                        },
+                    ],
+                    "next_cursor": "MC4yfDEy",
+                }
+            ]
+        },
+    }
@@ -1,11 +1,15 @@
 import sys
 import logging.config
 from dependency_injector import containers, providers
+from lib.core.sdk.metrics import RequestMetricsRegistry
 from lib.core.sdk.utils import get_all_modules
 from lib.infrastructure.config.features.demo_feature_container import DemoFeatureContainer
 from lib.infrastructure.config.features.get_client_data_for_download_feature_container import (
     GetClientDataForDownloadFeatureContainer,
 )
+from lib.infrastructure.config.features.get_client_data_for_download_batch_feature_container import (
+    GetClientDataForDownloadBatchFeatureContainer,
+)
 from lib.infrastructure.config.features.list_conversations_feature_container import ListConversationsFeatureContainer
 from lib.infrastructure.config.features.create_default_data_feature_container import CreateDefaultDataFeatureContainer
 from lib.infrastructure.config.features.list_messages_feature_container import ListMessagesFeatureContainer
@@ -18,6 +22,8 @@ from lib.infrastructure.config.features.list_source_data_for_research_context_fe
 )
 from lib.infrastructure.config.features.new_conversation_feature_container import NewConversationFeatureContainer
 from lib.infrastructure.config.features.new_message_feature_container import NewMessageFeatureContainer
+from lib.infrastructure.config.features.new_message_batch_feature_container import NewMessageBatchFeatureContainer
+from lib.infrastructure.config.features.search_messages_feature_container import SearchMessagesFeatureContainer
 from lib.infrastructure.config.features.new_research_context_feature_container import NewResearchContextFeatureContainer
 from lib.infrastructure.config.features.extend_research_context_feature_container import (
     ExtendResearchContextFeatureContainer,
@@ -26,6 +32,9 @@ from lib.infrastructure.config.features.new_source_data_feature_container import
 from lib.infrastructure.config.features.get_client_data_for_upload_feature_container import (
     GetClientDataForUploadFeatureContainer,
 )
+from lib.infrastructure.config.features.get_client_data_for_upload_batch_feature_container import (
+    GetClientDataForUploadBatchFeatureContainer,
+)
 from lib.infrastructure.repository.minio.minio_file_repository import MinIOFileRepository
 from lib.infrastructure.repository.minio.minio_object_store import MinIOObjectStore
 from lib.infrastructure.repository.sqla.sqla_research_context_repository import SQLAReseachContextRepository
@@ -33,8 +42,11 @@ from lib.infrastructure.repository.sqla.sqla_source_data_repository import SQLAS
 from lib.infrastructure.repository.sqla.sqla_client_repository import SQLAClientRepository
 import lib.infrastructure.rest.endpoints as endpoints
 
-from lib.infrastructure.repository.sqla.database import Database
+from lib.infrastructure.repository.sqla.client_cache import ClientCache
+from lib.infrastructure.repository.sqla.database import AsyncDatabase, Database, SlowQueryLog
+from lib.infrastructure.repository.sqla.unit_of_work import AsyncSQLAUnitOfWork, SQLAUnitOfWork
 from lib.infrastructure.repository.sqla.sqla_conversation_repository import SQLAConversationRepository
+from lib.infrastructure.repository.sqla.async_sqla_conversation_repository import AsyncSQLAConversationRepository
 from pathlib import Path
 
 
@@ -48,16 +60,58 @@ class ApplicationContainer(containers.DeclarativeContainer):
         format=config.log.format,
     )
 
-    db = providers.Factory(
+    # Aggregates the timings of the requests handled by this worker, exposed on /metrics
+    request_metrics_registry = providers.Singleton(RequestMetricsRegistry)
+
+    slow_query_log = providers.Singleton(
+        SlowQueryLog,
+        threshold_ms=config.rdbms.slow_query_threshold_ms.as_float(),
+        sample_rate=config.rdbms.slow_query_sample_rate.as_float(),
+    )
+
+    db = providers.Singleton(
         Database,
         db_host=config.rdbms.host,
         db_port=config.rdbms.port.as_int(),
         db_user=config.rdbms.username,
         db_password=config.rdbms.password,
         db_name=config.rdbms.database,
+        pool_size=config.rdbms.pool_size.as_int(),
+        max_overflow=config.rdbms.max_overflow.as_int(),
+        pool_recycle=config.rdbms.pool_recycle.as_int(),
+        pool_pre_ping=config.rdbms.pool_pre_ping,
+        pool_timeout=config.rdbms.pool_timeout.as_int(),
+        echo=config.rdbms.echo,
+        slow_query_log=slow_query_log,
+        replicas=config.rdbms.replicas,
+        replica_max_lag_seconds=config.rdbms.replica_max_lag_seconds.as_float(),
     )
 
-    storage = providers.Factory(
+    unit_of_work = providers.Singleton(SQLAUnitOfWork, database=db)
+
+    # The hot features are served on the event loop, through asyncpg, with the same settings as the sync database
+    async_db = providers.Singleton(
+        AsyncDatabase,
+        db_host=config.rdbms.host,
+        db_port=config.rdbms.port.as_int(),
+        db_user=config.rdbms.username,
+        db_password=config.rdbms.password,
+        db_name=config.rdbms.database,
+        pool_size=config.rdbms.pool_size.as_int(),
+        max_overflow=config.rdbms.max_overflow.as_int(),
+        pool_recycle=config.rdbms.pool_recycle.as_int(),
+        pool_pre_ping=config.rdbms.pool_pre_ping,
+        pool_timeout=config.rdbms.pool_timeout.as_int(),
+        echo=config.rdbms.echo,
+        slow_query_log=slow_query_log,
+        replicas=config.rdbms.replicas,
+        replica_max_lag_seconds=config.rdbms.replica_max_lag_seconds.as_float(),
+    )
+
+    async_unit_of_work = providers.Singleton(AsyncSQLAUnitOfWork, database=async_db)
+
+    # A single store per process, so that its caches are shared by all requests
+    storage = providers.Singleton(
         MinIOObjectStore,
         host=config.object_store.host,
         port=config.object_store.port.as_int(),
@@ -66,26 +120,47 @@ class ApplicationContainer(containers.DeclarativeContainer):
         secure=config.object_store.secure,
         cert_check=config.object_store.cert_check,
         signed_url_expiry=config.object_store.signed_url_expiry.as_int(),
+        region=config.object_store.region,
+        object_cache_size=config.object_store.object_cache_size.as_int(),
+        object_cache_ttl=config.object_store.object_cache_ttl.as_int(),
+        missing_object_cache_ttl=config.object_store.missing_object_cache_ttl.as_int(),
+    )
+
+    # A single cache per process, so that the clients looked up by one request are found by the next ones
+    client_cache = providers.Singleton(
+        ClientCache,
+        database=db,
+        maxsize=config.rdbms.client_cache_size.as_int(),
+        ttl=config.rdbms.client_cache_ttl.as_int(),
     )
 
     # Repositories:
     sqla_client_repository: providers.Factory[SQLAClientRepository] = providers.Factory(
-        SQLAClientRepository, session_factory=db.provided.session
+        SQLAClientRepository, session_factory=db.provided.session, unit_of_work=unit_of_work, client_cache=client_cache
     )
 
     sqla_conversation_repository: providers.Factory[SQLAConversationRepository] = providers.Factory(
         SQLAConversationRepository,
         session_factory=db.provided.session,
+        unit_of_work=unit_of_work,
+    )
+
+    async_sqla_conversation_repository: providers.Factory[AsyncSQLAConversationRepository] = providers.Factory(
+        AsyncSQLAConversationRepository,
+        database=async_db,
+        unit_of_work=async_unit_of_work,
     )
 
     sqla_research_context_repository: providers.Factory[SQLAReseachContextRepository] = providers.Factory(
         SQLAReseachContextRepository,
         session_factory=db.provided.session,
+        unit_of_work=unit_of_work,
     )
 
     sqla_source_data_repository: providers.Factory[SQLASourceDataRepository] = providers.Factory(
         SQLASourceDataRepository,
         session_factory=db.provided.session,
+        unit_of_work=unit_of_work,
     )
 
     minio_file_repository: providers.Factory[MinIOFileRepository] = providers.Factory(
@@ -169,6 +244,13 @@ class ApplicationContainer(containers.DeclarativeContainer):
         file_repository=minio_file_repository,
     )
 
+    get_client_data_for_upload_batch_feature = providers.Container(
+        GetClientDataForUploadBatchFeatureContainer,
+        config=config.features.get_client_data_for_upload_batch,
+        client_repository=sqla_client_repository,
+        file_repository=minio_file_repository,
+    )
+
     get_client_data_for_download_feature = providers.Container(
         GetClientDataForDownloadFeatureContainer,
         config=config.features.get_client_data_for_download,
@@ -177,14 +259,36 @@ class ApplicationContainer(containers.DeclarativeContainer):
         file_repository=minio_file_repository,
     )
 
+    get_client_data_for_download_batch_feature = providers.Container(
+        GetClientDataForDownloadBatchFeatureContainer,
+        config=config.features.get_client_data_for_download_batch,
+        client_repository=sqla_client_repository,
+        source_data_repository=sqla_source_data_repository,
+        file_repository=minio_file_repository,
+    )
+
     list_messages_feature = providers.Container(
         ListMessagesFeatureContainer,
         config=config.features.list_messages,
         conversation_repository=sqla_conversation_repository,
+        async_conversation_repository=async_sqla_conversation_repository,
     )
 
     new_message_feature = providers.Container(
         NewMessageFeatureContainer,
         config=config.features.new_message,
         conversation_repository=sqla_conversation_repository,
+        async_conversation_repository=async_sqla_conversation_repository,
+    )
+
+    new_message_batch_feature = providers.Container(
+        NewMessageBatchFeatureContainer,
+        config=config.features.new_message_batch,
+        conversation_repository=sqla_conversation_repository,
+    )
+
+    search_messages_feature = providers.Container(
+        SearchMessagesFeatureContainer,
+        config=config.features.search_messages,
+        conversation_repository=sqla_conversation_repository,
     )
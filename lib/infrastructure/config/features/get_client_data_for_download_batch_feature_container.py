@@ -0,0 +1,36 @@
+from typing import Any
+from dependency_injector import providers
+
+from lib.core.ports.primary.get_client_data_for_download_batch_primary_ports import (
+    GetClientDataForDownloadBatchInputPort,
+    GetClientDataForDownloadBatchOutputPort,
+)
+from lib.core.sdk.ioc_feature_container import BaseFeatureContainer
+from lib.core.usecase.get_client_data_for_download_batch_usecase import GetClientDataForDownloadBatchUseCase
+from lib.infrastructure.controller.get_client_data_for_download_batch_controller import (
+    GetClientDataForDownloadBatchController,
+)
+from lib.infrastructure.presenter.get_client_data_for_download_batch_presenter import (
+    GetClientDataForDownloadBatchPresenter,
+)
+
+
+class GetClientDataForDownloadBatchFeatureContainer(BaseFeatureContainer):
+    client_repository: Any = providers.Dependency()
+    source_data_repository: Any = providers.Dependency()
+    file_repository: Any = providers.Dependency()
+
+    presenter = providers.Factory[GetClientDataForDownloadBatchOutputPort](GetClientDataForDownloadBatchPresenter)
+
+    usecase = providers.Factory[GetClientDataForDownloadBatchInputPort](
+        GetClientDataForDownloadBatchUseCase,
+        client_repository=client_repository,
+        source_data_repository=source_data_repository,
+        file_repository=file_repository,
+    )
+
+    controller = providers.Factory(
+        GetClientDataForDownloadBatchController,
+        usecase=usecase,
+        presenter=presenter,
+    )
@@ -0,0 +1,34 @@
+from typing import Any
+from dependency_injector import providers
+
+from lib.core.ports.primary.get_client_data_for_upload_batch_primary_ports import (
+    GetClientDataForUploadBatchInputPort,
+    GetClientDataForUploadBatchOutputPort,
+)
+from lib.core.sdk.ioc_feature_container import BaseFeatureContainer
+from lib.core.usecase.get_client_data_for_upload_batch_usecase import GetClientDataForUploadBatchUsecase
+from lib.infrastructure.controller.get_client_data_for_upload_batch_controller import (
+    GetClientDataForUploadBatchController,
+)
+from lib.infrastructure.presenter.get_client_data_for_upload_batch_presenter import (
+    GetClientDataForUploadBatchPresenter,
+)
+
+
+class GetClientDataForUploadBatchFeatureContainer(BaseFeatureContainer):
+    client_repository: Any = providers.Dependency()
+    file_repository: Any = providers.Dependency()
+
+    presenter = providers.Factory[GetClientDataForUploadBatchOutputPort](GetClientDataForUploadBatchPresenter)
+
+    usecase = providers.Factory[GetClientDataForUploadBatchInputPort](
+        GetClientDataForUploadBatchUsecase,
+        client_repository=client_repository,
+        file_repository=file_repository,
+    )
+
+    controller = providers.Factory(
+        GetClientDataForUploadBatchController,
+        usecase=usecase,
+        presenter=presenter,
+    )
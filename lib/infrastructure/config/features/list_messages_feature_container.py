@@ -1,15 +1,20 @@
 from typing import Any
 from dependency_injector import providers
 
-from lib.core.ports.primary.list_messages_primary_ports import ListMessagesInputPort, ListMessagesOutputPort
+from lib.core.ports.primary.list_messages_primary_ports import (
+    AsyncListMessagesInputPort,
+    ListMessagesInputPort,
+    ListMessagesOutputPort,
+)
 from lib.core.sdk.ioc_feature_container import BaseFeatureContainer
-from lib.core.usecase.list_messages_usecase import ListMessagesUseCase
-from lib.infrastructure.controller.list_messages_controller import ListMessagesController
+from lib.core.usecase.list_messages_usecase import AsyncListMessagesUseCase, ListMessagesUseCase
+from lib.infrastructure.controller.list_messages_controller import AsyncListMessagesController, ListMessagesController
 from lib.infrastructure.presenter.list_messages_presenter import ListMessagesPresenter
 
 
 class ListMessagesFeatureContainer(BaseFeatureContainer):
     conversation_repository: Any = providers.Dependency()
+    async_conversation_repository: Any = providers.Dependency()
 
     presenter = providers.Factory[ListMessagesOutputPort](ListMessagesPresenter)
 
@@ -22,3 +27,13 @@ class ListMessagesFeatureContainer(BaseFeatureContainer):
         usecase=usecase,
         presenter=presenter,
     )
+
+    async_usecase = providers.Factory[AsyncListMessagesInputPort](
+        AsyncListMessagesUseCase, conversation_repository=async_conversation_repository
+    )
+
+    async_controller = providers.Factory(
+        AsyncListMessagesController,
+        usecase=async_usecase,
+        presenter=presenter,
+    )
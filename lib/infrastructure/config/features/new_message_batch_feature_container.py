@@ -0,0 +1,25 @@
+from typing import Any
+from lib.core.ports.primary.new_message_batch_primary_ports import NewMessageBatchInputPort, NewMessageBatchOutputPort
+from lib.core.sdk.ioc_feature_container import BaseFeatureContainer
+
+from dependency_injector import providers
+
+from lib.core.usecase.new_message_batch_usecase import NewMessageBatchUseCase
+from lib.infrastructure.controller.new_message_batch_controller import NewMessageBatchController
+from lib.infrastructure.presenter.new_message_batch_presenter import NewMessageBatchPresenter
+
+
+class NewMessageBatchFeatureContainer(BaseFeatureContainer):
+    conversation_repository: Any = providers.Dependency()
+
+    presenter = providers.Factory[NewMessageBatchOutputPort](NewMessageBatchPresenter)
+
+    usecase = providers.Factory[NewMessageBatchInputPort](
+        NewMessageBatchUseCase, conversation_repository=conversation_repository
+    )
+
+    controller = providers.Factory(
+        NewMessageBatchController,
+        usecase=usecase,
+        presenter=presenter,
+    )
@@ -1,16 +1,21 @@
 from typing import Any
-from lib.core.ports.primary.new_message_primary_ports import NewMessageInputPort, NewMessageOutputPort
+from lib.core.ports.primary.new_message_primary_ports import (
+    AsyncNewMessageInputPort,
+    NewMessageInputPort,
+    NewMessageOutputPort,
+)
 from lib.core.sdk.ioc_feature_container import BaseFeatureContainer
 
 from dependency_injector import providers
 
-from lib.core.usecase.new_message_usecase import NewMessageUseCase
-from lib.infrastructure.controller.new_message_controller import NewMessageController
+from lib.core.usecase.new_message_usecase import AsyncNewMessageUseCase, NewMessageUseCase
+from lib.infrastructure.controller.new_message_controller import AsyncNewMessageController, NewMessageController
 from lib.infrastructure.presenter.new_message_presenter import NewMessagePresenter
 
 
 class NewMessageFeatureContainer(BaseFeatureContainer):
     conversation_repository: Any = providers.Dependency()
+    async_conversation_repository: Any = providers.Dependency()
 
     presenter = providers.Factory[NewMessageOutputPort](NewMessagePresenter)
 
@@ -21,3 +26,13 @@ class NewMessageFeatureContainer(BaseFeatureContainer):
         usecase=usecase,
         presenter=presenter,
     )
+
+    async_usecase = providers.Factory[AsyncNewMessageInputPort](
+        AsyncNewMessageUseCase, conversation_repository=async_conversation_repository
+    )
+
+    async_controller = providers.Factory(
+        AsyncNewMessageController,
+        usecase=async_usecase,
+        presenter=presenter,
+    )
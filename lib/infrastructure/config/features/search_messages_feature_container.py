@@ -0,0 +1,25 @@
+from typing import Any
+from lib.core.ports.primary.search_messages_primary_ports import SearchMessagesInputPort, SearchMessagesOutputPort
+from lib.core.sdk.ioc_feature_container import BaseFeatureContainer
+
+from dependency_injector import providers
+
+from lib.core.usecase.search_messages_usecase import SearchMessagesUseCase
+from lib.infrastructure.controller.search_messages_controller import SearchMessagesController
+from lib.infrastructure.presenter.search_messages_presenter import SearchMessagesPresenter
+
+
+class SearchMessagesFeatureContainer(BaseFeatureContainer):
+    conversation_repository: Any = providers.Dependency()
+
+    presenter = providers.Factory[SearchMessagesOutputPort](SearchMessagesPresenter)
+
+    usecase = providers.Factory[SearchMessagesInputPort](
+        SearchMessagesUseCase, conversation_repository=conversation_repository
+    )
+
+    controller = providers.Factory(
+        SearchMessagesController,
+        usecase=usecase,
+        presenter=presenter,
+    )
@@ -0,0 +1,58 @@
+from fastapi import HTTPException
+from pydantic import Field
+from typing import List
+from lib.core.entity.models import SourceDataCompositeIndex
+from lib.core.sdk.controller import BaseController, BaseControllerParameters
+from lib.core.usecase.get_client_data_for_download_batch_usecase import GetClientDataForDownloadBatchUseCase
+from lib.core.usecase_models.get_client_data_for_download_batch_usecase_models import (
+    GetClientDataForDownloadBatchError,
+    GetClientDataForDownloadBatchRequest,
+    GetClientDataForDownloadBatchResponse,
+)
+from lib.core.view_model.get_client_data_for_download_batch_view_model import GetClientDataForDownloadBatchViewModel
+from lib.infrastructure.presenter.get_client_data_for_download_batch_presenter import (
+    GetClientDataForDownloadBatchPresenter,
+)
+
+
+MAX_BATCH_SIZE = 1000
+
+
+class GetClientDataForDownloadBatchControllerParameters(BaseControllerParameters):
+    client_id: int = Field(title="Client ID", description="The ID of the client requesting the download.")
+
+    composite_indexes: List[SourceDataCompositeIndex] = Field(
+        title="Files",
+        description=f"The protocols and relative paths of the files to be downloaded. At most {MAX_BATCH_SIZE} files per batch.",
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+    )
+
+
+class GetClientDataForDownloadBatchController(
+    BaseController[
+        GetClientDataForDownloadBatchControllerParameters,
+        GetClientDataForDownloadBatchRequest,
+        GetClientDataForDownloadBatchResponse,
+        GetClientDataForDownloadBatchError,
+        GetClientDataForDownloadBatchViewModel,
+    ]
+):
+    def __init__(
+        self,
+        usecase: GetClientDataForDownloadBatchUseCase,
+        presenter: GetClientDataForDownloadBatchPresenter,
+    ) -> None:
+        super().__init__(usecase=usecase, presenter=presenter)
+
+    def create_request(
+        self, parameters: GetClientDataForDownloadBatchControllerParameters | None
+    ) -> GetClientDataForDownloadBatchRequest:
+        if parameters is None:
+            raise HTTPException(status_code=400, detail="Invalid request parameters.")
+
+        else:
+            return GetClientDataForDownloadBatchRequest(
+                client_id=parameters.client_id,
+                composite_indexes=parameters.composite_indexes,
+            )
@@ -1,7 +1,8 @@
 from fastapi import HTTPException
-from pydantic import Field
-from lib.core.sdk.controller import BaseController, BaseControllerParameters
-from lib.core.usecase.list_messages_usecase import ListMessagesUseCase
+from pydantic import Field, field_validator
+from lib.core.sdk.controller import AsyncBaseController, BaseController, BaseControllerParameters
+from lib.core.sdk.pagination import decode_cursor
+from lib.core.usecase.list_messages_usecase import AsyncListMessagesUseCase, ListMessagesUseCase
 from lib.core.usecase_models.list_messages_usecase_models import (
     ListMessagesError,
     ListMessagesRequest,
@@ -16,6 +17,34 @@ class ListMessagesControllerParameters(BaseControllerParameters):
         title="Conversation ID",
         description="Conversation ID for which the messages are to be listed.",
     )
+    limit: int | None = Field(
+        default=None,
+        ge=1,
+        le=1000,
+        title="Limit",
+        description="Maximum number of messages to list. All messages are listed if not provided.",
+    )
+    after: str | None = Field(
+        default=None,
+        title="After",
+        description="Cursor of a message; only the messages created after it are listed.",
+    )
+    before: str | None = Field(
+        default=None,
+        title="Before",
+        description="Cursor of a message; only the messages created before it are listed.",
+    )
+    stream: bool = Field(
+        default=False,
+        title="Stream",
+        description="Whether to stream the messages as they are fetched from the database, instead of listing them.",
+    )
+
+    @field_validator("after", "before")
+    def cursor_must_be_valid(cls, v: str | None) -> str | None:
+        if v is not None:
+            decode_cursor(v)
+        return v
 
 
 class ListMessagesController(
@@ -35,4 +64,36 @@ class ListMessagesController(
             raise HTTPException(status_code=400, detail="Invalid request parameters.")
 
         else:
-            return ListMessagesRequest(conversation_id=parameters.conversation_id)
+            return ListMessagesRequest(
+                conversation_id=parameters.conversation_id,
+                limit=parameters.limit,
+                after=parameters.after,
+                before=parameters.before,
+                stream=parameters.stream,
+            )
+
+
+class AsyncListMessagesController(
+    AsyncBaseController[
+        ListMessagesControllerParameters,
+        ListMessagesRequest,
+        ListMessagesResponse,
+        ListMessagesError,
+        ListMessagesViewModel,
+    ]
+):
+    def __init__(self, usecase: AsyncListMessagesUseCase, presenter: ListMessagesPresenter) -> None:
+        super().__init__(usecase=usecase, presenter=presenter)
+
+    def create_request(self, parameters: ListMessagesControllerParameters | None) -> ListMessagesRequest:
+        if parameters is None:
+            raise HTTPException(status_code=400, detail="Invalid request parameters.")
+
+        else:
+            return ListMessagesRequest(
+                conversation_id=parameters.conversation_id,
+                limit=parameters.limit,
+                after=parameters.after,
+                before=parameters.before,
+                stream=parameters.stream,
+            )
@@ -1,6 +1,9 @@
+from datetime import datetime, timezone
 from fastapi import HTTPException
-from pydantic import Field
+from pydantic import Field, field_validator
+from lib.core.entity.models import ProtocolEnum, SourceDataStatusEnum
 from lib.core.sdk.controller import BaseController, BaseControllerParameters
+from lib.core.sdk.pagination import decode_cursor
 from lib.core.usecase.list_source_data_usecase import ListSourceDataUseCase
 from lib.core.usecase_models.list_source_data_usecase_models import (
     ListSourceDataError,
@@ -16,6 +19,61 @@ class ListSourceDataControllerParameter(BaseControllerParameters):
         title="Client ID",
         description="Client ID for which the source data is to be listed.",
     )
+    limit: int | None = Field(
+        default=None,
+        ge=1,
+        le=1000,
+        title="Limit",
+        description="Maximum number of source data to list. All matching source data are listed if not provided.",
+    )
+    after: str | None = Field(
+        default=None,
+        title="After",
+        description="Cursor of a source data; only the source data created after it are listed.",
+    )
+    source_data_type: str | None = Field(
+        default=None,
+        title="Type",
+        description="Only list the source data of this type, e.g. 'pdf'.",
+    )
+    status: SourceDataStatusEnum | None = Field(
+        default=None,
+        title="Status",
+        description="Only list the source data with this status.",
+    )
+    protocol: ProtocolEnum | None = Field(
+        default=None,
+        title="Protocol",
+        description="Only list the source data stored with this protocol.",
+    )
+    relative_path_prefix: str | None = Field(
+        default=None,
+        title="Relative Path Prefix",
+        description="Only list the source data whose relative path starts with this prefix.",
+    )
+    created_after: datetime | None = Field(
+        default=None,
+        title="Created After",
+        description="Only list the source data created at or after this datetime.",
+    )
+    created_before: datetime | None = Field(
+        default=None,
+        title="Created Before",
+        description="Only list the source data created before this datetime.",
+    )
+
+    @field_validator("after")
+    def cursor_must_be_valid(cls, v: str | None) -> str | None:
+        if v is not None:
+            decode_cursor(v)
+        return v
+
+    @field_validator("created_after", "created_before")
+    def datetime_must_be_naive_utc(cls, v: datetime | None) -> datetime | None:
+        # The creation datetimes are stored as naive UTC
+        if v is not None and v.tzinfo is not None:
+            return v.astimezone(timezone.utc).replace(tzinfo=None)
+        return v
 
 
 class ListSourceDataController(
@@ -34,4 +92,14 @@ class ListSourceDataController(
         if parameters is None:
             raise HTTPException(status_code=400, detail="Invalid request parameters.")
         else:
-            return ListSourceDataRequest(client_id=parameters.client_id)
+            return ListSourceDataRequest(
+                client_id=parameters.client_id,
+                limit=parameters.limit,
+                after=parameters.after,
+                source_data_type=parameters.source_data_type,
+                status=parameters.status,
+                protocol=parameters.protocol,
+                relative_path_prefix=parameters.relative_path_prefix,
+                created_after=parameters.created_after,
+                created_before=parameters.created_before,
+            )
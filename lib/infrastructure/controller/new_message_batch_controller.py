@@ -0,0 +1,56 @@
+from fastapi import HTTPException
+from pydantic import Field
+from typing import List
+from lib.core.entity.models import BaseMessage
+from lib.core.sdk.controller import BaseController, BaseControllerParameters
+from lib.core.usecase.new_message_batch_usecase import NewMessageBatchUseCase
+from lib.core.usecase_models.new_message_batch_usecase_models import (
+    NewMessageBatchError,
+    NewMessageBatchRequest,
+    NewMessageBatchResponse,
+)
+from lib.core.view_model.new_message_batch_view_model import NewMessageBatchViewModel
+from lib.infrastructure.presenter.new_message_batch_presenter import NewMessageBatchPresenter
+
+
+MAX_BATCH_SIZE = 10_000
+
+
+class NewMessageBatchControllerParameters(BaseControllerParameters):
+    conversation_id: int = Field(
+        title="Conversation ID",
+        description="The ID of the conversation to which the messages are to be added.",
+    )
+
+    messages: List[BaseMessage] = Field(
+        title="Messages",
+        description=f"The messages to be added, in order, with their content pieces and citations. At most {MAX_BATCH_SIZE} messages per batch.",
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+    )
+
+
+class NewMessageBatchController(
+    BaseController[
+        NewMessageBatchControllerParameters,
+        NewMessageBatchRequest,
+        NewMessageBatchResponse,
+        NewMessageBatchError,
+        NewMessageBatchViewModel,
+    ]
+):
+    def __init__(
+        self,
+        usecase: NewMessageBatchUseCase,
+        presenter: NewMessageBatchPresenter,
+    ) -> None:
+        super().__init__(usecase=usecase, presenter=presenter)
+
+    def create_request(self, parameters: NewMessageBatchControllerParameters | None) -> NewMessageBatchRequest:
+        if parameters is None:
+            raise HTTPException(status_code=400, detail="Invalid request parameters.")
+        else:
+            return NewMessageBatchRequest(
+                conversation_id=parameters.conversation_id,
+                messages=parameters.messages,
+            )
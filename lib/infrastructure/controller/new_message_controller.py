@@ -2,8 +2,8 @@ from fastapi import HTTPException
 from pydantic import BaseModel, Field
 from typing import List
 from lib.core.entity.models import BaseMessageContent, MessageContentTypeEnum
-from lib.core.sdk.controller import BaseController, BaseControllerParameters
-from lib.core.usecase.new_message_usecase import NewMessageUseCase
+from lib.core.sdk.controller import AsyncBaseController, BaseController, BaseControllerParameters
+from lib.core.usecase.new_message_usecase import AsyncNewMessageUseCase, NewMessageUseCase
 from lib.core.usecase_models.new_message_usecase_models import NewMessageError, NewMessageRequest, NewMessageResponse
 from lib.core.view_model.new_message_view_model import NewMessageViewModel
 from lib.infrastructure.presenter.new_message_presenter import NewMessagePresenter
@@ -57,3 +57,31 @@ class NewMessageController(
                 sender_type=parameters.sender_type,
                 thread_id=parameters.thread_id,
             )
+
+
+class AsyncNewMessageController(
+    AsyncBaseController[
+        NewMessageControllerParameters,
+        NewMessageRequest,
+        NewMessageResponse,
+        NewMessageError,
+        NewMessageViewModel,
+    ]
+):
+    def __init__(
+        self,
+        usecase: AsyncNewMessageUseCase,
+        presenter: NewMessagePresenter,
+    ) -> None:
+        super().__init__(usecase=usecase, presenter=presenter)
+
+    def create_request(self, parameters: NewMessageControllerParameters | None) -> NewMessageRequest:
+        if parameters is None:
+            raise HTTPException(status_code=400, detail="Invalid request parameters.")
+        else:
+            return NewMessageRequest(
+                conversation_id=parameters.conversation_id,
+                message_contents=parameters.message_contents,
+                sender_type=parameters.sender_type,
+                thread_id=parameters.thread_id,
+            )
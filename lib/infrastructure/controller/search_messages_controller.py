@@ -0,0 +1,80 @@
+from fastapi import HTTPException
+from pydantic import Field, field_validator
+from lib.core.sdk.controller import BaseController, BaseControllerParameters
+from lib.core.sdk.pagination import decode_search_cursor
+from lib.core.usecase.search_messages_usecase import SearchMessagesUseCase
+from lib.core.usecase_models.search_messages_usecase_models import (
+    SearchMessagesError,
+    SearchMessagesRequest,
+    SearchMessagesResponse,
+)
+from lib.core.view_model.search_messages_view_model import SearchMessagesViewModel
+from lib.infrastructure.presenter.search_messages_presenter import SearchMessagesPresenter
+
+
+class SearchMessagesControllerParameters(BaseControllerParameters):
+    client_id: int = Field(
+        title="Client ID",
+        description="Client ID whose messages are to be searched.",
+    )
+    query: str = Field(
+        min_length=1,
+        max_length=1000,
+        title="Query",
+        description='Search, in web search syntax: words, "quoted phrases", OR, and -excluded words.',
+    )
+    research_context_id: int | None = Field(
+        default=None,
+        title="Research Context ID",
+        description="Only search the messages of this research context of the client.",
+    )
+    conversation_id: int | None = Field(
+        default=None,
+        title="Conversation ID",
+        description="Only search the messages of this conversation of the client.",
+    )
+    limit: int = Field(
+        default=20,
+        ge=1,
+        le=100,
+        title="Limit",
+        description="Maximum number of messages to return.",
+    )
+    after: str | None = Field(
+        default=None,
+        title="After",
+        description="Cursor of a search result; only the messages ranked after it are returned.",
+    )
+
+    @field_validator("after")
+    def cursor_must_be_valid(cls, v: str | None) -> str | None:
+        if v is not None:
+            decode_search_cursor(v)
+        return v
+
+
+class SearchMessagesController(
+    BaseController[
+        SearchMessagesControllerParameters,
+        SearchMessagesRequest,
+        SearchMessagesResponse,
+        SearchMessagesError,
+        SearchMessagesViewModel,
+    ]
+):
+    def __init__(self, usecase: SearchMessagesUseCase, presenter: SearchMessagesPresenter) -> None:
+        super().__init__(usecase=usecase, presenter=presenter)
+
+    def create_request(self, parameters: SearchMessagesControllerParameters | None) -> SearchMessagesRequest:
+        if parameters is None:
+            raise HTTPException(status_code=400, detail="Invalid request parameters.")
+
+        else:
+            return SearchMessagesRequest(
+                client_id=parameters.client_id,
+                query=parameters.query,
+                research_context_id=parameters.research_context_id,
+                conversation_id=parameters.conversation_id,
+                limit=parameters.limit,
+                after=parameters.after,
+            )
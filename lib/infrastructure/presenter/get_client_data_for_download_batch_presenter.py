@@ -0,0 +1,32 @@
+from lib.core.ports.primary.get_client_data_for_download_batch_primary_ports import (
+    GetClientDataForDownloadBatchOutputPort,
+)
+from lib.core.usecase_models.get_client_data_for_download_batch_usecase_models import (
+    GetClientDataForDownloadBatchError,
+    GetClientDataForDownloadBatchResponse,
+)
+from lib.core.view_model.get_client_data_for_download_batch_view_model import GetClientDataForDownloadBatchViewModel
+
+
+class GetClientDataForDownloadBatchPresenter(GetClientDataForDownloadBatchOutputPort):
+    def convert_error_response_to_view_model(
+        self, response: GetClientDataForDownloadBatchError
+    ) -> GetClientDataForDownloadBatchViewModel:
+        return GetClientDataForDownloadBatchViewModel(
+            status=False,
+            code=response.errorCode,
+            errorCode=response.errorCode,
+            errorMessage=response.errorMessage,
+            errorName=response.errorName,
+            errorType=response.errorType,
+            signed_urls={},
+        )
+
+    def convert_response_to_view_model(
+        self, response: GetClientDataForDownloadBatchResponse
+    ) -> GetClientDataForDownloadBatchViewModel:
+        return GetClientDataForDownloadBatchViewModel(
+            status=True,
+            code=200,
+            signed_urls=response.credentials,
+        )
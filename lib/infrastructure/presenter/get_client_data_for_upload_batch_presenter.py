@@ -0,0 +1,32 @@
+from lib.core.ports.primary.get_client_data_for_upload_batch_primary_ports import (
+    GetClientDataForUploadBatchOutputPort,
+)
+from lib.core.usecase_models.get_client_data_for_upload_batch_usecase_models import (
+    GetClientDataForUploadBatchError,
+    GetClientDataForUploadBatchResponse,
+)
+from lib.core.view_model.get_client_data_for_upload_batch_view_model import GetClientDataForUploadBatchViewModel
+
+
+class GetClientDataForUploadBatchPresenter(GetClientDataForUploadBatchOutputPort):
+    def convert_error_response_to_view_model(
+        self, response: GetClientDataForUploadBatchError
+    ) -> GetClientDataForUploadBatchViewModel:
+        return GetClientDataForUploadBatchViewModel(
+            status=False,
+            code=response.errorCode,
+            errorCode=response.errorCode,
+            errorMessage=response.errorMessage,
+            errorName=response.errorName,
+            errorType=response.errorType,
+            signed_urls={},
+        )
+
+    def convert_response_to_view_model(
+        self, response: GetClientDataForUploadBatchResponse
+    ) -> GetClientDataForUploadBatchViewModel:
+        return GetClientDataForUploadBatchViewModel(
+            status=True,
+            code=200,
+            signed_urls=response.credentials,
+        )
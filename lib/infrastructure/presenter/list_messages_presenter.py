@@ -20,4 +20,7 @@ class ListMessagesPresenter(ListMessagesOutputPort):
             status=True,
             code=200,
             message_list=response.message_list,
+            message_stream=response.message_stream,
+            next_cursor=response.next_cursor,
+            previous_cursor=response.previous_cursor,
         )
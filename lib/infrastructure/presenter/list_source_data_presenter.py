@@ -20,4 +20,5 @@ class ListSourceDataPresenter(ListSourceDataOutputPort):
             status=True,
             code=200,
             source_data_list=response.source_data_list,
+            next_cursor=response.next_cursor,
         )
@@ -0,0 +1,23 @@
+from lib.core.ports.primary.new_message_batch_primary_ports import NewMessageBatchOutputPort
+from lib.core.usecase_models.new_message_batch_usecase_models import NewMessageBatchError, NewMessageBatchResponse
+from lib.core.view_model.new_message_batch_view_model import NewMessageBatchViewModel
+
+
+class NewMessageBatchPresenter(NewMessageBatchOutputPort):
+    def convert_error_response_to_view_model(self, response: NewMessageBatchError) -> NewMessageBatchViewModel:
+        return NewMessageBatchViewModel(
+            status=False,
+            code=response.errorCode,
+            errorCode=response.errorCode,
+            errorMessage=response.errorMessage,
+            errorName=response.errorName,
+            errorType=response.errorType,
+            message_ids=[],
+        )
+
+    def convert_response_to_view_model(self, response: NewMessageBatchResponse) -> NewMessageBatchViewModel:
+        return NewMessageBatchViewModel(
+            status=True,
+            code=200,
+            message_ids=response.message_ids,
+        )
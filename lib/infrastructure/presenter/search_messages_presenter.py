@@ -0,0 +1,24 @@
+from lib.core.ports.primary.search_messages_primary_ports import SearchMessagesOutputPort
+from lib.core.usecase_models.search_messages_usecase_models import SearchMessagesError, SearchMessagesResponse
+from lib.core.view_model.search_messages_view_model import SearchMessagesViewModel
+
+
+class SearchMessagesPresenter(SearchMessagesOutputPort):
+    def convert_error_response_to_view_model(self, response: SearchMessagesError) -> SearchMessagesViewModel:
+        return SearchMessagesViewModel(
+            status=False,
+            search_results=[],
+            code=response.errorCode,
+            errorCode=response.errorCode,
+            errorMessage=response.errorMessage,
+            errorName=response.errorName,
+            errorType=response.errorType,
+        )
+
+    def convert_response_to_view_model(self, response: SearchMessagesResponse) -> SearchMessagesViewModel:
+        return SearchMessagesViewModel(
+            status=True,
+            code=200,
+            search_results=response.search_results,
+            next_cursor=response.next_cursor,
+        )
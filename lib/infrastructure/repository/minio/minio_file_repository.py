@@ -1,9 +1,12 @@
+from typing import List
 from lib.core.dto.file_repository_dto import (
+    GetClientDataForDownloadBatchDTO,
     GetClientDataForDownloadDTO,
+    GetClientDataForUploadBatchDTO,
     SourceDataCompositeIndexExistsAsFileDTO,
     GetClientDataForUploadDTO,
 )
-from lib.core.entity.models import Client, ProtocolEnum, SourceData
+from lib.core.entity.models import Client, ProtocolEnum, SourceData, SourceDataCompositeIndex
 from lib.core.ports.secondary.file_repository import FileRepositoryOutputPort
 
 from lib.infrastructure.repository.minio.minio_object_store import MinIOObjectStore
@@ -109,6 +112,69 @@ class MinIOFileRepository(FileRepositoryOutputPort):
             credentials=url,
         )
 
+    def get_client_data_for_upload_batch(
+        self, client: Client, composite_indexes: List[SourceDataCompositeIndex]
+    ) -> GetClientDataForUploadBatchDTO:
+        """
+        Gets the file manager client data for uploading several files at once. The bucket of the client is checked only once.
+
+        @param client: The client uploading the files.
+        @type client: Client
+        @param composite_indexes: The protocols and relative paths of the files to upload.
+        @type composite_indexes: List[SourceDataCompositeIndex]
+        @return: A DTO containing the signed URL of each file, by relative path.
+        @rtype: GetClientDataForUploadBatchDTO
+        """
+        if client is None:
+            self.logger.error("Client cannot be None")
+            return GetClientDataForUploadBatchDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage="Client cannot be None",
+                errorName="ClientNotProvided",
+                errorType="ClientNotProvided",
+            )
+
+        if not composite_indexes:
+            self.logger.error("Composite indexes cannot be empty")
+            return GetClientDataForUploadBatchDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage="Composite indexes cannot be empty",
+                errorName="CompositeIndexesNotProvided",
+                errorType="CompositeIndexesNotProvided",
+            )
+
+        try:
+            minio_objects = [
+                self.store.pfn_to_object_name(
+                    self.store.protocol_and_relative_path_to_pfn(
+                        protocol=composite_index.protocol,
+                        relative_path=composite_index.relative_path,
+                        bucket_name=client.sub,
+                    )
+                )
+                for composite_index in composite_indexes
+            ]
+
+            urls = self.store.get_signed_urls_for_file_upload(minio_objects)
+
+        except Exception as e:
+            errorDTO = GetClientDataForUploadBatchDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage=f"Could not get signed URLs to upload the files to MinIO Repository: {e}",
+                errorName="CouldNotGetClientDataForUploadBatch",
+                errorType="CouldNotGetClientDataForUploadBatch",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        return GetClientDataForUploadBatchDTO(
+            status=True,
+            credentials={composite_index.relative_path: url for composite_index, url in zip(composite_indexes, urls)},
+        )
+
     def get_client_data_for_download(self, client: Client, source_data: SourceData) -> GetClientDataForDownloadDTO:
         """
         Gets the file manager client data for downloading a file.
@@ -179,6 +245,69 @@ class MinIOFileRepository(FileRepositoryOutputPort):
             credentials=url,
         )
 
+    def get_client_data_for_download_batch(
+        self, client: Client, source_data_list: List[SourceData]
+    ) -> GetClientDataForDownloadBatchDTO:
+        """
+        Gets the file manager client data for downloading several files at once. The bucket of the client is checked only once.
+
+        @param client: The client downloading the files.
+        @type client: Client
+        @param source_data_list: The source data to download.
+        @type source_data_list: List[SourceData]
+        @return: A DTO containing the signed URL of each file, by relative path.
+        @rtype: GetClientDataForDownloadBatchDTO
+        """
+        if client is None:
+            self.logger.error("Client cannot be None")
+            return GetClientDataForDownloadBatchDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage="Client cannot be None",
+                errorName="ClientNotProvided",
+                errorType="ClientNotProvided",
+            )
+
+        if not source_data_list:
+            self.logger.error("Source data list cannot be empty")
+            return GetClientDataForDownloadBatchDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage="Source data list cannot be empty",
+                errorName="SourceDataNotProvided",
+                errorType="SourceDataNotProvided",
+            )
+
+        try:
+            minio_objects = [
+                self.store.pfn_to_object_name(
+                    self.store.protocol_and_relative_path_to_pfn(
+                        protocol=source_data.protocol,
+                        relative_path=source_data.relative_path,
+                        bucket_name=client.sub,
+                    )
+                )
+                for source_data in source_data_list
+            ]
+
+            urls = self.store.get_signed_urls_for_file_download(minio_objects)
+
+        except Exception as e:
+            errorDTO = GetClientDataForDownloadBatchDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage=f"Could not get signed URLs to download the files from MinIO Repository: {e}",
+                errorName="CouldNotGetClientDataForDownloadBatch",
+                errorType="CouldNotGetClientDataForDownloadBatch",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        return GetClientDataForDownloadBatchDTO(
+            status=True,
+            credentials={source_data.relative_path: url for source_data, url in zip(source_data_list, urls)},
+        )
+
     def composite_index_of_source_data_exists_as_file(
         self, client: Client, protocol: ProtocolEnum, relative_path: str
     ) -> SourceDataCompositeIndexExistsAsFileDTO:
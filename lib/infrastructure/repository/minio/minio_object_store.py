@@ -1,10 +1,33 @@
 from datetime import timedelta
 import logging
-from typing import Tuple
+import threading
+import time
+from typing import Any, List, Set, Tuple
 from minio import Minio
+from minio.error import S3Error
 
 from lib.core.entity.models import ProtocolEnum
+from lib.core.sdk.cache import TTLCache
+from lib.core.sdk.metrics import current_request_metrics
 from lib.infrastructure.repository.minio.models import MinIOObject, MinIOPFN
+from lib.infrastructure.repository.minio.signing import SigV4Presigner
+
+
+class InstrumentedMinio(Minio):
+    """
+    A MinIO client that counts the HTTP requests it sends to the object store, and the time spent waiting for them, into the metrics of the current request.
+    """
+
+    def _url_open(self, *args: Any, **kwargs: Any) -> Any:
+        metrics = current_request_metrics()
+        if metrics is None:
+            return super()._url_open(*args, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return super()._url_open(*args, **kwargs)
+        finally:
+            metrics.record_object_store_call(time.perf_counter() - start)
 
 
 class MinIOObjectStore:
@@ -25,8 +48,18 @@ class MinIOObjectStore:
     @type cert_check: bool
     @ivar signed_url_expiry: The expiry time for signed URLs in minutes.
     @type signed_url_expiry: int
+    @ivar region: The region of the MinIO S3 Object Store. It is pinned so that signed URLs are computed locally, without asking MinIO for the region of each bucket.
+    @type region: str
+    @ivar object_cache_size: The maximum number of object existence checks kept in cache.
+    @type object_cache_size: int
+    @ivar object_cache_ttl: How long, in seconds, an object found to exist is remembered as existing.
+    @type object_cache_ttl: int
+    @ivar missing_object_cache_ttl: How long, in seconds, an object found missing is remembered as missing. Kept short, as clients upload objects directly to MinIO.
+    @type missing_object_cache_ttl: int
     """
 
+    NOT_FOUND_ERROR_CODES = ("NoSuchKey", "NoSuchBucket", "ResourceNotFound")
+
     def __init__(
         self,
         host: str,
@@ -36,6 +69,10 @@ class MinIOObjectStore:
         secure: bool = False,
         cert_check: bool = False,
         signed_url_expiry: int = 60,
+        region: str = "us-east-1",
+        object_cache_size: int = 10000,
+        object_cache_ttl: int = 60,
+        missing_object_cache_ttl: int = 5,
     ) -> None:
         self._access_key = access_key
         self._secret_key = secret_key
@@ -44,13 +81,32 @@ class MinIOObjectStore:
         self._signed_url_expiry = signed_url_expiry
         self._secure = secure
         self._cert_check = cert_check
+        self._region = region
         self._client = self._get_client()
+        self._presigner = SigV4Presigner(
+            access_key=access_key, secret_key=secret_key, region=region, base_url=self.base_url
+        )
+        self._missing_object_cache_ttl = missing_object_cache_ttl
+        self._object_cache: TTLCache[Tuple[str, str], bool] = TTLCache(maxsize=object_cache_size, ttl=object_cache_ttl)
+        self._known_buckets: Set[str] = set()
+        self._known_buckets_lock = threading.Lock()
         self.logger = logging.getLogger(self.__class__.__name__)
 
     @property
     def url(self) -> str:
         return f"{self.host}:{self.port}"
 
+    @property
+    def base_url(self) -> str:
+        """
+        The URL of the MinIO S3 Object Store, as signed URLs point to it. Default ports are left out, as MinIO does.
+        """
+        scheme = "https" if self._secure else "http"
+        default_port = "443" if self._secure else "80"
+        if str(self.port) == default_port:
+            return f"{scheme}://{self.host}"
+        return f"{scheme}://{self.host}:{self.port}"
+
     @property
     def host(self) -> str:
         return self._host
@@ -63,17 +119,22 @@ class MinIOObjectStore:
     def signed_url_expiry(self) -> int:
         return self._signed_url_expiry
 
+    @property
+    def region(self) -> str:
+        return self._region
+
     @property
     def client(self) -> Minio:
         return self._client
 
     def _get_client(self) -> Minio:
-        client = Minio(
+        client = InstrumentedMinio(
             self.url,
             access_key=self._access_key,
             secret_key=self._secret_key,
             secure=self._secure,
             cert_check=self._cert_check,
+            region=self._region,
         )
         return client
 
@@ -81,6 +142,22 @@ class MinIOObjectStore:
         buckets = self.client.list_buckets()
         return [bucket.name for bucket in buckets]
 
+    def load_known_buckets(self) -> None:
+        """
+        Remember all the buckets that currently exist, so that checking whether one of them exists needs no round trip to MinIO.
+        """
+        bucket_names = self.list_buckets()
+        with self._known_buckets_lock:
+            self._known_buckets.update(bucket_names)
+
+    def _remember_bucket(self, bucket_name: str) -> None:
+        with self._known_buckets_lock:
+            self._known_buckets.add(bucket_name)
+
+    def _forget_bucket(self, bucket_name: str) -> None:
+        with self._known_buckets_lock:
+            self._known_buckets.discard(bucket_name)
+
     def ping(self) -> bool:
         """
         Ping the MinIO S3 Object Store to check if it is reachable.
@@ -101,9 +178,17 @@ class MinIOObjectStore:
         return bucket_name
 
     def bucket_exists(self, bucket_name_raw: str) -> bool:
+        """
+        Check if a bucket exists. Buckets already known to exist are not looked up in MinIO again, unless MinIO reports them missing later on.
+        """
         bucket_name = self.process_bucket_name(bucket_name_raw)
+        if bucket_name in self._known_buckets:
+            return True
+
         found = self.client.bucket_exists(bucket_name)
         assert isinstance(found, bool)
+        if found:
+            self._remember_bucket(bucket_name)
         return found
 
     def create_bucket_if_not_exists(self, bucket_name_raw: str) -> None:
@@ -114,12 +199,22 @@ class MinIOObjectStore:
         :type bucket_name_raw: str
         """
         bucket_name = self.process_bucket_name(bucket_name_raw)
-        if self.bucket_exists(bucket_name):
+        if bucket_name in self._known_buckets:
+            return
+
+        if self.client.bucket_exists(bucket_name):
             self.logger.info(f"MinIO Repository: Bucket '{bucket_name}' already exists.")
+            self._remember_bucket(bucket_name)
             return
 
-        self.client.make_bucket(bucket_name)
-        self.logger.info(f"MinIO Repository: Created bucket '{bucket_name}'.")
+        try:
+            self.client.make_bucket(bucket_name)
+            self.logger.info(f"MinIO Repository: Created bucket '{bucket_name}'.")
+        except S3Error as e:
+            # Another worker created the bucket in the meantime
+            if e.code not in ("BucketAlreadyOwnedByYou", "BucketAlreadyExists"):
+                raise
+        self._remember_bucket(bucket_name)
 
     def initialize_store(self, bucket_name: str) -> None:
         """
@@ -130,7 +225,12 @@ class MinIOObjectStore:
     def list_objects(self, bucket_name_raw: str) -> list[MinIOObject]:
         bucket_name = self.process_bucket_name(bucket_name_raw)
         objects = self.client.list_objects(bucket_name, recursive=True)
-        objects = list(objects)
+        try:
+            objects = list(objects)
+        except S3Error as e:
+            if e.code == "NoSuchBucket":
+                self._forget_bucket(bucket_name)
+            raise
 
         minio_objects = [MinIOObject(bucket_name=bucket_name, object_name=obj.object_name) for obj in objects]
 
@@ -208,22 +308,64 @@ class MinIOObjectStore:
 
         self.create_bucket_if_not_exists(minio_object.bucket_name)
 
-        url = self.client.presigned_put_object(
+        # The object is about to be uploaded, so it must not stay cached as missing
+        self._object_cache.invalidate((minio_object.bucket_name, minio_object.object_name))
+
+        url = self._presigner.presign(
+            method="PUT",
             bucket_name=minio_object.bucket_name,
             object_name=minio_object.object_name,
             expires=timedelta(minutes=self.signed_url_expiry),
         )
-        assert isinstance(url, str)
 
         return url
 
+    def get_signed_urls_for_file_upload(self, minio_objects: List[MinIOObject]) -> List[str]:
+        """
+        Get signed URLs to upload several files to MinIO S3 Repository, checking each of their buckets only once.
+        """
+        expires = timedelta(minutes=self.signed_url_expiry)
+
+        for bucket_name in {minio_object.bucket_name for minio_object in minio_objects}:
+            self.create_bucket_if_not_exists(bucket_name)
+
+        urls = []
+        for minio_object in minio_objects:
+            self._object_cache.invalidate((minio_object.bucket_name, minio_object.object_name))
+            urls.append(
+                self._presigner.presign(
+                    method="PUT",
+                    bucket_name=minio_object.bucket_name,
+                    object_name=minio_object.object_name,
+                    expires=expires,
+                )
+            )
+
+        return urls
+
     def object_exists(self, minio_object: MinIOObject) -> bool:
         """
-        Check if an object exists in a bucket in MinIO S3 Repository.
+        Check if an object exists in a bucket in MinIO S3 Repository, with a HEAD request on the object. Results are cached for a short while.
+
+        :raises S3Error: If MinIO fails for another reason than the object or its bucket not existing.
         """
-        object_list = self.list_objects(minio_object.bucket_name)
-        existence = minio_object in object_list
-        return existence
+        key = (minio_object.bucket_name, minio_object.object_name)
+        cached = self._object_cache.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            self.client.stat_object(minio_object.bucket_name, minio_object.object_name)
+        except S3Error as e:
+            if e.code not in self.NOT_FOUND_ERROR_CODES:
+                raise
+            # A HEAD request cannot tell a missing object from a missing bucket, so the bucket is checked again next time
+            self._forget_bucket(minio_object.bucket_name)
+            self._object_cache.set(key, False, ttl=self._missing_object_cache_ttl)
+            return False
+
+        self._object_cache.set(key, True)
+        return True
 
     def get_signed_url_for_file_download(self, minio_object: MinIOObject) -> str:
         """
@@ -239,11 +381,35 @@ class MinIOObjectStore:
             errorMessage = f"Object '{minio_object}' does not exist in MinIO"
             raise ValueError(errorMessage)
 
-        url = self.client.presigned_get_object(
+        url = self._presigner.presign(
+            method="GET",
             bucket_name=minio_object.bucket_name,
             object_name=minio_object.object_name,
             expires=timedelta(minutes=self.signed_url_expiry),
         )
-        assert isinstance(url, str)
 
         return url
+
+    def get_signed_urls_for_file_download(self, minio_objects: List[MinIOObject]) -> List[str]:
+        """
+        Get signed URLs to download several files from MinIO S3 Repository. Like for a single file, each object is checked to exist, with the cached HEAD request.
+
+        :raises ValueError: If any of the objects does not exist in MinIO; the error lists all the missing objects.
+        """
+        expires = timedelta(minutes=self.signed_url_expiry)
+
+        missing_objects = [minio_object for minio_object in minio_objects if not self.object_exists(minio_object)]
+        if missing_objects:
+            errorMessage = f"Objects {[str(minio_object) for minio_object in missing_objects]} do not exist in MinIO"
+            self.logger.error(errorMessage)
+            raise ValueError(errorMessage)
+
+        return [
+            self._presigner.presign(
+                method="GET",
+                bucket_name=minio_object.bucket_name,
+                object_name=minio_object.object_name,
+                expires=expires,
+            )
+            for minio_object in minio_objects
+        ]
@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta, timezone
+import hashlib
+import hmac
+from typing import Tuple
+from urllib.parse import quote
+
+
+class SigV4Presigner:
+    """
+    Computes AWS Signature Version 4 presigned URLs for path-style object requests, without any call to the object store.
+    The signing key derived from the secret key only changes once a day, so it is cached for the current day.
+
+    @ivar access_key: The access key of the object store.
+    @type access_key: str
+    @ivar secret_key: The secret key of the object store.
+    @type secret_key: str
+    @ivar region: The region of the object store, pinned in the configuration instead of being discovered.
+    @type region: str
+    @ivar base_url: The scheme and location of the object store, e.g. 'http://localhost:9001'.
+    @type base_url: str
+    """
+
+    ALGORITHM = "AWS4-HMAC-SHA256"
+    SERVICE = "s3"
+
+    def __init__(self, access_key: str, secret_key: str, region: str, base_url: str) -> None:
+        self._access_key = access_key
+        self._secret_key = secret_key
+        self._region = region
+        self._base_url = base_url.rstrip("/")
+        self._host = self._base_url.split("://", 1)[-1]
+        self._signing_key: Tuple[str, bytes] | None = None
+
+    @property
+    def region(self) -> str:
+        return self._region
+
+    @staticmethod
+    def _hmac(key: bytes, message: str) -> bytes:
+        return hmac.new(key, message.encode("utf-8"), hashlib.sha256).digest()
+
+    def signing_key(self, date: str) -> bytes:
+        """
+        Get the signing key for a day, derived from the secret key with four HMACs, and cached until the day changes.
+
+        @param date: The day, formatted as YYYYMMDD.
+        @type date: str
+        """
+        cached = self._signing_key
+        if cached is not None and cached[0] == date:
+            return cached[1]
+
+        key = self._hmac(f"AWS4{self._secret_key}".encode("utf-8"), date)
+        key = self._hmac(key, self._region)
+        key = self._hmac(key, self.SERVICE)
+        key = self._hmac(key, "aws4_request")
+        self._signing_key = (date, key)
+        return key
+
+    def presign(
+        self,
+        method: str,
+        bucket_name: str,
+        object_name: str,
+        expires: timedelta,
+        request_date: datetime | None = None,
+    ) -> str:
+        """
+        Get a presigned URL for an HTTP method on an object.
+
+        @param method: The HTTP method the URL is valid for, e.g. 'GET' or 'PUT'.
+        @type method: str
+        @param expires: How long the URL stays valid, between one second and seven days.
+        @type expires: timedelta
+        @param request_date: The date the URL is signed at. Defaults to now.
+        @type request_date: datetime | None
+        @raises ValueError: If the expiry is out of bounds.
+        """
+        expires_seconds = int(expires.total_seconds())
+        if expires_seconds < 1 or expires_seconds > 604800:
+            raise ValueError("The expiry of a presigned URL must be between 1 second and 7 days")
+
+        date = (request_date or datetime.now(timezone.utc)).astimezone(timezone.utc)
+        amz_date = date.strftime("%Y%m%dT%H%M%SZ")
+        signer_date = date.strftime("%Y%m%d")
+        scope = f"{signer_date}/{self._region}/{self.SERVICE}/aws4_request"
+
+        path = f"/{bucket_name}/{quote(object_name, safe='/')}"
+        query = (
+            f"X-Amz-Algorithm={self.ALGORITHM}"
+            f"&X-Amz-Credential={quote(f'{self._access_key}/{scope}', safe='')}"
+            f"&X-Amz-Date={amz_date}"
+            f"&X-Amz-Expires={expires_seconds}"
+            f"&X-Amz-SignedHeaders=host"
+        )
+        canonical_request = f"{method}\n{path}\n{query}\nhost:{self._host}\n\nhost\nUNSIGNED-PAYLOAD"
+        string_to_sign = (
+            f"{self.ALGORITHM}\n{amz_date}\n{scope}\n"
+            f"{hashlib.sha256(canonical_request.encode('utf-8')).hexdigest()}"
+        )
+        signature = hmac.new(self.signing_key(signer_date), string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+
+        return f"{self._base_url}{path}?{query}&X-Amz-Signature={signature}"
@@ -0,0 +1,425 @@
+from typing import AsyncGenerator, List, Tuple
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from lib.core.dto.conversation_repository_dto import (
+    ListConversationMessagesDTO,
+    NewMessageDTO,
+    StreamConversationMessagesDTO,
+)
+from lib.core.entity.models import (
+    AgentMessage,
+    BaseMessageContent,
+    MessageBase,
+    MessageContentTypeEnum,
+    MessageSenderTypeEnum,
+    TMessageBase,
+    UserMessage,
+)
+from lib.core.ports.secondary.conversation_repository import AsyncConversationRepository
+from lib.core.sdk.dto import CollectionVersionDTO
+from lib.core.sdk.pagination import encode_cursor
+from lib.infrastructure.repository.sqla.database import AsyncDatabase, read_only
+from lib.infrastructure.repository.sqla.models import (
+    SQLAAgentMessage,
+    SQLAConversation,
+    SQLAMessageBase,
+    SQLAMessageContent,
+    SQLAUserMessage,
+)
+from lib.infrastructure.repository.sqla.sqla_conversation_repository import (
+    advance_thread_counter_statement,
+    allocate_thread_ids_statement,
+    conversation_messages_statement,
+    conversation_messages_version_statement,
+    conversation_senders_statement,
+    convert_sqla_message,
+)
+from lib.infrastructure.repository.sqla.unit_of_work import AsyncSQLAUnitOfWork, AsyncSQLAUnitOfWorkMixin
+from lib.infrastructure.repository.sqla.utils import (
+    convert_sqla_agent_message_to_core_agent_message,
+    convert_sqla_client_message_to_core_user_message,
+)
+
+
+class AsyncSQLAConversationRepository(AsyncSQLAUnitOfWorkMixin, AsyncConversationRepository):
+    """
+    An async SQLAlchemy implementation of the hot operations of the conversation repository, on asyncpg. It runs the same queries as SQLAConversationRepository.
+    Nothing is lazily loaded, since an AsyncSession cannot do implicit I/O: the senders of the messages are resolved upfront, and the content pieces eagerly.
+    """
+
+    def __init__(self, database: AsyncDatabase, unit_of_work: AsyncSQLAUnitOfWork | None = None) -> None:
+        super().__init__()
+        self._init_async_session(database=database, unit_of_work=unit_of_work)
+
+    async def _conversation_senders(
+        self, session: AsyncSession, conversation_id: int
+    ) -> Tuple[str | None, str | None] | None:
+        """
+        Resolves who the senders of the messages of a conversation are.
+
+        @return: The client sub and the LLM name, or None if the conversation does not exist.
+        """
+        row = (await session.execute(conversation_senders_statement(conversation_id))).one_or_none()
+
+        if row is None:
+            return None
+        return row.sub, row.llm_name
+
+    @read_only
+    async def list_conversation_messages(
+        self,
+        conversation_id: int,
+        limit: int | None = None,
+        after: str | None = None,
+        before: str | None = None,
+    ) -> ListConversationMessagesDTO[TMessageBase]:
+        """
+        Lists the messages in a conversation, ordered by creation date. Without a limit, all messages are listed.
+
+        @param conversation_id: The ID of the conversation to list messages for.
+        @type conversation_id: int
+        @param limit: The maximum number of messages to list.
+        @type limit: int | None
+        @param after: A cursor; only the messages after it are listed.
+        @type after: str | None
+        @param before: A cursor; only the messages before it are listed.
+        @type before: str | None
+        @return: A DTO containing the result of the operation.
+        """
+        if conversation_id is None:
+            errorDTO = ListConversationMessagesDTO[TMessageBase](
+                status=False,
+                errorCode=-1,
+                errorMessage="Conversation ID cannot be None",
+                errorName="Conversation ID not provided",
+                errorType="ConversationIdNotProvided",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        # When paging backwards, walk the keyset in reverse so that the limit picks the messages right before the cursor
+        backwards = before is not None and after is None
+
+        try:
+            stmt = conversation_messages_statement(
+                conversation_id=conversation_id, after=after, before=before, descending=backwards
+            )
+        except ValueError as e:
+            errorDTO = ListConversationMessagesDTO[TMessageBase](
+                status=False,
+                errorCode=-1,
+                errorMessage=f"{e}",
+                errorName="Invalid cursor",
+                errorType="InvalidCursor",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        if limit is not None:
+            # One extra row tells whether there is another page in the direction we are walking
+            stmt = stmt.limit(limit + 1)
+
+        sqla_messages: List[SQLAMessageBase] = []
+        try:
+            async with self.session_scope() as session:
+                senders = await self._conversation_senders(session, conversation_id)
+                if senders is not None:
+                    sqla_messages = list((await session.scalars(stmt)).all())
+
+        except Exception as e:
+            self.logger.error(f"Error while querying the database for conversation with ID {conversation_id}: {e}")
+            errorDTO = ListConversationMessagesDTO[TMessageBase](
+                status=False,
+                errorCode=-1,
+                errorMessage=f"Error while querying the database for conversation with ID {conversation_id}: {e}",
+                errorName="Error while querying the database",
+                errorType="ErrorWhileQueryingDatabase",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        if senders is None:
+            self.logger.error(f"Conversation with ID {conversation_id} not found in the database.")
+            errorDTO = ListConversationMessagesDTO[TMessageBase](
+                status=False,
+                errorCode=-1,
+                errorMessage=f"Conversation with ID {conversation_id} not found in the database.",
+                errorName="Conversation not found",
+                errorType="ConversationNotFound",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        client_sub, llm_name = senders
+
+        has_more = limit is not None and len(sqla_messages) > limit
+        if has_more:
+            sqla_messages = sqla_messages[:limit]
+        if backwards:
+            sqla_messages.reverse()
+
+        core_messages: List[MessageBase] = []
+
+        for sqla_message in sqla_messages:
+            core_message = convert_sqla_message(sqla_message, client_sub=client_sub, llm_name=llm_name)
+            if core_message is not None:
+                core_messages.append(core_message)
+
+        next_cursor: str | None = None
+        previous_cursor: str | None = None
+        if len(sqla_messages) > 0:
+            first, last = sqla_messages[0], sqla_messages[-1]
+            if (has_more and not backwards) or (backwards and before is not None):
+                next_cursor = encode_cursor(last.created_at, last.id)
+            if (has_more and backwards) or (after is not None):
+                previous_cursor = encode_cursor(first.created_at, first.id)
+
+        return ListConversationMessagesDTO[TMessageBase](
+            status=True,
+            data=core_messages,
+            next_cursor=next_cursor,
+            previous_cursor=previous_cursor,
+        )
+
+    @read_only
+    async def get_conversation_messages_version(self, conversation_id: int) -> CollectionVersionDTO:
+        """
+        Summarizes the messages in a conversation, without loading them.
+
+        @param conversation_id: The ID of the conversation.
+        @type conversation_id: int
+        @return: A DTO containing the number of messages and their latest update.
+        @rtype: CollectionVersionDTO
+        """
+        if conversation_id is None:
+            errorDTO = CollectionVersionDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage="Conversation ID cannot be None",
+                errorName="Conversation ID not provided",
+                errorType="ConversationIdNotProvided",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        async with self.session_scope() as session:
+            count, last_updated_at = (
+                await session.execute(conversation_messages_version_statement(conversation_id))
+            ).one()
+        return CollectionVersionDTO(status=True, count=count, last_updated_at=last_updated_at)
+
+    async def stream_conversation_messages(
+        self,
+        conversation_id: int,
+        after: str | None = None,
+        before: str | None = None,
+        batch_size: int = 100,
+    ) -> StreamConversationMessagesDTO:
+        """
+        Streams the messages in a conversation, ordered by creation date. The messages are fetched lazily, in batches, while the returned async iterator is consumed.
+
+        @param conversation_id: The ID of the conversation to stream messages for.
+        @type conversation_id: int
+        @param after: A cursor; only the messages after it are streamed.
+        @type after: str | None
+        @param before: A cursor; only the messages before it are streamed.
+        @type before: str | None
+        @param batch_size: The number of messages fetched from the database at a time.
+        @type batch_size: int
+        @return: A DTO containing the result of the operation.
+        @rtype: StreamConversationMessagesDTO
+        """
+        if conversation_id is None:
+            errorDTO = StreamConversationMessagesDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage="Conversation ID cannot be None",
+                errorName="Conversation ID not provided",
+                errorType="ConversationIdNotProvided",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        try:
+            stmt = conversation_messages_statement(conversation_id=conversation_id, after=after, before=before)
+        except ValueError as e:
+            errorDTO = StreamConversationMessagesDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage=f"{e}",
+                errorName="Invalid cursor",
+                errorType="InvalidCursor",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        async with self.session_scope() as session:
+            senders = await self._conversation_senders(session, conversation_id)
+
+        if senders is None:
+            self.logger.error(f"Conversation with ID {conversation_id} not found in the database.")
+            errorDTO = StreamConversationMessagesDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage=f"Conversation with ID {conversation_id} not found in the database.",
+                errorName="Conversation not found",
+                errorType="ConversationNotFound",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        client_sub, llm_name = senders
+
+        return StreamConversationMessagesDTO(
+            status=True,
+            data=self._stream_sqla_messages(stmt=stmt, batch_size=batch_size, client_sub=client_sub, llm_name=llm_name),
+        )
+
+    async def _stream_sqla_messages(
+        self, stmt: Select[Tuple[SQLAMessageBase]], batch_size: int, client_sub: str | None, llm_name: str | None
+    ) -> AsyncGenerator[MessageBase, None]:
+        # The stream outlives the request that created it, so it gets its own session, closed once it is exhausted
+        async with self._async_database.session() as session:
+            result = await session.stream_scalars(stmt.execution_options(yield_per=batch_size))
+            async for partition in result.partitions():
+                for sqla_message in partition:
+                    core_message = convert_sqla_message(sqla_message, client_sub=client_sub, llm_name=llm_name)
+                    if core_message is not None:
+                        yield core_message
+
+    async def new_message(
+        self,
+        conversation_id: int,
+        message_contents: List[BaseMessageContent],
+        sender_type: MessageSenderTypeEnum,
+        thread_id: int | None = None,
+    ) -> NewMessageDTO:
+        """
+        Sends a message to a conversation.
+
+        @param conversation_id: The ID of the conversation to send the message to.
+        @type conversation_id: int
+        @param thread_id: The ID of the thread of the message
+        @type thread_id: int
+        @param message_contents: A list of the content pieces of the message
+        @type message_contents: List[MessageContent]
+        @return: A DTO containing the result of the operation.
+        @rtype: NewMessageDTO
+        """
+        if conversation_id is None:
+            errorDTO = NewMessageDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage="Conversation ID cannot be None",
+                errorName="Conversation ID not provided",
+                errorType="ConversationIdNotProvided",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        if not message_contents:
+            errorDTO = NewMessageDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage="Message contents must be a list with at least one item",
+                errorName="Message contents not provided",
+                errorType="MessageContentsNotProvided",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        sqla_message_class: type[SQLAAgentMessage] | type[SQLAUserMessage]
+        if sender_type == MessageSenderTypeEnum.AGENT:
+            sqla_message_class = SQLAAgentMessage
+        elif sender_type == MessageSenderTypeEnum.USER:
+            sqla_message_class = SQLAUserMessage
+        else:
+            errorDTO = NewMessageDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage="Invalid sender type provided",
+                errorName="Invalid sender type",
+                errorType="InvalidSenderType",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        async with self.session_scope() as session:
+            # 1. Check that the conversation exists, resolving the senders of its messages along the way
+            try:
+                senders = await self._conversation_senders(session, conversation_id)
+
+            except Exception as e:
+                self.logger.error(f"Error while querying the database for conversation with ID {conversation_id}: {e}")
+                errorDTO = NewMessageDTO(
+                    status=False,
+                    errorCode=-1,
+                    errorMessage=f"Error while querying the database for conversation with ID {conversation_id}: {e}",
+                    errorName="ErrorWhileQueryingDatabase",
+                    errorType="ErrorWhileQueryingDatabase",
+                )
+                self.logger.error(f"{errorDTO}")
+                return errorDTO
+
+            if senders is None:
+                self.logger.error(f"Conversation with ID {conversation_id} not found in the database.")
+                errorDTO = NewMessageDTO(
+                    status=False,
+                    errorCode=-1,
+                    errorMessage=f"Conversation with ID {conversation_id} not found in the database.",
+                    errorName="Conversation not found",
+                    errorType="ConversationNotFound",
+                )
+                self.logger.error(f"{errorDTO}")
+                return errorDTO
+
+            client_sub, llm_name = senders
+
+            try:
+                # 2. If thread ID not provided, allocate the next one from the counter of the conversation, else advance the counter past it
+                if not isinstance(thread_id, int):
+                    thread_id = (
+                        await session.execute(allocate_thread_ids_statement(conversation_id, new_threads=1))
+                    ).scalar_one()
+                else:
+                    await session.execute(advance_thread_counter_statement(conversation_id, thread_id))
+
+                assert isinstance(thread_id, int)
+
+                sqla_message = sqla_message_class(
+                    thread_id=thread_id,
+                    message_contents=[
+                        SQLAMessageContent(
+                            content=piece if isinstance(piece, str) else piece.content,
+                            content_type=MessageContentTypeEnum.TEXT if isinstance(piece, str) else piece.content_type,
+                        )
+                        for piece in message_contents
+                    ],
+                    conversation_id=conversation_id,
+                )
+
+                session.add(sqla_message)
+                await self.commit(session)
+
+                core_message: UserMessage | AgentMessage
+                if isinstance(sqla_message, SQLAUserMessage):
+                    core_message = convert_sqla_client_message_to_core_user_message(sqla_message, sender=client_sub)
+                else:
+                    core_message = convert_sqla_agent_message_to_core_agent_message(sqla_message, sender=llm_name)
+
+                return NewMessageDTO(status=True, data=core_message)
+
+            except Exception as e:
+                await self.rollback(session)
+                self.logger.error(f"Error while sending message to conversation: {e}")
+                errorDTO = NewMessageDTO(
+                    status=False,
+                    errorCode=-1,
+                    errorMessage=f"Error while sending message to conversation: {e}",
+                    errorName="Error while sending message to conversation",
+                    errorType="ErrorWhileSendingMessageToConversation",
+                )
+                self.logger.error(f"{errorDTO}")
+                return errorDTO
@@ -0,0 +1,84 @@
+from itertools import chain
+from typing import Any, Dict, List, Set, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import InstanceState, Session
+
+from lib.core.entity.models import Client
+from lib.core.sdk.cache import TTLCache
+from lib.infrastructure.repository.sqla.database import Database
+from lib.infrastructure.repository.sqla.models import SQLAClient
+
+
+class ClientCache:
+    """
+    A read-through cache of the clients, looked up by ID or by SUB, shared by all the client repositories of a worker. Nearly every use case starts by getting its client, and clients almost never change.
+    The entries of a client are dropped whenever it is updated or deleted through a session of the database, and expire after a time to live otherwise, e.g. when another worker wrote it.
+
+    @ivar maxsize: The maximum number of entries kept in the cache. Each client takes two, one per key.
+    @type maxsize: int
+    @ivar ttl: How long, in seconds, a client is cached.
+    @type ttl: float
+    """
+
+    WRITTEN_CLIENTS_KEY = "client_cache_written_clients"
+
+    def __init__(self, database: Database, maxsize: int = 10000, ttl: float = 300) -> None:
+        self._cache: TTLCache[Tuple[str, int | str], Client] = TTLCache(maxsize=maxsize, ttl=ttl)
+        event.listen(database.sessionmaker, "after_flush", self._after_flush)
+        event.listen(database.sessionmaker, "after_commit", self._after_commit)
+        event.listen(database.sessionmaker, "after_rollback", self._after_rollback)
+
+    def get_by_id(self, client_id: int) -> Client | None:
+        return self._cache.get(("id", client_id))
+
+    def get_by_sub(self, client_sub: str) -> Client | None:
+        return self._cache.get(("sub", client_sub))
+
+    def set(self, client: Client) -> None:
+        self._cache.set(("id", client.id), client)
+        self._cache.set(("sub", client.sub), client)
+
+    def invalidate(self, client_id: int, client_subs: Set[str] | None = None) -> None:
+        """
+        Drops the entries of a client.
+
+        @param client_subs: The SUBs the client is known by, besides the one of its cached entry, e.g. before it was renamed.
+        @type client_subs: Set[str] | None
+        """
+        subs = set(client_subs or ())
+        cached = self._cache.invalidate(("id", client_id))
+        if cached is not None:
+            subs.add(cached.sub)
+        for sub in subs:
+            self._cache.invalidate(("sub", sub))
+
+    def stats(self) -> Dict[str, int]:
+        """
+        @return: The number of hits and misses since the worker started, and the number of entries.
+        @rtype: Dict[str, int]
+        """
+        return {"hits": self._cache.hits, "misses": self._cache.misses, "size": len(self._cache)}
+
+    def _after_flush(self, session: Session, flush_context: Any) -> None:
+        written: List[Tuple[int, Set[str]]] = []
+        for instance in chain(session.dirty, session.deleted):
+            if isinstance(instance, SQLAClient):
+                # The history still holds the previous SUB, if this flush changed it
+                state: InstanceState[Any] = inspect(instance)
+                subs = {instance.sub, *state.attrs.sub.history.deleted}
+                written.append((instance.id, subs))
+        if not written:
+            return
+
+        # Dropped right away, so that this session does not read them back from the cache, and again once committed, in case a concurrent request cached them in between
+        for client_id, subs in written:
+            self.invalidate(client_id, subs)
+        session.info.setdefault(self.WRITTEN_CLIENTS_KEY, []).extend(written)
+
+    def _after_commit(self, session: Session) -> None:
+        for client_id, subs in session.info.pop(self.WRITTEN_CLIENTS_KEY, []):
+            self.invalidate(client_id, subs)
+
+    def _after_rollback(self, session: Session) -> None:
+        session.info.pop(self.WRITTEN_CLIENTS_KEY, None)
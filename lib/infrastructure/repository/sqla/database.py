@@ -1,23 +1,489 @@
-from contextlib import _GeneratorContextManager, contextmanager
-from typing import Any, Callable, Generator
+import asyncio
+from contextlib import _AsyncGeneratorContextManager, _GeneratorContextManager, asynccontextmanager, contextmanager
+from contextvars import ContextVar
+import functools
+import inspect
+import random
+import sys
+import threading
+import time
+from types import FrameType
+from typing import Any, AsyncGenerator, Callable, Dict, Generator, Iterator, List, Tuple, TypeVar, cast
 
-from sqlalchemy import create_engine, orm, Engine
+import greenlet
+from sqlalchemy import create_engine, event, orm, Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, declarative_base
+from sqlalchemy.engine import Connection, ExceptionContext
+from sqlalchemy.pool import ConnectionPoolEntry, QueuePool
 from sqlalchemy.sql import text
+from sqlalchemy.sql.dml import UpdateBase
 from sqlalchemy_utils.functions import database_exists, create_database
 import logging
 
+from lib.core.sdk.metrics import current_request_metrics
+
 Base = declarative_base()
 
 TDatabaseFactory = Callable[[], _GeneratorContextManager[Session]]
 
+TAsyncDatabaseFactory = Callable[[], _AsyncGeneratorContextManager[AsyncSession]]
+
+TMethod = TypeVar("TMethod", bound=Callable[..., Any])
+
+_read_only: ContextVar[bool] = ContextVar("rdbms_read_only", default=False)
+
+
+def read_only(method: TMethod) -> TMethod:
+    """
+    Marks a repository method as only reading from the RDBMS, so that its statements can be served by a replica, if any. It has no effect on the statements of a session that already wrote.
+    The statements must run before the method returns: the rows of a generator consumed afterwards are read from the primary.
+    """
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            token = _read_only.set(True)
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                _read_only.reset(token)
+
+        return cast(TMethod, async_wrapper)
+
+    @functools.wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        token = _read_only.set(True)
+        try:
+            return method(*args, **kwargs)
+        finally:
+            _read_only.reset(token)
+
+    return cast(TMethod, wrapper)
+
+
+def parse_replicas(replicas: str | None, default_port: int) -> List[Tuple[str, int]]:
+    """
+    Parses a comma-separated list of replicas, e.g. 'replica-1:5432,replica-2'.
+
+    @param default_port: The port of the replicas listed without one.
+    @type default_port: int
+    @return: The host and port of each replica, none if the list is empty.
+    @rtype: List[Tuple[str, int]]
+    """
+    hosts: List[Tuple[str, int]] = []
+    for replica in (replicas or "").split(","):
+        replica = replica.strip()
+        if not replica:
+            continue
+        host, _, port = replica.partition(":")
+        hosts.append((host, int(port) if port else default_port))
+    return hosts
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    A QueuePool that keeps track of how many checkouts had to wait for a connection to be returned to the pool, and for how long.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkouts_total = 0
+        self.waits_total = 0
+        self.wait_seconds_total = 0.0
+        self.timeouts_total = 0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        # The pool is exhausted when there are no idle connections and no overflow left, so this checkout will block
+        exhausted = self.checkedin() == 0 and self._max_overflow > -1 and self.overflow() >= self._max_overflow
+        start = time.perf_counter()
+        with self._stats_lock:
+            self.checkouts_total += 1
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            with self._stats_lock:
+                self.timeouts_total += 1
+            raise
+        finally:
+            if exhausted:
+                elapsed = time.perf_counter() - start
+                with self._stats_lock:
+                    self.waits_total += 1
+                    self.wait_seconds_total += elapsed
+
+    def stats(self) -> Dict[str, int | float]:
+        with self._stats_lock:
+            return {
+                "checkouts_total": self.checkouts_total,
+                "waits_total": self.waits_total,
+                "wait_seconds_total": self.wait_seconds_total,
+                "timeouts_total": self.timeouts_total,
+            }
+
+
+class RequestRoundTrips:
+    """
+    Counts the statements sent to the RDBMS while handling a request, and the time spent waiting for them, into the metrics of the current request.
+    """
+
+    START_TIMES_KEY = "request_round_trips_start_times"
+
+    @classmethod
+    def attach(cls, engine: Engine) -> None:
+        """
+        Starts counting the statements run by an engine. For an async engine, attach its sync_engine.
+        """
+        event.listen(engine, "before_cursor_execute", cls._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", cls._after_cursor_execute)
+        event.listen(engine, "handle_error", cls._handle_error)
+
+    @classmethod
+    def _before_cursor_execute(
+        cls, conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        if current_request_metrics() is not None:
+            conn.info.setdefault(cls.START_TIMES_KEY, []).append(time.perf_counter())
+
+    @classmethod
+    def _after_cursor_execute(
+        cls, conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        metrics = current_request_metrics()
+        start_times: List[float] = conn.info.get(cls.START_TIMES_KEY, [])
+        if metrics is not None and start_times:
+            metrics.record_db_round_trip(time.perf_counter() - start_times.pop())
+
+    @classmethod
+    def _handle_error(cls, exception_context: ExceptionContext) -> None:
+        conn = exception_context.connection
+        if conn is not None and conn.info.get(cls.START_TIMES_KEY):
+            conn.info[cls.START_TIMES_KEY].pop()
+
+
+class SlowQueryLog:
+    """
+    Logs the SQL statements that take longer than a threshold, as a cheap replacement for echoing every statement in production.
+    Each slow statement is tagged with the repository method that issued it, and only a sample of the statements is timed, so that the busiest workers can keep it on.
+
+    @ivar threshold_ms: The duration, in milliseconds, from which a statement is logged.
+    @type threshold_ms: float
+    @ivar sample_rate: The fraction of the statements that are timed, between 0 and 1.
+    @type sample_rate: float
+    """
+
+    START_TIMES_KEY = "slow_query_log_start_times"
+    REPOSITORY_PACKAGE = "lib.infrastructure.repository."
+    # The modules that run the statements on behalf of the repositories, and so never are the caller worth reporting
+    INTERNAL_MODULES = (
+        "lib.infrastructure.repository.sqla.database",
+        "lib.infrastructure.repository.sqla.unit_of_work",
+    )
+
+    def __init__(self, threshold_ms: float, sample_rate: float = 1.0) -> None:
+        if sample_rate < 0 or sample_rate > 1:
+            raise ValueError(f"The sample rate of the slow query log must be between 0 and 1, got {sample_rate}")
+        self._threshold_ms = threshold_ms
+        self._sample_rate = sample_rate
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def threshold_ms(self) -> float:
+        return self._threshold_ms
+
+    @property
+    def sample_rate(self) -> float:
+        return self._sample_rate
+
+    def attach(self, engine: Engine) -> None:
+        """
+        Starts timing the statements run by an engine. For an async engine, attach its sync_engine.
+        """
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+
+    def _before_cursor_execute(
+        self, conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        # Statements left out of the sample are pushed too, so that the start times always pair up with the statements
+        sampled = self._sample_rate >= 1 or random.random() < self._sample_rate
+        conn.info.setdefault(self.START_TIMES_KEY, []).append(time.perf_counter() if sampled else None)
+
+    def _after_cursor_execute(
+        self, conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        start_times: List[float | None] = conn.info.get(self.START_TIMES_KEY, [])
+        if not start_times:
+            return
+        start = start_times.pop()
+        if start is None:
+            return
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if elapsed_ms >= self._threshold_ms:
+            self.logger.warning(
+                f"Slow query in {self.caller()} took {elapsed_ms:.1f} ms (threshold {self._threshold_ms} ms): {statement}"
+            )
+
+    def _handle_error(self, exception_context: ExceptionContext) -> None:
+        conn = exception_context.connection
+        if conn is not None and conn.info.get(self.START_TIMES_KEY):
+            conn.info[self.START_TIMES_KEY].pop()
+
+    @classmethod
+    def caller(cls) -> str:
+        """
+        Finds the repository method that is running the current statement, e.g. 'SQLAConversationRepository.new_message'.
+        It is only looked up for the statements that are logged, since it walks the stack.
+
+        @return: The qualified name of the innermost public repository method on the stack, or 'unknown'.
+        @rtype: str
+        """
+        for frame in cls._frames():
+            module = frame.f_globals.get("__name__", "")
+            name = frame.f_code.co_name
+            if (
+                module.startswith(cls.REPOSITORY_PACKAGE)
+                and module not in cls.INTERNAL_MODULES
+                and not name.startswith("_")
+            ):
+                # co_qualname is only there from Python 3.11 on; before that the class is taken from the method's `self`
+                qualname: str | None = getattr(frame.f_code, "co_qualname", None)
+                if qualname is None:
+                    instance = frame.f_locals.get("self")
+                    qualname = name if instance is None else f"{type(instance).__name__}.{name}"
+                return qualname
+        return "unknown"
+
+    @staticmethod
+    def _frames() -> Iterator[FrameType]:
+        frame: FrameType | None = sys._getframe(1)
+        while frame is not None:
+            yield frame
+            frame = frame.f_back
+
+        # The statements of the async repositories run in a greenlet, whose stack stops short of the awaiting coroutines:
+        # they are on the stack of the parent greenlet, suspended until the statement is done
+        parent = greenlet.getcurrent().parent
+        while parent is not None:
+            frame = parent.gr_frame
+            while frame is not None:
+                yield frame
+                frame = frame.f_back
+            parent = parent.parent
+
+
+class ReplicaPool:
+    """
+    The read replicas of the RDBMS, taken in turn. A replica lagging behind the primary by more than a threshold, or failing to report its lag, is skipped until its lag is checked again.
+    The lag is checked at most once per interval and replica, on the first read that needs it.
+
+    @ivar max_lag_seconds: The replication lag, in seconds, from which a replica is skipped.
+    @type max_lag_seconds: float
+    @ivar check_interval_seconds: How long, in seconds, a lag check is trusted.
+    @type check_interval_seconds: float
+    """
+
+    # Zero when the replica has replayed all it received, so that a replica of an idle primary is not deemed lagging
+    LAG_QUERY = text(
+        "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+        "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+    )
+
+    def __init__(
+        self,
+        engines: List[Engine],
+        max_lag_seconds: float = 5.0,
+        check_interval_seconds: float = 1.0,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._engines = engines
+        self._max_lag_seconds = max_lag_seconds
+        self._check_interval_seconds = check_interval_seconds
+        self._timer = timer
+        self._lags: List[Tuple[float, float] | None] = [None] * len(engines)
+        self._next = 0
+        self._fallbacks_total = 0
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def engines(self) -> List[Engine]:
+        return self._engines
+
+    @property
+    def max_lag_seconds(self) -> float:
+        return self._max_lag_seconds
+
+    def engine(self) -> Engine | None:
+        """
+        Picks the next replica within the lag threshold.
+
+        @return: The engine of the replica, or None if every replica lags, in which case the primary should be used.
+        @rtype: Engine | None
+        """
+        with self._lock:
+            start = self._next
+            self._next = (self._next + 1) % len(self._engines)
+
+        for offset in range(len(self._engines)):
+            index = (start + offset) % len(self._engines)
+            if self._lag_seconds(index) <= self._max_lag_seconds:
+                return self._engines[index]
+
+        with self._lock:
+            self._fallbacks_total += 1
+        return None
+
+    def _lag_seconds(self, index: int) -> float:
+        now = self._timer()
+        with self._lock:
+            checked = self._lags[index]
+        if checked is not None and now - checked[0] < self._check_interval_seconds:
+            return checked[1]
+
+        try:
+            with self._engines[index].connect() as connection:
+                lag = float(connection.execute(self.LAG_QUERY).scalar_one())
+        except Exception as e:
+            self.logger.warning(f"Could not check the lag of replica {self._engines[index].url.host}: {e}")
+            lag = float("inf")
+        if lag > self._max_lag_seconds:
+            self.logger.warning(
+                f"Replica {self._engines[index].url.host} lags by {lag:.1f} s, reading from the primary"
+            )
+
+        with self._lock:
+            self._lags[index] = (now, lag)
+        return lag
+
+    def stats(self) -> Dict[str, int | float]:
+        """
+        @return: The number of replicas, how many were within the lag threshold when last checked, and how many reads fell back to the primary since the worker started.
+        @rtype: Dict[str, int | float]
+        """
+        with self._lock:
+            lags = list(self._lags)
+            fallbacks_total = self._fallbacks_total
+        return {
+            "replicas": len(self._engines),
+            "replicas_available": sum(1 for lag in lags if lag is not None and lag[1] <= self._max_lag_seconds),
+            "replica_fallbacks_total": fallbacks_total,
+        }
+
+
+class RoutingSession(Session):
+    """
+    A session sending the statements of the read-only repository methods to a replica, and all the others to the primary.
+    The replica is picked once per transaction, so that all the reads of a unit of work, e.g. the version of a collection and the collection itself, see the same snapshot.
+    Once it has written, or locked rows, it sticks to the primary, so that the reads that follow in the same unit of work see the writes.
+    """
+
+    WROTE_KEY = "routing_session_wrote"
+    REPLICA_KEY = "routing_session_replica"
+
+    def __init__(self, replicas: ReplicaPool | None = None, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._replicas = replicas
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs: Any) -> Any:
+        primary = super().get_bind(mapper=mapper, clause=clause, **kwargs)
+        if self._flushing or isinstance(clause, UpdateBase) or getattr(clause, "_for_update_arg", None) is not None:
+            self.info[self.WROTE_KEY] = True
+            return primary
+        if self._replicas is None or self.info.get(self.WROTE_KEY) or not _read_only.get():
+            return primary
+
+        # None when every replica lags, in which case the reads of the transaction go to the primary
+        if self.REPLICA_KEY not in self.info:
+            self.info[self.REPLICA_KEY] = self._replicas.engine()
+        replica: Engine | None = self.info[self.REPLICA_KEY]
+        return replica if replica is not None else primary
+
+    @classmethod
+    def _after_transaction_end(cls, session: Session, transaction: orm.SessionTransaction) -> None:
+        # Once committed or rolled back, the next transaction of the session may be served by another replica
+        if transaction.parent is None:
+            session.info.pop(cls.REPLICA_KEY, None)
+
+
+event.listen(RoutingSession, "after_transaction_end", RoutingSession._after_transaction_end)
+
 
 class Database:
-    def __init__(self, db_host: str, db_port: int, db_user: str, db_password: str, db_name: str) -> None:
+    """
+    Process-wide access point to the RDBMS. It owns the engine and its connection pool, so it is meant to be instantiated once per process and shared by all repositories.
+
+    @ivar pool_size: The number of connections kept open in the pool.
+    @type pool_size: int
+    @ivar max_overflow: The number of connections that can be opened beyond pool_size under load.
+    @type max_overflow: int
+    @ivar pool_recycle: The number of seconds after which a connection is recycled. -1 disables recycling.
+    @type pool_recycle: int
+    @ivar pool_pre_ping: Whether to test connections for liveness upon checkout.
+    @type pool_pre_ping: bool
+    @ivar pool_timeout: The number of seconds to wait for a connection before giving up.
+    @type pool_timeout: int
+    @ivar echo: Whether to log every statement and its parameters. Only meant for debugging, as it slows every query down.
+    @type echo: bool
+    @ivar slow_query_log: The log of the statements slower than a threshold, if any.
+    @type slow_query_log: SlowQueryLog | None
+    @ivar replicas: The read replicas, as a comma-separated list of 'host[:port]', each given a pool with the same settings as the primary. None or empty to read from the primary only.
+    @type replicas: str | None
+    @ivar replica_max_lag_seconds: The replication lag, in seconds, from which a replica is skipped in favor of the primary.
+    @type replica_max_lag_seconds: float
+    """
+
+    def __init__(
+        self,
+        db_host: str,
+        db_port: int,
+        db_user: str,
+        db_password: str,
+        db_name: str,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_recycle: int = 1800,
+        pool_pre_ping: bool = True,
+        pool_timeout: int = 30,
+        echo: bool = False,
+        slow_query_log: SlowQueryLog | None = None,
+        replicas: str | None = None,
+        replica_max_lag_seconds: float = 5.0,
+    ) -> None:
         self.__engine_url = f"postgresql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
-        self.__engine = create_engine(self.__engine_url, echo=True)
-        self.__session_factory = orm.scoped_session(
-            orm.sessionmaker(autoflush=False, autocommit=False, bind=self.__engine)
+        engine_options: Dict[str, Any] = {
+            "echo": echo,
+            "poolclass": InstrumentedQueuePool,
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_recycle": pool_recycle,
+            "pool_pre_ping": pool_pre_ping,
+            "pool_timeout": pool_timeout,
+        }
+        self.__engine = create_engine(self.__engine_url, **engine_options)
+        replica_engines = [
+            create_engine(f"postgresql://{db_user}:{db_password}@{host}:{port}/{db_name}", **engine_options)
+            for host, port in parse_replicas(replicas, default_port=db_port)
+        ]
+        for engine in [self.__engine, *replica_engines]:
+            RequestRoundTrips.attach(engine)
+            if slow_query_log is not None:
+                slow_query_log.attach(engine)
+
+        self.__replica_pool: ReplicaPool | None = None
+        if replica_engines:
+            self.__replica_pool = ReplicaPool(replica_engines, max_lag_seconds=replica_max_lag_seconds)
+        # Without replicas, a routing session sends every statement to the primary
+        self.__session_factory = orm.sessionmaker(
+            class_=RoutingSession,
+            replicas=self.__replica_pool,
+            autoflush=False,
+            autocommit=False,
+            bind=self.__engine,
         )
         self.logger = logging.getLogger(self.__class__.__name__)
         self.create_db()
@@ -50,10 +516,44 @@ class Database:
             self.logger.exception(f"Failed to ping database with error: {e}")
             return False
 
+    def pool_metrics(self) -> Dict[str, int | float]:
+        """
+        Returns a snapshot of the connection pool usage, to help sizing the pool.
+
+        @return: The pool size and current usage, plus cumulative checkout, wait and timeout counters.
+        @rtype: Dict[str, int | float]
+        """
+        pool = self.__engine.pool
+        metrics: Dict[str, int | float] = {}
+        if isinstance(pool, QueuePool):
+            metrics["size"] = pool.size()
+            metrics["checked_in"] = pool.checkedin()
+            metrics["checked_out"] = pool.checkedout()
+            metrics["overflow"] = pool.overflow()
+        if isinstance(pool, InstrumentedQueuePool):
+            metrics.update(pool.stats())
+        if self.__replica_pool is not None:
+            metrics.update(self.__replica_pool.stats())
+        return metrics
+
+    @property
+    def replica_pool(self) -> ReplicaPool | None:
+        """
+        The read replicas, or None if every statement goes to the primary.
+        """
+        return self.__replica_pool
+
     @property
     def url(self) -> str:
         return self.__engine_url
 
+    @property
+    def sessionmaker(self) -> orm.sessionmaker[RoutingSession]:
+        """
+        The factory of the sessions of this database, e.g. to listen to the events of all of them.
+        """
+        return self.__session_factory
+
     @property
     def base(self) -> Any:
         return Base
@@ -61,3 +561,153 @@ class Database:
     @property
     def engine(self) -> Engine:
         return self.__engine
+
+
+class AsyncDatabase:
+    """
+    Process-wide access point to the RDBMS for the requests served on the event loop, through asyncpg. It takes the same settings as Database, and is meant to be shared by all async repositories.
+    An asyncpg connection can only be used on the event loop that opened it, so an engine and its pool are kept per event loop: a single one under uvicorn, but a test client or a script may run each call on a new loop.
+
+    @ivar pool_size: The number of connections kept open in the pool of each event loop.
+    @type pool_size: int
+    @ivar max_overflow: The number of connections that can be opened beyond pool_size under load.
+    @type max_overflow: int
+    @ivar pool_recycle: The number of seconds after which a connection is recycled. -1 disables recycling.
+    @type pool_recycle: int
+    @ivar pool_pre_ping: Whether to test connections for liveness upon checkout.
+    @type pool_pre_ping: bool
+    @ivar pool_timeout: The number of seconds to wait for a connection before giving up.
+    @type pool_timeout: int
+    @ivar echo: Whether to log every statement and its parameters. Only meant for debugging, as it slows every query down.
+    @type echo: bool
+    @ivar slow_query_log: The log of the statements slower than a threshold, if any.
+    @type slow_query_log: SlowQueryLog | None
+    @ivar replicas: The read replicas, as a comma-separated list of 'host[:port]'. None or empty to read from the primary only.
+    @type replicas: str | None
+    @ivar replica_max_lag_seconds: The replication lag, in seconds, from which a replica is skipped in favor of the primary.
+    @type replica_max_lag_seconds: float
+    """
+
+    def __init__(
+        self,
+        db_host: str,
+        db_port: int,
+        db_user: str,
+        db_password: str,
+        db_name: str,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_recycle: int = 1800,
+        pool_pre_ping: bool = True,
+        pool_timeout: int = 30,
+        echo: bool = False,
+        slow_query_log: SlowQueryLog | None = None,
+        replicas: str | None = None,
+        replica_max_lag_seconds: float = 5.0,
+    ) -> None:
+        self.__engine_url = f"postgresql+asyncpg://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
+        self.__replica_urls = [
+            f"postgresql+asyncpg://{db_user}:{db_password}@{host}:{port}/{db_name}"
+            for host, port in parse_replicas(replicas, default_port=db_port)
+        ]
+        self.__replica_max_lag_seconds = replica_max_lag_seconds
+        self.__slow_query_log = slow_query_log
+        self.__engine_options: Dict[str, Any] = {
+            "echo": echo,
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_recycle": pool_recycle,
+            "pool_pre_ping": pool_pre_ping,
+            "pool_timeout": pool_timeout,
+        }
+        self.__engines: Dict[
+            asyncio.AbstractEventLoop, Tuple[AsyncEngine, async_sessionmaker[AsyncSession], List[AsyncEngine]]
+        ] = {}
+        self.__lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _engine_and_session_factory(
+        self,
+    ) -> Tuple[AsyncEngine, async_sessionmaker[AsyncSession], List[AsyncEngine]]:
+        loop = asyncio.get_running_loop()
+        with self.__lock:
+            entry = self.__engines.get(loop)
+            if entry is not None:
+                return entry
+
+            # The connections of the event loops that are gone cannot be closed anymore, so their pools are just dropped
+            for closed_loop in [other for other in self.__engines if other.is_closed()]:
+                closed_engine, _, closed_replicas = self.__engines.pop(closed_loop)
+                for closed in [closed_engine, *closed_replicas]:
+                    closed.sync_engine.dispose(close=False)
+
+            engine = create_async_engine(self.__engine_url, **self.__engine_options)
+            replica_engines = [create_async_engine(url, **self.__engine_options) for url in self.__replica_urls]
+            for attached in [engine, *replica_engines]:
+                RequestRoundTrips.attach(attached.sync_engine)
+                if self.__slow_query_log is not None:
+                    self.__slow_query_log.attach(attached.sync_engine)
+
+            # Objects stay usable after a commit without a lazy refresh, which an async session cannot do implicitly
+            if replica_engines:
+                replica_pool = ReplicaPool(
+                    [replica.sync_engine for replica in replica_engines],
+                    max_lag_seconds=self.__replica_max_lag_seconds,
+                )
+                session_factory = async_sessionmaker(
+                    bind=engine,
+                    sync_session_class=RoutingSession,
+                    replicas=replica_pool,
+                    autoflush=False,
+                    expire_on_commit=False,
+                )
+            else:
+                session_factory = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+            entry = (engine, session_factory, replica_engines)
+            self.__engines[loop] = entry
+            return entry
+
+    @asynccontextmanager
+    async def session(self) -> AsyncGenerator[AsyncSession, None]:
+        _, session_factory, _ = self._engine_and_session_factory()
+        session: AsyncSession = session_factory()
+        try:
+            yield session
+        except Exception:
+            self.logger.exception("Session rollback because of exception")
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+    async def ping(self) -> bool:
+        try:
+            async with self.session() as session:
+                await session.execute(text("SELECT 1"))
+                return True
+        except Exception as e:
+            self.logger.exception(f"Failed to ping database with error: {e}")
+            return False
+
+    async def dispose(self) -> None:
+        """
+        Closes the connections of the pools of the running event loop, e.g. when the application shuts down.
+        """
+        loop = asyncio.get_running_loop()
+        with self.__lock:
+            entry = self.__engines.pop(loop, None)
+        if entry is not None:
+            engine, _, replica_engines = entry
+            for disposed in [engine, *replica_engines]:
+                await disposed.dispose()
+
+    @property
+    def url(self) -> str:
+        return self.__engine_url
+
+    @property
+    def engine(self) -> AsyncEngine:
+        """
+        The engine of the running event loop.
+        """
+        return self._engine_and_session_factory()[0]
@@ -11,9 +11,11 @@ from sqlalchemy import (
     Boolean,
     ForeignKey,
     Table,
+    UniqueConstraint,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy import Enum as SAEnum
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import mapped_column, object_mapper, relationship, Mapped, MappedColumn
 from sqlalchemy.orm.session import Session
@@ -172,8 +174,9 @@ class SQLAClient(Base, SoftModelBase):  # type: ignore
 SourceDataResearchContextAssociation = Table(
     "source_data_research_context_association",
     Base.metadata,
-    Column("source_data_id", Integer, ForeignKey("source_data.id")),
-    Column("research_context_id", Integer, ForeignKey("research_context.id")),
+    Column("source_data_id", Integer, ForeignKey("source_data.id"), index=True),
+    Column("research_context_id", Integer, ForeignKey("research_context.id"), index=True),
+    UniqueConstraint("source_data_id", "research_context_id", name="uix_source_data_id_research_context_id"),
 )
 
 
@@ -219,6 +222,31 @@ class SQLASourceData(Base, SoftModelBase):  # type: ignore
         return f"<SourceData (id={self.id}, name={self.name})>"
 
 
+# Source data are listed per client in (created_at, id) keyset order, optionally filtered by status, type or relative path prefix
+# client_id leads all of these indexes, so it needs no index of its own for the lookups by client alone
+Index("ix_source_data_client_id_created_at_id", SQLASourceData.client_id, SQLASourceData.created_at, SQLASourceData.id)
+Index(
+    "ix_source_data_client_id_status_created_at_id",
+    SQLASourceData.client_id,
+    SQLASourceData.status,
+    SQLASourceData.created_at,
+    SQLASourceData.id,
+)
+Index(
+    "ix_source_data_client_id_type_created_at_id",
+    SQLASourceData.client_id,
+    SQLASourceData.type,
+    SQLASourceData.created_at,
+    SQLASourceData.id,
+)
+Index(
+    "ix_source_data_client_id_relative_path_pattern",
+    SQLASourceData.client_id,
+    SQLASourceData.relative_path,
+    postgresql_ops={"relative_path": "text_pattern_ops"},
+)
+
+
 EmbeddingModelLLMAssociation = Table(
     "embedding_model_llm_association",
     Base.metadata,
@@ -325,7 +353,7 @@ class SQLAResearchContext(Base, SoftModelBase):  # type: ignore
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     title: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[str] = mapped_column(String, nullable=False)
-    client_id: Mapped[int] = mapped_column(ForeignKey("client.id"), nullable=False)
+    client_id: Mapped[int] = mapped_column(ForeignKey("client.id"), nullable=False, index=True)
     llm_id: Mapped[int] = mapped_column(ForeignKey("llm.id"), nullable=False)
     source_data: Mapped[List["SQLASourceData"]] = relationship(
         "SQLASourceData", secondary=SourceDataResearchContextAssociation
@@ -349,13 +377,16 @@ class SQLAConversation(Base, SoftModelBase):  # type: ignore
     @type research_context_id: int
     @param message_segments: The message segments of the conversation
     @type message_segments: List[SQLAMessageBase]
+    @param last_thread_id: The last thread ID allocated in the conversation
+    @type last_thread_id: int
     """
 
     __tablename__ = "conversation"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     title: Mapped[str] = mapped_column(String, nullable=True)
-    research_context_id = mapped_column(ForeignKey("research_context.id"), nullable=False)
+    research_context_id = mapped_column(ForeignKey("research_context.id"), nullable=False, index=True)
+    last_thread_id: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     messages: Mapped[List["SQLAMessageBase"]] = relationship("SQLAMessageBase", backref="conversation")
 
 
@@ -376,9 +407,9 @@ class SQLACitation(Base, SoftModelBase):  # type: ignore
     __tablename__ = "citation"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    source_data_id: Mapped[int] = mapped_column(ForeignKey("source_data.id"), nullable=False)
+    source_data_id: Mapped[int] = mapped_column(ForeignKey("source_data.id"), nullable=False, index=True)
     citation_metadata: Mapped[str] = mapped_column(String, nullable=False)
-    agent_message_id: Mapped[int] = mapped_column(ForeignKey("agent_message.id"), nullable=False)
+    agent_message_id: Mapped[int] = mapped_column(ForeignKey("agent_message.id"), nullable=False, index=True)
 
 
 class SQLAMessageBase(Base, SoftModelBase):  # type: ignore
@@ -412,6 +443,16 @@ class SQLAMessageBase(Base, SoftModelBase):  # type: ignore
     }
 
 
+# Messages are looked up per conversation, either by thread or in (created_at, id) keyset order; both indexes also serve the lookups by conversation alone
+Index("ix_message_base_conversation_id_thread_id", SQLAMessageBase.conversation_id, SQLAMessageBase.thread_id)
+Index(
+    "ix_message_base_conversation_id_created_at_id",
+    SQLAMessageBase.conversation_id,
+    SQLAMessageBase.created_at,
+    SQLAMessageBase.id,
+)
+
+
 class SQLAUserMessage(SQLAMessageBase):
     """
     SQLAlchemy Message Query model
@@ -480,6 +521,8 @@ class SQLAMessageContent(Base, SoftModelBase):  # type: ignore
     @type content: str
     @param message_id: The ID of the message containing the message content
     @type message_segments: int
+    @param content_tsv: The lexemes of the content, for full-text search. Kept up to date by a trigger of the database, and only loaded when accessed.
+    @type content_tsv: str | None
     """
 
     __tablename__ = "message_content"
@@ -487,5 +530,10 @@ class SQLAMessageContent(Base, SoftModelBase):  # type: ignore
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     content: Mapped[str] = mapped_column(String, nullable=False)
     content_type: Mapped[MessageContentTypeEnum] = mapped_column(SAEnum(MessageContentTypeEnum), nullable=False)
+    content_tsv: Mapped[str | None] = mapped_column(TSVECTOR, nullable=True, deferred=True)
+
+    message_id: Mapped[int] = mapped_column(ForeignKey("message_base.id"), nullable=False, index=True)
+
 
-    message_id: Mapped[int] = mapped_column(ForeignKey("message_base.id"), nullable=False)
+# Message contents are searched by their lexemes
+Index("ix_message_content_content_tsv", SQLAMessageContent.content_tsv, postgresql_using="gin")
@@ -1,7 +1,8 @@
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from lib.core.dto.client_repository_dto import (
     GetClientDTO,
+    ListOwnedSourceDataIdsDTO,
     ListResearchContextsDTO,
     ListSourceDataDTO,
     NewResearchContextDTO,
@@ -9,38 +10,81 @@ from lib.core.dto.client_repository_dto import (
 )
 from lib.core.entity.models import LLM, ProtocolEnum, ResearchContext, SourceData, Client, SourceDataStatusEnum
 from lib.core.ports.secondary.client_repository import ClientRepositoryOutputPort
-from lib.infrastructure.repository.sqla.database import TDatabaseFactory
-from sqlalchemy.orm import Session
+from lib.core.sdk.dto import CollectionVersionDTO
+from lib.core.sdk.pagination import encode_cursor
+from lib.infrastructure.repository.sqla.client_cache import ClientCache
+from lib.infrastructure.repository.sqla.database import TDatabaseFactory, read_only
+from lib.infrastructure.repository.sqla.unit_of_work import SQLAUnitOfWork, SQLAUnitOfWorkMixin
 
 from lib.infrastructure.repository.sqla.models import (
     SQLALLM,
     SQLAResearchContext,
     SQLASourceData,
     SQLAClient,
+    SourceDataResearchContextAssociation,
 )
 from lib.infrastructure.repository.sqla.utils import (
+    collection_version_statement,
+    cursor_keyset,
     convert_sqla_LLM_to_core_LLM,
     convert_sqla_research_context_to_core_research_context,
     convert_sqla_client_to_core_client,
     convert_core_source_data_to_sqla_source_data,
     convert_sqla_source_data_to_core_source_data,
+    id_array,
 )
+from sqlalchemy import Select, any_, func, insert, literal, select, tuple_
+
+
+def source_data_statement(
+    client_id: int,
+    after: str | None = None,
+    source_data_type: str | None = None,
+    status: SourceDataStatusEnum | None = None,
+    protocol: ProtocolEnum | None = None,
+    relative_path_prefix: str | None = None,
+    created_after: datetime | None = None,
+    created_before: datetime | None = None,
+) -> Select[Tuple[SQLASourceData]]:
+    """
+    Builds the keyset query for the source data of a client, ordered by (created_at, id), with the given filters.
 
-
-class SQLAClientRepository(ClientRepositoryOutputPort):
+    @raises ValueError: If the cursor is malformed.
+    """
+    stmt = select(SQLASourceData).where(SQLASourceData.client_id == client_id)
+
+    if after is not None:
+        stmt = stmt.where(tuple_(SQLASourceData.created_at, SQLASourceData.id) > cursor_keyset(after))
+    if source_data_type is not None:
+        stmt = stmt.where(SQLASourceData.type == source_data_type)
+    if status is not None:
+        stmt = stmt.where(SQLASourceData.status == status)
+    if protocol is not None:
+        stmt = stmt.where(SQLASourceData.protocol == protocol)
+    if relative_path_prefix is not None:
+        stmt = stmt.where(SQLASourceData.relative_path.startswith(relative_path_prefix, autoescape=True))
+    if created_after is not None:
+        stmt = stmt.where(SQLASourceData.created_at >= created_after)
+    if created_before is not None:
+        stmt = stmt.where(SQLASourceData.created_at < created_before)
+
+    return stmt.order_by(SQLASourceData.created_at.asc(), SQLASourceData.id.asc())
+
+
+class SQLAClientRepository(SQLAUnitOfWorkMixin, ClientRepositoryOutputPort):
     """
-    A SQLAlchemy implementation of the client repository.
+    A SQLAlchemy implementation of the client repository. The lookups of a client by ID or SUB go through the client cache, if any.
     """
 
-    def __init__(self, session_factory: TDatabaseFactory) -> None:
+    def __init__(
+        self,
+        session_factory: TDatabaseFactory,
+        unit_of_work: SQLAUnitOfWork | None = None,
+        client_cache: ClientCache | None = None,
+    ) -> None:
         super().__init__()
-        with session_factory() as session:
-            self._session = session
-
-    @property
-    def session(self) -> Session:
-        self._session.expire_all()
-        return self._session
+        self._init_session(session_factory=session_factory, unit_of_work=unit_of_work)
+        self._client_cache = client_cache
 
     def get_client(self, client_id: int) -> GetClientDTO:
         """
@@ -64,6 +108,11 @@ class SQLAClientRepository(ClientRepositoryOutputPort):
             self.logger.error(f"{errorDTO}")
             return errorDTO
 
+        if self._client_cache is not None:
+            cached_client = self._client_cache.get_by_id(client_id)
+            if cached_client is not None:
+                return GetClientDTO(status=True, data=cached_client)
+
         sqla_client: SQLAClient | None = self.session.get(SQLAClient, client_id)
 
         if sqla_client is None:
@@ -79,6 +128,8 @@ class SQLAClientRepository(ClientRepositoryOutputPort):
             return errorDTO
 
         core_user: Client = convert_sqla_client_to_core_client(sqla_client)
+        if self._client_cache is not None:
+            self._client_cache.set(core_user)
 
         return GetClientDTO(status=True, data=core_user)
 
@@ -103,6 +154,11 @@ class SQLAClientRepository(ClientRepositoryOutputPort):
             self.logger.error(f"{errorDTO}")
             return errorDTO
 
+        if self._client_cache is not None:
+            cached_client = self._client_cache.get_by_sub(client_sub)
+            if cached_client is not None:
+                return GetClientDTO(status=True, data=cached_client)
+
         try:
             sqla_client = self.session.query(SQLAClient).filter_by(sub=client_sub).first()
 
@@ -119,6 +175,8 @@ class SQLAClientRepository(ClientRepositoryOutputPort):
                 return errorDTO
 
             core_user: Client = convert_sqla_client_to_core_client(sqla_client)
+            if self._client_cache is not None:
+                self._client_cache.set(core_user)
 
             return GetClientDTO(status=True, data=core_user)
 
@@ -306,29 +364,25 @@ class SQLAClientRepository(ClientRepositoryOutputPort):
         # Make the IDs unique
         source_data_ids = list(set(source_data_ids))
 
-        sqla_source_data: List[SQLASourceData] = []
-        sqla_source_data_error_ids: List[int] = []
         sqla_source_data_error_dict: Dict[str, str] = {}
 
-        for source_datum_id in source_data_ids:
-            try:
-                sqla_source_datum = self.session.get(SQLASourceData, source_datum_id)
-
-                if sqla_source_datum is None:
-                    sqla_source_data_error_ids.append(source_datum_id)
+        try:
+            existing_source_data_ids = set(
+                self.session.scalars(
+                    select(SQLASourceData.id).where(SQLASourceData.id == any_(id_array("ids", source_data_ids)))
+                ).all()
+            )
+            for source_datum_id in source_data_ids:
+                if source_datum_id not in existing_source_data_ids:
                     sqla_source_data_error_dict[f"ID {source_datum_id}"] = "Source data not found in the database"
-                    continue
-
-                sqla_source_data.append(sqla_source_datum)
 
-            except Exception as e:
-                sqla_source_data_error_ids.append(source_datum_id)
+        except Exception as e:
+            for source_datum_id in source_data_ids:
                 sqla_source_data_error_dict[
                     f"ID {source_datum_id}"
                 ] = f"Error while getting source data from the database: {e}"
-                continue
 
-        if sqla_source_data_error_ids != []:
+        if sqla_source_data_error_dict != {}:
             self.logger.error(
                 f"Error with the following source data. Operation aborted.\n\n {sqla_source_data_error_dict}"
             )
@@ -352,13 +406,22 @@ class SQLAClientRepository(ClientRepositoryOutputPort):
             description=research_context_description,
             client_id=client_id,
             llm_id=llm_id,
-            source_data=sqla_source_data,
             external_id=external_id,
         )
 
         try:
             sqla_new_research_context.save(session=self.session)
-            self.session.commit()
+            # Associate all the source data in a single INSERT ... SELECT unnest(:ids), rather than one row at a time
+            self.session.execute(
+                insert(SourceDataResearchContextAssociation).from_select(
+                    ["source_data_id", "research_context_id"],
+                    select(
+                        func.unnest(id_array("source_data_ids", source_data_ids)),
+                        literal(sqla_new_research_context.id),
+                    ),
+                )
+            )
+            self.commit()
         except Exception as e:
             self.logger.error(f"Error while creating new research context: {e}")
             errorDTO = NewResearchContextDTO(
@@ -383,6 +446,7 @@ class SQLAClientRepository(ClientRepositoryOutputPort):
             llm=core_llm,
         )
 
+    @read_only
     def list_research_contexts(self, client_id: int) -> ListResearchContextsDTO:
         """
         Lists all research contexts for a client.
@@ -428,6 +492,58 @@ class SQLAClientRepository(ClientRepositoryOutputPort):
 
         return ListResearchContextsDTO(status=True, data=core_research_contexts)
 
+    @read_only
+    def get_research_contexts_version(self, client_id: int) -> CollectionVersionDTO:
+        """
+        Summarizes the research contexts of a client, without loading them.
+
+        @param client_id: The ID of the client.
+        @type client_id: int
+        @return: A DTO containing the number of research contexts and their latest update.
+        @rtype: CollectionVersionDTO
+        """
+        if client_id is None:
+            errorDTO = CollectionVersionDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage="Client ID cannot be None",
+                errorName="Client ID not provided",
+                errorType="ClientIdNotProvided",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        count, last_updated_at = self.session.execute(
+            collection_version_statement(SQLAResearchContext, SQLAResearchContext.client_id == client_id)
+        ).one()
+        return CollectionVersionDTO(status=True, count=count, last_updated_at=last_updated_at)
+
+    @read_only
+    def get_source_data_version(self, client_id: int) -> CollectionVersionDTO:
+        """
+        Summarizes the source data of a client, without loading them.
+
+        @param client_id: The ID of the client.
+        @type client_id: int
+        @return: A DTO containing the number of source data and their latest update.
+        @rtype: CollectionVersionDTO
+        """
+        if client_id is None:
+            errorDTO = CollectionVersionDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage="Client ID cannot be None",
+                errorName="Client ID not provided",
+                errorType="ClientIdNotProvided",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        count, last_updated_at = self.session.execute(
+            collection_version_statement(SQLASourceData, SQLASourceData.client_id == client_id)
+        ).one()
+        return CollectionVersionDTO(status=True, count=count, last_updated_at=last_updated_at)
+
     def new_source_data(
         self, client_id: int, source_data_name: str, protocol: ProtocolEnum, relative_path: str
     ) -> NewSourceDataDTO:
@@ -574,7 +690,7 @@ class SQLAClientRepository(ClientRepositoryOutputPort):
         # 4. We used a triple composite index, so SD is unique, so we can commit it
         try:
             sqla_client.source_data.append(sqla_source_data)
-            self.session.commit()
+            self.commit()
 
             new_source_data = convert_sqla_source_data_to_core_source_data(sqla_source_data)
 
@@ -594,12 +710,85 @@ class SQLAClientRepository(ClientRepositoryOutputPort):
 
             # TODO OLD: In the previous version (allowing for a list for source data, instead of just one): fix this: if the second element of the input list is a duplicate of the first one, the first one will be added (correct), the second one catched in the duplicates list (correct), but from the third one onwards everything will fail because SQLA had an error in the session
 
-    def list_source_data(self, client_id: int) -> ListSourceDataDTO:
+    def list_owned_source_data_ids(self, client_id: int, source_data_ids: List[int]) -> ListOwnedSourceDataIdsDTO:
+        """
+        Checks which of the given source data belong to a client, in a single query, without loading the other source data of the client.
+
+        @param client_id: The ID of the client.
+        @type client_id: int
+        @param source_data_ids: The IDs of the source data to check.
+        @type source_data_ids: List[int]
+        @return: A DTO containing the IDs, among the given ones, of the source data owned by the client.
+        @rtype: ListOwnedSourceDataIdsDTO
+        """
+        if client_id is None:
+            errorDTO = ListOwnedSourceDataIdsDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage="Client ID cannot be None",
+                errorName="ClientIdNotProvided",
+                errorType="ClientIdNotProvided",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        if not source_data_ids:
+            return ListOwnedSourceDataIdsDTO(status=True, source_data_ids=[])
+
+        try:
+            stmt = select(SQLASourceData.id).where(
+                SQLASourceData.client_id == client_id,
+                SQLASourceData.id == any_(id_array("ids", list(set(source_data_ids)))),
+            )
+            owned_source_data_ids: List[int] = list(self.session.scalars(stmt).all())
+
+            return ListOwnedSourceDataIdsDTO(status=True, source_data_ids=owned_source_data_ids)
+
+        except Exception as e:
+            errorDTO = ListOwnedSourceDataIdsDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage=f"Could not check the ownership of source data for client with ID {client_id}: {e}",
+                errorName="CouldNotCheckSourceDataOwnership",
+                errorType="CouldNotCheckSourceDataOwnership",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+    @read_only
+    def list_source_data(
+        self,
+        client_id: int,
+        limit: int | None = None,
+        after: str | None = None,
+        source_data_type: str | None = None,
+        status: SourceDataStatusEnum | None = None,
+        protocol: ProtocolEnum | None = None,
+        relative_path_prefix: str | None = None,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+    ) -> ListSourceDataDTO:
         """
-        Lists source data for a given client.
+        Lists source data for a given client, ordered by creation date. Without a limit, all matching source data are listed.
 
         @param client_id: The ID of the client to list the source data for.
         @type client_id: int
+        @param limit: The maximum number of source data to list.
+        @type limit: int | None
+        @param after: A cursor; only the source data after it are listed.
+        @type after: str | None
+        @param source_data_type: Only list the source data of this type, e.g. 'pdf'.
+        @type source_data_type: str | None
+        @param status: Only list the source data with this status.
+        @type status: SourceDataStatusEnum | None
+        @param protocol: Only list the source data stored with this protocol.
+        @type protocol: ProtocolEnum | None
+        @param relative_path_prefix: Only list the source data whose relative path starts with this prefix.
+        @type relative_path_prefix: str | None
+        @param created_after: Only list the source data created at or after this datetime.
+        @type created_after: datetime | None
+        @param created_before: Only list the source data created before this datetime.
+        @type created_before: datetime | None
         @return: A DTO containing the result of the operation.
         @rtype: ListSourceDataDTO
         """
@@ -644,7 +833,39 @@ class SQLAClientRepository(ClientRepositoryOutputPort):
             return errorDTO
 
         try:
-            sqla_source_data_list = sqla_client.source_data
+            stmt = source_data_statement(
+                client_id=client_id,
+                after=after,
+                source_data_type=source_data_type,
+                status=status,
+                protocol=protocol,
+                relative_path_prefix=relative_path_prefix,
+                created_after=created_after,
+                created_before=created_before,
+            )
+        except ValueError as e:
+            errorDTO = ListSourceDataDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage=f"{e}",
+                errorName="Invalid cursor",
+                errorType="InvalidCursor",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        if limit is not None:
+            # One extra row tells whether there is a next page
+            stmt = stmt.limit(limit + 1)
+
+        try:
+            sqla_source_data_list: List[SQLASourceData] = list(self.session.scalars(stmt).all())
+
+            next_cursor: str | None = None
+            if limit is not None and len(sqla_source_data_list) > limit:
+                sqla_source_data_list = sqla_source_data_list[:limit]
+                last = sqla_source_data_list[-1]
+                next_cursor = encode_cursor(last.created_at, last.id)
 
             core_source_data_list = [
                 convert_sqla_source_data_to_core_source_data(sqla_sd) for sqla_sd in sqla_source_data_list
@@ -653,6 +874,7 @@ class SQLAClientRepository(ClientRepositoryOutputPort):
             return ListSourceDataDTO(
                 status=True,
                 data=core_source_data_list,
+                next_cursor=next_cursor,
             )
 
         except Exception as e:
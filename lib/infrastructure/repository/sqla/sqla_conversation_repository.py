@@ -1,4 +1,5 @@
-from typing import List, Set
+from datetime import datetime
+from typing import Any, Dict, Generator, List, Tuple
 
 
 from lib.core.dto.conversation_repository_dto import (
@@ -7,12 +8,17 @@ from lib.core.dto.conversation_repository_dto import (
     ListConversationMessagesDTO,
     ListConversationSourcesDTO,
     NewMessageDTO,
+    NewMessagesDTO,
+    SearchMessagesDTO,
+    StreamConversationMessagesDTO,
     UpdateConversationDTO,
 )
 from lib.core.entity.models import (
     AgentMessage,
+    BaseMessage,
     BaseMessageContent,
     MessageBase,
+    MessageSearchResult,
     MessageSenderTypeEnum,
     MessageContentTypeEnum,
     SourceData,
@@ -20,8 +26,14 @@ from lib.core.entity.models import (
     UserMessage,
 )
 from lib.core.ports.secondary.conversation_repository import ConversationRepository
-from lib.infrastructure.repository.sqla.database import TDatabaseFactory
+from lib.core.sdk.dto import CollectionVersionDTO
+from lib.core.sdk.pagination import encode_cursor, encode_search_cursor
+from lib.infrastructure.repository.sqla.database import TDatabaseFactory, read_only
+from lib.infrastructure.repository.sqla.unit_of_work import SQLAUnitOfWork, SQLAUnitOfWorkMixin
 from lib.infrastructure.repository.sqla.models import (
+    SQLACitation,
+    SQLAClient,
+    SQLALLM,
     SQLAConversation,
     SQLAMessageBase,
     SQLAUserMessage,
@@ -30,10 +42,15 @@ from lib.infrastructure.repository.sqla.models import (
     SQLAResearchContext,
     SQLASourceData,
 )
-from sqlalchemy.orm import Session
-from sqlalchemy import Select, Result, select, func
+from sqlalchemy import Select, Result, Table, Update, any_, cast, exists, func, insert, select, tuple_, update
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, REGCONFIG
+from sqlalchemy.orm import selectinload
 
 from lib.infrastructure.repository.sqla.utils import (
+    collection_version_statement,
+    cursor_keyset,
+    id_array,
+    search_cursor_keyset,
     convert_sqla_conversation_to_core_conversation,
     convert_sqla_client_message_to_core_user_message,
     convert_sqla_agent_message_to_core_agent_message,
@@ -43,16 +60,209 @@ from lib.infrastructure.repository.sqla.utils import (
 )
 
 
-class SQLAConversationRepository(ConversationRepository):
-    def __init__(self, session_factory: TDatabaseFactory) -> None:
-        super().__init__()
-        with session_factory() as session:
-            self._session = session
+def conversation_messages_version_statement(conversation_id: int) -> Select[Tuple[int, datetime | None]]:
+    """
+    Builds the aggregate query summarizing the messages of a conversation: their number and their latest update.
+    """
+    return collection_version_statement(SQLAMessageBase, SQLAMessageBase.conversation_id == conversation_id)
+
+
+def conversation_messages_statement(
+    conversation_id: int,
+    after: str | None = None,
+    before: str | None = None,
+    descending: bool = False,
+) -> Select[Tuple[SQLAMessageBase]]:
+    """
+    Builds the keyset query for the messages of a conversation, ordered by (created_at, id).
+
+    @raises ValueError: If one of the cursors is malformed.
+    """
+    keyset = tuple_(SQLAMessageBase.created_at, SQLAMessageBase.id)
+    stmt = (
+        select(SQLAMessageBase)
+        .options(selectinload(SQLAMessageBase.message_contents))
+        .where(SQLAMessageBase.conversation_id == conversation_id)
+    )
+
+    if after is not None:
+        stmt = stmt.where(keyset > cursor_keyset(after))
+    if before is not None:
+        stmt = stmt.where(keyset < cursor_keyset(before))
+
+    if descending:
+        return stmt.order_by(SQLAMessageBase.created_at.desc(), SQLAMessageBase.id.desc())
+    return stmt.order_by(SQLAMessageBase.created_at.asc(), SQLAMessageBase.id.asc())
+
+
+def allocate_thread_ids_statement(conversation_id: int, new_threads: int) -> Update:
+    """
+    Builds the update of the thread counter of a conversation that allocates the IDs of new threads, returning the new value of the counter.
+    The UPDATE locks the conversation row until the end of the transaction, so concurrent writers never get the same thread ID.
+    """
+    return (
+        update(SQLAConversation)
+        .where(SQLAConversation.id == conversation_id)
+        .values(last_thread_id=SQLAConversation.last_thread_id + new_threads)
+        .returning(SQLAConversation.last_thread_id)
+    )
+
+
+def advance_thread_counter_statement(conversation_id: int, thread_id: int) -> Update:
+    """
+    Builds the update raising the thread counter of a conversation to a thread ID given by a caller, so that the threads allocated later never reuse it.
+    The counter is only written, and its row locked, when the thread ID is above it.
+    """
+    return (
+        update(SQLAConversation)
+        .where(SQLAConversation.id == conversation_id)
+        .where(SQLAConversation.last_thread_id < thread_id)
+        .values(last_thread_id=func.greatest(SQLAConversation.last_thread_id, thread_id))
+    )
+
+
+def conversation_senders_statement(conversation_id: int) -> Select[Tuple[str, str]]:
+    """
+    Builds the query resolving who the senders of the messages of a conversation are: the client that owns its research context, and the LLM of that research context.
+    """
+    return (
+        select(SQLAClient.sub, SQLALLM.llm_name)
+        .select_from(SQLAConversation)
+        .join(SQLAResearchContext, SQLAResearchContext.id == SQLAConversation.research_context_id)
+        .join(SQLAClient, SQLAClient.id == SQLAResearchContext.client_id)
+        .join(SQLALLM, SQLALLM.id == SQLAResearchContext.llm_id)
+        .where(SQLAConversation.id == conversation_id)
+    )
+
+
+def uncited_agent_messages_statement(conversation_id: int) -> Select[Tuple[int]]:
+    """
+    Builds the query for the IDs of the agent messages of a conversation that cite no source data.
+    """
+    return (
+        select(SQLAAgentMessage.id)
+        .where(SQLAAgentMessage.conversation_id == conversation_id)
+        .where(~exists().where(SQLACitation.agent_message_id == SQLAAgentMessage.id))
+        .order_by(SQLAAgentMessage.created_at, SQLAAgentMessage.id)
+    )
+
+
+def conversation_sources_statement(
+    conversation_id: int,
+    after: str | None = None,
+    with_citation_counts: bool = False,
+) -> Select[Any]:
+    """
+    Builds the keyset query for the distinct source data cited in a conversation, ordered by (created_at, id): the citations are joined to the messages of the conversation, instead of querying the citations of each message.
+    With citation counts, the rows are (source data, count), else (source data,).
+
+    @raises ValueError: If the cursor is malformed.
+    """
+    stmt: Select[Any] = (
+        select(SQLASourceData)
+        .join(SQLACitation, SQLACitation.source_data_id == SQLASourceData.id)
+        .join(SQLAMessageBase, SQLAMessageBase.id == SQLACitation.agent_message_id)
+        .where(SQLAMessageBase.conversation_id == conversation_id)
+    )
+
+    if after is not None:
+        stmt = stmt.where(tuple_(SQLASourceData.created_at, SQLASourceData.id) > cursor_keyset(after))
+
+    if with_citation_counts:
+        stmt = stmt.add_columns(func.count(SQLACitation.id)).group_by(SQLASourceData.id)
+    else:
+        stmt = stmt.distinct()
+
+    return stmt.order_by(SQLASourceData.created_at.asc(), SQLASourceData.id.asc())
+
+
+# Must match the configuration the message_content_tsv_update trigger computes the lexemes of the message contents with
+TEXT_SEARCH_CONFIG = "english"
+
+MESSAGE_SENDER_TYPES = {
+    "user_message": MessageSenderTypeEnum.USER,
+    "agent_message": MessageSenderTypeEnum.AGENT,
+}
+
+
+def message_search_statement(
+    client_id: int,
+    query: str,
+    research_context_id: int | None = None,
+    conversation_id: int | None = None,
+    limit: int = 20,
+    after: str | None = None,
+) -> Select[Tuple[int, int, int, str, float, str]]:
+    """
+    Builds the keyset query for the messages of a client matching a web search, ordered by (rank, id) descending: the matching message contents are found with the GIN index of their lexemes, and each message is ranked by its best matching content.
+    The rows are (message ID, conversation ID, thread ID, message type, rank, snippet), with one row more than the limit when there is a next page. The snippets are only highlighted for the rows of the page.
+
+    @raises ValueError: If the cursor is malformed.
+    """
+    config = cast(TEXT_SEARCH_CONFIG, REGCONFIG)
+    tsquery = func.websearch_to_tsquery(config, query)
+    rank = cast(func.ts_rank_cd(SQLAMessageContent.content_tsv, tsquery), DOUBLE_PRECISION)
+
+    matches = (
+        select(
+            SQLAMessageContent.id.label("message_content_id"),
+            SQLAMessageBase.id.label("message_id"),
+            SQLAMessageBase.conversation_id,
+            SQLAMessageBase.thread_id,
+            SQLAMessageBase.type,
+            rank.label("rank"),
+            func.row_number()
+            .over(partition_by=SQLAMessageBase.id, order_by=(rank.desc(), SQLAMessageContent.id))
+            .label("position"),
+        )
+        .join(SQLAMessageBase, SQLAMessageBase.id == SQLAMessageContent.message_id)
+        .join(SQLAConversation, SQLAConversation.id == SQLAMessageBase.conversation_id)
+        .join(SQLAResearchContext, SQLAResearchContext.id == SQLAConversation.research_context_id)
+        .where(SQLAResearchContext.client_id == client_id)
+        .where(SQLAMessageContent.content_tsv.bool_op("@@")(tsquery))
+    )
+    if research_context_id is not None:
+        matches = matches.where(SQLAResearchContext.id == research_context_id)
+    if conversation_id is not None:
+        matches = matches.where(SQLAMessageBase.conversation_id == conversation_id)
+    ranked = matches.subquery("ranked")
+
+    page_stmt = select(ranked).where(ranked.c.position == 1)
+    if after is not None:
+        page_stmt = page_stmt.where(tuple_(ranked.c.rank, ranked.c.message_id) < search_cursor_keyset(after))
+    # One extra row tells whether there is a next page
+    page = page_stmt.order_by(ranked.c.rank.desc(), ranked.c.message_id.desc()).limit(limit + 1).subquery("page")
+
+    return (
+        select(
+            page.c.message_id,
+            page.c.conversation_id,
+            page.c.thread_id,
+            page.c.type,
+            page.c.rank,
+            func.ts_headline(config, SQLAMessageContent.content, tsquery),
+        )
+        .join(SQLAMessageContent, SQLAMessageContent.id == page.c.message_content_id)
+        .order_by(page.c.rank.desc(), page.c.message_id.desc())
+    )
+
+
+def convert_sqla_message(
+    sqla_message: SQLAMessageBase, client_sub: str | None, llm_name: str | None
+) -> MessageBase | None:
+    if isinstance(sqla_message, SQLAUserMessage):
+        return convert_sqla_client_message_to_core_user_message(sqla_message, sender=client_sub)
+
+    if isinstance(sqla_message, SQLAAgentMessage):
+        return convert_sqla_agent_message_to_core_agent_message(sqla_message, sender=llm_name)
+
+    return None
 
-    @property
-    def session(self) -> Session:
-        self._session.expire_all()
-        return self._session
+
+class SQLAConversationRepository(SQLAUnitOfWorkMixin, ConversationRepository):
+    def __init__(self, session_factory: TDatabaseFactory, unit_of_work: SQLAUnitOfWork | None = None) -> None:
+        super().__init__()
+        self._init_session(session_factory=session_factory, unit_of_work=unit_of_work)
 
     def get_conversation(self, conversation_id: int) -> GetConversationDTO:
         """
@@ -154,12 +364,37 @@ class SQLAConversationRepository(ConversationRepository):
             data=core_research_context,
         )
 
-    def list_conversation_messages(self, conversation_id: int) -> ListConversationMessagesDTO[TMessageBase]:
+    def _conversation_senders(self, conversation_id: int) -> Tuple[str | None, str | None]:
+        """
+        Resolves in a single query who the senders of the messages of a conversation are.
+
+        @return: The client sub and the LLM name.
         """
-        Lists all messages in a conversation.
+        row = self.session.execute(conversation_senders_statement(conversation_id)).one_or_none()
+
+        if row is None:
+            return None, None
+        return row.sub, row.llm_name
+
+    @read_only
+    def list_conversation_messages(
+        self,
+        conversation_id: int,
+        limit: int | None = None,
+        after: str | None = None,
+        before: str | None = None,
+    ) -> ListConversationMessagesDTO[TMessageBase]:
+        """
+        Lists the messages in a conversation, ordered by creation date. Without a limit, all messages are listed.
 
         @param conversation_id: The ID of the conversation to list messages for.
         @type conversation_id: int
+        @param limit: The maximum number of messages to list.
+        @type limit: int | None
+        @param after: A cursor; only the messages after it are listed.
+        @type after: str | None
+        @param before: A cursor; only the messages before it are listed.
+        @type before: str | None
         @return: A DTO containing the result of the operation.
         """
         if conversation_id is None:
@@ -200,22 +435,163 @@ class SQLAConversationRepository(ConversationRepository):
             self.logger.error(f"{errorDTO}")
             return errorDTO
 
+        # When paging backwards, walk the keyset in reverse so that the limit picks the messages right before the cursor
+        backwards = before is not None and after is None
+
+        try:
+            stmt = conversation_messages_statement(
+                conversation_id=conversation_id, after=after, before=before, descending=backwards
+            )
+        except ValueError as e:
+            errorDTO = ListConversationMessagesDTO[TMessageBase](
+                status=False,
+                errorCode=-1,
+                errorMessage=f"{e}",
+                errorName="Invalid cursor",
+                errorType="InvalidCursor",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        if limit is not None:
+            # One extra row tells whether there is another page in the direction we are walking
+            stmt = stmt.limit(limit + 1)
+
+        client_sub, llm_name = self._conversation_senders(conversation_id=conversation_id)
+        sqla_messages: List[SQLAMessageBase] = list(self.session.scalars(stmt).all())
+
+        has_more = limit is not None and len(sqla_messages) > limit
+        if has_more:
+            sqla_messages = sqla_messages[:limit]
+        if backwards:
+            sqla_messages.reverse()
+
         core_messages: List[MessageBase] = []
 
-        for sqla_message in sqla_conversation.messages:
-            if isinstance(sqla_message, SQLAUserMessage):
-                core_user_message = convert_sqla_client_message_to_core_user_message(sqla_message)
-                core_messages.append(core_user_message)
+        for sqla_message in sqla_messages:
+            core_message = convert_sqla_message(sqla_message, client_sub=client_sub, llm_name=llm_name)
+            if core_message is not None:
+                core_messages.append(core_message)
 
-            if isinstance(sqla_message, SQLAAgentMessage):
-                core_agent_message = convert_sqla_agent_message_to_core_agent_message(sqla_message)
-                core_messages.append(core_agent_message)
+        next_cursor: str | None = None
+        previous_cursor: str | None = None
+        if len(sqla_messages) > 0:
+            first, last = sqla_messages[0], sqla_messages[-1]
+            if (has_more and not backwards) or (backwards and before is not None):
+                next_cursor = encode_cursor(last.created_at, last.id)
+            if (has_more and backwards) or (after is not None):
+                previous_cursor = encode_cursor(first.created_at, first.id)
 
         return ListConversationMessagesDTO[TMessageBase](
             status=True,
             data=core_messages,
+            next_cursor=next_cursor,
+            previous_cursor=previous_cursor,
+        )
+
+    @read_only
+    def get_conversation_messages_version(self, conversation_id: int) -> CollectionVersionDTO:
+        """
+        Summarizes the messages in a conversation, without loading them.
+
+        @param conversation_id: The ID of the conversation.
+        @type conversation_id: int
+        @return: A DTO containing the number of messages and their latest update.
+        @rtype: CollectionVersionDTO
+        """
+        if conversation_id is None:
+            errorDTO = CollectionVersionDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage="Conversation ID cannot be None",
+                errorName="Conversation ID not provided",
+                errorType="ConversationIdNotProvided",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        count, last_updated_at = self.session.execute(conversation_messages_version_statement(conversation_id)).one()
+        return CollectionVersionDTO(status=True, count=count, last_updated_at=last_updated_at)
+
+    def stream_conversation_messages(
+        self,
+        conversation_id: int,
+        after: str | None = None,
+        before: str | None = None,
+        batch_size: int = 100,
+    ) -> StreamConversationMessagesDTO:
+        """
+        Streams the messages in a conversation, ordered by creation date. The messages are fetched lazily, in batches, while the returned iterator is consumed.
+
+        @param conversation_id: The ID of the conversation to stream messages for.
+        @type conversation_id: int
+        @param after: A cursor; only the messages after it are streamed.
+        @type after: str | None
+        @param before: A cursor; only the messages before it are streamed.
+        @type before: str | None
+        @param batch_size: The number of messages fetched from the database at a time.
+        @type batch_size: int
+        @return: A DTO containing the result of the operation.
+        @rtype: StreamConversationMessagesDTO
+        """
+        if conversation_id is None:
+            errorDTO = StreamConversationMessagesDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage="Conversation ID cannot be None",
+                errorName="Conversation ID not provided",
+                errorType="ConversationIdNotProvided",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        sqla_conversation: SQLAConversation | None = self.session.get(SQLAConversation, conversation_id)
+
+        if sqla_conversation is None:
+            self.logger.error(f"Conversation with ID {conversation_id} not found in the database.")
+            errorDTO = StreamConversationMessagesDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage=f"Conversation with ID {conversation_id} not found in the database.",
+                errorName="Conversation not found",
+                errorType="ConversationNotFound",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        try:
+            stmt = conversation_messages_statement(conversation_id=conversation_id, after=after, before=before)
+        except ValueError as e:
+            errorDTO = StreamConversationMessagesDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage=f"{e}",
+                errorName="Invalid cursor",
+                errorType="InvalidCursor",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        client_sub, llm_name = self._conversation_senders(conversation_id=conversation_id)
+
+        return StreamConversationMessagesDTO(
+            status=True,
+            data=self._stream_sqla_messages(stmt=stmt, batch_size=batch_size, client_sub=client_sub, llm_name=llm_name),
         )
 
+    def _stream_sqla_messages(
+        self, stmt: Select[Tuple[SQLAMessageBase]], batch_size: int, client_sub: str | None, llm_name: str | None
+    ) -> Generator[MessageBase, None, None]:
+        # The stream outlives the request that created it, so it gets its own session, closed once it is exhausted.
+        # The identity map only holds weak references, so the rows of the batches already yielded are released as we go
+        with self._session_factory() as session:
+            result = session.scalars(stmt.execution_options(yield_per=batch_size))
+            for partition in result.partitions():
+                for sqla_message in partition:
+                    core_message = convert_sqla_message(sqla_message, client_sub=client_sub, llm_name=llm_name)
+                    if core_message is not None:
+                        yield core_message
+
     def update_conversation(self, conversation_id: int, conversation_title: str) -> UpdateConversationDTO:
         """
         Updates a conversation in the research context.
@@ -265,7 +641,7 @@ class SQLAConversationRepository(ConversationRepository):
 
         try:
             sqla_conversation.update({"title": conversation_title}, session=self.session)
-            self.session.commit()
+            self.commit()
 
             return UpdateConversationDTO(status=True, conversation_id=sqla_conversation.id)
 
@@ -281,12 +657,26 @@ class SQLAConversationRepository(ConversationRepository):
             self.logger.error(f"{errorDTO}")
             return errorDTO
 
-    def list_conversation_sources(self, conversation_id: int) -> ListConversationSourcesDTO:
+    @read_only
+    def list_conversation_sources(
+        self,
+        conversation_id: int,
+        limit: int | None = None,
+        after: str | None = None,
+        with_citation_counts: bool = False,
+    ) -> ListConversationSourcesDTO:
         """
-        Lists all data sources of the citations of a conversation.
+        Lists the distinct data sources of the citations of a conversation, ordered by creation date. Without a limit, all of them are listed.
+        The number of queries does not depend on the number of messages in the conversation.
 
         @param conversation_id: The ID of the conversation to list data sources for.
         @type conversation_id: int
+        @param limit: The maximum number of data sources to list.
+        @type limit: int | None
+        @param after: A cursor; only the data sources after it are listed.
+        @type after: str | None
+        @param with_citation_counts: Whether to also count how many times each data source is cited in the conversation.
+        @type with_citation_counts: bool
         @return: A DTO containing the result of the operation.
         @rtype: ListConversationSourcesDTO
         """
@@ -315,26 +705,9 @@ class SQLAConversationRepository(ConversationRepository):
             self.logger.error(f"{errorDTO}")
             return errorDTO
 
-        sqlamessages: List[SQLAMessageBase] = sqla_conversation.messages
-        sqlasourcedata_set: Set[SQLASourceData] = set()
-        error_agent_message_ids: List[int] = []
-
-        for sqlamessage in sqlamessages:
-            if isinstance(sqlamessage, SQLAAgentMessage):
-                queried_sqla_source_data_list = (
-                    self.session.query(SQLASourceData)
-                    .join(SQLASourceData.agent_message)
-                    .filter_by(id=sqlamessage.id)
-                    .all()
-                )
-
-                if queried_sqla_source_data_list == []:
-                    error_agent_message_ids.append(sqlamessage.id)
-
-                queried_sqla_source_data_set = set(queried_sqla_source_data_list)
-                sqlasourcedata_set.update(queried_sqla_source_data_set)
-
-        sqlasourcedata = list(sqlasourcedata_set)
+        error_agent_message_ids: List[int] = list(
+            self.session.scalars(uncited_agent_messages_statement(conversation_id=conversation_id)).all()
+        )
 
         if error_agent_message_ids != []:
             self.logger.error(f"Message Responses with IDs {error_agent_message_ids} have no source data.")
@@ -348,13 +721,37 @@ class SQLAConversationRepository(ConversationRepository):
             self.logger.error(f"{errorDTO}")
             return errorDTO
 
-        core_source_data: List[SourceData] = []
+        try:
+            stmt = conversation_sources_statement(
+                conversation_id=conversation_id, after=after, with_citation_counts=with_citation_counts
+            )
+        except ValueError as e:
+            errorDTO = ListConversationSourcesDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage=f"{e}",
+                errorName="Invalid cursor",
+                errorType="InvalidCursor",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        if limit is not None:
+            # One extra row tells whether there is a next page
+            stmt = stmt.limit(limit + 1)
+
+        rows = list(self.session.execute(stmt).all())
 
-        for sqlasourcedatum in sqlasourcedata:
-            coresourcedatum = convert_sqla_source_data_to_core_source_data(sqlasourcedatum)
-            core_source_data.append(coresourcedatum)
+        next_cursor: str | None = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            last: SQLASourceData = rows[-1][0]
+            next_cursor = encode_cursor(last.created_at, last.id)
 
-        if core_source_data == []:
+        core_source_data: List[SourceData] = [convert_sqla_source_data_to_core_source_data(row[0]) for row in rows]
+        citation_counts: Dict[int, int] | None = {row[0].id: row[1] for row in rows} if with_citation_counts else None
+
+        if core_source_data == [] and after is None:
             self.logger.error(f"Conversation with ID {conversation_id} has no source data.")
             errorDTO = ListConversationSourcesDTO(
                 status=False,
@@ -369,8 +766,116 @@ class SQLAConversationRepository(ConversationRepository):
         return ListConversationSourcesDTO(
             status=True,
             data=core_source_data,
+            citation_counts=citation_counts,
+            next_cursor=next_cursor,
         )
 
+    @read_only
+    def search_messages(
+        self,
+        client_id: int,
+        query: str,
+        research_context_id: int | None = None,
+        conversation_id: int | None = None,
+        limit: int = 20,
+        after: str | None = None,
+    ) -> SearchMessagesDTO:
+        """
+        Searches the text of the messages of a client, optionally only in one of its research contexts or conversations. The matching messages are ranked, best matches first.
+        Only the best matching content of each message is returned, as a snippet with the matching words highlighted.
+
+        @param client_id: The ID of the client whose messages are searched.
+        @type client_id: int
+        @param query: The search, in web search syntax: words, "quoted phrases", OR, and -excluded words.
+        @type query: str
+        @param research_context_id: The ID of a research context of the client to search in.
+        @type research_context_id: int | None
+        @param conversation_id: The ID of a conversation of the client to search in.
+        @type conversation_id: int | None
+        @param limit: The maximum number of messages to return.
+        @type limit: int
+        @param after: A cursor; only the messages ranked after it are returned.
+        @type after: str | None
+        @return: A DTO containing the result of the operation.
+        @rtype: SearchMessagesDTO
+        """
+        if client_id is None:
+            errorDTO = SearchMessagesDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage="Client ID cannot be None",
+                errorName="Client ID not provided",
+                errorType="ClientIdNotProvided",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        if query is None or query.strip() == "":
+            errorDTO = SearchMessagesDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage="The search query cannot be empty",
+                errorName="Search query not provided",
+                errorType="SearchQueryNotProvided",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        sqla_client: SQLAClient | None = self.session.get(SQLAClient, client_id)
+
+        if sqla_client is None:
+            self.logger.error(f"Client with ID {client_id} not found in the database.")
+            errorDTO = SearchMessagesDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage=f"Client with ID {client_id} not found in the database.",
+                errorName="Client not found",
+                errorType="ClientNotFound",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        try:
+            stmt = message_search_statement(
+                client_id=client_id,
+                query=query,
+                research_context_id=research_context_id,
+                conversation_id=conversation_id,
+                limit=limit,
+                after=after,
+            )
+        except ValueError as e:
+            errorDTO = SearchMessagesDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage=f"{e}",
+                errorName="Invalid cursor",
+                errorType="InvalidCursor",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        rows = list(self.session.execute(stmt).all())
+
+        next_cursor: str | None = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_search_cursor(rows[-1].rank, rows[-1].message_id)
+
+        results: List[MessageSearchResult] = [
+            MessageSearchResult(
+                message_id=message_id,
+                conversation_id=message_conversation_id,
+                thread_id=thread_id,
+                sender_type=MESSAGE_SENDER_TYPES[message_type],
+                snippet=snippet,
+                rank=rank,
+            )
+            for message_id, message_conversation_id, thread_id, message_type, rank, snippet in rows
+        ]
+
+        return SearchMessagesDTO(status=True, search_results=results, next_cursor=next_cursor)
+
     def new_message(
         self,
         conversation_id: int,
@@ -454,17 +959,13 @@ class SQLAConversationRepository(ConversationRepository):
 
         sqla_message: SQLAAgentMessage | SQLAUserMessage
 
-        # 2. If thread ID not provided, get the highest thread ID and increment by one
-
-        max_thread_id: int = 0
+        # 2. If thread ID not provided, allocate the next one from the counter of the conversation, else advance the counter past it
 
         if not isinstance(thread_id, int):
-            max_thread_result = self._session.query(func.max(SQLAMessageBase.thread_id).label("max_thread_id")).first()
-
-            if max_thread_result.max_thread_id and max_thread_result.max_thread_id > 0:
-                max_thread_id = max_thread_result.max_thread_id
+            thread_id = self.session.execute(allocate_thread_ids_statement(conversation_id, new_threads=1)).scalar_one()
+        else:
+            self.session.execute(advance_thread_counter_statement(conversation_id, thread_id))
 
-        thread_id = max_thread_id + 1
         assert isinstance(thread_id, int)
 
         if sender_type == MessageSenderTypeEnum.AGENT:
@@ -507,7 +1008,7 @@ class SQLAConversationRepository(ConversationRepository):
         try:
             sqla_message.save(session=self.session)
 
-            self.session.commit()
+            self.commit()
 
             core_message: UserMessage | AgentMessage
 
@@ -530,3 +1031,236 @@ class SQLAConversationRepository(ConversationRepository):
             )
             self.logger.error(f"{errorDTO}")
             return errorDTO
+
+    def new_messages(self, conversation_id: int, messages: List[BaseMessage]) -> NewMessagesDTO:
+        """
+        Adds a batch of messages, with their content pieces and citations, to a conversation in a single transaction.
+        Each table is written with one multi-row INSERT, instead of one round trip per message.
+
+        @param conversation_id: The ID of the conversation to add the messages to.
+        @type conversation_id: int
+        @param messages: The messages to add, in order. Messages without a thread ID each start a new thread.
+        @type messages: List[BaseMessage]
+        @return: A DTO containing the IDs of the new messages, in the order they were given.
+        @rtype: NewMessagesDTO
+        """
+
+        if conversation_id is None:
+            errorDTO = NewMessagesDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage="Conversation ID cannot be None",
+                errorName="Conversation ID not provided",
+                errorType="ConversationIdNotProvided",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        if not messages:
+            errorDTO = NewMessagesDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage="Messages must be a list with at least one item",
+                errorName="Messages not provided",
+                errorType="MessagesNotProvided",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        for index, message in enumerate(messages):
+            if not message.message_contents:
+                errorDTO = NewMessagesDTO(
+                    status=False,
+                    errorCode=-1,
+                    errorMessage=f"Message contents of message {index} must be a list with at least one item",
+                    errorName="Message contents not provided",
+                    errorType="MessageContentsNotProvided",
+                )
+                self.logger.error(f"{errorDTO}")
+                return errorDTO
+
+            if message.citations and message.sender_type != MessageSenderTypeEnum.AGENT:
+                errorDTO = NewMessagesDTO(
+                    status=False,
+                    errorCode=-1,
+                    errorMessage=f"Message {index} has citations, but only agent messages can have citations",
+                    errorName="Citations on a non-agent message",
+                    errorType="InvalidCitations",
+                )
+                self.logger.error(f"{errorDTO}")
+                return errorDTO
+
+        # 1. Check that the conversation exists
+        try:
+            sqla_conversation: SQLAConversation | None = self.session.get(SQLAConversation, conversation_id)
+
+        except Exception as e:
+            self.logger.error(f"Error while querying the database for conversation with ID {conversation_id}: {e}")
+            errorDTO = NewMessagesDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage=f"Error while querying the database for conversation with ID {conversation_id}: {e}",
+                errorName="ErrorWhileQueryingDatabase",
+                errorType="ErrorWhileQueryingDatabase",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        if sqla_conversation is None:
+            errorDTO = NewMessagesDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage=f"Conversation with ID {conversation_id} not found in the database.",
+                errorName="Conversation not found",
+                errorType="ConversationNotFound",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        # 2. Check, in a single query, that every cited source data belongs to the client of the conversation
+        cited_source_data_ids = list(
+            {citation.source_data_id for message in messages for citation in message.citations}
+        )
+        if cited_source_data_ids:
+            try:
+                owned_source_data_ids = set(
+                    self.session.scalars(
+                        select(SQLASourceData.id)
+                        .join(SQLAResearchContext, SQLAResearchContext.client_id == SQLASourceData.client_id)
+                        .where(
+                            SQLAResearchContext.id == sqla_conversation.research_context_id,
+                            SQLASourceData.id == any_(id_array("ids", cited_source_data_ids)),
+                        )
+                    ).all()
+                )
+
+            except Exception as e:
+                errorDTO = NewMessagesDTO(
+                    status=False,
+                    errorCode=-1,
+                    errorMessage=f"Could not check the ownership of the source data cited in conversation with ID {conversation_id}: {e}",
+                    errorName="CouldNotCheckSourceDataOwnership",
+                    errorType="CouldNotCheckSourceDataOwnership",
+                )
+                self.logger.error(f"{errorDTO}")
+                return errorDTO
+
+            unauthorized_source_data_ids = sorted(
+                source_data_id
+                for source_data_id in cited_source_data_ids
+                if source_data_id not in owned_source_data_ids
+            )
+            if unauthorized_source_data_ids:
+                errorDTO = NewMessagesDTO(
+                    status=False,
+                    errorCode=-1,
+                    errorMessage=f"The client of conversation with ID {conversation_id} is not authorized to cite the following source data ids: {unauthorized_source_data_ids}",
+                    errorName="UnauthorizedSourceData",
+                    errorType="UnauthorizedSourceData",
+                )
+                self.logger.error(f"{errorDTO}")
+                return errorDTO
+
+        try:
+            # 3. Allocate one block of thread IDs for all the messages that start a new thread; the messages of the batch can join these threads by giving their IDs
+            new_threads = sum(1 for message in messages if message.thread_id is None)
+            next_thread_id = 0
+            if new_threads > 0:
+                last_thread_id = self.session.execute(
+                    allocate_thread_ids_statement(conversation_id, new_threads=new_threads)
+                ).scalar_one()
+                next_thread_id = last_thread_id - new_threads + 1
+
+            # Then advance the counter past the thread IDs given in the batch, if they are above it
+            given_thread_ids = [message.thread_id for message in messages if message.thread_id is not None]
+            if given_thread_ids:
+                self.session.execute(advance_thread_counter_statement(conversation_id, max(given_thread_ids)))
+
+            # 4. Insert the messages; all of them share the same timestamp, so they keep their order by ID
+            now = datetime.utcnow()
+            message_rows: List[Dict[str, Any]] = []
+            for message in messages:
+                thread_id = message.thread_id
+                if thread_id is None:
+                    thread_id = next_thread_id
+                    next_thread_id += 1
+
+                message_rows.append(
+                    {
+                        "type": SQLAAgentMessage.__mapper_args__["polymorphic_identity"]
+                        if message.sender_type == MessageSenderTypeEnum.AGENT
+                        else SQLAUserMessage.__mapper_args__["polymorphic_identity"],
+                        "thread_id": thread_id,
+                        "conversation_id": conversation_id,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                )
+
+            message_base_table = SQLAMessageBase.__table__
+            message_ids: List[int] = list(
+                self.session.execute(
+                    insert(message_base_table).returning(message_base_table.c.id, sort_by_parameter_order=True),
+                    message_rows,
+                ).scalars()
+            )
+
+            # 5. Insert the rows of the joined subclass tables, the content pieces and the citations
+            user_message_rows: List[Dict[str, Any]] = [
+                {"id": message_id}
+                for message_id, message in zip(message_ids, messages)
+                if message.sender_type != MessageSenderTypeEnum.AGENT
+            ]
+            agent_message_rows: List[Dict[str, Any]] = [
+                {"id": message_id}
+                for message_id, message in zip(message_ids, messages)
+                if message.sender_type == MessageSenderTypeEnum.AGENT
+            ]
+            content_rows: List[Dict[str, Any]] = [
+                {
+                    "content": piece.content,
+                    "content_type": piece.content_type,
+                    "message_id": message_id,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for message_id, message in zip(message_ids, messages)
+                for piece in message.message_contents
+            ]
+            citation_rows: List[Dict[str, Any]] = [
+                {
+                    "source_data_id": citation.source_data_id,
+                    "citation_metadata": citation.citation_metadata,
+                    "agent_message_id": message_id,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for message_id, message in zip(message_ids, messages)
+                for citation in message.citations
+            ]
+
+            table_rows: List[Tuple[Table, List[Dict[str, Any]]]] = [
+                (SQLAUserMessage.__table__, user_message_rows),
+                (SQLAAgentMessage.__table__, agent_message_rows),
+                (SQLAMessageContent.__table__, content_rows),
+                (SQLACitation.__table__, citation_rows),
+            ]
+            for table, rows in table_rows:
+                if rows:
+                    self.session.execute(insert(table), rows)
+
+            self.commit()
+
+            return NewMessagesDTO(status=True, message_ids=message_ids)
+
+        except Exception as e:
+            self.rollback()
+            errorDTO = NewMessagesDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage=f"Error while adding messages to conversation with ID {conversation_id}: {e}",
+                errorName="Error while adding messages to conversation",
+                errorType="ErrorWhileAddingMessagesToConversation",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
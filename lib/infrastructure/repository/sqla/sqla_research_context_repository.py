@@ -8,11 +8,19 @@ from lib.core.dto.research_context_repository_dto import (
 )
 from lib.core.entity.models import Conversation, ResearchContext, SourceData
 from lib.core.ports.secondary.research_context_repository import ResearchContextRepositoryOutputPort
-from lib.infrastructure.repository.sqla.database import TDatabaseFactory
-from sqlalchemy.orm import Session
-
-from lib.infrastructure.repository.sqla.models import SQLAConversation, SQLAResearchContext, SQLAClient
+from lib.core.sdk.dto import CollectionVersionDTO
+from lib.infrastructure.repository.sqla.database import TDatabaseFactory, read_only
+from lib.infrastructure.repository.sqla.unit_of_work import SQLAUnitOfWork, SQLAUnitOfWorkMixin
+
+from lib.infrastructure.repository.sqla.models import (
+    SQLAConversation,
+    SQLAResearchContext,
+    SQLAClient,
+    SQLASourceData,
+    SourceDataResearchContextAssociation,
+)
 from lib.infrastructure.repository.sqla.utils import (
+    collection_version_statement,
     convert_sqla_conversation_to_core_conversation,
     convert_sqla_research_context_to_core_research_context,
     convert_sqla_source_data_to_core_source_data,
@@ -20,16 +28,10 @@ from lib.infrastructure.repository.sqla.utils import (
 )
 
 
-class SQLAReseachContextRepository(ResearchContextRepositoryOutputPort):
-    def __init__(self, session_factory: TDatabaseFactory) -> None:
+class SQLAReseachContextRepository(SQLAUnitOfWorkMixin, ResearchContextRepositoryOutputPort):
+    def __init__(self, session_factory: TDatabaseFactory, unit_of_work: SQLAUnitOfWork | None = None) -> None:
         super().__init__()
-        with session_factory() as session:
-            self._session = session
-
-    @property
-    def session(self) -> Session:
-        self._session.expire_all()
-        return self._session
+        self._init_session(session_factory=session_factory, unit_of_work=unit_of_work)
 
     def get_research_context(self, research_context_id: int) -> GetResearchContextDTO:
         """
@@ -180,7 +182,7 @@ class SQLAReseachContextRepository(ResearchContextRepositoryOutputPort):
 
         try:
             sqla_new_conversation.save(session=self.session)
-            self.session.commit()
+            self.commit()
 
             return NewResearchContextConversationDTO(status=True, conversation_id=sqla_new_conversation.id)
 
@@ -196,6 +198,7 @@ class SQLAReseachContextRepository(ResearchContextRepositoryOutputPort):
             self.logger.error(f"{errorDTO}")
             return errorDTO
 
+    @read_only
     def list_conversations(self, research_context_id: int) -> ListResearchContextConversationsDTO:
         """
         Lists all conversations in the research context.
@@ -241,6 +244,33 @@ class SQLAReseachContextRepository(ResearchContextRepositoryOutputPort):
             data=core_conversations,
         )
 
+    @read_only
+    def get_conversations_version(self, research_context_id: int) -> CollectionVersionDTO:
+        """
+        Summarizes the conversations in a research context, without loading them.
+
+        @param research_context_id: The ID of the research context.
+        @type research_context_id: int
+        @return: A DTO containing the number of conversations and their latest update.
+        @rtype: CollectionVersionDTO
+        """
+        if research_context_id is None:
+            errorDTO = CollectionVersionDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage="Research Context ID cannot be None",
+                errorName="Research Context ID not provided",
+                errorType="ResearchContextIdNotProvided",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        count, last_updated_at = self.session.execute(
+            collection_version_statement(SQLAConversation, SQLAConversation.research_context_id == research_context_id)
+        ).one()
+        return CollectionVersionDTO(status=True, count=count, last_updated_at=last_updated_at)
+
+    @read_only
     def list_source_data(self, research_context_id: int) -> ListSourceDataDTO:
         """
         Lists all source data related to a research context.
@@ -287,3 +317,30 @@ class SQLAReseachContextRepository(ResearchContextRepositoryOutputPort):
             status=True,
             data=core_source_data,
         )
+
+    @read_only
+    def get_source_data_version(self, research_context_id: int) -> CollectionVersionDTO:
+        """
+        Summarizes the source data related to a research context, without loading them. Relating a source data to the research context changes the count.
+
+        @param research_context_id: The ID of the research context.
+        @type research_context_id: int
+        @return: A DTO containing the number of source data and their latest update.
+        @rtype: CollectionVersionDTO
+        """
+        if research_context_id is None:
+            errorDTO = CollectionVersionDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage="Research Context ID cannot be None",
+                errorName="Research Context ID not provided",
+                errorType="ResearchContextIdNotProvided",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
+
+        stmt = collection_version_statement(
+            SQLASourceData, SourceDataResearchContextAssociation.c.research_context_id == research_context_id
+        ).join(SourceDataResearchContextAssociation)
+        count, last_updated_at = self.session.execute(stmt).one()
+        return CollectionVersionDTO(status=True, count=count, last_updated_at=last_updated_at)
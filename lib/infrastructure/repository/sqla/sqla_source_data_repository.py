@@ -1,28 +1,29 @@
-from lib.core.dto.source_data_repository_dto import GetSourceDataByProtocolRelativePathDTO
-from lib.core.entity.models import ProtocolEnum
+from typing import List
+
+from sqlalchemy import tuple_
+
+from lib.core.dto.source_data_repository_dto import (
+    GetSourceDataByCompositeIndexesDTO,
+    GetSourceDataByProtocolRelativePathDTO,
+)
+from lib.core.entity.models import ProtocolEnum, SourceDataCompositeIndex
 from lib.core.ports.secondary.source_data_repository import SourceDataRepositoryOutputPort
 from lib.infrastructure.repository.sqla.database import TDatabaseFactory
+from lib.infrastructure.repository.sqla.unit_of_work import SQLAUnitOfWork, SQLAUnitOfWorkMixin
 
-from sqlalchemy.orm import Session
 
 from lib.infrastructure.repository.sqla.models import SQLASourceData
 from lib.infrastructure.repository.sqla.utils import convert_sqla_source_data_to_core_source_data
 
 
-class SQLASourceDataRepository(SourceDataRepositoryOutputPort):
+class SQLASourceDataRepository(SQLAUnitOfWorkMixin, SourceDataRepositoryOutputPort):
     """
     A SQLAlchemy implementation of the source data repository.
     """
 
-    def __init__(self, session_factory: TDatabaseFactory) -> None:
+    def __init__(self, session_factory: TDatabaseFactory, unit_of_work: SQLAUnitOfWork | None = None) -> None:
         super().__init__()
-        with session_factory() as session:
-            self._session = session
-
-    @property
-    def session(self) -> Session:
-        self._session.expire_all()
-        return self._session
+        self._init_session(session_factory=session_factory, unit_of_work=unit_of_work)
 
     def get_source_data_by_composite_index(
         self, client_id: int, protocol: ProtocolEnum, relative_path: str
@@ -119,3 +120,72 @@ class SQLASourceDataRepository(SourceDataRepositoryOutputPort):
             )
             self.logger.error(f"{errorDTO}")
             return errorDTO
+
+    def get_source_data_by_composite_indexes(
+        self, client_id: int, composite_indexes: List[SourceDataCompositeIndex]
+    ) -> GetSourceDataByCompositeIndexesDTO:
+        """
+        Gets several source data at once by their composite indexes, with a single query.
+
+        @param client_id: The ID of the client that owns the source data.
+        @type client_id: int
+        @param composite_indexes: The protocols and relative paths of the source data.
+        @type composite_indexes: List[SourceDataCompositeIndex]
+        @return: A DTO containing the source data found, leaving out the composite indexes that were not found.
+        @rtype: GetSourceDataByCompositeIndexesDTO
+        """
+        if not client_id:
+            self.logger.error("Client ID cannot be None")
+            return GetSourceDataByCompositeIndexesDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage="Client ID cannot be None",
+                errorName="ClientIDNotProvided",
+                errorType="ClientIDNotProvided",
+            )
+
+        if not composite_indexes:
+            self.logger.error("Composite indexes cannot be empty")
+            return GetSourceDataByCompositeIndexesDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage="Composite indexes cannot be empty",
+                errorName="CompositeIndexesNotProvided",
+                errorType="CompositeIndexesNotProvided",
+            )
+
+        try:
+            queried_source_data_list = (
+                self.session.query(SQLASourceData)
+                .filter(
+                    SQLASourceData.client_id == client_id,
+                    tuple_(SQLASourceData.protocol, SQLASourceData.relative_path).in_(
+                        [
+                            (composite_index.protocol, composite_index.relative_path)
+                            for composite_index in composite_indexes
+                        ]
+                    ),
+                )
+                .all()
+            )
+
+            core_source_data_list = [
+                convert_sqla_source_data_to_core_source_data(queried_source_data)
+                for queried_source_data in queried_source_data_list
+            ]
+
+            return GetSourceDataByCompositeIndexesDTO(
+                status=True,
+                data=core_source_data_list,
+            )
+
+        except Exception as e:
+            errorDTO = GetSourceDataByCompositeIndexesDTO(
+                status=False,
+                errorCode=-1,
+                errorMessage=f"Could not get source data of client with ID {client_id} by composite indexes: {e}",
+                errorName="CouldNotGetSourceDataByCompositeIndexes",
+                errorType="CouldNotGetSourceDataByCompositeIndexes",
+            )
+            self.logger.error(f"{errorDTO}")
+            return errorDTO
@@ -0,0 +1,204 @@
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+import logging
+from typing import AsyncGenerator, Generator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from lib.core.sdk.unit_of_work import AsyncBaseUnitOfWork, BaseUnitOfWork
+from lib.infrastructure.repository.sqla.database import AsyncDatabase, Database, TDatabaseFactory
+
+
+class _SQLAUnitOfWorkState:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+        self.rolled_back = False
+
+
+class SQLAUnitOfWork(BaseUnitOfWork):
+    """
+    A unit of work backed by a single SQLAlchemy session. The session is bound to the current context (thread or task), so concurrent requests never share it, and is closed once the unit of work ends.
+    """
+
+    def __init__(self, database: Database) -> None:
+        self._database = database
+        self._state: ContextVar[_SQLAUnitOfWorkState | None] = ContextVar(f"sqla_unit_of_work_{id(self)}", default=None)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def active(self) -> bool:
+        return self._state.get() is not None
+
+    @property
+    def session(self) -> Session | None:
+        """
+        The session of the open unit of work, or None if no unit of work is open in the current context.
+        """
+        state = self._state.get()
+        return state.session if state is not None else None
+
+    @contextmanager
+    def begin(self) -> Generator["SQLAUnitOfWork", None, None]:
+        if self.active:
+            yield self
+            return
+
+        with self._database.session() as session:
+            state = _SQLAUnitOfWorkState(session=session)
+            token = self._state.set(state)
+            try:
+                yield self
+                if state.rolled_back or not session.is_active:
+                    session.rollback()
+                else:
+                    session.commit()
+            finally:
+                self._state.reset(token)
+
+    def rollback(self) -> None:
+        state = self._state.get()
+        if state is None:
+            return
+        state.session.rollback()
+        state.rolled_back = True
+
+
+class SQLAUnitOfWorkMixin:
+    """
+    Gives a SQLA repository access to the session of the open unit of work, if any. Outside of a unit of work the repository falls back to its own long-lived session, and commits after each write as before.
+    """
+
+    _session: Session
+    _session_factory: TDatabaseFactory
+    _unit_of_work: SQLAUnitOfWork | None
+
+    def _init_session(self, session_factory: TDatabaseFactory, unit_of_work: SQLAUnitOfWork | None) -> None:
+        with session_factory() as session:
+            self._session = session
+        self._session_factory = session_factory
+        self._unit_of_work = unit_of_work
+
+    @property
+    def session(self) -> Session:
+        if self._unit_of_work is not None:
+            session = self._unit_of_work.session
+            if session is not None:
+                return session
+        self._session.expire_all()
+        return self._session
+
+    def commit(self) -> None:
+        """
+        Flushes the pending changes to the database. They are committed right away, unless a unit of work is open, in which case the commit happens once at the end of it.
+        """
+        if self._unit_of_work is not None and self._unit_of_work.session is not None:
+            self._unit_of_work.session.flush()
+        else:
+            self._session.commit()
+
+    def rollback(self) -> None:
+        """
+        Discards the pending changes. Inside a unit of work, the whole unit of work is rolled back.
+        """
+        if self._unit_of_work is not None and self._unit_of_work.session is not None:
+            self._unit_of_work.rollback()
+        else:
+            self._session.rollback()
+
+
+class _AsyncSQLAUnitOfWorkState:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self.rolled_back = False
+
+
+class AsyncSQLAUnitOfWork(AsyncBaseUnitOfWork):
+    """
+    The async counterpart of SQLAUnitOfWork, backed by a single AsyncSession bound to the current task.
+    """
+
+    def __init__(self, database: AsyncDatabase) -> None:
+        self._database = database
+        self._state: ContextVar[_AsyncSQLAUnitOfWorkState | None] = ContextVar(
+            f"async_sqla_unit_of_work_{id(self)}", default=None
+        )
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def active(self) -> bool:
+        return self._state.get() is not None
+
+    @property
+    def session(self) -> AsyncSession | None:
+        """
+        The session of the open unit of work, or None if no unit of work is open in the current context.
+        """
+        state = self._state.get()
+        return state.session if state is not None else None
+
+    @asynccontextmanager
+    async def begin(self) -> AsyncGenerator["AsyncSQLAUnitOfWork", None]:
+        if self.active:
+            yield self
+            return
+
+        async with self._database.session() as session:
+            state = _AsyncSQLAUnitOfWorkState(session=session)
+            token = self._state.set(state)
+            try:
+                yield self
+                if state.rolled_back or not session.is_active:
+                    await session.rollback()
+                else:
+                    await session.commit()
+            finally:
+                self._state.reset(token)
+
+    async def rollback(self) -> None:
+        state = self._state.get()
+        if state is None:
+            return
+        await state.session.rollback()
+        state.rolled_back = True
+
+
+class AsyncSQLAUnitOfWorkMixin:
+    """
+    Gives an async SQLA repository access to the session of the open unit of work. Outside of a unit of work, each operation opens a session of its own with `session_scope`, and commits before returning.
+    """
+
+    _async_database: AsyncDatabase
+    _async_unit_of_work: AsyncSQLAUnitOfWork | None
+
+    def _init_async_session(self, database: AsyncDatabase, unit_of_work: AsyncSQLAUnitOfWork | None) -> None:
+        self._async_database = database
+        self._async_unit_of_work = unit_of_work
+
+    @asynccontextmanager
+    async def session_scope(self) -> AsyncGenerator[AsyncSession, None]:
+        if self._async_unit_of_work is not None:
+            session = self._async_unit_of_work.session
+            if session is not None:
+                yield session
+                return
+
+        async with self._async_database.session() as session:
+            yield session
+            if session.in_transaction():
+                await session.commit()
+
+    async def commit(self, session: AsyncSession) -> None:
+        """
+        Flushes the pending changes of the session. Inside a unit of work, they are committed once at the end of it; otherwise `session_scope` commits them when it ends.
+        """
+        await session.flush()
+
+    async def rollback(self, session: AsyncSession) -> None:
+        """
+        Discards the pending changes. Inside a unit of work, the whole unit of work is rolled back.
+        """
+        if self._async_unit_of_work is not None and self._async_unit_of_work.session is session:
+            await self._async_unit_of_work.rollback()
+        else:
+            await session.rollback()
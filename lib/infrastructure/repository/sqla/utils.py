@@ -1,3 +1,21 @@
+from datetime import datetime
+from typing import Any, List, Sequence, Tuple
+
+from sqlalchemy import (
+    BindParameter,
+    ColumnElement,
+    DateTime,
+    Integer,
+    Select,
+    Tuple as SQLTuple,
+    bindparam,
+    func,
+    literal,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, DOUBLE_PRECISION
+
 from lib.core.entity.models import (
     LLM,
     Conversation,
@@ -8,6 +26,7 @@ from lib.core.entity.models import (
     SourceData,
     Client,
 )
+from lib.core.sdk.pagination import decode_cursor, decode_search_cursor
 from lib.infrastructure.repository.sqla.models import (
     SQLALLM,
     SQLAConversation,
@@ -20,6 +39,55 @@ from lib.infrastructure.repository.sqla.models import (
 )
 
 
+def id_array(name: str, ids: List[int]) -> BindParameter[Sequence[int]]:
+    """
+    Binds a list of IDs as a single array parameter, e.g. for `id = ANY(:ids)`, instead of one parameter per ID.
+    """
+    return bindparam(name, ids, type_=ARRAY(Integer))
+
+
+def cursor_keyset(cursor: str) -> SQLTuple:
+    """
+    Decodes a cursor created with `encode_cursor` into a (created_at, id) SQL tuple, to compare with the keyset of the rows of a query.
+
+    @param cursor: The cursor to decode.
+    @type cursor: str
+    @return: The keyset of the row of the cursor, as typed SQL literals.
+    @rtype: Tuple
+    @raises ValueError: If the cursor is malformed.
+    """
+    created_at, id = decode_cursor(cursor)
+    return tuple_(literal(created_at, DateTime), literal(id, Integer))
+
+
+def search_cursor_keyset(cursor: str) -> SQLTuple:
+    """
+    Decodes a cursor created with `encode_search_cursor` into a (rank, id) SQL tuple, to compare with the keyset of the results of a search.
+
+    @param cursor: The cursor to decode.
+    @type cursor: str
+    @return: The keyset of the result of the cursor, as typed SQL literals.
+    @rtype: Tuple
+    @raises ValueError: If the cursor is malformed.
+    """
+    rank, id = decode_search_cursor(cursor)
+    return tuple_(literal(rank, DOUBLE_PRECISION), literal(id, Integer))
+
+
+def collection_version_statement(model: Any, *criteria: ColumnElement[bool]) -> Select[Tuple[int, datetime | None]]:
+    """
+    Builds the aggregate query summarizing a collection of entities, i.e. their number and their latest update, in a single round trip.
+
+    @param model: The SQLAlchemy model of the entities.
+    @type model: Any
+    @param criteria: The criteria selecting the entities of the collection.
+    @type criteria: ColumnElement[bool]
+    @return: The query, returning a single (count, max(updated_at)) row.
+    @rtype: Select[Tuple[int, datetime | None]]
+    """
+    return select(func.count(model.id), func.max(model.updated_at)).where(*criteria)
+
+
 def convert_sqla_client_to_core_client(sqla_client: SQLAClient) -> Client:
     """
     Converts a SQLAClient to a (core) Client
@@ -83,16 +151,20 @@ def convert_sqla_conversation_to_core_conversation(sqla_conversation: SQLAConver
 
 def convert_sqla_client_message_to_core_user_message(
     sqla_client_message: SQLAUserMessage,
+    sender: str | None = None,
 ) -> UserMessage:
     """
     Converts a SQLAUserMessage to a (core) UserMessage
 
     @param sqla_client_message: The SQLAUserMessage to convert
     @type sqla_client_message: SQLAUserMessage
+    @param sender: The client sub of the conversation, if already known. Otherwise it is lazily loaded from the message, which costs a few queries per message
+    @type sender: str | None
     @return: The converted UserMessage
     @rtype: UserMessage
     """
-    sender = sqla_client_message.conversation.research_context.client.sub
+    if sender is None:
+        sender = sqla_client_message.conversation.research_context.client.sub
 
     message_contents = [
         MessageContent(
@@ -122,16 +194,20 @@ def convert_sqla_client_message_to_core_user_message(
 
 def convert_sqla_agent_message_to_core_agent_message(
     sqla_agent_message: SQLAAgentMessage,
+    sender: str | None = None,
 ) -> AgentMessage:
     """
     Converts a SQLAAgentMessage to a (core) AgentMessage
 
     @param sqla_agent_message: The SQLAAgentMessage to convert
     @type sqla_agent_message: SQLAAgentMessage
+    @param sender: The LLM name of the conversation, if already known. Otherwise it is lazily loaded from the message, which costs a few queries per message
+    @type sender: str | None
     @return: The converted AgentMessage
     @rtype: AgentMessage
     """
-    sender = sqla_agent_message.conversation.research_context.llm.llm_name
+    if sender is None:
+        sender = sqla_agent_message.conversation.research_context.llm.llm_name
 
     message_contents = [
         MessageContent(
@@ -161,14 +237,14 @@ def convert_sqla_agent_message_to_core_agent_message(
 
 def convert_sqla_source_data_to_core_source_data(sqla_source_data: SQLASourceData) -> SourceData:
     """
-    Converts a SQLASourceData to a (core) SourceData
+    Converts a SQLASourceData to a (core) SourceData, without validating its relative path and protocol again
 
     @param sqla_source_data: The SQLASourceData to convert
     @type sqla_source_data: SQLASourceData
     @return: The converted SourceData
     @rtype: SourceData
     """
-    return SourceData(
+    return SourceData.from_trusted(
         created_at=sqla_source_data.created_at,
         updated_at=sqla_source_data.updated_at,
         deleted=sqla_source_data.deleted,
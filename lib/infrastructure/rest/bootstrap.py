@@ -0,0 +1,112 @@
+"""
+The one-time startup work of the FastAPI server, and the registry of its features.
+
+`bootstrap` runs once, in the process that starts Uvicorn, before the workers are spawned: it creates the default data
+and scans the endpoints package for the features to mount. The registry is handed down to the workers through the
+`KP_FASTAPI_FEATURE_REGISTRY` environment variable, so that each worker only imports the listed modules and mounts
+their routes, without racing the others to insert the default data.
+"""
+import importlib
+import json
+import logging
+import os
+from pathlib import Path
+import time
+from typing import Any, List, Type
+
+from lib.core.sdk.fastapi import FastAPIEndpoint
+from lib.core.sdk.utils import get_all_modules
+from lib.infrastructure.config.containers import ApplicationContainer
+from lib.infrastructure.controller.create_default_data_controller import (
+    CreateDefaultDataController,
+    CreateDefaultDataControllerParameters,
+)
+import lib.infrastructure.rest.endpoints as endpoints
+
+logger = logging.getLogger(__name__)
+
+FEATURE_REGISTRY_ENV = "KP_FASTAPI_FEATURE_REGISTRY"
+
+
+def discover_fastapi_features() -> List[str]:
+    """
+    Scans the endpoints package for the modules defining a FastAPI feature, i.e. a class whose name contains 'FastAPIFeature'.
+
+    @return: The features found, as 'module:ClassName' entries sorted by module.
+    @rtype: List[str]
+    """
+    registry: List[str] = []
+    modules = get_all_modules(package=endpoints, relative_package_dir=Path(__file__).parent / "endpoints")
+    for module_name in sorted(modules):
+        module = importlib.import_module(module_name)
+        fastapi_feature_class = next(
+            (
+                obj
+                for name, obj in module.__dict__.items()
+                if isinstance(obj, type) and "FastAPIFeature" in obj.__name__ and obj != FastAPIEndpoint
+            ),
+            None,
+        )
+        if fastapi_feature_class is not None:
+            registry.append(f"{module_name}:{fastapi_feature_class.__name__}")
+    return registry
+
+
+def load_fastapi_features(registry: List[str]) -> List[Type[Any]]:
+    """
+    Imports the feature classes listed in a registry.
+
+    @param registry: The features, as 'module:ClassName' entries.
+    @type registry: List[str]
+    @return: The feature classes, in the order of the registry.
+    @rtype: List[Type[Any]]
+    """
+    feature_classes: List[Type[Any]] = []
+    for entry in registry:
+        module_name, _, class_name = entry.partition(":")
+        module = importlib.import_module(module_name)
+        feature_classes.append(getattr(module, class_name))
+    return feature_classes
+
+
+def frozen_feature_registry() -> List[str] | None:
+    """
+    Gets the registry computed by the bootstrap phase of the parent process, or None if the server was not started through it, e.g. in tests.
+    """
+    registry = os.getenv(FEATURE_REGISTRY_ENV)
+    if registry is None:
+        return None
+    entries: List[str] = json.loads(registry)
+    return entries
+
+
+def bootstrap(app_container: ApplicationContainer) -> List[str]:
+    """
+    Runs the startup work that must happen once per deployment rather than once per worker: creating the default data, and computing the registry of features. The migrations are expected to have been applied already.
+
+    @param app_container: The application container.
+    @type app_container: ApplicationContainer
+    @return: The registry of features, as 'module:ClassName' entries.
+    @rtype: List[str]
+    """
+    start = time.perf_counter()
+
+    create_default_data_controller: CreateDefaultDataController = (
+        app_container.create_default_data_feature().controller()
+    )
+    default_parameters: CreateDefaultDataControllerParameters = CreateDefaultDataControllerParameters(
+        client_sub=None, llm_name=None
+    )
+    create_default_data_controller.execute(default_parameters)
+
+    registry = discover_fastapi_features()
+
+    logger.info(f"Bootstrapped {len(registry)} features in {(time.perf_counter() - start) * 1000:.1f} ms")
+    return registry
+
+
+def freeze_feature_registry(registry: List[str]) -> None:
+    """
+    Hands the registry down to the workers spawned by this process, which inherit its environment.
+    """
+    os.environ[FEATURE_REGISTRY_ENV] = json.dumps(registry)
@@ -19,6 +19,7 @@ class CreateDefaultDataFastAPIFeature(
         self,
         descriptor: Any = Provide[ApplicationContainer.create_default_data_feature.feature_descriptor],
         controller: Any = Provide[ApplicationContainer.create_default_data_feature.controller],
+        unit_of_work: Any = Provide[ApplicationContainer.unit_of_work],
     ):
         responses: dict[int | str, dict[str, Any]] = {
             200: {
@@ -35,7 +36,7 @@ class CreateDefaultDataFastAPIFeature(
             },
         }
 
-        super().__init__(controller=controller, descriptor=descriptor, responses=responses)
+        super().__init__(controller=controller, descriptor=descriptor, responses=responses, unit_of_work=unit_of_work)
 
     def register_endpoint(self) -> None:
         @self.router.post(
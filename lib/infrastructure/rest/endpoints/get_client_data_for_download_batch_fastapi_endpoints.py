@@ -0,0 +1,69 @@
+from typing import Any, List
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from lib.core.entity.models import SourceDataCompositeIndex
+from lib.core.sdk.fastapi import FastAPIEndpoint
+from lib.core.view_model.get_client_data_for_download_batch_view_model import GetClientDataForDownloadBatchViewModel
+from lib.infrastructure.config.containers import ApplicationContainer
+from lib.infrastructure.controller.get_client_data_for_download_batch_controller import (
+    GetClientDataForDownloadBatchControllerParameters,
+)
+
+
+from dependency_injector.wiring import inject, Provide
+
+
+class GetClientDataForDownloadBatchFastAPIFeature(
+    FastAPIEndpoint[GetClientDataForDownloadBatchControllerParameters, GetClientDataForDownloadBatchViewModel]
+):
+    @inject
+    def __init__(
+        self,
+        descriptor: Any = Provide[ApplicationContainer.get_client_data_for_download_batch_feature.feature_descriptor],
+        controller: Any = Provide[ApplicationContainer.get_client_data_for_download_batch_feature.controller],
+        unit_of_work: Any = Provide[ApplicationContainer.unit_of_work],
+    ):
+        responses: dict[int | str, dict[str, Any]] = {
+            200: {
+                "model": GetClientDataForDownloadBatchViewModel,
+                "description": "Success",
+            },
+            400: {
+                "model": GetClientDataForDownloadBatchViewModel,
+                "description": "Bad Request.",
+            },
+            500: {
+                "model": GetClientDataForDownloadBatchViewModel,
+                "description": "Internal Server Error",
+            },
+        }
+
+        super().__init__(controller=controller, descriptor=descriptor, responses=responses, unit_of_work=unit_of_work)
+
+    def register_endpoint(self) -> None:
+        @self.router.post(
+            name=self.name,
+            description=self.descriptor.description,
+            path="/client/{id}/download-credentials/batch",
+            responses=self.responses,
+        )
+        def endpoint(
+            id: int,
+            files: List[SourceDataCompositeIndex],
+        ) -> GetClientDataForDownloadBatchViewModel | None:
+            try:
+                controller_parameters = GetClientDataForDownloadBatchControllerParameters(
+                    client_id=id,
+                    composite_indexes=files,
+                )
+            except ValidationError as ve:
+                raise HTTPException(status_code=400, detail=ve.errors(include_context=False))
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=str(e))
+
+            view_model: GetClientDataForDownloadBatchViewModel = self.execute(
+                controller_parameters=controller_parameters,
+            )
+
+            return view_model
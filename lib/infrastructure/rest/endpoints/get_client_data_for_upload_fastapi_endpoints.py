@@ -21,6 +21,7 @@ class GetClientDataForUploadFastAPIFeature(
         self,
         descriptor: Any = Provide[ApplicationContainer.get_client_data_for_upload_feature.feature_descriptor],
         controller: Any = Provide[ApplicationContainer.get_client_data_for_upload_feature.controller],
+        unit_of_work: Any = Provide[ApplicationContainer.unit_of_work],
     ):
         responses: dict[int | str, dict[str, Any]] = {
             200: {
@@ -37,7 +38,7 @@ class GetClientDataForUploadFastAPIFeature(
             },
         }
 
-        super().__init__(controller=controller, descriptor=descriptor, responses=responses)
+        super().__init__(controller=controller, descriptor=descriptor, responses=responses, unit_of_work=unit_of_work)
 
     def register_endpoint(self) -> None:
         @self.router.get(
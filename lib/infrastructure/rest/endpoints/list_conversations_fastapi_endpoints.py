@@ -1,8 +1,9 @@
 from typing import Any
 
-from fastapi import HTTPException
+from fastapi import HTTPException, Request, Response
 from pydantic import ValidationError
 
+from lib.core.sdk.dto import CollectionVersionDTO
 from lib.core.sdk.fastapi import FastAPIEndpoint
 from lib.core.view_model.list_conversations_view_model import ListConversationsViewModel
 from lib.infrastructure.config.containers import ApplicationContainer
@@ -19,6 +20,10 @@ class ListConversationsFastAPIFeature(
         self,
         descriptor: Any = Provide[ApplicationContainer.list_conversations_feature.feature_descriptor],
         controller: Any = Provide[ApplicationContainer.list_conversations_feature.controller],
+        unit_of_work: Any = Provide[ApplicationContainer.unit_of_work],
+        research_context_repository: Any = Provide[
+            ApplicationContainer.list_conversations_feature.research_context_repository
+        ],
     ):
         responses: dict[int | str, dict[str, Any]] = {
             200: {
@@ -35,7 +40,16 @@ class ListConversationsFastAPIFeature(
             },
         }
 
-        super().__init__(controller=controller, descriptor=descriptor, responses=responses)
+        super().__init__(controller=controller, descriptor=descriptor, responses=responses, unit_of_work=unit_of_work)
+        self._research_context_repository = research_context_repository
+
+    def collection_version(
+        self, controller_parameters: ListConversationsControllerParameters
+    ) -> CollectionVersionDTO | None:
+        version: CollectionVersionDTO = self._research_context_repository.get_conversations_version(
+            controller_parameters.research_context_id
+        )
+        return version
 
     def register_endpoint(self) -> None:
         @self.router.get(
@@ -43,10 +57,13 @@ class ListConversationsFastAPIFeature(
             description=self.descriptor.description,
             path="/research-context/{id}/conversation",
             responses=self.responses,
+            response_model=ListConversationsViewModel | None,
         )
         def endpoint(
+            request: Request,
+            response: Response,
             id: int,
-        ) -> ListConversationsViewModel | None:
+        ) -> ListConversationsViewModel | Response:
             try:
                 controller_parameters = ListConversationsControllerParameters(
                     research_context_id=id,
@@ -56,7 +73,7 @@ class ListConversationsFastAPIFeature(
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
 
-            view_model: ListConversationsViewModel = self.execute(
-                controller_parameters=controller_parameters,
+            view_model = self.conditional_execute(
+                controller_parameters=controller_parameters, request=request, response=response
             )
-            return view_model
+            return self.json_response(view_model, response)
@@ -1,20 +1,30 @@
-from typing import Any
+from typing import Annotated, Any, AsyncGenerator, AsyncIterable, Iterable
 from dependency_injector.wiring import inject, Provide
-from fastapi import HTTPException
+from fastapi import Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
+from starlette.concurrency import iterate_in_threadpool
 
-from lib.core.sdk.fastapi import FastAPIEndpoint
+from lib.core.entity.models import MessageBase
+from lib.core.sdk.dto import CollectionVersionDTO
+from lib.core.sdk.fastapi import AsyncFastAPIEndpoint
 from lib.core.view_model.list_messages_view_model import ListMessagesViewModel
 from lib.infrastructure.config.containers import ApplicationContainer
 from lib.infrastructure.controller.list_messages_controller import ListMessagesControllerParameters
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
 
-class ListMessagesFastAPIFeature(FastAPIEndpoint[ListMessagesControllerParameters, ListMessagesViewModel]):
+
+class ListMessagesFastAPIFeature(AsyncFastAPIEndpoint[ListMessagesControllerParameters, ListMessagesViewModel]):
     @inject
     def __init__(
         self,
         descriptor: Any = Provide[ApplicationContainer.list_messages_feature.feature_descriptor],
-        controller: Any = Provide[ApplicationContainer.list_messages_feature.controller],
+        controller: Any = Provide[ApplicationContainer.list_messages_feature.async_controller],
+        unit_of_work: Any = Provide[ApplicationContainer.async_unit_of_work],
+        conversation_repository: Any = Provide[
+            ApplicationContainer.list_messages_feature.async_conversation_repository
+        ],
     ):
         responses: dict[int | str, dict[str, Any]] = {
             200: {
@@ -31,7 +41,19 @@ class ListMessagesFastAPIFeature(FastAPIEndpoint[ListMessagesControllerParameter
             },
         }
 
-        super().__init__(controller=controller, descriptor=descriptor, responses=responses)
+        super().__init__(controller=controller, descriptor=descriptor, responses=responses, unit_of_work=unit_of_work)
+        self._conversation_repository = conversation_repository
+
+    async def collection_version(
+        self, controller_parameters: ListMessagesControllerParameters
+    ) -> CollectionVersionDTO | None:
+        # A stream is sent as it is read, so it has no ETag
+        if controller_parameters.stream:
+            return None
+        version: CollectionVersionDTO = await self._conversation_repository.get_conversation_messages_version(
+            controller_parameters.conversation_id
+        )
+        return version
 
     def register_endpoint(self) -> None:
         @self.router.get(
@@ -39,21 +61,52 @@ class ListMessagesFastAPIFeature(FastAPIEndpoint[ListMessagesControllerParameter
             description=self.descriptor.description,
             path="/conversations/{id}/message",
             responses=self.responses,
+            # The route also returns 304s, streams and pre-serialized responses, which FastAPI passes through as they are
+            response_model=ListMessagesViewModel | None,
         )
-        def endpoint(
+        async def endpoint(
+            request: Request,
+            response: Response,
             id: int,
-        ) -> ListMessagesViewModel | None:
+            limit: Annotated[int | None, Query(ge=1, le=1000)] = None,
+            after: str | None = None,
+            before: str | None = None,
+            accept: Annotated[str | None, Header()] = None,
+        ) -> ListMessagesViewModel | Response:
+            stream = accept is not None and NDJSON_MEDIA_TYPE in accept
             try:
                 controller_parameters = ListMessagesControllerParameters(
                     conversation_id=id,
+                    limit=limit,
+                    after=after,
+                    before=before,
+                    stream=stream,
                 )
             except ValidationError as ve:
-                raise HTTPException(status_code=400, detail=ve.errors())
+                raise HTTPException(status_code=400, detail=ve.errors(include_context=False))
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
 
-            view_model: ListMessagesViewModel = self.execute(
-                controller_parameters=controller_parameters,
+            result = await self.conditional_execute(
+                controller_parameters=controller_parameters, request=request, response=response
             )
+            if isinstance(result, Response):
+                return result
+            view_model: ListMessagesViewModel = result
+
+            if view_model.status and view_model.message_stream is not None:
+                return StreamingResponse(_ndjson_lines(view_model.message_stream), media_type=NDJSON_MEDIA_TYPE)
+
+            return self.json_response(view_model, response)
+
+
+def _ndjson_lines(messages: Iterable[MessageBase] | AsyncIterable[MessageBase]) -> AsyncGenerator[str, None]:
+    # A blocking iterator is read in the threadpool, so that it doesn't hold up the event loop
+    if not isinstance(messages, AsyncIterable):
+        messages = iterate_in_threadpool(iter(messages))
+    return _async_ndjson_lines(messages)
+
 
-            return view_model
+async def _async_ndjson_lines(messages: AsyncIterable[MessageBase]) -> AsyncGenerator[str, None]:
+    async for message in messages:
+        yield message.model_dump_json() + "\n"
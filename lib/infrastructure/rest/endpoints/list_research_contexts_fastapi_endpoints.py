@@ -1,7 +1,8 @@
 from typing import Any
 
-from fastapi import HTTPException
+from fastapi import HTTPException, Request, Response
 from pydantic import ValidationError
+from lib.core.sdk.dto import CollectionVersionDTO
 from lib.core.sdk.fastapi import FastAPIEndpoint
 from lib.core.view_model.list_research_contexts_view_model import ListResearchContextsViewModel
 from lib.infrastructure.config.containers import ApplicationContainer
@@ -18,6 +19,8 @@ class ListResearchContextsFastAPIFeature(
         self,
         descriptor: Any = Provide[ApplicationContainer.list_research_contexts_feature.feature_descriptor],
         controller: Any = Provide[ApplicationContainer.list_research_contexts_feature.controller],
+        unit_of_work: Any = Provide[ApplicationContainer.unit_of_work],
+        client_repository: Any = Provide[ApplicationContainer.list_research_contexts_feature.client_repository],
     ):
         responses: dict[int | str, dict[str, Any]] = {
             200: {
@@ -34,7 +37,16 @@ class ListResearchContextsFastAPIFeature(
             },
         }
 
-        super().__init__(controller=controller, descriptor=descriptor, responses=responses)
+        super().__init__(controller=controller, descriptor=descriptor, responses=responses, unit_of_work=unit_of_work)
+        self._client_repository = client_repository
+
+    def collection_version(
+        self, controller_parameters: ListResearchContextsControllerParameters
+    ) -> CollectionVersionDTO | None:
+        version: CollectionVersionDTO = self._client_repository.get_research_contexts_version(
+            controller_parameters.client_id
+        )
+        return version
 
     def register_endpoint(self) -> None:
         @self.router.get(
@@ -42,10 +54,13 @@ class ListResearchContextsFastAPIFeature(
             description=self.descriptor.description,
             path="/client/{id}/research-context",
             responses=self.responses,
+            response_model=ListResearchContextsViewModel | None,
         )
         def endpoint(
+            request: Request,
+            response: Response,
             id: int,
-        ) -> ListResearchContextsViewModel | None:
+        ) -> ListResearchContextsViewModel | Response:
             try:
                 controller_parameters = ListResearchContextsControllerParameters(
                     client_id=id,
@@ -55,7 +70,7 @@ class ListResearchContextsFastAPIFeature(
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
 
-            view_model: ListResearchContextsViewModel = self.execute(
-                controller_parameters=controller_parameters,
+            view_model = self.conditional_execute(
+                controller_parameters=controller_parameters, request=request, response=response
             )
-            return view_model
+            return self.json_response(view_model, response)
@@ -1,7 +1,10 @@
-from typing import Any
+from datetime import datetime
+from typing import Annotated, Any
 
-from fastapi import HTTPException
+from fastapi import HTTPException, Query, Request, Response
 from pydantic import ValidationError
+from lib.core.entity.models import ProtocolEnum, SourceDataStatusEnum
+from lib.core.sdk.dto import CollectionVersionDTO
 from lib.core.sdk.fastapi import FastAPIEndpoint
 from lib.core.view_model.list_source_data_view_model import ListSourceDataViewModel
 from lib.infrastructure.config.containers import ApplicationContainer
@@ -16,6 +19,8 @@ class ListSourceDataFastAPIFeature(FastAPIEndpoint[ListSourceDataControllerParam
         self,
         descriptor: Any = Provide[ApplicationContainer.list_source_data_feature.feature_descriptor],
         controller: Any = Provide[ApplicationContainer.list_source_data_feature.controller],
+        unit_of_work: Any = Provide[ApplicationContainer.unit_of_work],
+        client_repository: Any = Provide[ApplicationContainer.list_source_data_feature.client_repository],
     ):
         responses: dict[int | str, dict[str, Any]] = {
             200: {
@@ -32,7 +37,14 @@ class ListSourceDataFastAPIFeature(FastAPIEndpoint[ListSourceDataControllerParam
             },
         }
 
-        super().__init__(controller=controller, descriptor=descriptor, responses=responses)
+        super().__init__(controller=controller, descriptor=descriptor, responses=responses, unit_of_work=unit_of_work)
+        self._client_repository = client_repository
+
+    def collection_version(
+        self, controller_parameters: ListSourceDataControllerParameter
+    ) -> CollectionVersionDTO | None:
+        version: CollectionVersionDTO = self._client_repository.get_source_data_version(controller_parameters.client_id)
+        return version
 
     def register_endpoint(self) -> None:
         @self.router.get(
@@ -40,20 +52,39 @@ class ListSourceDataFastAPIFeature(FastAPIEndpoint[ListSourceDataControllerParam
             description=self.descriptor.description,
             path="/client/{id}/source",
             responses=self.responses,
+            response_model=ListSourceDataViewModel | None,
         )
         def endpoint(
+            request: Request,
+            response: Response,
             id: int | None = None,
-        ) -> ListSourceDataViewModel | None:
+            limit: Annotated[int | None, Query(ge=1, le=1000)] = None,
+            after: str | None = None,
+            source_data_type: Annotated[str | None, Query(alias="type")] = None,
+            status: SourceDataStatusEnum | None = None,
+            protocol: ProtocolEnum | None = None,
+            relative_path_prefix: str | None = None,
+            created_after: datetime | None = None,
+            created_before: datetime | None = None,
+        ) -> ListSourceDataViewModel | Response:
             try:
                 controller_parameters = ListSourceDataControllerParameter(
                     client_id=id,
+                    limit=limit,
+                    after=after,
+                    source_data_type=source_data_type,
+                    status=status,
+                    protocol=protocol,
+                    relative_path_prefix=relative_path_prefix,
+                    created_after=created_after,
+                    created_before=created_before,
                 )
             except ValidationError as ve:
-                raise HTTPException(status_code=400, detail=ve.errors())
+                raise HTTPException(status_code=400, detail=ve.errors(include_context=False))
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
 
-            view_model: ListSourceDataViewModel = self.execute(
-                controller_parameters=controller_parameters,
+            view_model = self.conditional_execute(
+                controller_parameters=controller_parameters, request=request, response=response
             )
-            return view_model
+            return self.json_response(view_model, response)
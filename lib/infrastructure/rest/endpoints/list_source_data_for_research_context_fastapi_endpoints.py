@@ -1,8 +1,9 @@
 from typing import Any
 from dependency_injector.wiring import inject, Provide
-from fastapi import HTTPException
+from fastapi import HTTPException, Request, Response
 from pydantic import ValidationError
 
+from lib.core.sdk.dto import CollectionVersionDTO
 from lib.core.sdk.fastapi import FastAPIEndpoint
 from lib.core.view_model.list_source_data_for_research_context_view_model import (
     ListSourceDataForResearchContextViewModel,
@@ -23,6 +24,10 @@ class ListSourceDataForResearchContextFastAPIFeature(
             ApplicationContainer.list_source_data_for_research_context_feature.feature_descriptor
         ],
         controller: Any = Provide[ApplicationContainer.list_source_data_for_research_context_feature.controller],
+        unit_of_work: Any = Provide[ApplicationContainer.unit_of_work],
+        research_context_repository: Any = Provide[
+            ApplicationContainer.list_source_data_for_research_context_feature.research_context_repository
+        ],
     ):
         responses: dict[int | str, dict[str, Any]] = {
             200: {
@@ -39,7 +44,16 @@ class ListSourceDataForResearchContextFastAPIFeature(
             },
         }
 
-        super().__init__(controller=controller, descriptor=descriptor, responses=responses)
+        super().__init__(controller=controller, descriptor=descriptor, responses=responses, unit_of_work=unit_of_work)
+        self._research_context_repository = research_context_repository
+
+    def collection_version(
+        self, controller_parameters: ListSourceDataForResearchContextControllerParameters
+    ) -> CollectionVersionDTO | None:
+        version: CollectionVersionDTO = self._research_context_repository.get_source_data_version(
+            controller_parameters.research_context_id
+        )
+        return version
 
     def register_endpoint(self) -> None:
         @self.router.get(
@@ -47,10 +61,13 @@ class ListSourceDataForResearchContextFastAPIFeature(
             description=self.descriptor.description,
             path="/research-context/{id}/source",
             responses=self.responses,
+            response_model=ListSourceDataForResearchContextViewModel | None,
         )
         def endpoint(
+            request: Request,
+            response: Response,
             id: int,
-        ) -> ListSourceDataForResearchContextViewModel | None:
+        ) -> ListSourceDataForResearchContextViewModel | Response:
             try:
                 controller_parameters = ListSourceDataForResearchContextControllerParameters(
                     research_context_id=id,
@@ -60,8 +77,7 @@ class ListSourceDataForResearchContextFastAPIFeature(
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
 
-            view_model: ListSourceDataForResearchContextViewModel = self.execute(
-                controller_parameters=controller_parameters,
+            view_model = self.conditional_execute(
+                controller_parameters=controller_parameters, request=request, response=response
             )
-
-            return view_model
+            return self.json_response(view_model, response)
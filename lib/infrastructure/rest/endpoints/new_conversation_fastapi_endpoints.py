@@ -16,6 +16,7 @@ class NewConversationFastAPIFeature(FastAPIEndpoint[NewConversationControllerPar
         self,
         descriptor: Any = Provide[ApplicationContainer.new_conversation_feature.feature_descriptor],
         controller: Any = Provide[ApplicationContainer.new_conversation_feature.controller],
+        unit_of_work: Any = Provide[ApplicationContainer.unit_of_work],
     ):
         responses: dict[int | str, dict[str, Any]] = {
             200: {
@@ -32,7 +33,7 @@ class NewConversationFastAPIFeature(FastAPIEndpoint[NewConversationControllerPar
             },
         }
 
-        super().__init__(controller=controller, descriptor=descriptor, responses=responses)
+        super().__init__(controller=controller, descriptor=descriptor, responses=responses, unit_of_work=unit_of_work)
 
     def register_endpoint(self) -> None:
         @self.router.post(
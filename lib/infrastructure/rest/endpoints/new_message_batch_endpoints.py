@@ -0,0 +1,64 @@
+from typing import Any, List
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from lib.core.sdk.fastapi import FastAPIEndpoint
+from lib.core.view_model.new_message_batch_view_model import NewMessageBatchViewModel
+from lib.core.entity.models import BaseMessage
+from lib.infrastructure.config.containers import ApplicationContainer
+from lib.infrastructure.controller.new_message_batch_controller import NewMessageBatchControllerParameters
+
+from dependency_injector.wiring import inject, Provide
+
+
+class NewMessageBatchFastAPIFeature(FastAPIEndpoint[NewMessageBatchControllerParameters, NewMessageBatchViewModel]):
+    @inject
+    def __init__(
+        self,
+        descriptor: Any = Provide[ApplicationContainer.new_message_batch_feature.feature_descriptor],
+        controller: Any = Provide[ApplicationContainer.new_message_batch_feature.controller],
+        unit_of_work: Any = Provide[ApplicationContainer.unit_of_work],
+    ):
+        responses: dict[int | str, dict[str, Any]] = {
+            200: {
+                "model": NewMessageBatchViewModel,
+                "description": "Success",
+            },
+            400: {
+                "model": NewMessageBatchViewModel,
+                "description": "Bad Request.",
+            },
+            500: {
+                "model": NewMessageBatchViewModel,
+                "description": "Internal Server Error",
+            },
+        }
+
+        super().__init__(controller=controller, descriptor=descriptor, responses=responses, unit_of_work=unit_of_work)
+
+    def register_endpoint(self) -> None:
+        @self.router.post(
+            name=self.name,
+            description=self.descriptor.description,
+            path="/conversation/{id}/messages",
+            responses=self.responses,
+        )
+        def endpoint(
+            id: int,
+            messages: List[BaseMessage],
+        ) -> NewMessageBatchViewModel | None:
+            try:
+                controller_parameters = NewMessageBatchControllerParameters(
+                    conversation_id=id,
+                    messages=messages,
+                )
+            except ValidationError as ve:
+                raise HTTPException(status_code=400, detail=ve.errors(include_context=False))
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=str(e))
+
+            view_model: NewMessageBatchViewModel = self.execute(
+                controller_parameters=controller_parameters,
+            )
+
+            return view_model
@@ -2,7 +2,7 @@ from typing import Any, List
 
 from fastapi import HTTPException
 from pydantic import ValidationError
-from lib.core.sdk.fastapi import FastAPIEndpoint
+from lib.core.sdk.fastapi import AsyncFastAPIEndpoint
 from lib.core.view_model.new_message_view_model import NewMessageViewModel
 from lib.core.entity.models import BaseMessageContent
 from lib.infrastructure.config.containers import ApplicationContainer
@@ -11,12 +11,13 @@ from lib.infrastructure.controller.new_message_controller import NewMessageContr
 from dependency_injector.wiring import inject, Provide
 
 
-class NewMessageFastAPIFeature(FastAPIEndpoint[NewMessageControllerParameters, NewMessageViewModel]):
+class NewMessageFastAPIFeature(AsyncFastAPIEndpoint[NewMessageControllerParameters, NewMessageViewModel]):
     @inject
     def __init__(
         self,
         descriptor: Any = Provide[ApplicationContainer.new_message_feature.feature_descriptor],
-        controller: Any = Provide[ApplicationContainer.new_message_feature.controller],
+        controller: Any = Provide[ApplicationContainer.new_message_feature.async_controller],
+        unit_of_work: Any = Provide[ApplicationContainer.async_unit_of_work],
     ):
         responses: dict[int | str, dict[str, Any]] = {
             200: {
@@ -33,7 +34,7 @@ class NewMessageFastAPIFeature(FastAPIEndpoint[NewMessageControllerParameters, N
             },
         }
 
-        super().__init__(controller=controller, descriptor=descriptor, responses=responses)
+        super().__init__(controller=controller, descriptor=descriptor, responses=responses, unit_of_work=unit_of_work)
 
     def register_endpoint(self) -> None:
         @self.router.post(
@@ -42,7 +43,7 @@ class NewMessageFastAPIFeature(FastAPIEndpoint[NewMessageControllerParameters, N
             path="/conversation/{id}/message",
             responses=self.responses,
         )
-        def endpoint(
+        async def endpoint(
             id: int,
             message_contents: List[BaseMessageContent],
             sender_type: str,
@@ -60,7 +61,7 @@ class NewMessageFastAPIFeature(FastAPIEndpoint[NewMessageControllerParameters, N
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
 
-            view_model: NewMessageViewModel = self.execute(
+            view_model: NewMessageViewModel = await self.execute(
                 controller_parameters=controller_parameters,
             )
 
@@ -18,6 +18,7 @@ class NewResearchContextFastAPIFeature(
         self,
         descriptor: Any = Provide[ApplicationContainer.new_research_context_feature.feature_descriptor],
         controller: Any = Provide[ApplicationContainer.new_research_context_feature.controller],
+        unit_of_work: Any = Provide[ApplicationContainer.unit_of_work],
     ):
         responses: dict[int | str, dict[str, Any]] = {
             200: {
@@ -34,7 +35,7 @@ class NewResearchContextFastAPIFeature(
             },
         }
 
-        super().__init__(controller=controller, descriptor=descriptor, responses=responses)
+        super().__init__(controller=controller, descriptor=descriptor, responses=responses, unit_of_work=unit_of_work)
 
     def register_endpoint(self) -> None:
         @self.router.post(
@@ -0,0 +1,71 @@
+from typing import Annotated, Any
+
+from fastapi import HTTPException, Query
+from pydantic import ValidationError
+from lib.core.sdk.fastapi import FastAPIEndpoint
+from lib.core.view_model.search_messages_view_model import SearchMessagesViewModel
+from lib.infrastructure.config.containers import ApplicationContainer
+from lib.infrastructure.controller.search_messages_controller import SearchMessagesControllerParameters
+
+from dependency_injector.wiring import inject, Provide
+
+
+class SearchMessagesFastAPIFeature(FastAPIEndpoint[SearchMessagesControllerParameters, SearchMessagesViewModel]):
+    @inject
+    def __init__(
+        self,
+        descriptor: Any = Provide[ApplicationContainer.search_messages_feature.feature_descriptor],
+        controller: Any = Provide[ApplicationContainer.search_messages_feature.controller],
+        unit_of_work: Any = Provide[ApplicationContainer.unit_of_work],
+    ):
+        responses: dict[int | str, dict[str, Any]] = {
+            200: {
+                "model": SearchMessagesViewModel,
+                "description": "Success",
+            },
+            400: {
+                "model": SearchMessagesViewModel,
+                "description": "Bad Request.",
+            },
+            500: {
+                "model": SearchMessagesViewModel,
+                "description": "Internal Server Error",
+            },
+        }
+
+        super().__init__(controller=controller, descriptor=descriptor, responses=responses, unit_of_work=unit_of_work)
+
+    def register_endpoint(self) -> None:
+        @self.router.get(
+            name=self.name,
+            description=self.descriptor.description,
+            path="/client/{id}/message/search",
+            responses=self.responses,
+        )
+        def endpoint(
+            id: int,
+            q: str,
+            research_context_id: int | None = None,
+            conversation_id: int | None = None,
+            limit: Annotated[int, Query(ge=1, le=100)] = 20,
+            after: str | None = None,
+        ) -> SearchMessagesViewModel | None:
+            try:
+                controller_parameters = SearchMessagesControllerParameters(
+                    client_id=id,
+                    query=q,
+                    research_context_id=research_context_id,
+                    conversation_id=conversation_id,
+                    limit=limit,
+                    after=after,
+                )
+            except ValidationError as ve:
+                raise HTTPException(status_code=400, detail=ve.errors(include_context=False))
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=str(e))
+
+            view_model: SearchMessagesViewModel = self.execute(
+                controller_parameters=controller_parameters,
+            )
+
+            return view_model
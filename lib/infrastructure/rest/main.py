@@ -1,20 +1,22 @@
-import importlib
+import logging
 import os
 from pathlib import Path
 import signal
-from typing import Any
+import time
+from typing import Any, List
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
 import uvicorn
-from lib.core.sdk.fastapi import FastAPIEndpoint
-from lib.core.sdk.utils import get_all_modules
 from lib.infrastructure.config.containers import ApplicationContainer
-from lib.infrastructure.controller.create_default_data_controller import (
-    CreateDefaultDataController,
-    CreateDefaultDataControllerParameters,
+from lib.infrastructure.rest.bootstrap import (
+    bootstrap,
+    freeze_feature_registry,
+    frozen_feature_registry,
+    load_fastapi_features,
 )
-import lib.infrastructure.rest.endpoints as endpoints
+from lib.infrastructure.rest.middleware import RequestMetricsMiddleware
 from tools.app_startup_utils import (
     cleanup_handler,
     run_alembic_migrations,
@@ -24,50 +26,110 @@ from tools.app_startup_utils import (
     wait_for_postgres_to_be_responsive,
 )
 
+logger = logging.getLogger(__name__)
+
+
+def allowed_origins() -> List[str]:
+    default_origins = ["http://localhost", "http://localhost:3000", "http://localhost:8080"]
+    extra_origins = os.getenv("KP_ALLOWED_ORIGINS", "").split(",")
+    return default_origins + [x.strip() for x in extra_origins if x.strip() != ""]
+
 
 def create_app() -> FastAPI:
+    startup_start = time.perf_counter()
     app = FastAPI()
     app_container = ApplicationContainer()
     app_container.config.from_yaml("../../../config.yaml")
     app.container = app_container  # type: ignore
 
-    create_default_data_controller: CreateDefaultDataController = (
-        app_container.create_default_data_feature().controller()
+    registry = frozen_feature_registry()
+    bootstrapped = registry is not None
+    if registry is None:
+        # Not started through `start` or the dev servers, e.g. in tests: this process does the bootstrap itself
+        registry = bootstrap(app_container)
+
+    storage = app_container.storage()
+    try:
+        storage.load_known_buckets()
+    except Exception as e:
+        storage.logger.warning(
+            f"Could not load the existing buckets from the object store, they will be checked on use: {e}"
+        )
+
+    for fastapi_feature_class in load_fastapi_features(registry):
+        fastapi_feature = fastapi_feature_class()
+        router: APIRouter | None = fastapi_feature.load()
+        if router is not None:
+            app.include_router(fastapi_feature.router)
+
+    app.get(
+        "/ping",
+        name="health",
+        tags=["Health Check"],
+        summary="Health Check",
+        description="Checks if Kernel Planchester is alive",
+        response_model=Any,
+    )(lambda: {"pong"})
+
+    db = app_container.db()
+    client_cache = app_container.client_cache()
+    app.add_event_handler("shutdown", app_container.async_db().dispose)
+
+    request_metrics_registry = app_container.request_metrics_registry()
+    app.add_middleware(RequestMetricsMiddleware, registry=request_metrics_registry)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=allowed_origins(),
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    @app.get(
+        "/metrics",
+        name="metrics",
+        tags=["Health Check"],
+        summary="Metrics",
+        description="Exposes the startup time, the usage of the database connection pool and the hit rate of the client cache of this worker, and the latency of each stage of its features, in Prometheus text format",
+        response_class=PlainTextResponse,
     )
-    default_parameters: CreateDefaultDataControllerParameters = CreateDefaultDataControllerParameters(
-        client_sub=None, llm_name=None
+    def metrics() -> str:
+        lines = [f"kp_worker_startup_seconds {app.state.startup_seconds}"]
+        lines.extend(f"kp_db_pool_{name} {value}" for name, value in db.pool_metrics().items())
+        client_cache_stats = client_cache.stats()
+        lines.append(f"kp_client_cache_hits_total {client_cache_stats['hits']}")
+        lines.append(f"kp_client_cache_misses_total {client_cache_stats['misses']}")
+        lines.append(f"kp_client_cache_size {client_cache_stats['size']}")
+        return "\n".join(lines) + "\n" + request_metrics_registry.render()
+
+    app.state.startup_seconds = time.perf_counter() - startup_start
+    logger.info(
+        f"Worker {os.getpid()} started in {app.state.startup_seconds * 1000:.1f} ms with {len(registry)} features"
+        f" ({'bootstrapped by the parent process' if bootstrapped else 'bootstrapped in process'})"
     )
-    create_default_data_controller.execute(default_parameters)
-    fastapi_endpoints = get_all_modules(package=endpoints, relative_package_dir=Path(__file__).parent / "endpoints")
-
-    for fastapi_endpoint in fastapi_endpoints:
-        module = importlib.import_module(fastapi_endpoint)
-        fastapi_feature_class = next(
-            (
-                obj
-                for name, obj in module.__dict__.items()
-                if isinstance(obj, type) and "FastAPIFeature" in obj.__name__ and obj != FastAPIEndpoint
-            ),
-            None,
-        )
-        if fastapi_feature_class is None:
-            continue
-        else:
-            fastapi_feature = fastapi_feature_class()
-            router: APIRouter | None = fastapi_feature.load()
-            if router is not None:
-                app.include_router(fastapi_feature.router)
-        app.get(
-            "/ping",
-            name="health",
-            tags=["Health Check"],
-            summary="Health Check",
-            description="Checks if Kernel Planchester is alive",
-            response_model=Any,
-        )(lambda: {"pong"})
     return app
 
 
+def serve(reload: bool, proxy_headers: bool = False) -> None:
+    """
+    Bootstraps the server once in this process, then starts Uvicorn, whose workers create the app with `create_app` and reuse the bootstrap.
+    The migrations must have been applied beforehand. With reload, a single worker is run.
+    """
+    app_container = ApplicationContainer()
+    freeze_feature_registry(bootstrap(app_container))
+    print(f"Allowed origins: {allowed_origins()}")
+
+    uvicorn.run(
+        "lib.infrastructure.rest.main:create_app",
+        factory=True,
+        host=app_container.config.fastapi.host(),
+        port=app_container.config.fastapi.port(),
+        proxy_headers=proxy_headers,
+        reload=reload,
+        workers=None if reload else app_container.config.fastapi.workers(),
+    )
+
+
 def dev_server() -> None:
     signal.signal(signal.SIGTERM, cleanup_handler)
     signal.signal(signal.SIGINT, cleanup_handler)
@@ -82,22 +144,7 @@ def dev_server() -> None:
         pg_password=os.getenv("KP_RDBMS_PASSWORD", "postgres"),
         pg_db=os.getenv("KP_RDBMS_DBNAME", "kp-db"),
     )
-    app = create_app()
-    # Add CORS middleware
-    default_origins = ["http://localhost", "http://localhost:3000", "http://localhost:8080"]
-    allowed_origins = os.getenv("KP_ALLOWED_ORIGINS", "").split(",")
-    final_origins = default_origins + [x.strip() for x in allowed_origins if x.strip() != ""]
-    print(f"Allowed origins: {final_origins}")
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=final_origins,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
-    host = app.container.config.fastapi.host()  # type: ignore
-    port = app.container.config.fastapi.port()  # type: ignore
-    uvicorn.run("lib.infrastructure.rest.main:create_app", host=host, port=port, reload=True)
+    serve(reload=True)
 
     stop_dependencies(
         project_root_dir=Path(__file__).parent.parent.parent.parent,
@@ -126,22 +173,7 @@ def dev_server_with_storage() -> None:
         object_store_default_bucket=os.getenv("KP_OBJECT_STORE_DEFAULT_BUCKET", "default"),
     )
 
-    app = create_app()
-    # Add CORS middleware
-    default_origins = ["http://localhost", "http://localhost:3000", "http://localhost:8080"]
-    allowed_origins = os.getenv("KP_ALLOWED_ORIGINS", "").split(",")
-    final_origins = default_origins + [x.strip() for x in allowed_origins if x.strip() != ""]
-    print(f"Allowed origins: {final_origins}")
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=final_origins,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
-    host = app.container.config.fastapi.host()  # type: ignore
-    port = app.container.config.fastapi.port()  # type: ignore
-    uvicorn.run("lib.infrastructure.rest.main:create_app", host=host, port=port, reload=True)
+    serve(reload=True)
 
     stop_dependencies(
         project_root_dir=Path(__file__).parent.parent.parent.parent,
@@ -220,32 +252,7 @@ def start() -> None:
 
     # TODO: check if provided Kafka is reachable
 
-    app = create_app()
-
-    # Add CORS middleware
-    default_origins = ["http://localhost", "http://localhost:3000", "http://localhost:8080"]
-    allowed_origins = os.getenv("KP_ALLOWED_ORIGINS", "").split(",")
-    final_origins = default_origins + [x.strip() for x in allowed_origins if x.strip() != ""]
-    print(f"Allowed origins: {final_origins}")
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=final_origins,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
-    host = app.container.config.fastapi.host()  # type: ignore
-    port = app.container.config.fastapi.port()  # type: ignore
-    workers = app.container.config.fastapi.workers()  # type: ignore
-
-    uvicorn.run(
-        "lib.infrastructure.rest.main:create_app",
-        host=host,
-        port=port,
-        proxy_headers=True,
-        reload=False,
-        workers=workers,
-    )
+    serve(reload=False, proxy_headers=True)
 
 
 if __name__ == "__main__":
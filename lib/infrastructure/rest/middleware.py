@@ -0,0 +1,46 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+import time
+
+from lib.core.sdk.metrics import RequestMetricsRegistry, start_request_metrics, stop_request_metrics
+
+
+class RequestMetricsMiddleware:
+    """
+    Collects the metrics of each HTTP request, adds them to the response as a Server-Timing header, and aggregates them into the registry once the request is done.
+    It is a plain ASGI middleware, so that the metrics of the request are shared with the endpoint through the context, and streamed responses are not buffered.
+
+    @param app: The ASGI application to wrap.
+    @type app: ASGIApp
+    @param registry: The registry the metrics of each request are added to.
+    @type registry: RequestMetricsRegistry
+    """
+
+    def __init__(self, app: ASGIApp, registry: RequestMetricsRegistry) -> None:
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics, token = start_request_metrics()
+        start = time.perf_counter()
+
+        async def send_with_server_timing(message: Message) -> None:
+            if message["type"] == "http.response.start" and metrics.feature is not None:
+                # The whole request so far: the endpoint, plus the validation of the parameters and the serialization of the response
+                server_timing = metrics.server_timing()
+                total = f"total;dur={(time.perf_counter() - start) * 1000:.1f}"
+                MutableHeaders(scope=message).append(
+                    "Server-Timing", f"{server_timing}, {total}" if server_timing else total
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_server_timing)
+        finally:
+            metrics.record("total", time.perf_counter() - start)
+            stop_request_metrics(token)
+            self.registry.observe(metrics)
@@ -0,0 +1,150 @@
+import requests
+from lib.core.entity.models import SourceDataCompositeIndex
+from lib.core.usecase.get_client_data_for_download_batch_usecase import GetClientDataForDownloadBatchUseCase
+from lib.core.usecase_models.get_client_data_for_download_batch_usecase_models import (
+    GetClientDataForDownloadBatchError,
+    GetClientDataForDownloadBatchRequest,
+    GetClientDataForDownloadBatchResponse,
+)
+from lib.infrastructure.config.containers import ApplicationContainer
+from lib.infrastructure.presenter.get_client_data_for_download_batch_presenter import (
+    GetClientDataForDownloadBatchPresenter,
+)
+from lib.infrastructure.repository.minio.models import MinIOPFN
+from lib.infrastructure.repository.sqla.database import TDatabaseFactory
+from lib.infrastructure.repository.sqla.models import SQLAClient
+
+
+def test_get_client_data_for_download_batch_feature(
+    app_container: ApplicationContainer,
+    test_file_path: str,
+    fake_client_with_source_data: SQLAClient,
+    db_session: TDatabaseFactory,
+) -> None:
+    presenter: GetClientDataForDownloadBatchPresenter = (
+        app_container.get_client_data_for_download_batch_feature.presenter()
+    )
+    usecase: GetClientDataForDownloadBatchUseCase = app_container.get_client_data_for_download_batch_feature.usecase()
+
+    sqla_client = fake_client_with_source_data
+
+    with db_session() as session:
+        session.add(sqla_client)
+        session.commit()
+
+        # Manually upload every file, each with its relative path as content
+        minio_store = app_container.minio_file_repository().store
+        bucket_name = MinIOPFN.process_bucket_name(sqla_client.sub)
+
+        for sqla_source_data in sqla_client.source_data:
+            pfn = minio_store.protocol_and_relative_path_to_pfn(
+                protocol=sqla_source_data.protocol,
+                relative_path=sqla_source_data.relative_path,
+                bucket_name=bucket_name,
+            )
+            minio_object = minio_store.pfn_to_object_name(pfn)
+            minio_store.create_bucket_if_not_exists(minio_object.bucket_name)
+            minio_store.client.fput_object(
+                bucket_name=minio_object.bucket_name, object_name=minio_object.object_name, file_path=test_file_path
+            )
+
+        composite_indexes = [
+            SourceDataCompositeIndex(protocol=sqla_source_data.protocol, relative_path=sqla_source_data.relative_path)
+            for sqla_source_data in sqla_client.source_data
+        ]
+
+        request = GetClientDataForDownloadBatchRequest(client_id=sqla_client.id, composite_indexes=composite_indexes)
+        response = usecase.execute(request=request)
+
+        assert isinstance(response, GetClientDataForDownloadBatchResponse)
+
+        view_model = presenter.convert_response_to_view_model(response=response)
+
+        assert view_model.status == True
+        assert set(view_model.signed_urls) == {composite_index.relative_path for composite_index in composite_indexes}
+
+        # Now test that every signed URL actually works
+        with open(test_file_path, "rb") as file:
+            original_content = file.read()
+
+        for signed_url in view_model.signed_urls.values():
+            download_res = requests.get(signed_url)
+            assert download_res.content == original_content
+
+
+def test_error_get_client_data_for_download_batch_feature_reports_missing_source_data(
+    app_container: ApplicationContainer,
+    fake_client_with_source_data: SQLAClient,
+    db_session: TDatabaseFactory,
+) -> None:
+    usecase: GetClientDataForDownloadBatchUseCase = app_container.get_client_data_for_download_batch_feature.usecase()
+
+    sqla_client = fake_client_with_source_data
+
+    with db_session() as session:
+        session.add(sqla_client)
+        session.commit()
+
+        sqla_source_data = sqla_client.source_data[0]
+        request = GetClientDataForDownloadBatchRequest(
+            client_id=sqla_client.id,
+            composite_indexes=[
+                SourceDataCompositeIndex(
+                    protocol=sqla_source_data.protocol, relative_path=sqla_source_data.relative_path
+                ),
+                SourceDataCompositeIndex(protocol="s3", relative_path="not/registered.txt"),
+            ],
+        )
+        response = usecase.execute(request=request)
+
+        assert isinstance(response, GetClientDataForDownloadBatchError)
+        assert response.errorCode == 404
+        assert response.errorType == "SourceDataNotFound"
+        assert "not/registered.txt" in response.errorMessage
+        assert sqla_source_data.relative_path not in response.errorMessage
+
+
+def test_error_get_client_data_for_download_batch_feature_reports_missing_files(
+    app_container: ApplicationContainer,
+    test_file_path: str,
+    fake_client_with_source_data: SQLAClient,
+    db_session: TDatabaseFactory,
+) -> None:
+    usecase: GetClientDataForDownloadBatchUseCase = app_container.get_client_data_for_download_batch_feature.usecase()
+
+    sqla_client = fake_client_with_source_data
+
+    with db_session() as session:
+        session.add(sqla_client)
+        session.commit()
+
+        # Only the first file is uploaded, the others are registered as source data but missing from MinIO
+        minio_store = app_container.minio_file_repository().store
+        uploaded_source_data, *missing_source_data = sqla_client.source_data
+        minio_object = minio_store.pfn_to_object_name(
+            minio_store.protocol_and_relative_path_to_pfn(
+                protocol=uploaded_source_data.protocol,
+                relative_path=uploaded_source_data.relative_path,
+                bucket_name=MinIOPFN.process_bucket_name(sqla_client.sub),
+            )
+        )
+        minio_store.create_bucket_if_not_exists(minio_object.bucket_name)
+        minio_store.client.fput_object(
+            bucket_name=minio_object.bucket_name, object_name=minio_object.object_name, file_path=test_file_path
+        )
+
+        request = GetClientDataForDownloadBatchRequest(
+            client_id=sqla_client.id,
+            composite_indexes=[
+                SourceDataCompositeIndex(
+                    protocol=sqla_source_data.protocol, relative_path=sqla_source_data.relative_path
+                )
+                for sqla_source_data in sqla_client.source_data
+            ],
+        )
+        response = usecase.execute(request=request)
+
+        assert isinstance(response, GetClientDataForDownloadBatchError)
+        for sqla_source_data in missing_source_data:
+            assert sqla_source_data.relative_path in response.errorMessage
+        assert uploaded_source_data.relative_path not in response.errorMessage
@@ -0,0 +1,91 @@
+import requests
+from lib.core.entity.models import SourceDataCompositeIndex
+from lib.core.usecase.get_client_data_for_upload_batch_usecase import GetClientDataForUploadBatchUsecase
+from lib.core.usecase_models.get_client_data_for_upload_batch_usecase_models import (
+    GetClientDataForUploadBatchError,
+    GetClientDataForUploadBatchRequest,
+    GetClientDataForUploadBatchResponse,
+)
+from lib.infrastructure.config.containers import ApplicationContainer
+from lib.infrastructure.presenter.get_client_data_for_upload_batch_presenter import (
+    GetClientDataForUploadBatchPresenter,
+)
+from lib.infrastructure.repository.sqla.database import TDatabaseFactory
+from lib.infrastructure.repository.sqla.models import SQLAClient
+
+
+def test_get_client_data_for_upload_batch_feature_usecase_presenter(
+    app_container: ApplicationContainer,
+    test_file_path: str,
+    fake_client_with_source_data: SQLAClient,
+    db_session: TDatabaseFactory,
+) -> None:
+    presenter: GetClientDataForUploadBatchPresenter = app_container.get_client_data_for_upload_batch_feature.presenter()
+    usecase: GetClientDataForUploadBatchUsecase = app_container.get_client_data_for_upload_batch_feature.usecase()
+
+    sqla_client = fake_client_with_source_data
+
+    with db_session() as session:
+        session.add(sqla_client)
+        session.commit()
+
+        composite_indexes = [
+            SourceDataCompositeIndex(protocol=sqla_source_data.protocol, relative_path=sqla_source_data.relative_path)
+            for sqla_source_data in sqla_client.source_data
+        ]
+
+        request = GetClientDataForUploadBatchRequest(client_id=sqla_client.id, composite_indexes=composite_indexes)
+        response = usecase.execute(request=request)
+
+        assert isinstance(response, GetClientDataForUploadBatchResponse)
+
+        view_model = presenter.convert_response_to_view_model(response=response)
+
+        assert view_model.status == True
+        assert set(view_model.signed_urls) == {composite_index.relative_path for composite_index in composite_indexes}
+
+        # Now test that every signed URL actually works
+        with open(test_file_path, "rb") as file:
+            content = file.read()
+
+        for signed_url in view_model.signed_urls.values():
+            upload_res = requests.put(signed_url, data=content)
+            assert upload_res.status_code == 200
+
+        minio_file_repo = app_container.minio_file_repository()
+        for composite_index in composite_indexes:
+            dto = minio_file_repo.composite_index_of_source_data_exists_as_file(
+                client=sqla_client,
+                protocol=composite_index.protocol,
+                relative_path=composite_index.relative_path,
+            )
+            assert dto.existence == True
+
+
+def test_error_get_client_data_for_upload_batch_feature_reports_all_invalid_paths(
+    app_container: ApplicationContainer,
+    fake_client: SQLAClient,
+    db_session: TDatabaseFactory,
+) -> None:
+    usecase: GetClientDataForUploadBatchUsecase = app_container.get_client_data_for_upload_batch_feature.usecase()
+
+    with db_session() as session:
+        session.add(fake_client)
+        session.commit()
+
+        request = GetClientDataForUploadBatchRequest(
+            client_id=fake_client.id,
+            composite_indexes=[
+                SourceDataCompositeIndex(protocol="s3", relative_path="valid/file.txt"),
+                SourceDataCompositeIndex(protocol="s3", relative_path="/starts/with/slash.txt"),
+                SourceDataCompositeIndex(protocol="s3", relative_path="no/extension"),
+            ],
+        )
+        response = usecase.execute(request=request)
+
+        assert isinstance(response, GetClientDataForUploadBatchError)
+        assert response.errorCode == 400
+        assert response.errorType == "CompositeIndexValidationError"
+        assert "/starts/with/slash.txt" in response.errorMessage
+        assert "no/extension" in response.errorMessage
+        assert "valid/file.txt" not in response.errorMessage
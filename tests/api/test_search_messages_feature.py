@@ -0,0 +1,112 @@
+import uuid
+from faker import Faker
+from lib.core.usecase.search_messages_usecase import SearchMessagesUseCase
+from lib.core.usecase_models.search_messages_usecase_models import (
+    SearchMessagesError,
+    SearchMessagesRequest,
+    SearchMessagesResponse,
+)
+from lib.core.view_model.search_messages_view_model import SearchMessagesViewModel
+from lib.infrastructure.config.containers import ApplicationContainer
+from lib.infrastructure.controller.search_messages_controller import (
+    SearchMessagesController,
+    SearchMessagesControllerParameters,
+)
+from lib.infrastructure.repository.sqla.database import TDatabaseFactory
+from lib.infrastructure.repository.sqla.models import SQLALLM, SQLAClient
+
+
+def test_search_messages_usecase(
+    app_initialization_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client_with_conversation: SQLAClient,
+) -> None:
+    usecase: SearchMessagesUseCase = app_initialization_container.search_messages_feature.usecase()
+
+    assert usecase is not None
+
+    client = fake_client_with_conversation
+    SQLALLM(llm_name=fake.name(), research_contexts=client.research_contexts)
+    conversation = client.research_contexts[0].conversations[0]
+    message = conversation.messages[0]
+    term = f"nebula{uuid.uuid4().hex}"
+    message.message_contents[0].content = f"What is a {term}?"
+
+    with db_session() as session:
+        client.save(session=session, flush=True)
+        session.commit()
+
+        client_id = client.id
+        conversation_id = conversation.id
+        message_id = message.id
+
+    request = SearchMessagesRequest(client_id=client_id, query=term)
+    response = usecase.execute(request=request)
+
+    assert response is not None
+    assert isinstance(response, SearchMessagesResponse)
+    assert len(response.search_results) == 1
+    assert response.search_results[0].message_id == message_id
+    assert response.search_results[0].conversation_id == conversation_id
+    assert term in response.search_results[0].snippet
+    assert response.next_cursor is None
+
+    request = SearchMessagesRequest(client_id=client_id, query=f"{term}-nowhere-to-be-found")
+    response = usecase.execute(request=request)
+
+    assert isinstance(response, SearchMessagesResponse)
+    assert response.search_results == []
+
+    request = SearchMessagesRequest(client_id=-1, query=term)
+    response = usecase.execute(request=request)
+
+    assert isinstance(response, SearchMessagesError)
+    assert response.errorType == "ClientNotFound"
+
+
+def test_search_messages_controller(
+    app_initialization_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client_with_conversation: SQLAClient,
+) -> None:
+    controller: SearchMessagesController = app_initialization_container.search_messages_feature.controller()
+
+    assert controller is not None
+
+    client = fake_client_with_conversation
+    SQLALLM(llm_name=fake.name(), research_contexts=client.research_contexts)
+    research_context = client.research_contexts[0]
+    term = f"nebula{uuid.uuid4().hex}"
+    for conversation in research_context.conversations:
+        conversation.messages[0].message_contents[0].content = f"Tell me about the {term}."
+
+    with db_session() as session:
+        client.save(session=session, flush=True)
+        session.commit()
+
+        client_id = client.id
+        research_context_id = research_context.id
+        number_of_conversations = len(research_context.conversations)
+
+    parameters = SearchMessagesControllerParameters(
+        client_id=client_id, query=term, research_context_id=research_context_id, limit=2
+    )
+
+    view_model: SearchMessagesViewModel | None = controller.execute(parameters=parameters)
+
+    assert view_model is not None
+    assert view_model.status is True
+    assert len(view_model.search_results) == 2
+    assert view_model.next_cursor is not None
+
+    parameters = SearchMessagesControllerParameters(
+        client_id=client_id, query=term, research_context_id=research_context_id, after=view_model.next_cursor
+    )
+
+    next_view_model: SearchMessagesViewModel | None = controller.execute(parameters=parameters)
+
+    assert next_view_model is not None
+    assert next_view_model.next_cursor is None
+    assert len(view_model.search_results) + len(next_view_model.search_results) == len(research_context.conversations)
@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta, timezone
+import uuid
+
+import requests
+
+from lib.infrastructure.repository.minio.minio_object_store import MinIOObjectStore
+from lib.infrastructure.repository.minio.models import MinIOObject
+from lib.infrastructure.repository.minio.signing import SigV4Presigner
+
+
+def test_presigned_urls_match_the_minio_client(app_object_store: MinIOObjectStore) -> None:
+    presigner = SigV4Presigner(
+        access_key=app_object_store._access_key,
+        secret_key=app_object_store._secret_key,
+        region=app_object_store.region,
+        base_url=app_object_store.base_url,
+    )
+    request_date = datetime(2024, 2, 29, 23, 59, 59, tzinfo=timezone.utc)
+
+    for method in ("GET", "PUT"):
+        for object_name in ("file.txt", "some dir/with spaces/and+symbols~!.csv"):
+            expected = app_object_store.client.get_presigned_url(
+                method, "bucket", object_name, expires=timedelta(minutes=60), request_date=request_date
+            )
+            url = presigner.presign(method, "bucket", object_name, timedelta(minutes=60), request_date=request_date)
+            assert url == expected
+
+
+def test_presigned_urls_work_and_reuse_the_signing_key(app_object_store: MinIOObjectStore) -> None:
+    minio_object = MinIOObject(bucket_name=f"signing-{uuid.uuid4()}", object_name="some/path/file.txt")
+
+    upload_url = app_object_store.get_signed_url_for_file_upload(minio_object)
+    signing_key = app_object_store._presigner._signing_key
+    assert requests.put(upload_url, data=b"content").status_code == 200
+
+    download_url = app_object_store.get_signed_url_for_file_download(minio_object)
+    assert app_object_store._presigner._signing_key is signing_key
+    response = requests.get(download_url)
+    assert response.status_code == 200
+    assert response.content == b"content"
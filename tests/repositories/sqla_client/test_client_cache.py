@@ -0,0 +1,72 @@
+from faker import Faker
+from lib.core.sdk.metrics import start_request_metrics, stop_request_metrics
+from lib.infrastructure.repository.sqla.client_cache import ClientCache
+from lib.infrastructure.repository.sqla.database import Database
+from lib.infrastructure.repository.sqla.models import SQLAClient
+from lib.infrastructure.repository.sqla.sqla_client_repository import SQLAClientRepository
+
+
+def test_client_lookups_go_through_the_cache(app_migrated_db: Database, fake_client: SQLAClient) -> None:
+    client_cache = ClientCache(database=app_migrated_db)
+    client_repository = SQLAClientRepository(session_factory=app_migrated_db.session, client_cache=client_cache)
+
+    with app_migrated_db.session() as session:
+        fake_client.save(session=session, flush=True)
+        session.commit()
+        client_id = fake_client.id
+        client_sub = fake_client.sub
+
+    first_dto = client_repository.get_client(client_id)
+    assert first_dto.status == True
+
+    metrics, token = start_request_metrics()
+    try:
+        by_id_dto = client_repository.get_client(client_id)
+        by_sub_dto = client_repository.get_client_by_sub(client_sub)
+    finally:
+        stop_request_metrics(token)
+
+    assert metrics.db_round_trips == 0
+    assert by_id_dto.data == first_dto.data
+    assert by_sub_dto.data == first_dto.data
+    assert client_cache.stats() == {"hits": 2, "misses": 1, "size": 2}
+
+
+def test_client_cache_is_invalidated_when_the_client_is_written(
+    app_migrated_db: Database, fake: Faker, fake_client: SQLAClient
+) -> None:
+    client_cache = ClientCache(database=app_migrated_db)
+    client_repository = SQLAClientRepository(session_factory=app_migrated_db.session, client_cache=client_cache)
+
+    with app_migrated_db.session() as session:
+        fake_client.save(session=session, flush=True)
+        session.commit()
+        client_id = fake_client.id
+        old_sub = fake_client.sub
+
+    assert client_repository.get_client(client_id).status == True
+    assert client_cache.get_by_sub(old_sub) is not None
+
+    new_sub = fake.name()
+    with app_migrated_db.session() as session:
+        sqla_client = session.get(SQLAClient, client_id)
+        assert sqla_client is not None
+        sqla_client.sub = new_sub
+        session.commit()
+
+    assert client_cache.stats()["size"] == 0
+
+    dto = client_repository.get_client(client_id)
+    assert dto.data is not None
+    assert dto.data.sub == new_sub
+    assert client_repository.get_client_by_sub(old_sub).status == False
+
+
+def test_unknown_clients_are_not_cached(app_migrated_db: Database) -> None:
+    client_cache = ClientCache(database=app_migrated_db)
+    client_repository = SQLAClientRepository(session_factory=app_migrated_db.session, client_cache=client_cache)
+
+    assert client_repository.get_client(999999999).status == False
+    assert client_repository.get_client(999999999).status == False
+
+    assert client_cache.stats() == {"hits": 0, "misses": 2, "size": 0}
@@ -0,0 +1,43 @@
+from typing import List
+from lib.core.dto.client_repository_dto import ListOwnedSourceDataIdsDTO
+from lib.infrastructure.config.containers import ApplicationContainer
+from lib.infrastructure.repository.sqla.database import TDatabaseFactory
+from lib.infrastructure.repository.sqla.models import SQLAClient
+
+
+def test_list_owned_source_data_ids(
+    app_initialization_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake_client_with_source_data_list: List[SQLAClient],
+) -> None:
+    sqla_client_repository = app_initialization_container.sqla_client_repository()
+
+    client, other_client = fake_client_with_source_data_list[:2]
+
+    with db_session() as session:
+        for c in fake_client_with_source_data_list:
+            c.save(session=session, flush=True)
+        session.commit()
+
+        own_ids = [sd.id for sd in client.source_data]
+        other_ids = [sd.id for sd in other_client.source_data]
+        irrealistic_id = 999999999
+
+        dto: ListOwnedSourceDataIdsDTO = sqla_client_repository.list_owned_source_data_ids(
+            client_id=client.id, source_data_ids=own_ids[:2] + other_ids + [irrealistic_id, own_ids[0]]
+        )
+
+    assert dto.status == True
+    assert sorted(dto.source_data_ids) == sorted(own_ids[:2])
+
+
+def test_list_owned_source_data_ids_empty(
+    app_initialization_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+) -> None:
+    sqla_client_repository = app_initialization_container.sqla_client_repository()
+
+    dto = sqla_client_repository.list_owned_source_data_ids(client_id=999999999, source_data_ids=[])
+
+    assert dto.status == True
+    assert dto.source_data_ids == []
@@ -1,6 +1,8 @@
+from datetime import datetime, timedelta
 import random
 from typing import List
 from faker import Faker
+from lib.core.entity.models import ProtocolEnum, SourceDataStatusEnum
 from lib.infrastructure.config.containers import ApplicationContainer
 
 from lib.infrastructure.repository.sqla.database import TDatabaseFactory
@@ -106,3 +108,115 @@ def test_error_list_source_data_by_client_id_ks_not_found(
     assert list_source_data_DTO.status == False
     assert list_source_data_DTO.errorCode == -1
     assert list_source_data_DTO.errorType == "ClientNotFound"
+
+
+def _date_source_data(client: SQLAClient) -> SQLAClient:
+    """
+    Makes the source data of a client created a minute apart: the even ones are available pdfs under 'reports/', the odd ones unavailable csvs under 'raw/'.
+    """
+    start = datetime(2024, 1, 1)
+    for i, sd in enumerate(client.source_data):
+        sd.created_at = start + timedelta(minutes=i)
+        sd.type = "pdf" if i % 2 == 0 else "csv"
+        sd.status = SourceDataStatusEnum.AVAILABLE if i % 2 == 0 else SourceDataStatusEnum.UNAVAILABLE
+        sd.relative_path = f"reports/{i}.pdf" if i % 2 == 0 else f"raw/{i}.csv"
+    return client
+
+
+def test_list_source_data_pages_with_cursor(
+    app_initialization_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake_client_with_source_data: SQLAClient,
+) -> None:
+    sqla_client_repository = app_initialization_container.sqla_client_repository()
+    client = _date_source_data(fake_client_with_source_data)
+
+    with db_session() as session:
+        client.save(session=session, flush=True)
+        session.commit()
+        expected_ids = [sd.id for sd in sorted(client.source_data, key=lambda sd: sd.created_at)]
+
+        listed_ids: List[int] = []
+        cursor: str | None = None
+        pages = 0
+        while True:
+            dto = sqla_client_repository.list_source_data(client_id=client.id, limit=3, after=cursor)
+            assert dto.status == True
+            listed_ids.extend(sd.id for sd in dto.data)
+            pages += 1
+            cursor = dto.next_cursor
+            if cursor is None:
+                break
+
+    assert pages == 2
+    assert listed_ids == expected_ids
+
+
+def test_list_source_data_filters(
+    app_initialization_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake_client_with_source_data: SQLAClient,
+) -> None:
+    sqla_client_repository = app_initialization_container.sqla_client_repository()
+    client = _date_source_data(fake_client_with_source_data)
+
+    with db_session() as session:
+        client.save(session=session, flush=True)
+        session.commit()
+
+        by_type = sqla_client_repository.list_source_data(client_id=client.id, source_data_type="pdf")
+        by_status = sqla_client_repository.list_source_data(
+            client_id=client.id, status=SourceDataStatusEnum.UNAVAILABLE
+        )
+        by_prefix = sqla_client_repository.list_source_data(client_id=client.id, relative_path_prefix="raw/")
+        by_protocol = sqla_client_repository.list_source_data(client_id=client.id, protocol=ProtocolEnum.NAS)
+        by_date = sqla_client_repository.list_source_data(
+            client_id=client.id,
+            created_after=datetime(2024, 1, 1, 0, 2),
+            created_before=datetime(2024, 1, 1, 0, 4),
+        )
+        combined = sqla_client_repository.list_source_data(
+            client_id=client.id, source_data_type="pdf", created_after=datetime(2024, 1, 1, 0, 1)
+        )
+
+    assert [sd.relative_path for sd in by_type.data] == ["reports/0.pdf", "reports/2.pdf"]
+    assert [sd.relative_path for sd in by_status.data] == ["raw/1.csv", "raw/3.csv"]
+    assert [sd.relative_path for sd in by_prefix.data] == ["raw/1.csv", "raw/3.csv"]
+    assert by_protocol.data == []
+    assert [sd.relative_path for sd in by_date.data] == ["reports/2.pdf", "raw/3.csv"]
+    assert [sd.relative_path for sd in combined.data] == ["reports/2.pdf"]
+
+
+def test_list_source_data_relative_path_prefix_is_escaped(
+    app_initialization_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake_client_with_source_data: SQLAClient,
+) -> None:
+    sqla_client_repository = app_initialization_container.sqla_client_repository()
+    client = _date_source_data(fake_client_with_source_data)
+
+    with db_session() as session:
+        client.save(session=session, flush=True)
+        session.commit()
+
+        dto = sqla_client_repository.list_source_data(client_id=client.id, relative_path_prefix="r%")
+
+    assert dto.status == True
+    assert dto.data == []
+
+
+def test_error_list_source_data_invalid_cursor(
+    app_initialization_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake_client_with_source_data: SQLAClient,
+) -> None:
+    sqla_client_repository = app_initialization_container.sqla_client_repository()
+
+    with db_session() as session:
+        fake_client_with_source_data.save(session=session, flush=True)
+        session.commit()
+
+        dto = sqla_client_repository.list_source_data(client_id=fake_client_with_source_data.id, after="not-a-cursor")
+
+    assert dto.status == False
+    assert dto.errorType == "InvalidCursor"
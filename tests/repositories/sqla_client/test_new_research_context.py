@@ -3,9 +3,10 @@ from typing import List
 import uuid
 from faker import Faker
 from lib.core.dto.client_repository_dto import NewResearchContextDTO
+from lib.core.sdk.metrics import start_request_metrics, stop_request_metrics
 from lib.infrastructure.config.containers import ApplicationContainer
 from lib.infrastructure.repository.sqla.database import TDatabaseFactory
-from lib.infrastructure.repository.sqla.models import SQLALLM, SQLAResearchContext, SQLAClient
+from lib.infrastructure.repository.sqla.models import SQLALLM, SQLAResearchContext, SQLAClient, SQLASourceData
 
 
 def test_create_new_research_context(
@@ -79,6 +80,81 @@ def test_create_new_research_context(
             assert source_data.id in source_data_id_list
 
 
+def test_new_research_context_round_trips_do_not_grow_with_source_data(
+    app_initialization_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_llm: SQLALLM,
+    fake_client_with_source_data: SQLAClient,
+    fake_source_data_list: List[SQLASourceData],
+) -> None:
+    sqla_client_repository = app_initialization_container.sqla_client_repository()
+
+    client = fake_client_with_source_data
+    client.source_data.extend(fake_source_data_list)
+
+    with db_session() as session:
+        session.add(fake_llm)
+        session.add(client)
+        session.commit()
+        source_data_id_list = [source_data.id for source_data in client.source_data]
+        client_sub, llm_name = client.sub, fake_llm.llm_name
+
+    metrics, token = start_request_metrics()
+    try:
+        new_research_context_DTO = sqla_client_repository.new_research_context(
+            research_context_title=fake.name(),
+            research_context_description=fake.text(),
+            client_sub=client_sub,
+            llm_name=llm_name,
+            source_data_ids=source_data_id_list,
+            external_id=str(uuid.uuid4()),
+        )
+    finally:
+        stop_request_metrics(token)
+
+    assert new_research_context_DTO.status == True
+    assert new_research_context_DTO.research_context is not None
+    # LLM, client, source data check, research context, associations, commit: not one statement per source data
+    assert metrics.db_round_trips < len(source_data_id_list)
+
+    with db_session() as session:
+        queried = session.get(SQLAResearchContext, new_research_context_DTO.research_context.id)
+        assert queried is not None
+        assert sorted(sd.id for sd in queried.source_data) == sorted(source_data_id_list)
+
+
+def test_error_new_research_context_unknown_source_data(
+    app_initialization_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_llm: SQLALLM,
+    fake_client_with_source_data: SQLAClient,
+) -> None:
+    sqla_client_repository = app_initialization_container.sqla_client_repository()
+
+    with db_session() as session:
+        session.add(fake_llm)
+        session.add(fake_client_with_source_data)
+        session.commit()
+        source_data_id_list = [source_data.id for source_data in fake_client_with_source_data.source_data]
+        client_sub, llm_name = fake_client_with_source_data.sub, fake_llm.llm_name
+
+    new_research_context_DTO = sqla_client_repository.new_research_context(
+        research_context_title=fake.name(),
+        research_context_description=fake.text(),
+        client_sub=client_sub,
+        llm_name=llm_name,
+        source_data_ids=source_data_id_list + [999999999],
+        external_id=str(uuid.uuid4()),
+    )
+
+    assert new_research_context_DTO.status == False
+    assert new_research_context_DTO.errorType == "SourceDataDatabaseErrors"
+    assert new_research_context_DTO.errorMessage is not None
+    assert "ID 999999999" in new_research_context_DTO.errorMessage
+
+
 def test_error_new_research_context_research_context_title_is_None(
     app_initialization_container: ApplicationContainer, db_session: TDatabaseFactory
 ) -> None:
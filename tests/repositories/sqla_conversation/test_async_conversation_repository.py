@@ -0,0 +1,161 @@
+import asyncio
+from typing import List, Tuple
+from faker import Faker
+from lib.core.dto.conversation_repository_dto import (
+    ListConversationMessagesDTO,
+    NewMessageDTO,
+    StreamConversationMessagesDTO,
+)
+from lib.core.entity.models import BaseMessageContent, MessageBase, MessageSenderTypeEnum
+from lib.infrastructure.config.containers import ApplicationContainer
+from lib.infrastructure.repository.sqla.database import TDatabaseFactory
+
+from lib.infrastructure.repository.sqla.models import (
+    SQLALLM,
+    SQLAAgentMessage,
+    SQLAConversation,
+    SQLAClient,
+    SQLAResearchContext,
+    SQLAUserMessage,
+)
+
+
+def _save_conversation(
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client: SQLAClient,
+    fake_research_context: SQLAResearchContext,
+    fake_conversation: SQLAConversation,
+    messages: Tuple[SQLAUserMessage, SQLAAgentMessage] | None = None,
+) -> int:
+    if messages is not None:
+        fake_conversation.messages.extend(messages)
+    fake_research_context.conversations = [fake_conversation]
+    fake_research_context.llm = SQLALLM(llm_name=fake.name())
+    fake_client.research_contexts = [fake_research_context]
+
+    with db_session() as session:
+        fake_client.save(session=session, flush=True)
+        session.commit()
+        return fake_conversation.id
+
+
+def test_async_list_conversation_messages_matches_sync(
+    app_initialization_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client: SQLAClient,
+    fake_research_context: SQLAResearchContext,
+    fake_conversation: SQLAConversation,
+    fake_message_pair: Tuple[SQLAUserMessage, SQLAAgentMessage],
+) -> None:
+    conversation_repository = app_initialization_container.sqla_conversation_repository()
+    async_conversation_repository = app_initialization_container.async_sqla_conversation_repository()
+
+    conversation_id = _save_conversation(
+        db_session, fake, fake_client, fake_research_context, fake_conversation, fake_message_pair
+    )
+
+    sync_dto: ListConversationMessagesDTO[MessageBase] = conversation_repository.list_conversation_messages(
+        conversation_id=conversation_id
+    )
+    async_dto: ListConversationMessagesDTO[MessageBase] = asyncio.run(
+        async_conversation_repository.list_conversation_messages(conversation_id=conversation_id)
+    )
+
+    assert async_dto.status == True
+    assert async_dto.data is not None
+    assert sync_dto.data is not None
+    assert [message.id for message in async_dto.data] == [message.id for message in sync_dto.data]
+    assert [message.sender for message in async_dto.data] == [message.sender for message in sync_dto.data]
+    assert [message.message_contents for message in async_dto.data] == [
+        message.message_contents for message in sync_dto.data
+    ]
+
+
+def test_async_stream_conversation_messages(
+    app_initialization_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client: SQLAClient,
+    fake_research_context: SQLAResearchContext,
+    fake_conversation: SQLAConversation,
+    fake_message_pair: Tuple[SQLAUserMessage, SQLAAgentMessage],
+) -> None:
+    async_conversation_repository = app_initialization_container.async_sqla_conversation_repository()
+
+    conversation_id = _save_conversation(
+        db_session, fake, fake_client, fake_research_context, fake_conversation, fake_message_pair
+    )
+
+    async def list_and_stream() -> Tuple[ListConversationMessagesDTO[MessageBase], List[MessageBase]]:
+        full_dto: ListConversationMessagesDTO[
+            MessageBase
+        ] = await async_conversation_repository.list_conversation_messages(conversation_id=conversation_id)
+        stream_dto: StreamConversationMessagesDTO = await async_conversation_repository.stream_conversation_messages(
+            conversation_id=conversation_id, batch_size=4
+        )
+        assert stream_dto.status == True
+        assert stream_dto.data is not None
+        return full_dto, [message async for message in stream_dto.data]  # type: ignore
+
+    full_dto, streamed = asyncio.run(list_and_stream())
+
+    assert full_dto.data is not None
+    assert [message.id for message in streamed] == [message.id for message in full_dto.data]
+
+
+def test_async_new_message(
+    app_initialization_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client: SQLAClient,
+    fake_research_context: SQLAResearchContext,
+    fake_conversation: SQLAConversation,
+) -> None:
+    async_conversation_repository = app_initialization_container.async_sqla_conversation_repository()
+
+    conversation_id = _save_conversation(db_session, fake, fake_client, fake_research_context, fake_conversation)
+    content = fake.text()
+
+    async def send_messages() -> List[NewMessageDTO]:
+        return list(
+            await asyncio.gather(
+                *(
+                    async_conversation_repository.new_message(
+                        conversation_id=conversation_id,
+                        message_contents=[BaseMessageContent(content=content, content_type="text")],
+                        sender_type=MessageSenderTypeEnum.USER,
+                    )
+                    for _ in range(5)
+                )
+            )
+        )
+
+    dtos = asyncio.run(send_messages())
+
+    assert all(dto.status == True for dto in dtos)
+    thread_ids = [dto.data.thread_id for dto in dtos if dto.data is not None]
+    assert sorted(thread_ids) == [1, 2, 3, 4, 5]
+
+    with db_session() as session:
+        for dto in dtos:
+            assert dto.data is not None
+            sqla_message = session.get(SQLAUserMessage, dto.data.id)
+            assert sqla_message is not None
+            assert sqla_message.conversation_id == conversation_id
+            assert sqla_message.message_contents[0].content == content
+
+
+def test_error_async_list_conversation_messages_conversation_not_found(
+    app_initialization_container: ApplicationContainer, db_session: TDatabaseFactory
+) -> None:
+    async_conversation_repository = app_initialization_container.async_sqla_conversation_repository()
+
+    dto: ListConversationMessagesDTO[MessageBase] = asyncio.run(
+        async_conversation_repository.list_conversation_messages(conversation_id=-1)
+    )
+
+    assert dto.status == False
+    assert dto.errorCode == -1
+    assert dto.errorType == "ConversationNotFound"
@@ -1,11 +1,13 @@
 import random
-from typing import Tuple
+from typing import Any, Iterable, List, Tuple
 import uuid
 from faker import Faker
+from sqlalchemy import event
 from lib.core.dto.conversation_repository_dto import (
     ListConversationMessagesDTO,
+    StreamConversationMessagesDTO,
 )
-from lib.core.entity.models import MessageBase
+from lib.core.entity.models import MessageBase, MessageContentTypeEnum
 from lib.infrastructure.config.containers import ApplicationContainer
 from lib.infrastructure.repository.sqla.database import TDatabaseFactory
 
@@ -14,6 +16,8 @@ from lib.infrastructure.repository.sqla.models import (
     SQLAAgentMessage,
     SQLAConversation,
     SQLAClient,
+    SQLAMessageContent,
+    SQLAResearchContext,
     SQLAUserMessage,
 )
 
@@ -132,3 +136,192 @@ def test_error_list_conversation_messages_conversation_id_not_found(
     assert list_conv_msgs_DTO.errorMessage == f"Conversation with ID {irrealistic_ID} not found in the database."
     assert list_conv_msgs_DTO.errorName == "Conversation not found"
     assert list_conv_msgs_DTO.errorType == "ConversationNotFound"
+
+
+def test_list_conversation_messages_keyset_pagination(
+    app_initialization_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client: SQLAClient,
+    fake_research_context: SQLAResearchContext,
+    fake_conversation: SQLAConversation,
+    fake_message_pair: Tuple[SQLAUserMessage, SQLAAgentMessage],
+) -> None:
+    conversation_repository = app_initialization_container.sqla_conversation_repository()
+
+    sqla_conversation = fake_conversation
+    sqla_conversation.messages.extend(fake_message_pair)
+    sqla_research_context = fake_research_context
+    sqla_research_context.conversations = [sqla_conversation]
+    sqla_research_context.llm = SQLALLM(llm_name=fake.name())
+    fake_client.research_contexts = [sqla_research_context]
+
+    with db_session() as session:
+        fake_client.save(session=session, flush=True)
+        session.commit()
+        conversation_id = sqla_conversation.id
+
+    full_dto: ListConversationMessagesDTO[MessageBase] = conversation_repository.list_conversation_messages(
+        conversation_id=conversation_id
+    )
+    assert full_dto.status == True
+    assert full_dto.data is not None
+    assert full_dto.next_cursor is None
+    assert full_dto.previous_cursor is None
+    all_ids = [message.id for message in full_dto.data]
+    assert len(all_ids) == 6
+
+    paged_ids = []
+    after = None
+    while True:
+        page: ListConversationMessagesDTO[MessageBase] = conversation_repository.list_conversation_messages(
+            conversation_id=conversation_id, limit=4, after=after
+        )
+        assert page.status == True
+        assert page.data is not None
+        assert len(page.data) <= 4
+        paged_ids.extend([message.id for message in page.data])
+        if page.next_cursor is None:
+            break
+        after = page.next_cursor
+
+    assert paged_ids == all_ids
+    assert page.previous_cursor is not None
+
+    backwards: ListConversationMessagesDTO[MessageBase] = conversation_repository.list_conversation_messages(
+        conversation_id=conversation_id, limit=3, before=page.previous_cursor
+    )
+    assert backwards.status == True
+    assert backwards.data is not None
+    assert [message.id for message in backwards.data] == all_ids[1:4]
+    assert backwards.next_cursor is not None
+    assert backwards.previous_cursor is not None
+
+
+def test_stream_conversation_messages(
+    app_initialization_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client: SQLAClient,
+    fake_research_context: SQLAResearchContext,
+    fake_conversation: SQLAConversation,
+    fake_message_pair: Tuple[SQLAUserMessage, SQLAAgentMessage],
+) -> None:
+    conversation_repository = app_initialization_container.sqla_conversation_repository()
+
+    sqla_conversation = fake_conversation
+    sqla_conversation.messages.extend(fake_message_pair)
+    sqla_research_context = fake_research_context
+    sqla_research_context.conversations = [sqla_conversation]
+    sqla_research_context.llm = SQLALLM(llm_name=fake.name())
+    fake_client.research_contexts = [sqla_research_context]
+
+    with db_session() as session:
+        fake_client.save(session=session, flush=True)
+        session.commit()
+        conversation_id = sqla_conversation.id
+
+    full_dto: ListConversationMessagesDTO[MessageBase] = conversation_repository.list_conversation_messages(
+        conversation_id=conversation_id
+    )
+    assert full_dto.data is not None
+
+    stream_dto: StreamConversationMessagesDTO = conversation_repository.stream_conversation_messages(
+        conversation_id=conversation_id, batch_size=4
+    )
+    assert stream_dto.status == True
+    assert isinstance(stream_dto.data, Iterable)
+
+    streamed = list(stream_dto.data)
+    assert [message.id for message in streamed] == [message.id for message in full_dto.data]
+    assert [message.sender for message in streamed] == [message.sender for message in full_dto.data]
+
+
+def test_error_stream_conversation_messages_invalid_cursor(
+    app_initialization_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client: SQLAClient,
+    fake_research_context: SQLAResearchContext,
+    fake_conversation: SQLAConversation,
+) -> None:
+    conversation_repository = app_initialization_container.sqla_conversation_repository()
+
+    fake_research_context.conversations = [fake_conversation]
+    fake_research_context.llm = SQLALLM(llm_name=fake.name())
+    fake_client.research_contexts = [fake_research_context]
+
+    with db_session() as session:
+        fake_client.save(session=session, flush=True)
+        session.commit()
+        conversation_id = fake_conversation.id
+
+    stream_dto = conversation_repository.stream_conversation_messages(
+        conversation_id=conversation_id, after="not-a-cursor"
+    )
+
+    assert stream_dto.status == False
+    assert stream_dto.errorCode == -1
+    assert stream_dto.errorName == "Invalid cursor"
+    assert stream_dto.errorType == "InvalidCursor"
+
+
+def test_list_conversation_messages_query_count_does_not_grow_with_messages(
+    app_initialization_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client: SQLAClient,
+    fake_research_context: SQLAResearchContext,
+    fake_conversation: SQLAConversation,
+) -> None:
+    conversation_repository = app_initialization_container.sqla_conversation_repository()
+    engine = app_initialization_container.db().engine
+
+    fake_research_context.conversations = [fake_conversation]
+    fake_research_context.llm = SQLALLM(llm_name=fake.name())
+    fake_client.research_contexts = [fake_research_context]
+
+    with db_session() as session:
+        fake_client.save(session=session, flush=True)
+        session.commit()
+        conversation_id = fake_conversation.id
+
+    statements: List[str] = []
+
+    def count_statement(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    def list_messages_query_count() -> Tuple[int, int]:
+        statements.clear()
+        event.listen(engine, "before_cursor_execute", count_statement)
+        try:
+            dto: ListConversationMessagesDTO[MessageBase] = conversation_repository.list_conversation_messages(
+                conversation_id=conversation_id
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+        assert dto.status == True
+        assert dto.data is not None
+        return len(dto.data), len(statements)
+
+    few_messages, few_messages_queries = list_messages_query_count()
+
+    with db_session() as session:
+        sqla_conversation = session.get(SQLAConversation, conversation_id)
+        assert sqla_conversation is not None
+        for i in range(20):
+            message_cls = SQLAUserMessage if i % 2 == 0 else SQLAAgentMessage
+            sqla_conversation.messages.append(
+                message_cls(
+                    thread_id=i,
+                    message_contents=[
+                        SQLAMessageContent(content=fake.text(max_nb_chars=70), content_type=MessageContentTypeEnum.TEXT)
+                    ],
+                )
+            )
+        session.commit()
+
+    many_messages, many_messages_queries = list_messages_query_count()
+
+    assert many_messages == few_messages + 20
+    assert many_messages_queries == few_messages_queries
@@ -1,10 +1,11 @@
 import random
-from typing import List
+from typing import Dict, List
 import uuid
 from faker import Faker
 from lib.core.dto.conversation_repository_dto import (
     ListConversationSourcesDTO,
 )
+from lib.core.sdk.metrics import start_request_metrics, stop_request_metrics
 from lib.infrastructure.config.containers import ApplicationContainer
 from lib.infrastructure.repository.sqla.database import TDatabaseFactory
 
@@ -13,6 +14,7 @@ from lib.infrastructure.repository.sqla.models import (
     SQLACitation,
     SQLAConversation,
     SQLAClient,
+    SQLAAgentMessage,
 )
 
 
@@ -155,3 +157,95 @@ def test_error_list_conversation_sources_research_context_no_source_data(
     assert dto.errorMessage == f"Message Responses with ID {agent_messages_ids} have no source data."
     assert dto.errorName == "Message Responses have no source data"
     assert dto.errorType == "AgentMessagesHaveNoSourceData"
+
+
+def _cite_source_data_round_robin(
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    client_with_conv: SQLAClient,
+    client_with_sd: SQLAClient,
+) -> tuple[int, Dict[int, int]]:
+    """
+    Makes each agent message of a conversation cite the source data of a client in turn.
+
+    @return: The ID of the conversation, and the expected number of citations per source data ID.
+    """
+    SQLALLM(llm_name=fake.name(), research_contexts=client_with_conv.research_contexts)
+    research_context = client_with_conv.research_contexts[0]
+    research_context.source_data = client_with_sd.source_data
+    conversation = research_context.conversations[0]
+    conversation.title = f"{conversation.title}-{uuid.uuid4()}"
+
+    agent_messages = [message for message in conversation.messages if isinstance(message, SQLAAgentMessage)]
+    cited = []
+    for i, message in enumerate(agent_messages):
+        source_datum = client_with_sd.source_data[i % len(client_with_sd.source_data)]
+        citation = SQLACitation(citation_metadata=fake.text(max_nb_chars=70))
+        source_datum.citations.append(citation)
+        message.citations.append(citation)
+        cited.append(source_datum)
+
+    with db_session() as session:
+        research_context.save(session=session, flush=True)
+        session.commit()
+        expected_counts: Dict[int, int] = {}
+        for source_datum in cited:
+            expected_counts[source_datum.id] = expected_counts.get(source_datum.id, 0) + 1
+        return conversation.id, expected_counts
+
+
+def test_list_conversation_sources_with_citation_counts(
+    app_initialization_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client_with_conversation: SQLAClient,
+    fake_client_with_source_data: SQLAClient,
+) -> None:
+    conversation_repository = app_initialization_container.sqla_conversation_repository()
+    conv_id, expected_counts = _cite_source_data_round_robin(
+        db_session, fake, fake_client_with_conversation, fake_client_with_source_data
+    )
+
+    with db_session() as session:
+        metrics, token = start_request_metrics()
+        try:
+            dto = conversation_repository.list_conversation_sources(conversation_id=conv_id, with_citation_counts=True)
+        finally:
+            stop_request_metrics(token)
+
+    assert dto.status == True
+    assert dto.data is not None
+    assert sorted(source.id for source in dto.data) == sorted(expected_counts)
+    assert dto.citation_counts == expected_counts
+    assert dto.next_cursor is None
+    # The conversation, its uncited agent messages, and its sources: not one query per message
+    assert metrics.db_round_trips <= 3
+
+
+def test_list_conversation_sources_paginates(
+    app_initialization_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client_with_conversation: SQLAClient,
+    fake_client_with_source_data: SQLAClient,
+) -> None:
+    conversation_repository = app_initialization_container.sqla_conversation_repository()
+    conv_id, expected_counts = _cite_source_data_round_robin(
+        db_session, fake, fake_client_with_conversation, fake_client_with_source_data
+    )
+
+    listed_ids: List[int] = []
+    cursor: str | None = None
+    with db_session() as session:
+        while True:
+            dto = conversation_repository.list_conversation_sources(conversation_id=conv_id, limit=1, after=cursor)
+            assert dto.status == True
+            assert dto.data is not None
+            assert dto.citation_counts is None
+            listed_ids.extend(source.id for source in dto.data)
+            cursor = dto.next_cursor
+            if cursor is None:
+                break
+
+    assert len(listed_ids) == len(set(listed_ids))
+    assert sorted(listed_ids) == sorted(expected_counts)
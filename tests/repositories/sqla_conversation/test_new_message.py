@@ -1,5 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import random
+from typing import List
 import uuid
 from faker import Faker
 from lib.core.dto.conversation_repository_dto import (
@@ -7,7 +9,7 @@ from lib.core.dto.conversation_repository_dto import (
     NewMessageDTO,
     NewMessageContentDTO,
 )
-from lib.core.entity.models import BaseMessageContent, MessageSenderTypeEnum
+from lib.core.entity.models import BaseMessageContent, MessageContentTypeEnum, MessageSenderTypeEnum
 from lib.infrastructure.config.containers import ApplicationContainer
 from lib.infrastructure.repository.sqla.database import TDatabaseFactory
 
@@ -153,3 +155,148 @@ def test_error_new_message_no_sqla_conversation(
     assert list_conv_srcs_DTO.errorMessage == f"Conversation with ID {irrealistic_ID} not found in the database."
     assert list_conv_srcs_DTO.errorName == "Conversation not found"
     assert list_conv_srcs_DTO.errorType == "ConversationNotFound"
+
+
+def test_new_message_allocates_thread_ids_per_conversation(
+    app_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client_with_conversation: SQLAClient,
+) -> None:
+    conversation_repository = app_container.sqla_conversation_repository()
+
+    sqla_client_with_conv = fake_client_with_conversation
+    SQLALLM(
+        llm_name=fake.name(),
+        research_contexts=sqla_client_with_conv.research_contexts,
+    )
+    research_context = sqla_client_with_conv.research_contexts[0]
+    first_conversation, second_conversation = research_context.conversations[:2]
+
+    with db_session() as session:
+        research_context.save(session=session, flush=True)
+        session.commit()
+        first_conversation_id = first_conversation.id
+        second_conversation_id = second_conversation.id
+        first_start = first_conversation.last_thread_id
+        second_start = second_conversation.last_thread_id
+
+    def new_message(conversation_id: int, thread_id: int | None = None) -> int:
+        dto: NewMessageDTO = conversation_repository.new_message(
+            conversation_id=conversation_id,
+            message_contents=[fake.text()],
+            sender_type=MessageSenderTypeEnum.USER,
+            thread_id=thread_id,
+        )
+        assert dto.status == True
+        assert dto.data is not None
+        return dto.data.thread_id
+
+    assert new_message(first_conversation_id) == first_start + 1
+    assert new_message(first_conversation_id) == first_start + 2
+    assert new_message(second_conversation_id) == second_start + 1
+    assert new_message(first_conversation_id, thread_id=first_start + 1) == first_start + 1
+    assert new_message(first_conversation_id) == first_start + 3
+
+
+def test_new_message_concurrent_writers_get_distinct_thread_ids(
+    app_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client_with_conversation: SQLAClient,
+) -> None:
+    sqla_client_with_conv = fake_client_with_conversation
+    SQLALLM(
+        llm_name=fake.name(),
+        research_contexts=sqla_client_with_conv.research_contexts,
+    )
+    research_context = sqla_client_with_conv.research_contexts[0]
+    conversation = research_context.conversations[0]
+
+    with db_session() as session:
+        research_context.save(session=session, flush=True)
+        session.commit()
+        conversation_id = conversation.id
+
+    def post_messages(_: int) -> List[int]:
+        # Each writer gets its own repository, hence its own session and transaction
+        conversation_repository = app_container.sqla_conversation_repository()
+        thread_ids = []
+        for _ in range(10):
+            dto: NewMessageDTO = conversation_repository.new_message(
+                conversation_id=conversation_id,
+                message_contents=[
+                    BaseMessageContent(content="concurrent message", content_type=MessageContentTypeEnum.TEXT)
+                ],
+                sender_type=MessageSenderTypeEnum.AGENT,
+            )
+            assert dto.status == True
+            assert dto.data is not None
+            thread_ids.append(dto.data.thread_id)
+        return thread_ids
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        thread_ids = [thread_id for result in executor.map(post_messages, range(4)) for thread_id in result]
+
+    assert len(thread_ids) == 40
+    assert len(set(thread_ids)) == 40
+
+
+def test_new_message_given_thread_id_is_never_allocated_again(
+    app_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client_with_conversation: SQLAClient,
+) -> None:
+    conversation_repository = app_container.sqla_conversation_repository()
+
+    sqla_client_with_conv = fake_client_with_conversation
+    SQLALLM(
+        llm_name=fake.name(),
+        research_contexts=sqla_client_with_conv.research_contexts,
+    )
+    research_context = sqla_client_with_conv.research_contexts[0]
+    conversation = research_context.conversations[0]
+
+    with db_session() as session:
+        research_context.save(session=session, flush=True)
+        session.commit()
+        conversation_id = conversation.id
+        last_thread_id = conversation.last_thread_id
+
+    message_contents = [BaseMessageContent(content="a message", content_type=MessageContentTypeEnum.TEXT)]
+
+    # A thread ID above the counter of the conversation, e.g. created by another client
+    given_thread_id = last_thread_id + 5
+    dto: NewMessageDTO = conversation_repository.new_message(
+        conversation_id=conversation_id,
+        message_contents=message_contents,
+        sender_type=MessageSenderTypeEnum.USER,
+        thread_id=given_thread_id,
+    )
+    assert dto.status == True
+    assert dto.data is not None
+    assert dto.data.thread_id == given_thread_id
+
+    # A thread ID below the counter leaves it as it is
+    dto = conversation_repository.new_message(
+        conversation_id=conversation_id,
+        message_contents=message_contents,
+        sender_type=MessageSenderTypeEnum.AGENT,
+        thread_id=last_thread_id,
+    )
+    assert dto.status == True
+
+    dto = conversation_repository.new_message(
+        conversation_id=conversation_id,
+        message_contents=message_contents,
+        sender_type=MessageSenderTypeEnum.USER,
+    )
+    assert dto.status == True
+    assert dto.data is not None
+    assert dto.data.thread_id == given_thread_id + 1
+
+    with db_session() as session:
+        sqla_conversation = session.get(SQLAConversation, conversation_id)
+        assert sqla_conversation is not None
+        assert sqla_conversation.last_thread_id == given_thread_id + 1
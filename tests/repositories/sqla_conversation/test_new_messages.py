@@ -0,0 +1,301 @@
+from typing import List, Tuple
+from faker import Faker
+from lib.core.dto.conversation_repository_dto import NewMessagesDTO
+from lib.core.entity.models import (
+    BaseCitation,
+    BaseMessage,
+    BaseMessageContent,
+    MessageContentTypeEnum,
+    MessageSenderTypeEnum,
+)
+from lib.infrastructure.config.containers import ApplicationContainer
+from lib.infrastructure.repository.sqla.database import TDatabaseFactory
+from lib.infrastructure.repository.sqla.models import (
+    SQLALLM,
+    SQLAAgentMessage,
+    SQLACitation,
+    SQLAClient,
+    SQLAMessageBase,
+    SQLASourceData,
+    SQLAUserMessage,
+)
+
+
+def _save_conversation(
+    db_session: TDatabaseFactory, fake: Faker, client: SQLAClient, source_data: List[SQLASourceData]
+) -> Tuple[int, int, int]:
+    SQLALLM(
+        llm_name=fake.name(),
+        research_contexts=client.research_contexts,
+    )
+    client.source_data.extend(source_data)
+    research_context = client.research_contexts[0]
+    research_context.source_data = source_data
+    conversation = research_context.conversations[0]
+
+    with db_session() as session:
+        client.save(session=session, flush=True)
+        session.commit()
+        return conversation.id, conversation.last_thread_id, research_context.source_data[0].id
+
+
+def test_new_messages_inserts_batch_in_order(
+    app_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client_with_conversation: SQLAClient,
+    fake_source_data_list: List[SQLASourceData],
+) -> None:
+    conversation_repository = app_container.sqla_conversation_repository()
+    conversation_id, last_thread_id, source_data_id = _save_conversation(
+        db_session, fake, fake_client_with_conversation, fake_source_data_list
+    )
+
+    messages = [
+        BaseMessage(
+            sender_type=MessageSenderTypeEnum.USER,
+            message_contents=[BaseMessageContent(content="question", content_type=MessageContentTypeEnum.TEXT)],
+        ),
+        BaseMessage(
+            sender_type=MessageSenderTypeEnum.AGENT,
+            message_contents=[
+                BaseMessageContent(content="answer", content_type=MessageContentTypeEnum.TEXT),
+                BaseMessageContent(content="more answer", content_type=MessageContentTypeEnum.TEXT),
+            ],
+            thread_id=last_thread_id + 1,
+            citations=[BaseCitation(source_data_id=source_data_id, citation_metadata="page 1")],
+        ),
+        BaseMessage(
+            sender_type=MessageSenderTypeEnum.USER,
+            message_contents=[BaseMessageContent(content="follow-up", content_type=MessageContentTypeEnum.TEXT)],
+        ),
+    ]
+
+    dto: NewMessagesDTO = conversation_repository.new_messages(conversation_id=conversation_id, messages=messages)
+
+    assert dto.status == True
+    assert dto.message_ids is not None
+    assert len(dto.message_ids) == 3
+    assert dto.message_ids == sorted(dto.message_ids)
+
+    with db_session() as session:
+        sqla_messages: List[SQLAMessageBase] = []
+        for message_id in dto.message_ids:
+            sqla_message = session.get(SQLAMessageBase, message_id)
+            assert sqla_message is not None
+            sqla_messages.append(sqla_message)
+
+        assert isinstance(sqla_messages[0], SQLAUserMessage)
+        assert isinstance(sqla_messages[1], SQLAAgentMessage)
+        assert isinstance(sqla_messages[2], SQLAUserMessage)
+        assert [message.thread_id for message in sqla_messages] == [
+            last_thread_id + 1,
+            last_thread_id + 1,
+            last_thread_id + 2,
+        ]
+        assert [piece.content for piece in sqla_messages[1].message_contents] == ["answer", "more answer"]
+
+        citations = session.query(SQLACitation).filter_by(agent_message_id=dto.message_ids[1]).all()
+        assert [(citation.source_data_id, citation.citation_metadata) for citation in citations] == [
+            (source_data_id, "page 1")
+        ]
+
+    # The counter of the conversation skips the thread IDs allocated by the batch
+    dto = conversation_repository.new_messages(conversation_id=conversation_id, messages=messages[:1])
+    assert dto.status == True
+    with db_session() as session:
+        assert session.get(SQLAMessageBase, dto.message_ids[0]).thread_id == last_thread_id + 3  # type: ignore
+
+
+def test_new_messages_rolls_back_whole_batch_on_error(
+    app_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client_with_conversation: SQLAClient,
+    fake_source_data_list: List[SQLASourceData],
+) -> None:
+    conversation_repository = app_container.sqla_conversation_repository()
+    conversation_id, _, _ = _save_conversation(db_session, fake, fake_client_with_conversation, fake_source_data_list)
+
+    with db_session() as session:
+        messages_before = session.query(SQLAMessageBase).filter_by(conversation_id=conversation_id).count()
+
+    dto: NewMessagesDTO = conversation_repository.new_messages(
+        conversation_id=conversation_id,
+        messages=[
+            BaseMessage(
+                sender_type=MessageSenderTypeEnum.USER,
+                message_contents=[BaseMessageContent(content="question", content_type=MessageContentTypeEnum.TEXT)],
+            ),
+            BaseMessage(
+                sender_type=MessageSenderTypeEnum.AGENT,
+                # Postgres rejects NUL characters in text, so the insert of the content pieces fails mid-batch
+                message_contents=[BaseMessageContent(content="answer\x00", content_type=MessageContentTypeEnum.TEXT)],
+            ),
+        ],
+    )
+
+    assert dto.status == False
+    assert dto.errorType == "ErrorWhileAddingMessagesToConversation"
+
+    with db_session() as session:
+        assert session.query(SQLAMessageBase).filter_by(conversation_id=conversation_id).count() == messages_before
+
+    # The repository is still usable after the rollback
+    dto = conversation_repository.new_messages(
+        conversation_id=conversation_id,
+        messages=[
+            BaseMessage(
+                sender_type=MessageSenderTypeEnum.USER,
+                message_contents=[BaseMessageContent(content="question", content_type=MessageContentTypeEnum.TEXT)],
+            )
+        ],
+    )
+    assert dto.status == True
+
+
+def test_error_new_messages_citing_source_data_of_another_client(
+    app_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client_with_conversation: SQLAClient,
+    fake_source_data_list: List[SQLASourceData],
+    fake_client_with_source_data: SQLAClient,
+) -> None:
+    conversation_repository = app_container.sqla_conversation_repository()
+    conversation_id, _, source_data_id = _save_conversation(
+        db_session, fake, fake_client_with_conversation, fake_source_data_list
+    )
+
+    with db_session() as session:
+        fake_client_with_source_data.save(session=session, flush=True)
+        session.commit()
+        other_source_data_id = fake_client_with_source_data.source_data[0].id
+        messages_before = session.query(SQLAMessageBase).filter_by(conversation_id=conversation_id).count()
+
+    dto: NewMessagesDTO = conversation_repository.new_messages(
+        conversation_id=conversation_id,
+        messages=[
+            BaseMessage(
+                sender_type=MessageSenderTypeEnum.AGENT,
+                message_contents=[BaseMessageContent(content="answer", content_type=MessageContentTypeEnum.TEXT)],
+                citations=[
+                    BaseCitation(source_data_id=source_data_id, citation_metadata="own source"),
+                    BaseCitation(source_data_id=other_source_data_id, citation_metadata="someone else's source"),
+                ],
+            ),
+        ],
+    )
+
+    assert dto.status == False
+    assert dto.errorType == "UnauthorizedSourceData"
+    assert dto.errorMessage is not None
+    assert str(other_source_data_id) in dto.errorMessage
+
+    with db_session() as session:
+        assert session.query(SQLAMessageBase).filter_by(conversation_id=conversation_id).count() == messages_before
+        assert session.query(SQLACitation).filter_by(source_data_id=other_source_data_id).count() == 0
+
+
+def test_error_new_messages_citations_on_user_message(
+    app_container: ApplicationContainer, db_session: TDatabaseFactory
+) -> None:
+    conversation_repository = app_container.sqla_conversation_repository()
+
+    dto: NewMessagesDTO = conversation_repository.new_messages(
+        conversation_id=1,
+        messages=[
+            BaseMessage(
+                sender_type=MessageSenderTypeEnum.USER,
+                message_contents=[BaseMessageContent(content="abc", content_type=MessageContentTypeEnum.TEXT)],
+                citations=[BaseCitation(source_data_id=1, citation_metadata="abc")],
+            )
+        ],
+    )
+
+    assert dto.status == False
+    assert dto.errorCode == -1
+    assert dto.errorType == "InvalidCitations"
+
+
+def test_error_new_messages_no_sqla_conversation(
+    app_container: ApplicationContainer, db_session: TDatabaseFactory
+) -> None:
+    conversation_repository = app_container.sqla_conversation_repository()
+
+    irrealistic_ID = 99999999
+    dto: NewMessagesDTO = conversation_repository.new_messages(
+        conversation_id=irrealistic_ID,
+        messages=[
+            BaseMessage(
+                sender_type=MessageSenderTypeEnum.USER,
+                message_contents=[BaseMessageContent(content="abc", content_type=MessageContentTypeEnum.TEXT)],
+            )
+        ],
+    )
+
+    assert dto.status == False
+    assert dto.errorCode == -1
+    assert dto.errorMessage == f"Conversation with ID {irrealistic_ID} not found in the database."
+    assert dto.errorType == "ConversationNotFound"
+
+
+def test_new_messages_given_thread_ids_are_never_allocated_again(
+    app_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client_with_conversation: SQLAClient,
+    fake_source_data_list: List[SQLASourceData],
+) -> None:
+    conversation_repository = app_container.sqla_conversation_repository()
+    conversation_id, last_thread_id, _ = _save_conversation(
+        db_session, fake, fake_client_with_conversation, fake_source_data_list
+    )
+
+    # The given thread ID is above the counter, and beyond the threads the batch starts
+    given_thread_id = last_thread_id + 5
+    messages = [
+        BaseMessage(
+            sender_type=MessageSenderTypeEnum.USER,
+            message_contents=[BaseMessageContent(content="question", content_type=MessageContentTypeEnum.TEXT)],
+        ),
+        BaseMessage(
+            sender_type=MessageSenderTypeEnum.USER,
+            message_contents=[BaseMessageContent(content="elsewhere", content_type=MessageContentTypeEnum.TEXT)],
+            thread_id=given_thread_id,
+        ),
+        BaseMessage(
+            sender_type=MessageSenderTypeEnum.USER,
+            message_contents=[BaseMessageContent(content="another", content_type=MessageContentTypeEnum.TEXT)],
+        ),
+    ]
+
+    dto: NewMessagesDTO = conversation_repository.new_messages(conversation_id=conversation_id, messages=messages)
+
+    assert dto.status == True
+    assert dto.message_ids is not None
+
+    with db_session() as session:
+        thread_ids = []
+        for message_id in dto.message_ids:
+            sqla_message = session.get(SQLAMessageBase, message_id)
+            assert sqla_message is not None
+            thread_ids.append(sqla_message.thread_id)
+
+    assert thread_ids == [last_thread_id + 1, given_thread_id, last_thread_id + 2]
+
+    # A batch with only given thread IDs advances the counter too
+    dto = conversation_repository.new_messages(
+        conversation_id=conversation_id,
+        messages=[messages[1].model_copy(update={"thread_id": given_thread_id + 10})],
+    )
+    assert dto.status == True
+
+    dto = conversation_repository.new_messages(conversation_id=conversation_id, messages=messages[:1])
+    assert dto.status == True
+    assert dto.message_ids is not None
+
+    with db_session() as session:
+        sqla_message = session.get(SQLAMessageBase, dto.message_ids[0])
+        assert sqla_message is not None
+        assert sqla_message.thread_id == given_thread_id + 11
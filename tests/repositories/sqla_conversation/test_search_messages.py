@@ -0,0 +1,249 @@
+from typing import Dict, List
+import uuid
+from faker import Faker
+from sqlalchemy import select
+from lib.core.dto.conversation_repository_dto import SearchMessagesDTO
+from lib.core.entity.models import MessageSenderTypeEnum
+from lib.infrastructure.config.containers import ApplicationContainer
+from lib.infrastructure.repository.sqla.database import TDatabaseFactory
+from lib.infrastructure.repository.sqla.models import (
+    SQLALLM,
+    SQLAClient,
+    SQLAMessageBase,
+    SQLAMessageContent,
+    SQLAResearchContext,
+)
+
+
+def _search_term() -> str:
+    # Made of letters only, so that it is a single lexeme, and unique so that only the messages of this test match it
+    return "quasar" + "".join(chr(ord("a") + int(c, 16)) for c in uuid.uuid4().hex[:12])
+
+
+def _set_contents(message: SQLAMessageBase, content: str) -> None:
+    for message_content in message.message_contents:
+        message_content.content = content
+
+
+def test_search_messages(
+    app_initialization_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client_with_conversation: SQLAClient,
+    fake_client: SQLAClient,
+    fake_research_context: SQLAResearchContext,
+) -> None:
+    conversation_repository = app_initialization_container.sqla_conversation_repository()
+    term = _search_term()
+
+    client = fake_client_with_conversation
+    SQLALLM(llm_name=fake.name(), research_contexts=client.research_contexts)
+    research_context, other_research_context = client.research_contexts[0], client.research_contexts[1]
+    conversation, other_conversation = research_context.conversations[0], research_context.conversations[1]
+
+    best_match, match = conversation.messages[0], conversation.messages[1]
+    _set_contents(best_match, f"The {term} is bright. Another {term}, and a third {term} in the same sky.")
+    _set_contents(match, f"A faint {term} was seen once, among many other stars and galaxies far away.")
+    other_conversation_match = other_conversation.messages[0]
+    _set_contents(other_conversation_match, f"Nothing but a {term} and a comet.")
+    other_research_context_match = other_research_context.conversations[0].messages[0]
+    _set_contents(other_research_context_match, f"One {term} again, in another research context.")
+
+    # The messages of other clients are never found
+    other_client = fake_client
+    other_client.research_contexts = [fake_research_context]
+    SQLALLM(llm_name=fake.name(), research_contexts=other_client.research_contexts)
+    _set_contents(fake_research_context.conversations[0].messages[0], f"The {term} of another client.")
+
+    with db_session() as session:
+        client.save(session=session, flush=True)
+        other_client.save(session=session, flush=True)
+        session.commit()
+
+        client_id = client.id
+        research_context_id = research_context.id
+        conversation_id = conversation.id
+        best_match_id, match_id = best_match.id, match.id
+        other_conversation_match_id = other_conversation_match.id
+        other_research_context_match_id = other_research_context_match.id
+
+    dto: SearchMessagesDTO = conversation_repository.search_messages(client_id=client_id, query=term)
+
+    assert dto.status == True
+    assert dto.errorCode == None
+    assert dto.search_results is not None
+    assert dto.next_cursor is None
+    assert {result.message_id for result in dto.search_results} == {
+        best_match_id,
+        match_id,
+        other_conversation_match_id,
+        other_research_context_match_id,
+    }
+    assert dto.search_results[0].message_id == best_match_id
+    assert dto.search_results[0].conversation_id == conversation_id
+    assert dto.search_results[0].sender_type == MessageSenderTypeEnum.USER
+    assert [result.rank for result in dto.search_results] == sorted(
+        [result.rank for result in dto.search_results], reverse=True
+    )
+    for result in dto.search_results:
+        assert f"<b>{term}</b>" in result.snippet
+
+    dto = conversation_repository.search_messages(
+        client_id=client_id, query=term, research_context_id=research_context_id
+    )
+
+    assert dto.search_results is not None
+    assert {result.message_id for result in dto.search_results} == {
+        best_match_id,
+        match_id,
+        other_conversation_match_id,
+    }
+
+    dto = conversation_repository.search_messages(client_id=client_id, query=term, conversation_id=conversation_id)
+
+    assert dto.search_results is not None
+    assert [result.message_id for result in dto.search_results] == [best_match_id, match_id]
+
+    # Web search syntax: the messages with the excluded word are left out
+    dto = conversation_repository.search_messages(client_id=client_id, query=f"{term} -comet")
+
+    assert dto.search_results is not None
+    assert other_conversation_match_id not in {result.message_id for result in dto.search_results}
+    assert len(dto.search_results) == 3
+
+
+def test_search_messages_pagination(
+    app_initialization_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client_with_conversation: SQLAClient,
+) -> None:
+    conversation_repository = app_initialization_container.sqla_conversation_repository()
+    term = _search_term()
+
+    client = fake_client_with_conversation
+    SQLALLM(llm_name=fake.name(), research_contexts=client.research_contexts)
+    messages = [
+        message for conversation in client.research_contexts[0].conversations for message in conversation.messages
+    ]
+    # Some of the messages have the same rank, so that the cursor has to break ties
+    for i, message in enumerate(messages):
+        _set_contents(message, " ".join([term] * (i % 3 + 1)))
+
+    with db_session() as session:
+        client.save(session=session, flush=True)
+        session.commit()
+
+        client_id = client.id
+        message_ids = {message.id for message in messages}
+
+    expected: SearchMessagesDTO = conversation_repository.search_messages(
+        client_id=client_id, query=term, limit=len(messages)
+    )
+    assert expected.search_results is not None
+    assert expected.next_cursor is None
+
+    found: List[int] = []
+    after: str | None = None
+    pages = 0
+    while True:
+        dto: SearchMessagesDTO = conversation_repository.search_messages(
+            client_id=client_id, query=term, limit=2, after=after
+        )
+        assert dto.status == True
+        assert dto.search_results is not None
+        assert len(dto.search_results) <= 2
+        found.extend(result.message_id for result in dto.search_results)
+        pages += 1
+        if dto.next_cursor is None:
+            break
+        after = dto.next_cursor
+
+    assert found == [result.message_id for result in expected.search_results]
+    assert set(found) == message_ids
+    assert pages == (len(messages) + 1) // 2
+
+
+def test_search_messages_errors(
+    app_initialization_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client_with_conversation: SQLAClient,
+) -> None:
+    conversation_repository = app_initialization_container.sqla_conversation_repository()
+
+    client = fake_client_with_conversation
+    SQLALLM(llm_name=fake.name(), research_contexts=client.research_contexts)
+
+    with db_session() as session:
+        client.save(session=session, flush=True)
+        session.commit()
+
+        client_id = client.id
+
+    dto: SearchMessagesDTO = conversation_repository.search_messages(client_id=client_id, query="  ")
+
+    assert dto.status == False
+    assert dto.errorType == "SearchQueryNotProvided"
+
+    dto = conversation_repository.search_messages(client_id=client_id, query="quasar", after="not a cursor")
+
+    assert dto.status == False
+    assert dto.errorType == "InvalidCursor"
+
+    dto = conversation_repository.search_messages(client_id=-1, query="quasar")
+
+    assert dto.status == False
+    assert dto.errorType == "ClientNotFound"
+
+
+def test_message_content_lexemes_follow_the_content(
+    app_initialization_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client_with_conversation: SQLAClient,
+) -> None:
+    conversation_repository = app_initialization_container.sqla_conversation_repository()
+    term, new_term = _search_term(), _search_term()
+
+    client = fake_client_with_conversation
+    SQLALLM(llm_name=fake.name(), research_contexts=client.research_contexts)
+    message = client.research_contexts[0].conversations[0].messages[0]
+    _set_contents(message, f"A message about a {term}.")
+
+    with db_session() as session:
+        client.save(session=session, flush=True)
+        session.commit()
+
+        client_id = client.id
+        message_id = message.id
+        content_ids = [message_content.id for message_content in message.message_contents]
+
+        tsvs: Dict[int, str | None] = {
+            content_id: tsv
+            for content_id, tsv in session.execute(
+                select(SQLAMessageContent.id, SQLAMessageContent.content_tsv).where(
+                    SQLAMessageContent.id.in_(content_ids)
+                )
+            )
+        }
+        assert len(tsvs) != 0
+        assert all(tsv is not None for tsv in tsvs.values())
+
+    dto: SearchMessagesDTO = conversation_repository.search_messages(client_id=client_id, query=term)
+    assert dto.search_results is not None
+    assert [result.message_id for result in dto.search_results] == [message_id]
+
+    with db_session() as session:
+        for message_content in session.scalars(
+            select(SQLAMessageContent).where(SQLAMessageContent.id.in_(content_ids))
+        ):
+            message_content.content = f"A message about a {new_term}."
+        session.commit()
+
+    dto = conversation_repository.search_messages(client_id=client_id, query=term)
+    assert dto.search_results == []
+
+    dto = conversation_repository.search_messages(client_id=client_id, query=new_term)
+    assert dto.search_results is not None
+    assert [result.message_id for result in dto.search_results] == [message_id]
@@ -111,3 +111,37 @@ def test_error_list_source_data_research_context_not_found_by_id(
     assert dto.errorName == "Research Context not found"
     assert dto.errorType == "ResearchContextNotFound"
     assert dto.data == None
+
+
+def test_source_data_version_of_research_context(
+    app_initialization_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client_with_conversation: SQLAClient,
+    fake_client_with_source_data: SQLAClient,
+) -> None:
+    research_context_repository = app_initialization_container.sqla_research_context_repository()
+
+    research_context = random.choice(fake_client_with_conversation.research_contexts)
+    llm = SQLALLM(
+        llm_name=fake.name(),
+        research_contexts=fake_client_with_conversation.research_contexts,
+    )
+
+    with db_session() as session:
+        session.add(llm)
+        session.add(fake_client_with_source_data)
+        session.commit()
+
+        empty_version = research_context_repository.get_source_data_version(research_context.id)
+        assert empty_version.status == True
+        assert empty_version.count == 0
+        assert empty_version.last_updated_at is None
+
+        # Relating existing source data, without updating them, changes the version
+        research_context.source_data.extend(fake_client_with_source_data.source_data)
+        session.commit()
+
+        version = research_context_repository.get_source_data_version(research_context.id)
+        assert version.count == len(fake_client_with_source_data.source_data)
+        assert version.last_updated_at == max(sd.updated_at for sd in fake_client_with_source_data.source_data)
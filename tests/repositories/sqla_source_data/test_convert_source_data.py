@@ -0,0 +1,48 @@
+from datetime import datetime, timezone
+
+from pydantic import ValidationError
+import pytest
+
+from lib.core.entity.models import ProtocolEnum, SourceData, SourceDataStatusEnum
+from lib.infrastructure.repository.sqla.models import SQLASourceData
+from lib.infrastructure.repository.sqla.utils import convert_sqla_source_data_to_core_source_data
+
+
+def _sqla_source_data(protocol: ProtocolEnum) -> SQLASourceData:
+    now = datetime.now(timezone.utc)
+    return SQLASourceData(
+        id=1,
+        name="file",
+        relative_path="dir/file.pdf",
+        type="pdf",
+        protocol=protocol,
+        status=SourceDataStatusEnum.AVAILABLE,
+        created_at=now,
+        updated_at=now,
+        deleted=False,
+        deleted_at=None,
+    )
+
+
+def test_converted_source_data_equals_the_validated_one() -> None:
+    sqla_source_data = _sqla_source_data(ProtocolEnum.S3)
+
+    core_source_data = convert_sqla_source_data_to_core_source_data(sqla_source_data)
+    validated_source_data = SourceData(
+        **{field: getattr(sqla_source_data, field) for field in SourceData.model_fields},
+    )
+
+    assert core_source_data == validated_source_data
+    assert core_source_data.to_json() == validated_source_data.to_json()
+    assert core_source_data.model_fields_set == validated_source_data.model_fields_set
+
+
+def test_converted_source_data_is_not_validated_again() -> None:
+    # A row of a protocol that is not implemented anymore can still be listed
+    sqla_source_data = _sqla_source_data(ProtocolEnum.NAS)
+
+    core_source_data = convert_sqla_source_data_to_core_source_data(sqla_source_data)
+
+    assert core_source_data.protocol == ProtocolEnum.NAS
+    with pytest.raises(ValidationError):
+        SourceData(**{field: getattr(sqla_source_data, field) for field in SourceData.model_fields})
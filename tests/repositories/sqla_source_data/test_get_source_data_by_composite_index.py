@@ -1,5 +1,6 @@
 import random
 from typing import List
+from lib.core.entity.models import ProtocolEnum, SourceDataCompositeIndex
 from lib.infrastructure.config.containers import ApplicationContainer
 from lib.infrastructure.repository.sqla.database import TDatabaseFactory
 from lib.infrastructure.repository.sqla.models import SQLAClient, SQLASourceData
@@ -108,3 +109,44 @@ def test_error_get_source_data_by_composite_index_either_not_found(
         assert dto.errorCode == -1
         assert dto.errorName == "SourceDataNotFound"
         assert dto.errorType == "SourceDataNotFound"
+
+
+def test_get_source_data_by_composite_indexes(
+    app_initialization_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake_client_with_source_data_list: List[SQLAClient],
+) -> None:
+    sqla_source_data_repository = app_initialization_container.sqla_source_data_repository()
+
+    sqla_clients = fake_client_with_source_data_list
+    sqla_client, other_sqla_client = sqla_clients[0], sqla_clients[1]
+
+    with db_session() as session:
+        for client in sqla_clients:
+            client.save(session=session, flush=True)
+        session.commit()
+
+        wanted = sqla_client.source_data[:2]
+        composite_indexes = [
+            SourceDataCompositeIndex(protocol=sqla_source_data.protocol, relative_path=sqla_source_data.relative_path)
+            for sqla_source_data in wanted
+        ]
+        # Neither a missing path nor a path of another client is returned
+        composite_indexes.append(SourceDataCompositeIndex(protocol=ProtocolEnum.S3, relative_path="not/there.txt"))
+        composite_indexes.append(
+            SourceDataCompositeIndex(
+                protocol=other_sqla_client.source_data[0].protocol,
+                relative_path=other_sqla_client.source_data[0].relative_path,
+            )
+        )
+
+        dto = sqla_source_data_repository.get_source_data_by_composite_indexes(
+            client_id=sqla_client.id, composite_indexes=composite_indexes
+        )
+
+        assert dto.status == True
+        assert dto.data is not None
+        assert sorted(dto.data, key=lambda source_data: source_data.id) == sorted(
+            [convert_sqla_source_data_to_core_source_data(sqla_source_data) for sqla_source_data in wanted],
+            key=lambda source_data: source_data.id,
+        )
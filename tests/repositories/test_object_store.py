@@ -1,7 +1,12 @@
+import io
+from typing import Any
+import uuid
 import docker
+import pytest
 
 from lib.infrastructure.config.containers import ApplicationContainer
 from lib.infrastructure.repository.minio.minio_object_store import MinIOObjectStore
+from lib.infrastructure.repository.minio.models import MinIOObject
 
 
 def test_minio_container_is_available(app_object_store: MinIOObjectStore) -> None:
@@ -16,3 +21,57 @@ def test_minio_bucket_is_created(app_container: ApplicationContainer) -> None:
     storage = app_container.storage()
     assert storage is not None
     assert storage.ping() is True
+
+
+def test_minio_object_exists_uses_head_request_and_cache(app_object_store: MinIOObjectStore) -> None:
+    bucket_name = f"object-exists-{uuid.uuid4()}"
+    app_object_store.create_bucket_if_not_exists(bucket_name)
+    minio_object = MinIOObject(bucket_name=bucket_name, object_name="some/relative/path.txt")
+
+    assert app_object_store.object_exists(minio_object) == False
+
+    # The upload credentials forget that the object was missing
+    app_object_store.get_signed_url_for_file_upload(minio_object)
+    app_object_store.client.put_object(minio_object.bucket_name, minio_object.object_name, io.BytesIO(b"content"), 7)
+
+    assert app_object_store.object_exists(minio_object) == True
+
+    # Once found, the object is not looked up again until its cache entry expires
+    app_object_store.client.remove_object(minio_object.bucket_name, minio_object.object_name)
+    assert app_object_store.object_exists(minio_object) == True
+
+
+def test_minio_object_exists_in_missing_bucket(app_object_store: MinIOObjectStore) -> None:
+    minio_object = MinIOObject(bucket_name=f"missing-{uuid.uuid4()}", object_name="path.txt")
+
+    assert app_object_store.object_exists(minio_object) == False
+
+
+def test_minio_known_buckets_skip_network_round_trip(
+    app_object_store: MinIOObjectStore, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    bucket_name = f"known-bucket-{uuid.uuid4()}"
+    app_object_store.create_bucket_if_not_exists(bucket_name)
+    minio_object = MinIOObject(bucket_name=bucket_name, object_name="path.txt")
+
+    def fail(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("The bucket should be known, with no call to MinIO")
+
+    monkeypatch.setattr(app_object_store.client, "bucket_exists", fail)
+    monkeypatch.setattr(app_object_store.client, "make_bucket", fail)
+
+    assert app_object_store.bucket_exists(bucket_name) == True
+    assert app_object_store.get_signed_url_for_file_upload(minio_object) is not None
+
+
+def test_minio_known_buckets_are_forgotten_once_missing(app_object_store: MinIOObjectStore) -> None:
+    bucket_name = f"deleted-bucket-{uuid.uuid4()}"
+    app_object_store.create_bucket_if_not_exists(bucket_name)
+    minio_object = MinIOObject(bucket_name=bucket_name, object_name="path.txt")
+
+    # The bucket is deleted behind the back of the store
+    app_object_store.client.remove_bucket(minio_object.bucket_name)
+    assert app_object_store.object_exists(minio_object) == False
+
+    app_object_store.get_signed_url_for_file_upload(minio_object)
+    assert app_object_store.client.bucket_exists(minio_object.bucket_name) == True
@@ -1,9 +1,27 @@
+import asyncio
+import logging
+from typing import Any
 import docker
 
+from lib.core.dto.conversation_repository_dto import ListConversationMessagesDTO
+from lib.core.entity.models import MessageBase
 from lib.infrastructure.config.containers import ApplicationContainer
 import pytest
 
-from lib.infrastructure.repository.sqla.database import Database
+from lib.infrastructure.repository.sqla.async_sqla_conversation_repository import AsyncSQLAConversationRepository
+from sqlalchemy import event, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from lib.infrastructure.repository.sqla.database import (
+    AsyncDatabase,
+    Database,
+    ReplicaPool,
+    SlowQueryLog,
+    read_only,
+)
+from lib.infrastructure.repository.sqla.models import SQLALLM
+from lib.infrastructure.repository.sqla.sqla_conversation_repository import SQLAConversationRepository
 
 
 def test_pg_container_is_available(app_raw_db: Database) -> None:
@@ -19,3 +37,218 @@ def test_migrations_are_applied(app_container: ApplicationContainer) -> None:
     assert db is not None
     assert db.ping() is True
     assert db.engine is not None
+
+
+def test_db_is_shared_across_resolutions(app_container: ApplicationContainer) -> None:
+    assert app_container.db() is app_container.db()
+
+    client_repository = app_container.sqla_client_repository()
+    conversation_repository = app_container.sqla_conversation_repository()
+    assert client_repository.session.get_bind() is conversation_repository.session.get_bind()
+
+
+def test_pool_metrics_count_checkouts(app_container: ApplicationContainer) -> None:
+    db = app_container.db()
+    before = db.pool_metrics()
+
+    assert db.ping() is True
+
+    after = db.pool_metrics()
+    assert after["size"] == app_container.config.rdbms.pool_size.as_int()()
+    assert after["checkouts_total"] > before["checkouts_total"]
+    assert after["checked_out"] == before["checked_out"]
+    assert after["waits_total"] >= before["waits_total"]
+
+
+def _rdbms_settings(app_container: ApplicationContainer) -> dict[str, str | int]:
+    rdbms = app_container.config.rdbms
+    return {
+        "db_host": rdbms.host(),
+        "db_port": rdbms.port.as_int()(),
+        "db_user": rdbms.username(),
+        "db_password": rdbms.password(),
+        "db_name": rdbms.database(),
+    }
+
+
+def test_echo_is_off_by_default(app_container: ApplicationContainer) -> None:
+    assert app_container.db().engine.echo is False
+
+
+def test_slow_query_log_tags_the_repository_method(
+    app_container: ApplicationContainer, caplog: pytest.LogCaptureFixture
+) -> None:
+    db = Database(**_rdbms_settings(app_container), slow_query_log=SlowQueryLog(threshold_ms=0))  # type: ignore
+    conversation_repository = SQLAConversationRepository(session_factory=db.session)
+
+    with caplog.at_level(logging.WARNING, logger="SlowQueryLog"):
+        conversation_repository.list_conversation_messages(conversation_id=-1)
+
+    assert "Slow query in SQLAConversationRepository.list_conversation_messages" in caplog.text
+
+
+def test_slow_query_log_tags_the_async_repository_method(
+    app_container: ApplicationContainer, caplog: pytest.LogCaptureFixture
+) -> None:
+    db = AsyncDatabase(**_rdbms_settings(app_container), slow_query_log=SlowQueryLog(threshold_ms=0))  # type: ignore
+    conversation_repository = AsyncSQLAConversationRepository(database=db)
+
+    with caplog.at_level(logging.WARNING, logger="SlowQueryLog"):
+        asyncio.run(conversation_repository.list_conversation_messages(conversation_id=-1))
+
+    assert "Slow query in AsyncSQLAConversationRepository.list_conversation_messages" in caplog.text
+
+
+def test_slow_query_log_skips_fast_and_unsampled_queries(
+    app_container: ApplicationContainer, caplog: pytest.LogCaptureFixture
+) -> None:
+    fast_db = Database(**_rdbms_settings(app_container), slow_query_log=SlowQueryLog(threshold_ms=60_000))  # type: ignore
+    unsampled_db = Database(
+        **_rdbms_settings(app_container), slow_query_log=SlowQueryLog(threshold_ms=0, sample_rate=0)  # type: ignore
+    )
+
+    with caplog.at_level(logging.WARNING, logger="SlowQueryLog"):
+        assert fast_db.ping() is True
+        assert unsampled_db.ping() is True
+
+    assert "Slow query" not in caplog.text
+
+    with pytest.raises(ValueError):
+        SlowQueryLog(threshold_ms=0, sample_rate=2)
+
+
+def _replica_of_the_primary(app_container: ApplicationContainer) -> str:
+    # The primary itself, reached through a second pool, stands in for a replica: it reports no replication lag
+    rdbms = app_container.config.rdbms
+    return f"{rdbms.host()}:{rdbms.port.as_int()()}"
+
+
+def _count_statements(engine: Engine) -> list[str]:
+    statements: list[str] = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+    return statements
+
+
+def test_read_only_methods_are_routed_to_a_replica(app_container: ApplicationContainer) -> None:
+    db = Database(**_rdbms_settings(app_container), replicas=_replica_of_the_primary(app_container))  # type: ignore
+    assert db.replica_pool is not None
+    primary_statements = _count_statements(db.engine)
+    replica_statements = _count_statements(db.replica_pool.engines[0])
+    conversation_repository = SQLAConversationRepository(session_factory=db.session)
+
+    dto: ListConversationMessagesDTO[MessageBase] = conversation_repository.list_conversation_messages(
+        conversation_id=-1
+    )
+
+    assert dto.status is False
+    assert len(replica_statements) > 0
+    assert primary_statements == []
+
+    assert db.ping() is True
+    assert len(primary_statements) == 1
+    assert db.pool_metrics()["replicas_available"] == 1
+
+
+@read_only
+def bind_of_a_read(session: Session) -> Any:
+    return session.get_bind(clause=select(SQLALLM))
+
+
+def test_reads_after_a_write_stay_on_the_primary(app_container: ApplicationContainer) -> None:
+    db = Database(**_rdbms_settings(app_container), replicas=_replica_of_the_primary(app_container))  # type: ignore
+    assert db.replica_pool is not None
+
+    with db.session() as session:
+        assert session.get_bind(clause=select(SQLALLM)) is db.engine
+        assert bind_of_a_read(session) is db.replica_pool.engines[0]
+
+        session.add(SQLALLM(llm_name="test-replica-routing"))
+        session.flush()
+
+        assert bind_of_a_read(session) is db.engine
+        session.rollback()
+
+
+def test_replica_is_picked_once_per_transaction(app_container: ApplicationContainer) -> None:
+    replica = _replica_of_the_primary(app_container)
+    db = Database(**_rdbms_settings(app_container), replicas=f"{replica},{replica}")  # type: ignore
+    assert db.replica_pool is not None
+    statements = [_count_statements(engine) for engine in db.replica_pool.engines]
+
+    @read_only
+    def read(session: Session) -> None:
+        session.execute(select(SQLALLM.id).limit(1))
+
+    def reads_per_replica() -> list[int]:
+        # The lag checks of the replicas are left out
+        return [len([statement for statement in replica if "llm" in statement]) for replica in statements]
+
+    with db.session() as session:
+        read(session)
+        read(session)
+        assert reads_per_replica() == [2, 0]
+        session.commit()
+
+        read(session)
+        read(session)
+        assert reads_per_replica() == [2, 2]
+        session.rollback()
+
+        read(session)
+        assert reads_per_replica() == [3, 2]
+
+
+def test_lagging_or_unreachable_replicas_fall_back_to_the_primary(app_container: ApplicationContainer) -> None:
+    lagging_db = Database(
+        **_rdbms_settings(app_container),  # type: ignore
+        replicas=_replica_of_the_primary(app_container),
+        replica_max_lag_seconds=-1,
+    )
+    unreachable_db = Database(**_rdbms_settings(app_container), replicas="127.0.0.1:1")  # type: ignore
+
+    for db in (lagging_db, unreachable_db):
+        primary_statements = _count_statements(db.engine)
+        conversation_repository = SQLAConversationRepository(session_factory=db.session)
+
+        conversation_repository.list_conversation_messages(conversation_id=-1)
+
+        assert len(primary_statements) > 0
+        assert db.pool_metrics()["replicas_available"] == 0
+        assert db.pool_metrics()["replica_fallbacks_total"] >= 1
+
+
+def test_replica_lag_is_checked_once_per_interval(app_container: ApplicationContainer) -> None:
+    db = Database(**_rdbms_settings(app_container), replicas=_replica_of_the_primary(app_container))  # type: ignore
+    assert db.replica_pool is not None
+    now = [0.0]
+    pool = ReplicaPool(db.replica_pool.engines, max_lag_seconds=5, check_interval_seconds=1, timer=lambda: now[0])
+    lag_checks = _count_statements(pool.engines[0])
+
+    assert pool.engine() is pool.engines[0]
+    assert pool.engine() is pool.engines[0]
+    assert len(lag_checks) == 1
+
+    now[0] = 2.0
+    assert pool.engine() is pool.engines[0]
+    assert len(lag_checks) == 2
+
+
+def test_async_read_only_methods_are_routed_to_a_replica(app_container: ApplicationContainer) -> None:
+    db = AsyncDatabase(**_rdbms_settings(app_container), replicas=_replica_of_the_primary(app_container))  # type: ignore
+    conversation_repository = AsyncSQLAConversationRepository(database=db)
+
+    @read_only
+    async def bind_of_a_read() -> object:
+        async with db.session() as session:
+            return session.sync_session.get_bind(clause=select(SQLALLM))
+
+    async def run() -> None:
+        dto: ListConversationMessagesDTO[MessageBase] = await conversation_repository.list_conversation_messages(
+            conversation_id=-1
+        )
+        assert dto.status is False
+        bind = await bind_of_a_read()
+        assert bind is not None and bind is not db.engine.sync_engine
+        await db.dispose()
+
+    asyncio.run(run())
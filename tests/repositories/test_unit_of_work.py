@@ -0,0 +1,79 @@
+import pytest
+from lib.infrastructure.config.containers import ApplicationContainer
+from lib.infrastructure.repository.sqla.database import TDatabaseFactory
+from lib.infrastructure.repository.sqla.models import SQLAClient
+
+
+def test_repositories_share_the_unit_of_work_session(app_container: ApplicationContainer) -> None:
+    unit_of_work = app_container.unit_of_work()
+    client_repository = app_container.sqla_client_repository()
+    conversation_repository = app_container.sqla_conversation_repository()
+
+    assert unit_of_work.active is False
+    assert client_repository.session is not conversation_repository.session
+
+    with unit_of_work.begin():
+        assert unit_of_work.active is True
+        assert client_repository.session is unit_of_work.session
+        assert conversation_repository.session is unit_of_work.session
+
+        with unit_of_work.begin():
+            assert client_repository.session is unit_of_work.session
+
+    assert unit_of_work.active is False
+    assert unit_of_work.session is None
+
+
+def test_unit_of_work_commits_once_at_the_end(
+    app_container: ApplicationContainer, db_session: TDatabaseFactory, fake_client: SQLAClient
+) -> None:
+    unit_of_work = app_container.unit_of_work()
+    client_repository = app_container.sqla_client_repository()
+    client_sub = fake_client.sub
+
+    with unit_of_work.begin():
+        fake_client.save(session=client_repository.session)
+        client_repository.commit()
+
+        dto = client_repository.get_client_by_sub(client_sub=client_sub)
+        assert dto.status == True
+
+        with db_session() as session:
+            assert session.query(SQLAClient).filter_by(sub=client_sub).first() is None
+
+    with db_session() as session:
+        assert session.query(SQLAClient).filter_by(sub=client_sub).first() is not None
+
+
+def test_unit_of_work_rolls_back_on_exception(
+    app_container: ApplicationContainer, db_session: TDatabaseFactory, fake_client: SQLAClient
+) -> None:
+    unit_of_work = app_container.unit_of_work()
+    client_repository = app_container.sqla_client_repository()
+    client_sub = fake_client.sub
+
+    with pytest.raises(RuntimeError):
+        with unit_of_work.begin():
+            fake_client.save(session=client_repository.session)
+            client_repository.commit()
+            raise RuntimeError("Boom")
+
+    assert unit_of_work.active is False
+    with db_session() as session:
+        assert session.query(SQLAClient).filter_by(sub=client_sub).first() is None
+
+
+def test_unit_of_work_explicit_rollback(
+    app_container: ApplicationContainer, db_session: TDatabaseFactory, fake_client: SQLAClient
+) -> None:
+    unit_of_work = app_container.unit_of_work()
+    client_repository = app_container.sqla_client_repository()
+    client_sub = fake_client.sub
+
+    with unit_of_work.begin():
+        fake_client.save(session=client_repository.session)
+        client_repository.commit()
+        unit_of_work.rollback()
+
+    with db_session() as session:
+        assert session.query(SQLAClient).filter_by(sub=client_sub).first() is None
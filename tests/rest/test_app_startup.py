@@ -0,0 +1,47 @@
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import pytest
+from lib.infrastructure.config.containers import ApplicationContainer
+from lib.infrastructure.rest.bootstrap import FEATURE_REGISTRY_ENV, discover_fastapi_features, load_fastapi_features
+
+
+def _route_paths(app: FastAPI) -> list[str]:
+    return [route.path for route in app.routes]  # type: ignore
+
+
+def test_discover_fastapi_features() -> None:
+    registry = discover_fastapi_features()
+
+    assert "lib.infrastructure.rest.endpoints.list_messages_endpoints:ListMessagesFastAPIFeature" in registry
+    assert registry == sorted(registry)
+    assert len(load_fastapi_features(registry)) == len(registry)
+
+
+def test_ping_is_registered_once(server: FastAPI) -> None:
+    assert _route_paths(server).count("/ping") == 1
+
+
+def test_create_app_mounts_only_the_frozen_registry(
+    app_container: ApplicationContainer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from lib.infrastructure.rest.main import create_app
+
+    monkeypatch.setenv(
+        FEATURE_REGISTRY_ENV,
+        json.dumps(["lib.infrastructure.rest.endpoints.list_messages_endpoints:ListMessagesFastAPIFeature"]),
+    )
+
+    app = create_app()
+
+    paths = _route_paths(app)
+    assert "/conversations/{id}/message" in paths
+    assert "/client/{id}/source" not in paths
+
+
+def test_metrics_endpoint_exposes_worker_startup_time(httpx_client: TestClient) -> None:
+    response = httpx_client.get("/metrics")
+
+    startup_line = next(line for line in response.text.splitlines() if line.startswith("kp_worker_startup_seconds "))
+    assert float(startup_line.split(" ")[1]) > 0
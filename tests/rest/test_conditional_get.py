@@ -0,0 +1,132 @@
+from typing import Tuple
+from faker import Faker
+from fastapi.testclient import TestClient
+from lib.core.sdk.fastapi import etag_matches
+from lib.infrastructure.config.containers import ApplicationContainer
+from lib.infrastructure.repository.sqla.database import TDatabaseFactory
+from lib.infrastructure.repository.sqla.models import (
+    SQLALLM,
+    SQLAAgentMessage,
+    SQLAClient,
+    SQLAConversation,
+    SQLAResearchContext,
+    SQLAUserMessage,
+)
+
+HEADERS = {"x-auth-token": "test123"}
+
+
+def _db_round_trips(server_timing: str) -> str:
+    return next(entry for entry in server_timing.split(",") if entry.strip().startswith("db;"))
+
+
+def test_etag_matches() -> None:
+    assert etag_matches('W/"abc"', 'W/"abc"')
+    assert etag_matches('W/"abc"', '"abc"')
+    assert etag_matches('W/"abc"', 'W/"xyz", W/"abc"')
+    assert etag_matches('W/"abc"', "*")
+    assert not etag_matches('W/"abc"', 'W/"xyz"')
+    assert not etag_matches('W/"abc"', None)
+
+
+def test_list_research_contexts_answers_conditional_requests(
+    httpx_client: TestClient,
+    app_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client_with_conversation: SQLAClient,
+) -> None:
+    llm = SQLALLM(llm_name=fake.name(), research_contexts=fake_client_with_conversation.research_contexts)
+    with db_session() as session:
+        llm.save(session=session, flush=True)
+        session.commit()
+        client_id = fake_client_with_conversation.id
+        llm_id = llm.id
+        research_contexts = len(fake_client_with_conversation.research_contexts)
+
+    response = httpx_client.get(f"/client/{client_id}/research-context", headers=HEADERS)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+
+    response = httpx_client.get(f"/client/{client_id}/research-context", headers={**HEADERS, "if-none-match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+    # Only the aggregate query, the research contexts are not loaded
+    assert 'desc="1 round trips"' in _db_round_trips(response.headers["server-timing"])
+
+    with db_session() as session:
+        research_context = SQLAResearchContext(
+            title=fake.name(), description=fake.text(), external_id=fake.uuid4(), client_id=client_id, llm_id=llm_id
+        )
+        research_context.save(session=session, flush=True)
+        session.commit()
+
+    response = httpx_client.get(f"/client/{client_id}/research-context", headers={**HEADERS, "if-none-match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert len(response.json()["research_contexts"]) == research_contexts + 1
+
+
+def test_list_source_data_etag_depends_on_the_query_parameters(
+    httpx_client: TestClient,
+    app_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake_client_with_source_data: SQLAClient,
+) -> None:
+    with db_session() as session:
+        fake_client_with_source_data.save(session=session, flush=True)
+        session.commit()
+        client_id = fake_client_with_source_data.id
+
+    response = httpx_client.get(f"/client/{client_id}/source", headers=HEADERS)
+    etag = response.headers["etag"]
+
+    response = httpx_client.get(
+        f"/client/{client_id}/source", params={"limit": 1}, headers={**HEADERS, "if-none-match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_list_messages_answers_conditional_requests(
+    httpx_client: TestClient,
+    app_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client: SQLAClient,
+    fake_research_context: SQLAResearchContext,
+    fake_conversation: SQLAConversation,
+    fake_message_pair: Tuple[SQLAUserMessage, SQLAAgentMessage],
+) -> None:
+    fake_research_context.conversations = [fake_conversation]
+    fake_research_context.llm = SQLALLM(llm_name=fake.name())
+    fake_client.research_contexts = [fake_research_context]
+    with db_session() as session:
+        fake_client.save(session=session, flush=True)
+        session.commit()
+        conversation_id = fake_conversation.id
+        messages = len(fake_conversation.messages)
+
+    response = httpx_client.get(f"/conversations/{conversation_id}/message", headers=HEADERS)
+    etag = response.headers["etag"]
+
+    response = httpx_client.get(f"/conversations/{conversation_id}/message", headers={**HEADERS, "if-none-match": etag})
+    assert response.status_code == 304
+
+    with db_session() as session:
+        sqla_conversation = session.get(SQLAConversation, conversation_id)
+        assert sqla_conversation is not None
+        sqla_conversation.messages.extend(fake_message_pair)
+        session.commit()
+
+    response = httpx_client.get(f"/conversations/{conversation_id}/message", headers={**HEADERS, "if-none-match": etag})
+    assert response.status_code == 200
+    assert len(response.json()["message_list"]) == messages + 2
+
+    response = httpx_client.get(
+        f"/conversations/{conversation_id}/message", headers={**HEADERS, "accept": "application/x-ndjson"}
+    )
+    assert response.status_code == 200
+    assert "etag" not in response.headers
@@ -0,0 +1,36 @@
+from fastapi.testclient import TestClient
+from lib.core.view_model.get_client_data_for_upload_batch_view_model import GetClientDataForUploadBatchViewModel
+from lib.infrastructure.config.containers import ApplicationContainer
+from lib.infrastructure.repository.sqla.database import TDatabaseFactory
+from lib.infrastructure.repository.sqla.models import SQLAClient
+
+
+def test_get_client_data_for_upload_batch_fastapi_post_endpoint_returns_signed_urls(
+    httpx_client: TestClient,
+    app_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake_client: SQLAClient,
+) -> None:
+    with db_session() as session:
+        fake_client.save(session=session, flush=True)
+        session.commit()
+        client_id = fake_client.id
+
+    files = [{"protocol": "s3", "relative_path": f"batch/file-{i}.txt"} for i in range(20)]
+
+    response = httpx_client.post(
+        f"/client/{client_id}/upload-credentials/batch", json=files, headers={"x-auth-token": "test123"}
+    )
+
+    assert response.status_code == 200
+    received_vm = GetClientDataForUploadBatchViewModel.model_validate(response.json())
+    assert received_vm.status == True
+    assert set(received_vm.signed_urls) == {file["relative_path"] for file in files}
+
+
+def test_get_client_data_for_upload_batch_fastapi_post_endpoint_rejects_empty_batch(
+    httpx_client: TestClient, app_container: ApplicationContainer
+) -> None:
+    response = httpx_client.post("/client/1/upload-credentials/batch", json=[], headers={"x-auth-token": "test123"})
+
+    assert response.status_code == 400
@@ -0,0 +1,110 @@
+import json
+from typing import Tuple
+from faker import Faker
+from fastapi.testclient import TestClient
+from lib.core.entity.models import MessageBase
+from lib.core.view_model.list_messages_view_model import ListMessagesViewModel
+from lib.infrastructure.config.containers import ApplicationContainer
+from lib.infrastructure.repository.sqla.database import TDatabaseFactory
+from lib.infrastructure.repository.sqla.models import (
+    SQLALLM,
+    SQLAAgentMessage,
+    SQLAClient,
+    SQLAConversation,
+    SQLAResearchContext,
+    SQLAUserMessage,
+)
+
+
+def _create_conversation(
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    client: SQLAClient,
+    research_context: SQLAResearchContext,
+    conversation: SQLAConversation,
+    message_pair: Tuple[SQLAUserMessage, SQLAAgentMessage],
+) -> int:
+    conversation.messages.extend(message_pair)
+    research_context.conversations = [conversation]
+    research_context.llm = SQLALLM(llm_name=fake.name())
+    client.research_contexts = [research_context]
+
+    with db_session() as session:
+        client.save(session=session, flush=True)
+        session.commit()
+        return conversation.id
+
+
+def test_list_messages_fastapi_endpoint_paginates(
+    httpx_client: TestClient,
+    app_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client: SQLAClient,
+    fake_research_context: SQLAResearchContext,
+    fake_conversation: SQLAConversation,
+    fake_message_pair: Tuple[SQLAUserMessage, SQLAAgentMessage],
+) -> None:
+    conversation_id = _create_conversation(
+        db_session, fake, fake_client, fake_research_context, fake_conversation, fake_message_pair
+    )
+    headers = {"x-auth-token": "test123"}
+
+    response = httpx_client.get(f"/conversations/{conversation_id}/message", headers=headers)
+    assert response.status_code == 200
+    all_ids = [message["id"] for message in response.json()["message_list"]]
+    assert len(all_ids) == 6
+
+    response = httpx_client.get(f"/conversations/{conversation_id}/message", params={"limit": 4}, headers=headers)
+    first_page = ListMessagesViewModel.model_validate(response.json())
+    assert first_page.status == True
+    assert [message.id for message in first_page.message_list] == all_ids[:4]
+    assert first_page.next_cursor is not None
+    assert first_page.previous_cursor is None
+
+    response = httpx_client.get(
+        f"/conversations/{conversation_id}/message",
+        params={"limit": 4, "after": first_page.next_cursor},
+        headers=headers,
+    )
+    second_page = ListMessagesViewModel.model_validate(response.json())
+    assert [message.id for message in second_page.message_list] == all_ids[4:]
+    assert second_page.next_cursor is None
+    assert second_page.previous_cursor is not None
+
+
+def test_list_messages_fastapi_endpoint_streams_ndjson(
+    httpx_client: TestClient,
+    app_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client: SQLAClient,
+    fake_research_context: SQLAResearchContext,
+    fake_conversation: SQLAConversation,
+    fake_message_pair: Tuple[SQLAUserMessage, SQLAAgentMessage],
+) -> None:
+    conversation_id = _create_conversation(
+        db_session, fake, fake_client, fake_research_context, fake_conversation, fake_message_pair
+    )
+    headers = {"x-auth-token": "test123"}
+
+    response = httpx_client.get(f"/conversations/{conversation_id}/message", headers=headers)
+    all_ids = [message["id"] for message in response.json()["message_list"]]
+
+    response = httpx_client.get(
+        f"/conversations/{conversation_id}/message", headers={**headers, "accept": "application/x-ndjson"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    streamed = [MessageBase.model_validate(json.loads(line)) for line in response.text.splitlines()]
+    assert [message.id for message in streamed] == all_ids
+
+
+def test_list_messages_fastapi_endpoint_rejects_invalid_cursor(
+    httpx_client: TestClient, app_container: ApplicationContainer
+) -> None:
+    response = httpx_client.get(
+        "/conversations/1/message", params={"after": "not-a-cursor"}, headers={"x-auth-token": "test123"}
+    )
+    assert response.status_code == 400
@@ -0,0 +1,82 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from lib.core.view_model.list_source_data_view_model import ListSourceDataViewModel
+from lib.infrastructure.config.containers import ApplicationContainer
+from lib.infrastructure.repository.sqla.database import TDatabaseFactory
+from lib.infrastructure.repository.sqla.models import SQLAClient
+
+
+def test_list_source_data_fastapi_endpoint_filters_and_paginates(
+    httpx_client: TestClient,
+    app_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake_client_with_source_data: SQLAClient,
+) -> None:
+    for i, sd in enumerate(fake_client_with_source_data.source_data):
+        sd.type = "pdf" if i % 2 == 0 else "csv"
+        sd.relative_path = f"{sd.relative_path}.{sd.type}"
+
+    with db_session() as session:
+        fake_client_with_source_data.save(session=session, flush=True)
+        session.commit()
+        client_id = fake_client_with_source_data.id
+
+    headers = {"x-auth-token": "test123"}
+
+    response = httpx_client.get(f"/client/{client_id}/source", params={"type": "pdf", "limit": 1}, headers=headers)
+    first_page = ListSourceDataViewModel.model_validate(response.json())
+    assert first_page.status == True
+    assert len(first_page.source_data_list) == 1
+    assert first_page.source_data_list[0].type == "pdf"
+    assert first_page.next_cursor is not None
+
+    response = httpx_client.get(
+        f"/client/{client_id}/source",
+        params={"type": "pdf", "limit": 1, "after": first_page.next_cursor},
+        headers=headers,
+    )
+    second_page = ListSourceDataViewModel.model_validate(response.json())
+    assert len(second_page.source_data_list) == 1
+    assert second_page.source_data_list[0].type == "pdf"
+    assert second_page.source_data_list[0].id != first_page.source_data_list[0].id
+    assert second_page.next_cursor is None
+
+
+def test_list_source_data_fastapi_endpoint_rejects_invalid_cursor(
+    httpx_client: TestClient, app_container: ApplicationContainer
+) -> None:
+    response = httpx_client.get(
+        "/client/1/source", params={"after": "not-a-cursor"}, headers={"x-auth-token": "test123"}
+    )
+
+    assert response.status_code == 400
+
+
+def test_list_source_data_fastapi_endpoint_fast_json_response_matches_the_response_model(
+    httpx_client: TestClient,
+    app_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake_client_with_source_data: SQLAClient,
+) -> None:
+    assert app_container.list_source_data_feature.feature_descriptor().fast_json_response is True
+    with db_session() as session:
+        fake_client_with_source_data.save(session=session, flush=True)
+        session.commit()
+        client_id = fake_client_with_source_data.id
+        source_data = len(fake_client_with_source_data.source_data)
+
+    response = httpx_client.get(f"/client/{client_id}/source", headers={"x-auth-token": "test123"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert "etag" in response.headers
+    view_model = ListSourceDataViewModel.model_validate(response.json())
+    assert len(view_model.source_data_list) == source_data
+
+    # The same view model, serialized by FastAPI through the response model of the route
+    default_app = FastAPI()
+
+    @default_app.get("/source")
+    def default_endpoint() -> ListSourceDataViewModel | None:
+        return view_model
+
+    assert TestClient(default_app).get("/source").content == response.content
@@ -0,0 +1,56 @@
+from faker import Faker
+from fastapi.testclient import TestClient
+from lib.core.view_model.new_message_batch_view_model import NewMessageBatchViewModel
+from lib.infrastructure.config.containers import ApplicationContainer
+from lib.infrastructure.repository.sqla.database import TDatabaseFactory
+from lib.infrastructure.repository.sqla.models import SQLALLM, SQLAClient, SQLAConversation, SQLAResearchContext
+
+
+def test_new_message_batch_fastapi_post_endpoint_returns_ids(
+    httpx_client: TestClient,
+    app_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client: SQLAClient,
+    fake_research_context: SQLAResearchContext,
+    fake_conversation: SQLAConversation,
+) -> None:
+    fake_research_context.conversations = [fake_conversation]
+    fake_research_context.llm = SQLALLM(llm_name=fake.name())
+    fake_client.research_contexts = [fake_research_context]
+    with db_session() as session:
+        fake_client.save(session=session, flush=True)
+        session.commit()
+        conversation_id = fake_conversation.id
+
+    headers = {"x-auth-token": "test123"}
+    messages = [
+        {
+            "sender_type": "user" if i % 2 == 0 else "agent",
+            "message_contents": [{"content": f"message {i}", "content_type": "text"}],
+        }
+        for i in range(50)
+    ]
+
+    response = httpx_client.post(f"/conversation/{conversation_id}/messages", json=messages, headers=headers)
+
+    assert response.status_code == 200
+    received_vm = NewMessageBatchViewModel.model_validate(response.json())
+    assert received_vm.status == True
+    assert len(received_vm.message_ids) == 50
+
+    response = httpx_client.get(f"/conversations/{conversation_id}/message", params={"limit": 1000}, headers=headers)
+    listed = response.json()["message_list"]
+    listed_ids = [message["id"] for message in listed]
+    assert listed_ids[-50:] == received_vm.message_ids
+    assert [message["message_contents"][0]["content"] for message in listed[-50:]] == [
+        f"message {i}" for i in range(50)
+    ]
+
+
+def test_new_message_batch_fastapi_post_endpoint_rejects_empty_batch(
+    httpx_client: TestClient, app_container: ApplicationContainer
+) -> None:
+    response = httpx_client.post("/conversation/1/messages", json=[], headers={"x-auth-token": "test123"})
+
+    assert response.status_code == 400
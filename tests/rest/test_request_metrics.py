@@ -0,0 +1,78 @@
+from fastapi.testclient import TestClient
+from lib.core.sdk.metrics import Histogram, RequestMetrics
+from lib.infrastructure.config.containers import ApplicationContainer
+
+
+def _server_timing_stages(server_timing: str) -> dict[str, str]:
+    return {entry.split(";")[0].strip(): entry for entry in server_timing.split(",")}
+
+
+def test_server_timing_header_breaks_down_async_endpoint(
+    httpx_client: TestClient, app_container: ApplicationContainer
+) -> None:
+    response = httpx_client.get("/conversations/999999999/message", headers={"x-auth-token": "test123"})
+
+    stages = _server_timing_stages(response.headers["server-timing"])
+    for stage in ("create_request", "usecase", "present", "endpoint", "db", "total"):
+        assert stage in stages
+    # The aggregate query of the ETag, then the conversation
+    assert 'desc="2 round trips"' in stages["db"]
+
+
+def test_server_timing_header_breaks_down_sync_endpoint(
+    httpx_client: TestClient, app_container: ApplicationContainer
+) -> None:
+    response = httpx_client.get("/client/999999999/source", headers={"x-auth-token": "test123"})
+
+    stages = _server_timing_stages(response.headers["server-timing"])
+    for stage in ("create_request", "usecase", "present", "endpoint", "db", "total"):
+        assert stage in stages
+
+
+def test_metrics_endpoint_exposes_feature_histograms(
+    httpx_client: TestClient, app_container: ApplicationContainer
+) -> None:
+    httpx_client.get("/conversations/999999999/message", headers={"x-auth-token": "test123"})
+
+    response = httpx_client.get("/metrics")
+
+    assert response.status_code == 200
+    assert "server-timing" not in response.headers
+    assert "# TYPE kp_feature_stage_seconds histogram" in response.text
+    assert 'kp_feature_stage_seconds_count{feature="List Messages",stage="usecase"}' in response.text
+    assert 'kp_feature_db_round_trips_bucket{feature="List Messages",le="+Inf"}' in response.text
+    assert "kp_db_pool_size" in response.text
+    assert "kp_client_cache_hits_total" in response.text
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    histogram = Histogram("kp_test_seconds", "A test histogram.", label_names=("feature",), buckets=(0.1, 1.0))
+
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(("demo",), value)
+
+    assert histogram.render() == [
+        "# HELP kp_test_seconds A test histogram.",
+        "# TYPE kp_test_seconds histogram",
+        'kp_test_seconds_bucket{feature="demo",le="0.1"} 2',
+        'kp_test_seconds_bucket{feature="demo",le="1"} 3',
+        'kp_test_seconds_bucket{feature="demo",le="+Inf"} 4',
+        'kp_test_seconds_sum{feature="demo"} 2.65',
+        'kp_test_seconds_count{feature="demo"} 4',
+    ]
+
+
+def test_request_metrics_accumulate_stages() -> None:
+    metrics = RequestMetrics()
+
+    metrics.record("usecase", 0.002)
+    metrics.record("usecase", 0.003)
+    metrics.record_db_round_trip(0.001)
+    metrics.record_object_store_call(0.004)
+
+    assert metrics.stages["usecase"] == 0.005
+    assert metrics.db_round_trips == 1
+    assert metrics.object_store_calls == 1
+    assert metrics.server_timing() == (
+        'usecase;dur=5.0, db;dur=1.0;desc="1 round trips", object_store;dur=4.0;desc="1 calls"'
+    )
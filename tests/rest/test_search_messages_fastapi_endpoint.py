@@ -0,0 +1,50 @@
+import uuid
+from faker import Faker
+from fastapi.testclient import TestClient
+from lib.core.view_model.search_messages_view_model import SearchMessagesViewModel
+from lib.infrastructure.config.containers import ApplicationContainer
+from lib.infrastructure.repository.sqla.database import TDatabaseFactory
+from lib.infrastructure.repository.sqla.models import SQLALLM, SQLAClient
+
+
+def test_search_messages_fastapi_endpoint(
+    httpx_client: TestClient,
+    app_container: ApplicationContainer,
+    db_session: TDatabaseFactory,
+    fake: Faker,
+    fake_client_with_conversation: SQLAClient,
+) -> None:
+    client = fake_client_with_conversation
+    SQLALLM(llm_name=fake.name(), research_contexts=client.research_contexts)
+    conversation = client.research_contexts[0].conversations[0]
+    term = f"pulsar{uuid.uuid4().hex}"
+    conversation.messages[0].message_contents[0].content = f"How fast does a {term} spin?"
+    conversation.messages[1].message_contents[0].content = f"A {term} spins very fast."
+
+    with db_session() as session:
+        client.save(session=session, flush=True)
+        session.commit()
+
+        client_id = client.id
+        conversation_id = conversation.id
+        message_ids = {conversation.messages[0].id, conversation.messages[1].id}
+
+    headers = {"x-auth-token": "test123"}
+
+    response = httpx_client.get(
+        f"/client/{client_id}/message/search",
+        params={"q": term, "conversation_id": conversation_id},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    view_model = SearchMessagesViewModel.model_validate(response.json())
+    assert view_model.status == True
+    assert {result.message_id for result in view_model.search_results} == message_ids
+
+    response = httpx_client.get(
+        f"/client/{client_id}/message/search", params={"q": term, "after": "not a cursor"}, headers=headers
+    )
+    assert response.status_code == 400
+
+    response = httpx_client.get(f"/client/{client_id}/message/search", params={"q": ""}, headers=headers)
+    assert response.status_code == 400